@@ -8,17 +8,37 @@ tarefas (geração aleatória, pseudoaleatória e leitura de arquivo) em uma
 """
 
 import argparse
+import json
 import sys
 import logging
 from pathlib import Path
+from typing import Callable, Iterable
 from src import (
     criar_transcritor_dna_rna,
-    criar_ribossomo,
+    obter_ribossomo,
     gerar_dna_aleatorio,
     gerar_dna_pseudoaleatorio,
     escrever_arquivo,
-    ler_arquivo,
-    formatar_proteina
+    ler_blocos,
+    normalizar_dna,
+    processar_em_pipeline,
+    CacheResultados,
+    calcular_chave,
+    impressao_digital_definicoes,
+    CODIGOS_GENETICOS,
+    TraducaoIncremental,
+    traduzir_codigos,
+    traduzir_uma_letra,
+    escrever_proteinas_binario,
+    separar_lote,
+    calcular_estatisticas,
+    ServidorTraducao,
+    MOTORES,
+    escolher_motor,
+    TrabalhadorTraducao,
+    CoordenadorTraducao,
+    interpretar_endereco,
+    FalhaTrabalhador
 )
 
 # --- Constantes Globais ---
@@ -28,6 +48,10 @@ INPUT_PATH = Path("./data/input/")
 OUTPUT_PATH = Path("./data/output/")
 CODONS_PSEUDOALEATORIO_DEFAULT = 1000
 BASES_ALEATORIO_DEFAULT = 10000
+TAMANHO_BLOCO_DEFAULT = 1 << 20
+CACHE_PATH = Path("./data/cache/")
+CACHE_LIMITE_MB_DEFAULT = 1024
+FORMATOS_PROTEINA = ("tres-letras", "uma-letra", "binario")
 
 # --- Configuração e Execução ---
 
@@ -70,11 +94,132 @@ def setup_parser() -> argparse.ArgumentParser:
         metavar="ARQUIVO",
         help="Lê uma cadeia de DNA a partir de um arquivo (ex: 'meu_dna.txt' ou 'data/input/meu_dna.txt')."
     )
+    parser.add_argument(
+        "-c", "--codigo",
+        type=int,
+        nargs='+',
+        default=[1],
+        metavar="N",
+        help="Código(s) genético(s) NCBI usados na tradução (padrão: 1, o código padrão).\n"
+             f"Disponíveis: {', '.join(map(str, CODIGOS_GENETICOS))}. Com vários códigos,\n"
+             "a entrada é traduzida sob todos eles em uma única varredura."
+    )
+    parser.add_argument(
+        "--formato",
+        choices=FORMATOS_PROTEINA,
+        default=FORMATOS_PROTEINA[0],
+        help="Formato do arquivo de proteínas (padrão: tres-letras):\n"
+             "  tres-letras  'Met-Phe ...' em '<nome>_proteina.txt'\n"
+             "  uma-letra    uma proteína por linha ('MF') em '<nome>_proteina_uma_letra.txt'\n"
+             "  binario      um byte por resíduo e tabela de genes em '<nome>_proteina.bin'"
+    )
+    parser.add_argument(
+        "--estatisticas",
+        action="store_true",
+        help="Calcula apenas estatísticas (uso de códons, composição de aminoácidos,\n"
+             "comprimentos dos genes e conteúdo GC) em memória constante, sem gravar\n"
+             "RNA nem proteínas; o resumo vai para '<nome>_estatisticas.json'."
+    )
+    parser.add_argument(
+        "--serve-stdio",
+        choices=("linhas", "prefixo"),
+        nargs='?',
+        const="linhas",
+        default=None,
+        metavar="ENQUADRAMENTO",
+        help="Fica residente, lendo trabalhos JSON da entrada padrão e escrevendo os\n"
+             "resultados (com tempos por etapa) na saída padrão. ENQUADRAMENTO é 'linhas'\n"
+             "(padrão, um trabalho por linha) ou 'prefixo' (tamanho uint32 antes de cada um)."
+    )
+    parser.add_argument(
+        "--trabalhador",
+        type=interpretar_endereco,
+        default=None,
+        metavar="[HOST:]PORTA",
+        help="Fica residente como trabalhador da tradução distribuída, traduzindo\n"
+             "os fragmentos enviados por um coordenador (--distribuir) por TCP. Sem HOST,\n"
+             "atende só em 127.0.0.1; use 0.0.0.0:PORTA para aceitar outras máquinas\n"
+             "(o protocolo não tem autenticação: só em redes confiáveis)."
+    )
+    parser.add_argument(
+        "--distribuir",
+        type=interpretar_endereco,
+        nargs='+',
+        default=None,
+        metavar="HOST:PORTA",
+        help="Coordena a tradução: divide o RNA em fragmentos de --tamanho-bloco bases,\n"
+             "traduz cada um em um dos trabalhadores e junta as proteínas em ordem.\n"
+             "Fragmentos de um trabalhador que falhar são reenviados aos demais."
+    )
+    parser.add_argument(
+        "--motor", "--engine",
+        choices=("auto", *MOTORES),
+        default="auto",
+        help="Motor de tradução (padrão: auto: o autômato de pilha, salvo quando o tamanho\n"
+             "da entrada, ela estar em arquivo, as CPUs ou a memória disponível pedem outro).\n"
+             "Não se combina com --formato, vários -c, --estatisticas, --incremental nem --distribuir:\n"
+             + "\n".join(f"  {motor.nome:<9} {motor.descricao}" for motor in MOTORES.values())
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Executa leitura, transcrição, tradução e escrita como etapas concorrentes em blocos\n"
+             "(o mesmo que --motor pipeline)."
+    )
+    parser.add_argument(
+        "--retomar", "--resume",
+        action="store_true",
+        help="Continua uma execução em pipeline interrompida a partir do último ponto de\n"
+             "controle ('<nome>_ponto_controle.json'), com saída idêntica à de uma execução\n"
+             "sem interrupção. Implica --motor pipeline."
+    )
+    parser.add_argument(
+        "--max-memoria", "--max-memory",
+        type=int,
+        default=None,
+        metavar="MB",
+        help="Orçamento de memória do pipeline: ajusta o tamanho dos blocos e derrama em disco\n"
+             "a parte da pilha de um gene aberto longo demais. Implica --motor pipeline."
+    )
+    parser.add_argument(
+        "--memorizar", "--memoize",
+        action="store_true",
+        help="Reaplica a tradução de blocos de RNA repetidos (repetições em tandem, cópias)\n"
+             "em vez de executá-los de novo. Implica --motor pipeline."
+    )
+    parser.add_argument(
+        "--tamanho-bloco",
+        type=int,
+        default=TAMANHO_BLOCO_DEFAULT,
+        metavar="N_BASES",
+        help=f"Tamanho dos blocos usados no modo --pipeline e dos fragmentos de --distribuir (padrão: {TAMANHO_BLOCO_DEFAULT})."
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reaproveita a tradução anterior da mesma entrada e retraduz só o trecho editado."
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        nargs='?',
+        const=CACHE_PATH,
+        default=None,
+        metavar="DIRETORIO",
+        help=f"Reaproveita resultados de entradas já processadas (padrão: '{CACHE_PATH}')."
+    )
+    parser.add_argument(
+        "--cache-limite",
+        type=int,
+        default=CACHE_LIMITE_MB_DEFAULT,
+        metavar="MB",
+        help=f"Tamanho máximo do cache em MB; as entradas usadas há mais tempo são removidas (padrão: {CACHE_LIMITE_MB_DEFAULT})."
+    )
     return parser
 
 # --- Funções de Processamento ---
 
-def processar_cadeia(dna: str, nome_base_arquivo: str):
+def processar_cadeia(dna: str, nome_base_arquivo: str, codigo: int = 1, formato: str = FORMATOS_PROTEINA[0], motor: str = "pilha"):
     """
     Executa o pipeline completo de processamento para uma cadeia de DNA.
 
@@ -84,27 +229,30 @@ def processar_cadeia(dna: str, nome_base_arquivo: str):
     Args:
         dna (str): A cadeia de DNA a ser processada.
         nome_base_arquivo (str): O nome base para os arquivos de saída (ex: 'aleatorio').
+        codigo (int): O número NCBI do código genético usado na tradução.
+        formato (str): Um dos `FORMATOS_PROTEINA`; fora o padrão, a tradução usa
+            os índices dos códons e não monta a pilha de nomes de aminoácidos.
+        motor (str): O motor em memória (de `MOTORES`) usado na tradução de três letras.
     
     Raises:
         ValueError: Se a cadeia de DNA contiver caracteres inválidos.
     """
     # Passo 1: Validação e Limpeza da Cadeia de DNA
     logging.info("Validando e limpando DNA...")
-    cadeia_dna = "".join(filter(str.isalpha, dna)).upper()
-    if not all(base in 'ATCG' for base in cadeia_dna):
-        raise ValueError("DNA contém bases inválidas. Use apenas A, T, C, G.")
+    cadeia_dna = normalizar_dna(dna)
     
     # Passo 2: Transcrição para RNA usando o Transdutor Finito
     logging.info("Transcrevendo DNA para RNA...")
     transcritor = criar_transcritor_dna_rna()
     cadeia_rna = transcritor.transcrever(cadeia_dna)
 
-    # Passo 3: Tradução para Proteína usando o Autômato de Pilha
-    logging.info("Traduzindo RNA para Proteína...")
-    ribossomo = criar_ribossomo()
-    
-    resultado_pilha = ribossomo.transcrever_pilha(cadeia_rna)
-    cadeia_proteina = formatar_proteina(resultado_pilha)
+    if formato != FORMATOS_PROTEINA[0]:
+        processar_uma_letra(cadeia_dna, cadeia_rna, nome_base_arquivo, codigo, formato)
+        return
+
+    # Passo 3: Tradução para Proteína (por padrão, usando o Autômato de Pilha)
+    logging.info(f"Traduzindo RNA para Proteína (motor '{motor}')...")
+    cadeia_proteina = MOTORES[motor].traduzir(cadeia_rna, codigo)
 
     if cadeia_proteina:
         logging.info("Tradução bem-sucedida.")
@@ -112,9 +260,276 @@ def processar_cadeia(dna: str, nome_base_arquivo: str):
         logging.warning("Nenhuma estrutura de gene válida (AUG...STOP) foi encontrada no RNA. Nenhuma proteína foi produzida.")
 
     # Passo 4: Exibição dos resultados formatados no terminal
+    exibir_resultados(cadeia_dna, len(cadeia_dna), cadeia_rna, len(cadeia_rna), cadeia_proteina)
+
+    # Passo 5: Salvando os resultados em arquivos de saída
+    logging.info("Salvando arquivos de saída...")
+    escrever_arquivo(OUTPUT_PATH / f"{nome_base_arquivo}_rna.txt", cadeia_rna)
+    escrever_arquivo(OUTPUT_PATH / f"{nome_base_arquivo}_proteina.txt", cadeia_proteina)
+    logging.info(f"Arquivos de RNA e Proteína salvos em '{OUTPUT_PATH}'.")
+
+
+def processar_uma_letra(cadeia_dna: str, cadeia_rna: str, nome_base_arquivo: str, codigo: int, formato: str):
+    """
+    Traduz o RNA direto para códigos de uma letra e salva no formato pedido.
+
+    Args:
+        cadeia_dna (str): O DNA já normalizado.
+        cadeia_rna (str): O RNA transcrito.
+        nome_base_arquivo (str): O nome base para os arquivos de saída.
+        codigo (int): O número NCBI do código genético usado na tradução.
+        formato (str): 'uma-letra' (texto, uma proteína por linha) ou 'binario'.
+    """
+    logging.info("Traduzindo RNA para Proteína (códigos de uma letra)...")
+    residuos, deslocamentos = traduzir_uma_letra(cadeia_rna, codigo)
+    genes = len(deslocamentos) - 1
+    if genes:
+        logging.info(f"Tradução bem-sucedida: {genes} gene(s), {len(residuos)} resíduo(s).")
+    else:
+        logging.warning("Nenhuma estrutura de gene válida (AUG...STOP) foi encontrada no RNA. Nenhuma proteína foi produzida.")
+
+    previa = " ".join(proteina.decode('ascii') for proteina in separar_lote(residuos, deslocamentos[:LARGURA_LINHA + 1]))
+    exibir_resultados(cadeia_dna, len(cadeia_dna), cadeia_rna, len(cadeia_rna), previa)
+
+    logging.info("Salvando arquivos de saída...")
+    escrever_arquivo(OUTPUT_PATH / f"{nome_base_arquivo}_rna.txt", cadeia_rna)
+    if formato == "binario":
+        escrever_proteinas_binario(OUTPUT_PATH / f"{nome_base_arquivo}_proteina.bin", residuos, deslocamentos)
+    else:
+        linhas = b"".join(proteina + b"\n" for proteina in separar_lote(residuos, deslocamentos))
+        escrever_arquivo(OUTPUT_PATH / f"{nome_base_arquivo}_proteina_uma_letra.txt", linhas.decode('ascii'))
+    logging.info(f"Arquivos de RNA e Proteína salvos em '{OUTPUT_PATH}'.")
+
+
+def processar_estatisticas(fonte: Iterable[str], nome_arquivo: str, codigo: int = 1):
+    """
+    Calcula as estatísticas da entrada sem materializar RNA nem proteínas.
+
+    Args:
+        fonte (Iterable[str]): Os blocos de DNA bruto, em ordem.
+        nome_arquivo (str): O nome do arquivo JSON de saída.
+        codigo (int): O número NCBI do código genético usado na tradução.
+
+    Raises:
+        ValueError: Se a cadeia de DNA contiver caracteres inválidos.
+    """
+    logging.info(f"Calculando estatísticas (código genético {codigo})...")
+    resumo = calcular_estatisticas(fonte, criar_transcritor_dna_rna(), codigo)
+    comprimentos = resumo["comprimento_genes"]
+    logging.info(
+        f"{resumo['bases']} bases, GC {resumo['conteudo_gc']:.2%}, {resumo['genes']} gene(s) "
+        f"(comprimento mín. {comprimentos['minimo']}, médio {comprimentos['medio']:.1f}, máx. {comprimentos['maximo']})."
+    )
+    escrever_arquivo(OUTPUT_PATH / nome_arquivo, json.dumps(resumo, ensure_ascii=False, indent=2))
+    logging.info(f"Estatísticas salvas em '{OUTPUT_PATH / nome_arquivo}'.")
+
+
+def processar_em_blocos(fonte: Iterable[str], nome_base_arquivo: str, codigo: int = 1, retomar: bool = False,
+                        memoria_maxima: int | None = None, memorizar: bool = False):
+    """
+    Executa o pipeline completo com as etapas rodando concorrentemente.
+
+    Equivalente a `processar_cadeia`, mas a entrada é consumida em blocos e
+    leitura, transcrição, tradução e escrita se sobrepõem no tempo. Pontos de
+    controle são gravados periodicamente em '<nome>_ponto_controle.json'.
+
+    Args:
+        fonte (Iterable[str]): Os blocos de DNA bruto, em ordem.
+        nome_base_arquivo (str): O nome base para os arquivos de saída (ex: 'aleatorio').
+        codigo (int): O número NCBI do código genético usado na tradução.
+        retomar (bool): Continua do último ponto de controle, se houver.
+        memoria_maxima (int | None): Orçamento de memória do pipeline em bytes (None para não limitar).
+        memorizar (bool): Reaplica a tradução de blocos de RNA repetidos.
+
+    Raises:
+        ValueError: Se a cadeia de DNA contiver caracteres inválidos.
+    """
+    logging.info("Processando DNA em pipeline (leitura -> transcrição -> tradução -> escrita)...")
+    caminho_rna = OUTPUT_PATH / f"{nome_base_arquivo}_rna.txt"
+    caminho_proteina = OUTPUT_PATH / f"{nome_base_arquivo}_proteina.txt"
+
+    # Guarda o início do DNA para a prévia sem reter a cadeia inteira.
+    previa_dna = []
+    def fonte_com_previa():
+        for bloco in fonte:
+            if not previa_dna:
+                previa_dna.append(normalizar_dna(bloco[:PREVIA_CADEIA * 2]))
+            yield bloco
+
+    relatorio = processar_em_pipeline(
+        fonte_com_previa(), caminho_rna, caminho_proteina,
+        criar_transcritor_dna_rna(), obter_ribossomo(codigo),
+        ponto_controle=OUTPUT_PATH / f"{nome_base_arquivo}_ponto_controle.json", retomar=retomar,
+        memoria_maxima=memoria_maxima, memorizar=memorizar
+    )
+    logging.info(f"Estatísticas do pipeline:\n{relatorio.resumo()}")
+
+    if relatorio.genes:
+        logging.info("Tradução bem-sucedida.")
+    else:
+        logging.warning("Nenhuma estrutura de gene válida (AUG...STOP) foi encontrada no RNA. Nenhuma proteína foi produzida.")
+
+    exibir_resultados_arquivos("".join(previa_dna), caminho_rna.stat().st_size, caminho_rna, caminho_proteina)
+    logging.info(f"Arquivos de RNA e Proteína salvos em '{OUTPUT_PATH}'.")
+
+
+def processar_incremental(dna: str, nome_base_arquivo: str, codigo: int = 1):
+    """
+    Executa o pipeline reaproveitando a tradução da execução anterior.
+
+    Se existirem os arquivos de saída e o estado incremental de uma execução
+    anterior com o mesmo nome base, apenas o trecho que mudou é retraduzido.
+    Caso contrário, a tradução é completa e o estado é salvo para a próxima vez.
+
+    Args:
+        dna (str): A cadeia de DNA (nova versão) a ser processada.
+        nome_base_arquivo (str): O nome base para os arquivos de saída.
+        codigo (int): O número NCBI do código genético usado na tradução.
+
+    Raises:
+        ValueError: Se a cadeia de DNA contiver caracteres inválidos.
+    """
+    caminho_rna = OUTPUT_PATH / f"{nome_base_arquivo}_rna.txt"
+    caminho_proteina = OUTPUT_PATH / f"{nome_base_arquivo}_proteina.txt"
+    caminho_estado = OUTPUT_PATH / f"{nome_base_arquivo}_incremental.json"
+
+    logging.info("Validando, limpando e transcrevendo DNA...")
+    cadeia_dna = normalizar_dna(dna)
+    cadeia_rna = criar_transcritor_dna_rna().transcrever(cadeia_dna)
+    ribossomo = obter_ribossomo(codigo)
+
+    traducao = None
+    if caminho_estado.exists() and caminho_rna.exists() and caminho_proteina.exists():
+        try:
+            traducao = TraducaoIncremental.carregar(
+                caminho_estado, ribossomo,
+                caminho_rna.read_text(encoding='utf-8'), caminho_proteina.read_text(encoding='utf-8')
+            )
+        except (ValueError, KeyError) as e:
+            logging.warning(f"Estado incremental descartado ({e}); traduzindo a cadeia inteira.")
+
+    if traducao is None:
+        logging.info("Traduzindo RNA para Proteína (execução completa)...")
+        traducao = TraducaoIncremental(ribossomo)
+        cadeia_proteina = traducao.traduzir(cadeia_rna)
+    else:
+        logging.info("Retraduzindo apenas o trecho alterado...")
+        cadeia_proteina = traducao.atualizar(cadeia_rna)
+        logging.info(f"{traducao.simbolos_reprocessados} de {len(cadeia_rna)} bases reprocessadas.")
+
+    exibir_resultados(cadeia_dna, len(cadeia_dna), cadeia_rna, len(cadeia_rna), cadeia_proteina)
+
+    logging.info("Salvando arquivos de saída...")
+    escrever_arquivo(caminho_rna, cadeia_rna)
+    escrever_arquivo(caminho_proteina, cadeia_proteina)
+    traducao.salvar(caminho_estado)
+    logging.info(f"Arquivos de RNA, Proteína e estado incremental salvos em '{OUTPUT_PATH}'.")
+
+
+def processar_distribuido(dna: str, nome_base_arquivo: str, codigo: int, enderecos: list[tuple[str, int]], tamanho_fragmento: int):
+    """
+    Executa o pipeline com a tradução distribuída entre trabalhadores remotos.
+
+    Args:
+        dna (str): A cadeia de DNA a ser processada.
+        nome_base_arquivo (str): O nome base para os arquivos de saída.
+        codigo (int): O número NCBI do código genético usado na tradução.
+        enderecos (list[tuple[str, int]]): Os trabalhadores, como pares (host, porta).
+        tamanho_fragmento (int): Bases de RNA por fragmento enviado.
+
+    Raises:
+        ValueError: Se a cadeia de DNA contiver caracteres inválidos.
+        FalhaTrabalhador: Se algum fragmento ficar sem resposta após as novas tentativas.
+    """
+    logging.info("Validando, limpando e transcrevendo DNA...")
+    cadeia_dna = normalizar_dna(dna)
+    cadeia_rna = criar_transcritor_dna_rna().transcrever(cadeia_dna)
+
+    logging.info(f"Traduzindo RNA em {len(enderecos)} trabalhador(es)...")
+    coordenador = CoordenadorTraducao(enderecos, tamanho_fragmento)
+    proteinas = coordenador.traduzir(cadeia_rna, codigo)
+    logging.info(
+        f"{len(proteinas)} gene(s) traduzido(s); {coordenador.fragmentos_reenviados} fragmento(s) reenviado(s), "
+        f"{coordenador.genes_locais} gene(s) de fronteira traduzido(s) localmente."
+    )
+    cadeia_proteina = " ".join(proteinas)
+    exibir_resultados(cadeia_dna, len(cadeia_dna), cadeia_rna, len(cadeia_rna), cadeia_proteina)
+
+    logging.info("Salvando arquivos de saída...")
+    escrever_arquivo(OUTPUT_PATH / f"{nome_base_arquivo}_rna.txt", cadeia_rna)
+    escrever_arquivo(OUTPUT_PATH / f"{nome_base_arquivo}_proteina.txt", cadeia_proteina)
+    logging.info(f"Arquivos de RNA e Proteína salvos em '{OUTPUT_PATH}'.")
+
+
+def processar_varios_codigos(dna: str, nome_base_arquivo: str, codigos: list[int]):
+    """
+    Traduz uma cadeia de DNA sob vários códigos genéticos em uma única varredura.
+
+    Escreve um arquivo de proteínas por código (`<nome>_proteina_codigo<N>.txt`).
+
+    Args:
+        dna (str): A cadeia de DNA a ser processada.
+        nome_base_arquivo (str): O nome base para os arquivos de saída.
+        codigos (list[int]): Os números NCBI dos códigos genéticos.
+
+    Raises:
+        ValueError: Se a cadeia de DNA contiver caracteres inválidos ou um código for desconhecido.
+    """
+    logging.info("Validando, limpando e transcrevendo DNA...")
+    cadeia_dna = normalizar_dna(dna)
+    cadeia_rna = criar_transcritor_dna_rna().transcrever(cadeia_dna)
+
+    logging.info(f"Traduzindo RNA sob os códigos genéticos {', '.join(map(str, codigos))}...")
+    proteinas_por_codigo = traduzir_codigos(cadeia_rna, codigos)
+
+    for codigo, proteinas in proteinas_por_codigo.items():
+        print("\n" + f" CÓDIGO {codigo}: {CODIGOS_GENETICOS[codigo][0].upper()} ".center(LARGURA_LINHA, "#"))
+        exibir_resultados(cadeia_dna, len(cadeia_dna), cadeia_rna, len(cadeia_rna), " ".join(proteinas[:LARGURA_LINHA]))
+        logging.info(f"Código {codigo}: {len(proteinas)} gene(s) traduzido(s).")
+
+    logging.info("Salvando arquivos de saída...")
+    escrever_arquivo(OUTPUT_PATH / f"{nome_base_arquivo}_rna.txt", cadeia_rna)
+    for codigo, proteinas in proteinas_por_codigo.items():
+        escrever_arquivo(OUTPUT_PATH / f"{nome_base_arquivo}_proteina_codigo{codigo}.txt", " ".join(proteinas))
+    logging.info(f"Arquivos de RNA e Proteína salvos em '{OUTPUT_PATH}'.")
+
+
+def exibir_resultados_arquivos(previa_dna: str, tamanho_dna: int, caminho_rna: Path, caminho_proteina: Path):
+    """
+    Exibe a prévia dos resultados lendo apenas o início dos arquivos de saída.
+
+    Args:
+        previa_dna (str): O início do DNA processado.
+        tamanho_dna (int): O número total de bases de DNA.
+        caminho_rna (Path): O arquivo de RNA escrito.
+        caminho_proteina (Path): O arquivo de proteínas escrito.
+    """
+    with caminho_rna.open(encoding='utf-8') as arquivo:
+        previa_rna = arquivo.read(PREVIA_CADEIA + 1)
+    with caminho_proteina.open(encoding='utf-8') as arquivo:
+        previa_proteina = arquivo.read(PREVIA_CADEIA * LARGURA_LINHA)
+        if arquivo.read(1):
+            # Descarta a última proteína, que foi cortada no meio pela leitura parcial.
+            previa_proteina = previa_proteina.rsplit(" ", 1)[0]
+
+    # A transcrição preserva o tamanho: o RNA tem tantas bases quanto o DNA.
+    exibir_resultados(previa_dna, tamanho_dna, previa_rna, tamanho_dna, previa_proteina)
+
+
+def exibir_resultados(cadeia_dna: str, tamanho_dna: int, cadeia_rna: str, tamanho_rna: int, cadeia_proteina: str):
+    """
+    Exibe no terminal uma prévia formatada dos resultados.
+
+    Args:
+        cadeia_dna (str): O DNA processado (ou o seu início).
+        tamanho_dna (int): O número total de bases de DNA.
+        cadeia_rna (str): O RNA transcrito (ou o seu início).
+        tamanho_rna (int): O número total de bases de RNA.
+        cadeia_proteina (str): As proteínas formatadas (ou o seu início).
+    """
     print("\n" + " RESULTADOS ".center(LARGURA_LINHA, "="))
-    previa_dna = f"{cadeia_dna[:PREVIA_CADEIA]}..." if len(cadeia_dna) > PREVIA_CADEIA else cadeia_dna
-    previa_rna = f"{cadeia_rna[:PREVIA_CADEIA]}..." if len(cadeia_rna) > PREVIA_CADEIA else cadeia_rna
+    previa_dna = f"{cadeia_dna[:PREVIA_CADEIA]}..." if tamanho_dna > PREVIA_CADEIA else cadeia_dna
+    previa_rna = f"{cadeia_rna[:PREVIA_CADEIA]}..." if tamanho_rna > PREVIA_CADEIA else cadeia_rna
     proteinas = cadeia_proteina.split(" ")
     previa_proteina = [
         f"{proteina[:PREVIA_CADEIA]}..." if len(proteina) > PREVIA_CADEIA else proteina
@@ -123,16 +538,116 @@ def processar_cadeia(dna: str, nome_base_arquivo: str):
 
     proteina_gerada = '\n    '.join(previa_proteina) if previa_proteina else 'N/A'
     
-    print(f"DNA Processado ({len(cadeia_dna)} bases):\n    {previa_dna}")
-    print(f"RNA Transcrito ({len(cadeia_rna)} bases):\n    {previa_rna}")
+    print(f"DNA Processado ({tamanho_dna} bases):\n    {previa_dna}")
+    print(f"RNA Transcrito ({tamanho_rna} bases):\n    {previa_rna}")
     print(f"Proteína(s) Gerada(s):\n    {proteina_gerada}")
     print("=" * LARGURA_LINHA)
 
-    # Passo 5: Salvando os resultados em arquivos de saída
-    logging.info("Salvando arquivos de saída...")
-    escrever_arquivo(OUTPUT_PATH / f"{nome_base_arquivo}_rna.txt", cadeia_rna)
-    escrever_arquivo(OUTPUT_PATH / f"{nome_base_arquivo}_proteina.txt", cadeia_proteina)
-    logging.info(f"Arquivos de RNA e Proteína salvos em '{OUTPUT_PATH}'.")
+
+def dividir_em_blocos(cadeia: str, tamanho_bloco: int) -> Iterable[str]:
+    """Divide uma cadeia já carregada em blocos de tamanho fixo."""
+    return (cadeia[i:i + tamanho_bloco] for i in range(0, len(cadeia), tamanho_bloco))
+
+
+def conflitos_motor(args: argparse.Namespace) -> list[str]:
+    """
+    As opções que ignorariam o `--motor` escolhido explicitamente.
+
+    Args:
+        args (argparse.Namespace): Os argumentos da linha de comando.
+
+    Returns:
+        list[str]: As opções em conflito (vazia se `--motor` for 'auto' ou puder ser usado).
+    """
+    if args.motor == "auto":
+        return []
+    opcoes = [
+        (f"--formato {args.formato}", args.formato != FORMATOS_PROTEINA[0]),
+        ("vários -c", len(args.codigo) > 1),
+        ("--estatisticas", args.estatisticas),
+        ("--incremental", args.incremental),
+        ("--distribuir", args.distribuir),
+    ]
+    if args.motor != "pipeline":
+        # Estas opções implicam o pipeline.
+        opcoes += [("--pipeline", args.pipeline), ("--retomar", args.retomar),
+                   ("--max-memoria", args.max_memoria), ("--memorizar", args.memorizar)]
+    return [opcao for opcao, ativa in opcoes if ativa]
+
+
+def processar(args: argparse.Namespace, abrir_fonte: Callable[[], Iterable[str]], nome_base_arquivo: str,
+              tamanho_entrada: int = 0, em_arquivo: bool = False):
+    """
+    Encaminha uma entrada ao modo de processamento escolhido na linha de comando.
+
+    Com `--cache`, calcula primeiro a chave da entrada; em caso de acerto os
+    resultados guardados são colocados em `OUTPUT_PATH` sem reprocessamento.
+
+    Args:
+        args (argparse.Namespace): Os argumentos da linha de comando.
+        abrir_fonte (Callable[[], Iterable[str]]): Retorna, a cada chamada, os blocos de DNA desde o início.
+        nome_base_arquivo (str): O nome base para os arquivos de saída.
+        tamanho_entrada (int): O tamanho da entrada (bases, ou bytes do arquivo), para a escolha do motor.
+        em_arquivo (bool): Se a entrada é lida de um arquivo, para a escolha do motor.
+    """
+    if args.estatisticas:
+        for codigo in args.codigo:
+            sufixo = f"_codigo{codigo}" if len(args.codigo) > 1 else ""
+            processar_estatisticas(abrir_fonte(), f"{nome_base_arquivo}_estatisticas{sufixo}.json", codigo)
+        return
+
+    if len(args.codigo) > 1:
+        if args.cache or args.pipeline or args.incremental or args.formato != FORMATOS_PROTEINA[0]:
+            logging.warning("Com vários códigos genéticos, --cache, --pipeline, --incremental e --formato são ignorados.")
+        processar_varios_codigos("".join(abrir_fonte()), nome_base_arquivo, args.codigo)
+        return
+
+    codigo = args.codigo[0]
+    if args.formato != FORMATOS_PROTEINA[0]:
+        if args.cache or args.pipeline or args.incremental:
+            logging.warning(f"Com --formato {args.formato}, --cache, --pipeline e --incremental são ignorados.")
+        processar_cadeia("".join(abrir_fonte()), nome_base_arquivo, codigo, args.formato)
+        return
+
+    caminho_rna = OUTPUT_PATH / f"{nome_base_arquivo}_rna.txt"
+    caminho_proteina = OUTPUT_PATH / f"{nome_base_arquivo}_proteina.txt"
+
+    cache = None
+    if args.cache and args.retomar:
+        logging.warning("Com --retomar, --cache é ignorado.")
+    elif args.cache:
+        cache = CacheResultados(args.cache, args.cache_limite * 1024 * 1024)
+        impressao = impressao_digital_definicoes(criar_transcritor_dna_rna(), obter_ribossomo(codigo), CODIGOS_GENETICOS[codigo][1])
+        chave = calcular_chave(abrir_fonte(), impressao)
+        if cache.materializar(chave, caminho_rna, caminho_proteina):
+            logging.info(f"Resultado encontrado no cache (chave {chave[:12]}...); reprocessamento evitado.")
+            previa_dna = normalizar_dna(next(iter(abrir_fonte()), "")[:PREVIA_CADEIA * 2])
+            exibir_resultados_arquivos(previa_dna, caminho_rna.stat().st_size, caminho_rna, caminho_proteina)
+            return
+        logging.info("Resultado ausente do cache; processando.")
+
+    if args.incremental:
+        processar_incremental("".join(abrir_fonte()), nome_base_arquivo, codigo)
+    elif args.distribuir:
+        processar_distribuido("".join(abrir_fonte()), nome_base_arquivo, codigo, args.distribuir, args.tamanho_bloco)
+    else:
+        motor = "pipeline" if args.pipeline or args.retomar or args.max_memoria or args.memorizar else args.motor
+        if motor == "auto":
+            motor, motivo = escolher_motor(tamanho_entrada, em_arquivo)
+            logging.info(f"Motor escolhido: '{motor}' ({motivo}).")
+            if motor != "pilha":
+                logging.info("Para forçar a tradução de referência pelo autômato de pilha, use --motor pilha.")
+        else:
+            logging.info(f"Motor '{motor}' (escolhido na linha de comando).")
+        if MOTORES[motor].traduzir is None:
+            memoria_maxima = args.max_memoria * 1024 * 1024 if args.max_memoria else None
+            processar_em_blocos(abrir_fonte(), nome_base_arquivo, codigo, args.retomar, memoria_maxima, args.memorizar)
+        else:
+            processar_cadeia("".join(abrir_fonte()), nome_base_arquivo, codigo, motor=motor)
+
+    if cache:
+        cache.guardar(chave, caminho_rna, caminho_proteina)
+        logging.info(f"Resultado guardado no cache '{cache.diretorio}'.")
 
 
 def main() -> None:
@@ -158,6 +673,25 @@ def main() -> None:
         return
 
     args = parser.parse_args()
+    if conflitos := conflitos_motor(args):
+        parser.error(f"--motor {args.motor} não se aplica com {', '.join(conflitos)}, que usa(m) uma tradução própria.")
+
+    if args.serve_stdio:
+        # A saída padrão é do protocolo; o log continua indo para a saída de erro.
+        logging.info(f"Servidor iniciado (enquadramento '{args.serve_stdio}').")
+        ServidorTraducao().servir(sys.stdin.buffer, sys.stdout.buffer, args.serve_stdio)
+        return
+
+    if args.trabalhador:
+        with TrabalhadorTraducao(args.trabalhador) as trabalhador:
+            host, porta = trabalhador.endereco
+            logging.info(f"Trabalhador de tradução escutando em {host}:{porta} (Ctrl+C encerra).")
+            try:
+                trabalhador.serve_forever()
+            except KeyboardInterrupt:
+                logging.info("Trabalhador encerrado.")
+        return
+
     logging.info("Início da Execução")
 
     try:
@@ -167,7 +701,7 @@ def main() -> None:
             dna_gerado = gerar_dna_pseudoaleatorio(args.pseudoaleatorio)
             logging.info(f"Salvando DNA gerado em '{INPUT_PATH}'...")
             escrever_arquivo(INPUT_PATH / "pseudoaleatorio_dna.txt", dna_gerado)
-            processar_cadeia(dna_gerado, "pseudoaleatorio")
+            processar(args, lambda: dividir_em_blocos(dna_gerado, args.tamanho_bloco), "pseudoaleatorio", len(dna_gerado))
 
         # Executa a tarefa de geração de DNA aleatório se solicitada.
         if args.aleatorio is not None:
@@ -175,7 +709,7 @@ def main() -> None:
             dna_gerado = gerar_dna_aleatorio(args.aleatorio)
             logging.info(f"Salvando DNA gerado em '{INPUT_PATH}'...")
             escrever_arquivo(INPUT_PATH / "aleatorio_dna.txt", dna_gerado)
-            processar_cadeia(dna_gerado, "aleatorio")
+            processar(args, lambda: dividir_em_blocos(dna_gerado, args.tamanho_bloco), "aleatorio", len(dna_gerado))
 
         # Executa a tarefa de leitura de arquivo se solicitada.
         if args.ler_arquivo:
@@ -192,11 +726,11 @@ def main() -> None:
                 raise FileNotFoundError(f"Arquivo não encontrado. Verificado em '{caminho_proposto}' e '{caminho_final}'.")
 
             logging.info(f"Lendo arquivo: {caminho_final}")
-            dna_lido = ler_arquivo(caminho_final)
             nome_base = caminho_final.stem
-            processar_cadeia(dna_lido, nome_base)
+            processar(args, lambda: ler_blocos(caminho_final, args.tamanho_bloco), nome_base,
+                      caminho_final.stat().st_size, em_arquivo=True)
 
-    except (ValueError, FileNotFoundError) as e:
+    except (ValueError, FileNotFoundError, FalhaTrabalhador) as e:
         # Captura erros esperados (ex: DNA inválido, arquivo não encontrado) e os loga como erro.
         logging.error(f"{e}")
     except Exception as e:
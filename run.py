@@ -46,6 +46,89 @@ def clean_project(*args):
         else:
             print("Diretório 'data' não encontrado. Pulando limpeza de dados.")
 
+def profile_project(*args):
+    """
+    Perfila o processamento de uma cadeia de DNA e grava os relatórios em 'data/output/'.
+
+    Gera um DNA aleatório do tamanho pedido (ou lê um arquivo) e o processa sob
+    cProfile e tracemalloc, gravando o relatório de pontos quentes, o arquivo de
+    pilhas colapsadas (para flame graphs) e o pico de memória de cada etapa.
+
+    Args:
+        *args: Argumentos adicionais passados pela linha de comando
+            ('-a N' para o tamanho, '-l ARQUIVO' para ler um arquivo).
+    """
+    import argparse
+    import logging
+    from src import criar_transcritor_dna_rna, criar_ribossomo, gerar_dna_aleatorio, ler_arquivo
+    from src.perfil import perfilar
+
+    parser = argparse.ArgumentParser(prog="run.py profile", description="Perfila o processamento de uma cadeia de DNA.")
+    parser.add_argument("-a", "--aleatorio", type=int, default=1_000_000, metavar="N",
+                        help="Gera DNA aleatório com N bases (padrão: 1000000).")
+    parser.add_argument("-l", "--ler-arquivo", type=Path, metavar="ARQUIVO",
+                        help="Perfila o DNA de um arquivo em vez de gerar um.")
+    opcoes = parser.parse_args(args)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if opcoes.ler_arquivo:
+        caminho = opcoes.ler_arquivo if opcoes.ler_arquivo.exists() else Path('./data/input') / opcoes.ler_arquivo
+        dna = ler_arquivo(caminho)
+    else:
+        dna = gerar_dna_aleatorio(opcoes.aleatorio)
+
+    saida = Path('./data/output')
+    saida.mkdir(parents=True, exist_ok=True)
+    memoria = perfilar(dna, saida, criar_transcritor_dna_rna(), criar_ribossomo())
+    print(f"Perfil de {memoria['bases']} bases:")
+    for nome, etapa in memoria["etapas"].items():
+        print(f"  {nome:<13} {etapa['segundos']:8.3f} s   pico {etapa['pico_bytes'] / 2**20:9.1f} MB")
+    print(f"Relatórios gravados em '{saida}' (perfil_hotspots.txt, perfil_pilhas.txt, perfil_memoria.json).")
+
+def calibrate_engines(*args):
+    """
+    Mede a vazão dos motores de tradução em memória (ver `src/motores.py`).
+
+    O limiar de 'processos' derivado das medições é gravado em `data/cache/calibracao.json`
+    e passa a valer na escolha automática (`--motor auto`).
+
+    Args:
+        *args: Tamanhos de entrada, em bases (padrão: 10000 100000 1000000).
+    """
+    import logging
+    from src import calibrar, detectar_recursos
+    from src.motores import ARQUIVO_CALIBRACAO
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    tamanhos = tuple(int(tamanho) for tamanho in args) if args else ()
+    medicoes = calibrar(tamanhos, arquivo=ARQUIVO_CALIBRACAO) if tamanhos else calibrar(arquivo=ARQUIVO_CALIBRACAO)
+    recursos = detectar_recursos()
+    print(f"CPUs: {recursos.cpus}; memória livre: {recursos.memoria_disponivel} bytes")
+    for tamanho, mais_rapido in medicoes["mais_rapido"].items():
+        print(f"  {tamanho:>10} bases: motor mais rápido '{mais_rapido}'")
+    if "limiar_processos" in medicoes:
+        limiar = medicoes["limiar_processos"]
+        print(f"Limiar de 'processos': {'nunca' if limiar is None else f'{limiar} bases'} (gravado em '{ARQUIVO_CALIBRACAO}')")
+
+def measure_scaling(*args):
+    """
+    Mede a vazão do processamento em um pool de threads com autômatos compartilhados.
+
+    Só há ganho real em builds do CPython sem GIL (3.13t em diante).
+
+    Args:
+        *args: Números de threads medidos (padrão: 1 2 4 8).
+    """
+    from src import criar_transcritor_dna_rna, criar_ribossomo, gerar_dna_aleatorio, medir_escalabilidade
+
+    contagens = tuple(int(contagem) for contagem in args) or (1, 2, 4, 8)
+    cadeias = [gerar_dna_aleatorio(100_000) for _ in range(32)]
+    resultado = medir_escalabilidade(cadeias, criar_transcritor_dna_rna(), criar_ribossomo(), contagens)
+    print(f"GIL ativo: {resultado['gil']}; CPUs: {resultado['cpus']}; 32 cadeias de 100000 bases")
+    for threads, medicao in resultado["medicoes"].items():
+        print(f"  {threads:>3} thread(s): {medicao['segundos']:7.3f} s   "
+              f"{medicao['bases_por_segundo'] / 1e6:6.2f} Mbases/s   aceleração {medicao['aceleracao']:.2f}x")
+
 # Mapeia um nome amigável para o comando ou função
 TASKS = {
     "main": ["python", "main.py"],
@@ -56,6 +139,9 @@ TASKS = {
     "demo_dna_a": ["python", "-m", "tests.dna_aleatorio"],
     "demo_ribossomo": ["python", "-m", "tests.ribossomo"],
     "clean": clean_project,
+    "profile": profile_project,
+    "calibrar": calibrate_engines,
+    "escalabilidade": measure_scaling,
 }
 
 if __name__ == "__main__":
@@ -66,6 +152,7 @@ if __name__ == "__main__":
         print("  python run.py main -a 100")
         print("  python run.py test")
         print("  python run.py clean --all")
+        print("  python run.py profile -a 1000000")
         sys.exit(1)
 
     task_name = sys.argv[1]
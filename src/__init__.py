@@ -6,9 +6,21 @@ disponibilizando as principais funções e classes para serem importadas
 em outras partes do projeto.
 """
 
-from .automata import TransdutorFinito, Automato_Pilha
-from .utils import gerar_dna_aleatorio, gerar_dna_pseudoaleatorio, ler_arquivo, escrever_arquivo, formatar_proteina
-from .tabela_codons import TABELA_CODONS
+from .automata import TransdutorFinito, Automato_Pilha, ExecucaoPilha, MemoriaBlocos, Rastreador, PilhaLimitada, VisaoTranscricao, compilar_automato, concatenar_lote, separar_lote
+from .utils import gerar_dna_aleatorio, gerar_dna_pseudoaleatorio, ler_arquivo, ler_blocos, escrever_arquivo, formatar_proteina, formatar_proteina_uma_letra, separar_proteinas, normalizar_dna
+from .tabela_codons import TABELA_CODONS, CODIGOS_GENETICOS, CODIGO_UMA_LETRA
+from .pipeline import processar_em_pipeline, RelatorioPipeline, carregar_ponto_controle
+from .cache import CacheResultados, calcular_chave, impressao_digital_definicoes
+from .incremental import TraducaoIncremental, calcular_diferenca
+from .codigos_geneticos import obter_ribossomo, compilar_tabela, compilar_tabela_indices, traduzir_codigos, traduzir_direto, traduzir_uma_letra
+from .formato_binario import escrever_proteinas_binario, ler_proteinas_binario
+from .estatisticas import EstatisticasTraducao, calcular_estatisticas
+from .servidor import ServidorTraducao
+from .paralelo import processar_em_threads, medir_escalabilidade, gil_ativo
+from .distribuido import TrabalhadorTraducao, CoordenadorTraducao, FalhaTrabalhador, traduzir_fragmento, interpretar_endereco
+from .processos import processar_em_processos, traduzir_em_processos, tabela_transcricao
+from .motores import MOTORES, Motor, Recursos, registrar_motor, detectar_recursos, escolher_motor, calibrar, carregar_calibracao
+
 
 def criar_transcritor_dna_rna() -> TransdutorFinito:
     """
@@ -41,11 +53,15 @@ def criar_transcritor_dna_rna() -> TransdutorFinito:
     return TransdutorFinito(Q, Σ, Γ, δ, λ, q0)
 
 
-def criar_ribossomo() -> Automato_Pilha:
+def criar_ribossomo(tabela_codons: dict[str, str] = TABELA_CODONS) -> Automato_Pilha:
     """
     Cria e retorna uma instância do Automato_Pilha configurado para simular
     um ribossomo, traduzindo uma fita de RNA em proteínas.
 
+    Por padrão usa o código genético padrão; outras tabelas (ex: as de
+    `CODIGOS_GENETICOS`) podem ser informadas em `tabela_codons`. Para obter
+    instâncias já montadas e reaproveitadas, use `obter_ribossomo`.
+
     O autômato implementa uma estratégia Z0-cêntrica, onde o símbolo 'Z0' é
     mantido no topo da pilha na maior parte do tempo para padronizar as transições.
 
@@ -55,10 +71,13 @@ def criar_ribossomo() -> Automato_Pilha:
     3. Rollback: Limpa a pilha em caso de um gene incompleto no final da cadeia.
     4. Finalização: Move o autômato para o estado de aceitação.
 
+    Args:
+        tabela_codons (dict[str, str]): Mapeamento de cada códon para o seu aminoácido ('Stop' nos de parada).
+
     Returns:
         Automato_Pilha: Uma instância do autômato pronta para uso.
     """
-    aminoacidos = set(TABELA_CODONS.values())
+    aminoacidos = set(tabela_codons.values())
     Q = {'q_inicial', 'q_achouA', 'q_achouAU', 'q_traduz', 'q_baseXA', 'q_baseXU', 'q_baseXC', 'q_baseXG', 'q_rollback', 'q_final'}
     Σ = {'A', 'C', 'G', 'U', None} # Alfabeto de entrada, incluindo ε (None)
     q0 = 'q_inicial'
@@ -102,7 +121,7 @@ def criar_ribossomo() -> Automato_Pilha:
             δ[('q_traduz', base2, base1)] = (f'q_baseX{base2}', [base1])
             for base3 in bases:
                 # Lê a 3ª base: combina (topo=base1, estado=base2, entrada=base3) para formar o códon.
-                aminoacido = TABELA_CODONS[f'{base1}{base2}{base3}']
+                aminoacido = tabela_codons[f'{base1}{base2}{base3}']
                 # Se for um códon de parada, empilha 'Stop' e 'Z0', e volta a buscar.
                 if aminoacido == 'Stop':
                     δ[(f'q_baseX{base2}', base3, base1)] = ('q_inicial', ['Stop', Z0])
@@ -12,4 +12,10 @@ from src.automata import TransdutorFinito
 """
 
 from .transdutor_finito import TransdutorFinito
-from .automato_pilha import Automato_Pilha
+from .automato_pilha import Automato_Pilha, ExecucaoPilha
+from .lote import concatenar_lote, separar_lote
+from .rastreamento import Rastreador
+from .visao import VisaoTranscricao
+from .geracao import compilar_automato
+from .pilha_limitada import PilhaLimitada
+from .memorizacao import MemoriaBlocos
@@ -1,3 +1,21 @@
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+from array import array
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterator, Mapping, Sequence
+
+from .busca import RegiaoBusca, analisar_regioes
+from .lote import preparar_lote
+from .rastreamento import Rastreador
+
+if TYPE_CHECKING:
+    from .memorizacao import MemoriaBlocos
+    from .pilha_limitada import PilhaLimitada
+
+
 class Automato_Pilha:
     """
     Representa um Autômato de Pilha (AP), uma máquina de estados finitos
@@ -5,6 +23,11 @@ class Automato_Pilha:
 
     Esta classe implementa a lógica para validar a definição do autômato e
     simular seu comportamento em uma cadeia de entrada.
+
+    A definição é congelada na construção (conjuntos viram `frozenset`, a função de
+    transição vira `MappingProxyType` e as listas a empilhar, tuplas). A pilha e o
+    estado de cada execução são locais a ela (ou a uma `ExecucaoPilha`), por isso uma
+    mesma instância pode ser usada por várias threads ao mesmo tempo.
     """
     def __init__(self,
         Q: set[str],                                            # conjunto de estados
@@ -59,13 +82,200 @@ class Automato_Pilha:
             if not set(simbolos_pilha).issubset(Γ):
                 raise TypeError(f"A transição {trinca} -> {dupla}. {simbolos_pilha} não pertence(m) ao alfabeto da pilha")
 
-        self.estados = Q
-        self.alfabeto_entrada = Σ
-        self.alfabeto_pilha = Γ
-        self.transicoes = δ
+        # Cópias imutáveis: a definição não muda depois de validada.
+        self.estados = frozenset(Q)
+        self.alfabeto_entrada = frozenset(Σ)
+        self.alfabeto_pilha = frozenset(Γ)
+        self.transicoes = MappingProxyType({
+            trinca: (estado_destino, tuple(simbolos_pilha)) for trinca, (estado_destino, simbolos_pilha) in δ.items()
+        })
         self.estado_inicial = q0
         self.estado_inicial_pilha = Z0
-        self.estados_finais = F
+        self.estados_finais = frozenset(F)
+        self._saltos = None     # Regiões de busca, analisadas no primeiro uso (ver `regioes_busca`).
+        self._equivalente = None    # (PilhaLimitada | None,), compilado no primeiro uso (ver `transdutor_equivalente`).
+
+    def impressao_digital(self) -> str:
+        """
+        Calcula um hash SHA-256 da definição completa do autômato.
+
+        Duas instâncias com a mesma definição (Q, Σ, Γ, δ, q0, Z0, F) têm a mesma
+        impressão digital, independentemente da ordem de inserção nos dicionários.
+
+        Returns:
+            O hash em hexadecimal.
+        """
+        definicao = (
+            sorted(self.estados), sorted(map(repr, self.alfabeto_entrada)),
+            sorted(map(repr, self.alfabeto_pilha)),
+            sorted((repr(trinca), repr((destino, list(simbolos)))) for trinca, (destino, simbolos) in self.transicoes.items()),
+            self.estado_inicial, self.estado_inicial_pilha, sorted(self.estados_finais),
+        )
+        return hashlib.sha256(repr(definicao).encode('utf-8')).hexdigest()
+
+    def _topos_possiveis(self) -> dict[str, set[str | None]]:
+        """
+        Estima, para cada estado alcançável, os símbolos que podem estar no topo da pilha.
+
+        É uma sobre-aproximação: após um desempilhamento puro (sem empilhar nada),
+        assume-se que qualquer símbolo já empilhado (ou a pilha vazia, None) pode
+        ter ficado exposto. Estados ausentes do resultado são inalcançáveis.
+
+        Returns:
+            Um dicionário estado -> conjunto de topos possíveis.
+        """
+        topos: dict[str, set[str | None]] = {self.estado_inicial: {self.estado_inicial_pilha}}
+        empilhados = {self.estado_inicial_pilha}
+        expostos = set()    # Estados alcançados por desempilhamento puro.
+        por_origem: dict[str, list] = {}
+        for (origem, simbolo_entrada, topo), (destino, simbolos) in self.transicoes.items():
+            por_origem.setdefault(origem, []).append((topo, destino, simbolos))
+
+        mudou = True
+        while mudou:
+            mudou = False
+            for origem in list(topos):
+                for topo, destino, simbolos in por_origem.get(origem, ()):
+                    if topo not in topos[origem]:
+                        continue
+                    if simbolos:
+                        novos = {simbolos[-1]}
+                        novos_empilhados = set(simbolos) - empilhados
+                        if novos_empilhados:
+                            empilhados |= novos_empilhados
+                            mudou = True
+                    else:
+                        expostos.add(destino)
+                        novos = set()
+                    conhecidos = topos.setdefault(destino, set())
+                    if not novos <= conhecidos:
+                        conhecidos |= novos
+                        mudou = True
+            for estado in expostos:
+                if not empilhados | {None} <= topos[estado]:
+                    topos[estado] |= empilhados | {None}
+                    mudou = True
+        return topos
+
+    def minimizar(self) -> tuple["Automato_Pilha", dict[str, int]]:
+        """
+        Constrói um autômato equivalente com menos estados e transições.
+
+        Três reduções são aplicadas, todas preservando o comportamento de
+        `validar` e `transcrever_pilha` para qualquer cadeia:
+        1. Remoção de estados inalcançáveis a partir de q0.
+        2. Remoção de transições mortas, cujo topo de pilha nunca ocorre no estado de origem.
+        3. Fusão de estados equivalentes (bissimilares): mesma aceitação e, para cada
+           (entrada, topo), a mesma pilha empilhada rumo a estados equivalentes.
+
+        Returns:
+            O autômato reduzido e um relatório com 'estados_inalcancaveis',
+            'estados_equivalentes', 'estados_removidos', 'transicoes_mortas'
+            e 'transicoes_removidas'.
+        """
+        # 1 e 2. Estados alcançáveis e transições que podem de fato disparar.
+        topos = self._topos_possiveis()
+        vivas = {
+            trinca: dupla for trinca, dupla in self.transicoes.items()
+            if trinca[0] in topos and trinca[2] in topos[trinca[0]]
+        }
+        alcancaveis = set(topos)
+
+        # 3. Refinamento de partições, começando por finais x não finais.
+        saidas: dict[str, list] = {estado: [] for estado in alcancaveis}
+        for (origem, simbolo_entrada, topo), (destino, simbolos) in vivas.items():
+            saidas[origem].append((repr(simbolo_entrada), repr(topo), tuple(simbolos), destino))
+
+        def numerar(assinaturas: dict) -> dict[str, int]:
+            numeros = {}
+            return {estado: numeros.setdefault(assinatura, len(numeros)) for estado, assinatura in assinaturas.items()}
+
+        bloco = numerar({estado: estado in self.estados_finais for estado in alcancaveis})
+        while True:
+            refinado = numerar({
+                estado: (bloco[estado], tuple(sorted(
+                    (entrada, topo, simbolos, bloco[destino]) for entrada, topo, simbolos, destino in saidas[estado]
+                )))
+                for estado in alcancaveis
+            })
+            estavel = len(set(refinado.values())) == len(set(bloco.values()))
+            bloco = refinado
+            if estavel:
+                break
+
+        representante = {}
+        for estado in sorted(alcancaveis, key=lambda e: (e != self.estado_inicial, e)):
+            representante.setdefault(bloco[estado], estado)
+        mapa = {estado: representante[bloco[estado]] for estado in alcancaveis}
+
+        δ = {
+            trinca: (mapa[destino], simbolos)
+            for trinca, (destino, simbolos) in vivas.items()
+            if mapa[trinca[0]] == trinca[0]
+        }
+        Q = set(mapa.values())
+        reduzido = Automato_Pilha(
+            Q, self.alfabeto_entrada, self.alfabeto_pilha, δ,
+            self.estado_inicial, self.estado_inicial_pilha, self.estados_finais & Q
+        )
+        relatorio = {
+            "estados_inalcancaveis": len(self.estados) - len(alcancaveis),
+            "estados_equivalentes": len(alcancaveis) - len(Q),
+            "estados_removidos": len(self.estados) - len(Q),
+            "transicoes_mortas": len(self.transicoes) - len(vivas),
+            "transicoes_removidas": len(self.transicoes) - len(δ),
+        }
+        return reduzido, relatorio
+
+    def regioes_busca(self) -> dict[tuple[str, str | None], RegiaoBusca]:
+        """
+        Retorna as regiões de busca sobre as quais `transcrever_pilha` salta (ver `src.automata.busca`).
+
+        Returns:
+            Um dicionário (estado, topo) -> RegiaoBusca, com as configurações de entrada
+            de cada região; vazio se nenhuma região compensar.
+        """
+        return self._preparar_saltos()[1]
+
+    def transdutor_equivalente(self) -> "PilhaLimitada | None":
+        """
+        Compila (uma única vez) o autômato em um transdutor finito, se o trecho da
+        pilha lido durante a entrada for limitado (ver `src.automata.pilha_limitada`).
+
+        Returns:
+            Uma `PilhaLimitada`, cujo `transcrever_pilha` tem o mesmo resultado que o
+            deste autômato, ou None se a pilha não puder ser limitada.
+        """
+        if self._equivalente is None:
+            # Importação local: o módulo compila para código gerado, que importa este módulo.
+            from .pilha_limitada import compilar_pilha_limitada
+            self._equivalente = (compilar_pilha_limitada(self),)
+        return self._equivalente[0]
+
+    def _preparar_saltos(self) -> tuple[Mapping, dict, "re.Pattern | None"]:
+        """
+        Analisa (uma única vez) as regiões de busca do autômato.
+
+        Returns:
+            A função de transição estendida, trinca -> (destino, empilhados, salto), em que
+            `salto` é o `RegiaoBusca.saltar` da configuração de destino, ou None; as regiões;
+            e a expressão que localiza símbolos fora do alfabeto (None, se não há regiões).
+        """
+        if self._saltos is None:
+            entradas = {(destino, empilhados[-1]) for destino, empilhados in self.transicoes.values() if empilhados}
+            entradas.add((self.estado_inicial, self.estado_inicial_pilha))
+            regioes = analisar_regioes(self.transicoes, self.alfabeto_entrada, entradas)
+            estendidas = {}
+            for (origem, simbolo, topo), (destino, empilhados) in self.transicoes.items():
+                regiao = regioes.get((destino, empilhados[-1])) if empilhados else None
+                # Transições de dentro da própria região não saltam de novo.
+                if regiao is not None and topo == regiao.topo and origem in regiao.estados:
+                    regiao = None
+                estendidas[(origem, simbolo, topo)] = (destino, empilhados, regiao.saltar if regiao else None)
+            simbolos = "".join(sorted(simbolo for simbolo in self.alfabeto_entrada if simbolo is not None))
+            invalido = re.compile(f"[^{re.escape(simbolos)}]") if regioes else None
+            self._saltos = (MappingProxyType(estendidas), regioes, invalido)
+        return self._saltos
 
     def _transitar(self, trinca: tuple[str, str, str], pilha: list[str]) -> str:
         """
@@ -138,7 +348,108 @@ class Automato_Pilha:
         # A cadeia é válida se o autômato parou em um estado final.
         return estado_atual in self.estados_finais
 
-    def transcrever_pilha(self, cadeia: str) -> list[str]:
+    def _consumir(self, cadeia: str, estado_atual: str, pilha: list[str], inicio: int = 0, fim: int | None = None) -> str:
+        """
+        Consome o trecho `cadeia[inicio:fim]` a partir de uma configuração qualquer.
+
+        É o laço principal de `transcrever_pilha`, separado para que a mesma
+        execução possa ser retomada bloco a bloco (ver `ExecucaoPilha`). Ao entrar
+        em uma região de busca, salta direto para a próxima saída dela (ver
+        `src.automata.busca`); o laço rastreado é a referência passo a passo.
+
+        Args:
+            cadeia: A string de entrada.
+            estado_atual: O estado em que a execução se encontra.
+            pilha: A pilha atual do autômato, que será modificada.
+            inicio: Índice do primeiro símbolo a consumir.
+            fim: Índice final (exclusivo); por padrão, o fim da cadeia.
+
+        Returns:
+            O estado do autômato após consumir o trecho.
+
+        Raises:
+            ValueError: Se algum símbolo não pertencer ao alfabeto de entrada.
+        """
+        # Referências locais evitam buscas de atributo a cada símbolo.
+        transicoes, regioes, invalido = self._preparar_saltos()
+        alfabeto_entrada = self.alfabeto_entrada
+        empilhar = pilha.extend
+        desempilhar = pilha.pop
+
+        indice_cadeia = inicio
+        fim = len(cadeia) if fim is None else fim
+        # Os saltos sobre regiões de busca não passam do primeiro símbolo inválido:
+        # a partir dele, o laço passo a passo levanta o mesmo erro de sempre.
+        limite = fim
+        if invalido is not None:
+            encontrado = invalido.search(cadeia, indice_cadeia, fim)
+            if encontrado:
+                limite = encontrado.start()
+            regiao = regioes.get((estado_atual, pilha[-1])) if pilha else None
+            if regiao is not None:
+                indice_cadeia, estado_atual = regiao.saltar(cadeia, indice_cadeia, limite, estado_atual)
+
+        while indice_cadeia < fim:
+            simbolo_entrada = cadeia[indice_cadeia]
+            if simbolo_entrada not in alfabeto_entrada:
+                raise ValueError(f"Símbolo '{simbolo_entrada}' na cadeia de entrada não pertence ao alfabeto de entrada Σ.")
+            
+            # Estratégia de leitura destrutiva.
+            topo_pilha = desempilhar() if pilha else None
+
+            trinca_com_entrada = (estado_atual, simbolo_entrada, topo_pilha)
+            if trinca_com_entrada in transicoes:
+                estado_atual, novos_simbolos_pilha, saltar = transicoes[trinca_com_entrada]
+                empilhar(novos_simbolos_pilha)
+                indice_cadeia += 1
+                if saltar is not None:
+                    # Entrou em uma região de busca: vai direto à próxima saída dela.
+                    indice_cadeia, estado_atual = saltar(cadeia, indice_cadeia, limite, estado_atual)
+                continue
+
+            trinca_sem_entrada = (estado_atual, None, topo_pilha)
+            if trinca_sem_entrada in transicoes:
+                estado_atual, novos_simbolos_pilha, saltar = transicoes[trinca_sem_entrada]
+                empilhar(novos_simbolos_pilha)
+                if saltar is not None:
+                    indice_cadeia, estado_atual = saltar(cadeia, indice_cadeia, limite, estado_atual)
+            
+            else:
+                # Se não há transição, restaura a pilha e ignora o símbolo de entrada.
+                pilha.append(topo_pilha) if topo_pilha else None
+                indice_cadeia += 1
+
+        return estado_atual
+
+    def _finalizar(self, estado_atual: str, pilha: list[str]) -> str:
+        """
+        Processa as transições ε restantes após o fim da entrada (ex: rollback/limpeza).
+
+        Args:
+            estado_atual: O estado em que a entrada terminou.
+            pilha: A pilha atual do autômato, que será modificada.
+
+        Returns:
+            O estado final alcançado.
+
+        Raises:
+            RuntimeError: Se o autômato travar em um estado não final sem
+                          mais transições em vazio para processar.
+        """
+        while estado_atual not in self.estados_finais:
+            topo_pilha = pilha.pop() if pilha else None
+            trinca_sem_entrada = (estado_atual, None, topo_pilha)
+            
+            if trinca_sem_entrada in self.transicoes:
+                estado_atual = self._transitar(trinca_sem_entrada, pilha)
+            else:
+                # Restaura a pilha antes de levantar o erro.
+                pilha.append(topo_pilha) if topo_pilha else None
+                raise RuntimeError(f"Autômato travado no estado '{estado_atual}' sem mais transições ε para chegar a um estado final.")
+
+        return estado_atual
+
+    def transcrever_pilha(self, cadeia: str, rastreador: Rastreador | None = None) -> list[str]:
         """
         Simula o autômato como um transdutor/parser, retornando o estado final da pilha.
 
@@ -148,51 +459,360 @@ class Automato_Pilha:
 
         Args:
             cadeia: A string de entrada a ser processada.
+            rastreador: Ganchos e histórico para depuração (ver `Rastreador`).
+                Sem ele, a execução não tem custo extra algum.
 
         Returns:
             Uma lista de strings representando o conteúdo final da pilha.
         
         Raises:
+            ValueError: Se algum símbolo não pertencer ao alfabeto de entrada.
             RuntimeError: Se o autômato travar em um estado não final sem
                           mais transições em vazio para processar.
         """
-        estado_atual = self.estado_inicial
         pilha = [self.estado_inicial_pilha]
-        
+        if rastreador is not None:
+            # Laço separado: sem rastreador, o laço principal não paga nenhum teste extra.
+            estado_atual = self._consumir_rastreado(cadeia, self.estado_inicial, pilha, rastreador)
+            self._finalizar_rastreado(estado_atual, pilha, rastreador)
+            return pilha
+        estado_atual = self._consumir(cadeia, self.estado_inicial, pilha)
+        self._finalizar(estado_atual, pilha)
+        return pilha
+
+    def _consumir_rastreado(self, cadeia: str, estado_atual: str, pilha: list[str], rastreador: Rastreador) -> str:
+        """Versão de `_consumir` que notifica o rastreador a cada passo."""
+        transicoes = self.transicoes
+        alfabeto_entrada = self.alfabeto_entrada
+
         indice_cadeia = 0
         while indice_cadeia < len(cadeia):
             simbolo_entrada = cadeia[indice_cadeia]
-            if simbolo_entrada not in self.alfabeto_entrada:
+            if simbolo_entrada not in alfabeto_entrada:
                 raise ValueError(f"Símbolo '{simbolo_entrada}' na cadeia de entrada não pertence ao alfabeto de entrada Σ.")
-            
-            # Estratégia de leitura destrutiva.
+
             topo_pilha = pilha.pop() if pilha else None
 
             trinca_com_entrada = (estado_atual, simbolo_entrada, topo_pilha)
-            trinca_sem_entrada = (estado_atual, None, topo_pilha)
-
-            if trinca_com_entrada in self.transicoes:
-                estado_atual = self._transitar(trinca_com_entrada, pilha)
+            if trinca_com_entrada in transicoes:
+                destino, novos_simbolos_pilha = transicoes[trinca_com_entrada]
+                pilha.extend(novos_simbolos_pilha)
+                rastreador.transicao(indice_cadeia, estado_atual, simbolo_entrada, topo_pilha, destino, novos_simbolos_pilha, pilha)
+                estado_atual = destino
                 indice_cadeia += 1
-            
-            elif trinca_sem_entrada in self.transicoes:
-                estado_atual = self._transitar(trinca_sem_entrada, pilha)
-            
+                continue
+
+            trinca_sem_entrada = (estado_atual, None, topo_pilha)
+            if trinca_sem_entrada in transicoes:
+                destino, novos_simbolos_pilha = transicoes[trinca_sem_entrada]
+                pilha.extend(novos_simbolos_pilha)
+                rastreador.transicao(indice_cadeia, estado_atual, None, topo_pilha, destino, novos_simbolos_pilha, pilha)
+                estado_atual = destino
             else:
-                # Se não há transição, restaura a pilha e ignora o símbolo de entrada.
                 pilha.append(topo_pilha) if topo_pilha else None
+                rastreador.rejeicao(indice_cadeia, estado_atual, simbolo_entrada, topo_pilha)
                 indice_cadeia += 1
 
-        # Após consumir a cadeia, processa transições ε (ex: rollback/limpeza).
+        return estado_atual
+
+    def _finalizar_rastreado(self, estado_atual: str, pilha: list[str], rastreador: Rastreador) -> str:
+        """Versão de `_finalizar` que notifica o rastreador a cada transição ε."""
         while estado_atual not in self.estados_finais:
             topo_pilha = pilha.pop() if pilha else None
             trinca_sem_entrada = (estado_atual, None, topo_pilha)
-            
-            if trinca_sem_entrada in self.transicoes:
-                estado_atual = self._transitar(trinca_sem_entrada, pilha)
-            else:
-                # Restaura a pilha antes de levantar o erro.
+            if trinca_sem_entrada not in self.transicoes:
                 pilha.append(topo_pilha) if topo_pilha else None
                 raise RuntimeError(f"Autômato travado no estado '{estado_atual}' sem mais transições ε para chegar a um estado final.")
-            
-        return pilha
\ No newline at end of file
+            destino, novos_simbolos_pilha = self.transicoes[trinca_sem_entrada]
+            pilha.extend(novos_simbolos_pilha)
+            rastreador.transicao(None, estado_atual, None, topo_pilha, destino, novos_simbolos_pilha, pilha)
+            estado_atual = destino
+
+        return estado_atual
+
+    def transcrever_pilha_lote(self, entrada: str | Sequence[str], deslocamentos: Sequence[int] | None = None) -> tuple[list[str], array]:
+        """
+        Executa `transcrever_pilha` sobre várias sequências independentes em uma única chamada.
+
+        Cada sequência começa na configuração inicial (q0, [Z0]) e é lida
+        diretamente do buffer, sem fatiá-lo. A entrada é uma lista de sequências
+        ou um buffer concatenado com os seus deslocamentos (ver `src.automata.lote`).
+
+        Args:
+            entrada (str | Sequence[str]): As sequências, ou o buffer concatenado.
+            deslocamentos (Sequence[int] | None): Os N + 1 deslocamentos do buffer.
+
+        Returns:
+            tuple[list[str], array]: As pilhas finais concatenadas e os seus N + 1
+            deslocamentos: a pilha da sequência i é `simbolos[d[i]:d[i + 1]]`.
+
+        Raises:
+            ValueError: Nas mesmas condições de `transcrever_pilha`, ou se os deslocamentos forem inválidos.
+            RuntimeError: Nas mesmas condições de `transcrever_pilha`.
+        """
+        buffer, deslocamentos = preparar_lote(entrada, deslocamentos)
+        consumir = self._consumir
+        finalizar = self._finalizar
+        estado_inicial = self.estado_inicial
+        estado_inicial_pilha = self.estado_inicial_pilha
+
+        simbolos: list[str] = []
+        deslocamentos_saida = array('q', [0])
+        for i in range(len(deslocamentos) - 1):
+            pilha = [estado_inicial_pilha]
+            finalizar(consumir(buffer, estado_inicial, pilha, deslocamentos[i], deslocamentos[i + 1]), pilha)
+            simbolos.extend(pilha)
+            deslocamentos_saida.append(len(simbolos))
+
+        return simbolos, deslocamentos_saida
+
+
+class ExecucaoPilha:
+    """
+    Contexto de uma execução do `Automato_Pilha` alimentada em blocos.
+
+    Guarda a configuração corrente (estado e pilha) entre chamadas de `consumir`,
+    de modo que uma cadeia grande possa ser processada aos pedaços com resultado
+    idêntico ao de `transcrever_pilha` sobre a cadeia inteira.
+
+    Se um `marcador` for informado, tudo o que está na pilha até a última
+    ocorrência dele é considerado definitivo e pode ser retirado com `drenar`.
+    Isso vale para autômatos que nunca desempilham abaixo do marcador durante a
+    leitura; no ribossomo o marcador é 'Stop', que fecha cada gene.
+
+    Com `limite_pilha`, a pilha em memória não passa (muito) desse número de
+    símbolos: o excedente do fundo, que a leitura nunca alcança (ver
+    `Automato_Pilha.transdutor_equivalente`), é derramado em um arquivo
+    temporário. No ribossomo, é o gene ainda aberto: `drenar_partes` o devolve
+    aos pedaços quando o gene se fecha, e o rollback final o descarta sem lê-lo.
+
+    Com `memoria`, os blocos são lidos por uma `MemoriaBlocos` do mesmo
+    autômato, que reaplica o efeito dos trechos repetidos da entrada.
+    """
+    def __init__(self, automato: Automato_Pilha, marcador: str | None = None, limite_pilha: int | None = None,
+                 memoria: "MemoriaBlocos | None" = None):
+        """
+        Args:
+            automato: O autômato a ser executado.
+            marcador: Símbolo da pilha que delimita o trecho definitivo (opcional).
+            limite_pilha: Quantos símbolos a pilha mantém em memória (opcional).
+            memoria: A memorização por blocos usada na leitura (opcional).
+
+        Raises:
+            ValueError: Se `limite_pilha` for informado e o trecho da pilha lido
+                        durante a entrada não for limitado.
+        """
+        self.automato = automato
+        self.marcador = marcador
+        self.limite_pilha = limite_pilha
+        self.memoria = memoria
+        self.estado = automato.estado_inicial
+        self.pilha = [automato.estado_inicial_pilha]
+        self.simbolos_consumidos = 0
+        # Símbolos do topo que ficam sempre em memória, e o derramado: (posição, quantidade) de cada trecho no arquivo.
+        self._reserva = 0
+        self._arquivo = None
+        self._trechos: list[tuple[int, int]] = []
+        self._simbolos_derramados: set[str] = set()
+        # Altura do fundo da pilha já percorrido sem encontrar o marcador. Só cresce se o
+        # controle for limitado: abaixo dele a leitura nunca desempilha, então o fundo não muda.
+        self._sem_marcador = 0
+        self._limitada = False
+        if limite_pilha is not None or marcador is not None:
+            equivalente = automato.transdutor_equivalente()
+            if equivalente is None and limite_pilha is not None:
+                raise ValueError("O trecho da pilha lido pelo autômato não é limitado: a pilha não pode ser derramada em disco.")
+            if equivalente is not None:
+                self._reserva = equivalente.altura_controle
+                self._limitada = True
+
+    def consumir(self, trecho: str, inicio: int = 0, fim: int | None = None) -> None:
+        """
+        Consome um bloco da entrada, continuando da configuração anterior.
+
+        Args:
+            trecho: O bloco de entrada (ou uma cadeia maior que o contém).
+            inicio: Índice do primeiro símbolo do bloco em `trecho`.
+            fim: Índice final (exclusivo) do bloco; por padrão, o fim de `trecho`.
+
+        Raises:
+            ValueError: Se algum símbolo não pertencer ao alfabeto de entrada.
+        """
+        fim = len(trecho) if fim is None else fim
+        if self.memoria is None:
+            self.estado = self.automato._consumir(trecho, self.estado, self.pilha, inicio, fim)
+        else:
+            self.estado = self.memoria.consumir(trecho, self.estado, self.pilha, inicio, fim, self.simbolos_consumidos)
+        self.simbolos_consumidos += fim - inicio
+        if self.marcador is None:
+            # Com marcador, o excedente só é derramado depois de `drenar`: o disco nunca guarda um marcador.
+            self._derramar_excedente()
+
+    @property
+    def derramados(self) -> int:
+        """Quantos símbolos do fundo da pilha estão no arquivo temporário."""
+        return sum(quantidade for _, quantidade in self._trechos)
+
+    @property
+    def configuracao(self) -> tuple[str, tuple[str, ...]]:
+        """A configuração corrente (estado, pilha) em forma imutável e comparável."""
+        return self.estado, tuple(self.pilha)
+
+    def restaurar(self, estado: str, pilha: tuple[str, ...] | list[str]) -> None:
+        """Coloca a execução em uma configuração salva anteriormente."""
+        self.estado = estado
+        self.pilha = list(pilha)
+        self._sem_marcador = 0
+        derramado = self._retirar_derramado()
+        if derramado is not None:
+            derramado[0].close()
+
+    def drenar(self) -> list[str]:
+        """
+        Retira da base da pilha o trecho definitivo (até o último marcador, inclusive).
+
+        Returns:
+            Os símbolos retirados, na ordem em que foram empilhados.
+        """
+        definitivos = []
+        for parte in self.drenar_partes():
+            definitivos += parte
+        return definitivos
+
+    def drenar_partes(self) -> Iterator[list[str]]:
+        """
+        Como `drenar`, mas devolve o trecho definitivo aos pedaços: primeiro os
+        trechos derramados em disco, lidos um de cada vez, e depois o que estava
+        em memória. A pilha é atualizada na chamada, antes da iteração.
+
+        Returns:
+            Um iterador sobre listas de símbolos, na ordem em que foram empilhados.
+        """
+        definitivos = self._cortar_definitivos()
+        if not definitivos:
+            self._derramar_excedente()
+            return iter(())
+        # O marcador está acima do disco: tudo o que foi derramado também é definitivo.
+        derramado = self._retirar_derramado()
+        self._derramar_excedente()
+        return self._partes(derramado, definitivos)
+
+    def _partes(self, derramado: tuple | None, definitivos: list[str]) -> Iterator[list[str]]:
+        if derramado is not None:
+            arquivo, trechos = derramado
+            with arquivo:
+                for posicao, _ in trechos:
+                    arquivo.seek(posicao)
+                    yield pickle.load(arquivo)
+        yield definitivos
+
+    def _cortar_definitivos(self) -> list[str]:
+        """Retira da pilha em memória o trecho até o último marcador (vazio se não houver)."""
+        pilha = self.pilha
+        if self.marcador is None:
+            return []
+        # Procura o último marcador em janelas cada vez maiores a partir do topo,
+        # com `list.index` (em C), sem voltar ao fundo já percorrido: um gene longo
+        # em aberto é percorrido uma única vez, e não a cada `drenar`.
+        base = self._sem_marcador if self._sem_marcador <= len(pilha) else 0
+        corte, fim, largura = 0, len(pilha), 64
+        while fim > base and not corte:
+            inicio = max(base, fim - largura)
+            try:
+                posicao = pilha.index(self.marcador, inicio, fim)
+            except ValueError:
+                fim, largura = inicio, largura * 2
+                continue
+            while True:
+                corte = posicao + 1
+                try:
+                    posicao = pilha.index(self.marcador, corte, fim)
+                except ValueError:
+                    break
+        if corte:
+            definitivos = pilha[:corte]
+            del pilha[:corte]
+        else:
+            definitivos = []
+        # Acima do último marcador não há outro; só o controle ainda pode mudar.
+        self._sem_marcador = max(0, len(pilha) - self._reserva) if self._limitada else 0
+        return definitivos
+
+    def _derramar_excedente(self) -> None:
+        """Grava no arquivo temporário o fundo da pilha, se ela passou de `limite_pilha`."""
+        pilha = self.pilha
+        if self.limite_pilha is None or len(pilha) <= self.limite_pilha:
+            return
+        excedente = len(pilha) - self._reserva
+        if self._arquivo is None:
+            self._arquivo = tempfile.TemporaryFile()
+        trecho = pilha[:excedente]
+        posicao = self._arquivo.seek(0, os.SEEK_END)
+        pickle.dump(trecho, self._arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+        self._trechos.append((posicao, excedente))
+        self._simbolos_derramados.update(trecho)
+        del pilha[:excedente]
+        self._sem_marcador = max(0, self._sem_marcador - excedente)
+
+    def _retirar_derramado(self) -> tuple | None:
+        """Desliga o arquivo temporário da execução, devolvendo-o com seus trechos (None se vazio)."""
+        derramado = (self._arquivo, self._trechos) if self._trechos else None
+        if derramado is None and self._arquivo is not None:
+            self._arquivo.close()
+        self._arquivo, self._trechos, self._simbolos_derramados = None, [], set()
+        return derramado
+
+    def _recarregar(self, todos: bool = False) -> list[str]:
+        """Retira do arquivo o último trecho derramado (ou todos), na ordem da pilha."""
+        arquivo, trechos = self._arquivo, self._trechos
+        recarregados = []
+        while trechos and (todos or not recarregados):
+            posicao, _ = trechos.pop()
+            arquivo.seek(posicao)
+            recarregados[:0] = pickle.load(arquivo)
+            arquivo.truncate(posicao)
+        if not trechos:
+            self._retirar_derramado()
+        return recarregados
+
+    def finalizar(self) -> list[str]:
+        """
+        Encerra a execução, processando as transições ε finais.
+
+        Returns:
+            O conteúdo restante da pilha (o que ainda não foi drenado).
+
+        Raises:
+            RuntimeError: Se o autômato travar em um estado não final.
+        """
+        # As transições ε finais desempilham abaixo do controle (ex: o rollback).
+        self._sem_marcador = 0
+        if not self._trechos:
+            self.estado = self.automato._finalizar(self.estado, self.pilha)
+            return self.pilha
+
+        # Com parte da pilha em disco: o mesmo laço de `Automato_Pilha._finalizar`, que
+        # recorre ao arquivo quando a pilha em memória se esgota.
+        transicoes = self.automato.transicoes
+        pilha = self.pilha
+        try:
+            while self.estado not in self.automato.estados_finais:
+                if not pilha and self._trechos:
+                    if all(transicoes.get((self.estado, None, simbolo)) == (self.estado, ())
+                           for simbolo in self._simbolos_derramados):
+                        # Cada símbolo derramado seria só desempilhado (ex: o rollback de um
+                        # gene aberto): o arquivo é descartado sem ser lido.
+                        self._retirar_derramado()[0].close()
+                        continue
+                    pilha.extend(self._recarregar())
+                topo_pilha = pilha.pop() if pilha else None
+                trinca_sem_entrada = (self.estado, None, topo_pilha)
+                if trinca_sem_entrada not in transicoes:
+                    pilha.append(topo_pilha) if topo_pilha else None
+                    raise RuntimeError(f"Autômato travado no estado '{self.estado}' sem mais transições ε para chegar a um estado final.")
+                self.estado = self.automato._transitar(trinca_sem_entrada, pilha)
+        finally:
+            if self._trechos:
+                # O que ficou em disco volta para baixo da pilha em memória.
+                pilha[:0] = self._recarregar(todos=True)
+        return pilha
@@ -0,0 +1,194 @@
+"""
+Módulo que implementa o salto sobre trechos de busca do Autômato de Pilha.
+
+Uma região de busca é um conjunto de estados que, com um mesmo símbolo `t` no
+topo, só fazem transições neutras: ignoram o símbolo (sem regra e sem ε) ou vão
+para outro estado da região devolvendo `t` à pilha. Enquanto a execução está
+em uma região, a pilha não muda e só o estado importa; a execução sai dela na
+primeira transição não neutra (a "saída"). No ribossomo, `q_inicial`,
+`q_achouA` e `q_achouAU` com Z0 no topo formam uma região cuja única saída é
+ler 'G' em `q_achouAU`, isto é, o fim do primeiro 'AUG'.
+
+Se o estado dentro da região é determinado pelos últimos m símbolos lidos
+(para qualquer estado de partida), as saídas correspondem a um conjunto
+finito de palavras de m + 1 símbolos, e a próxima saída pode ser encontrada
+com `str.find` (ou uma expressão regular, em C), sem um passo do laço por
+símbolo. `analisar_regioes` procura essas regiões em qualquer autômato;
+`Automato_Pilha._consumir` salta sobre elas, com resultado idêntico ao do
+laço passo a passo.
+"""
+
+import re
+from itertools import product
+from typing import Mapping
+
+# --- CONSTANTES DO MÓDULO ---
+PROFUNDIDADE_MAXIMA = 4             # Maior m (símbolos que determinam o estado) testado
+PALAVRAS_MAXIMAS = 4096             # Limite de |Σ|^m na análise
+FRACAO_MAXIMA_SAIDAS = 0.25         # Fração máxima das palavras de m + 1 símbolos que saem da região
+
+
+class RegiaoBusca:
+    """
+    Uma região de busca e as tabelas usadas para saltar sobre ela.
+
+    Attributes:
+        estados (frozenset[str]): Os estados da região.
+        topo (str | None): O símbolo no topo da pilha durante a região.
+        profundidade (int): Quantos símbolos lidos determinam o estado (m).
+        palavras_saida (tuple[str, ...]): As palavras de m + 1 símbolos cujo último símbolo sai da região.
+    """
+
+    __slots__ = ("estados", "topo", "profundidade", "palavras_saida", "_passos", "_estado_apos", "_busca")
+
+    def __init__(self, estados: frozenset[str], topo: str | None, profundidade: int,
+                 passos: dict[tuple[str, str], str], estado_apos: dict[str, str], palavras_saida: list[str]):
+        """
+        Args:
+            estados (frozenset[str]): Os estados da região.
+            topo (str | None): O símbolo no topo da pilha.
+            profundidade (int): Quantos símbolos lidos determinam o estado.
+            passos (dict): (estado, símbolo) -> estado seguinte, para as transições neutras.
+            estado_apos (dict): Palavra de `profundidade` símbolos -> estado após lê-la.
+            palavras_saida (list[str]): As palavras de `profundidade` + 1 símbolos que saem da região.
+        """
+        self.estados = estados
+        self.topo = topo
+        self.profundidade = profundidade
+        self.palavras_saida = tuple(sorted(palavras_saida))
+        self._passos = passos
+        self._estado_apos = estado_apos
+        if len(self.palavras_saida) > 1:
+            # Todas as palavras têm o mesmo tamanho: o primeiro início é também o primeiro fim.
+            self._busca = re.compile("(?=" + "|".join(map(re.escape, self.palavras_saida)) + ")")
+        else:
+            self._busca = None
+
+    def saltar(self, cadeia: str, indice: int, limite: int, estado: str) -> tuple[int, str]:
+        """
+        Avança a execução, a partir de `estado` (da região), até a próxima saída.
+
+        Args:
+            cadeia (str): A entrada.
+            indice (int): A posição do próximo símbolo a ler.
+            limite (int): A posição até a qual o salto pode ir (exclusiva); todos
+                os símbolos antes dela pertencem ao alfabeto de entrada.
+            estado (str): O estado atual, com `topo` no topo da pilha.
+
+        Returns:
+            tuple[int, str]: A posição do símbolo que sai da região (ou `limite`) e
+            o estado da região nesse ponto.
+        """
+        # Os m primeiros símbolos são lidos passo a passo: antes disso, o estado
+        # ainda depende do estado de partida.
+        passos = self._passos
+        entrada = indice
+        for _ in range(self.profundidade):
+            if indice >= limite:
+                return indice, estado
+            seguinte = passos.get((estado, cadeia[indice]))
+            if seguinte is None:
+                return indice, estado
+            estado = seguinte
+            indice += 1
+
+        if self._busca is not None:
+            encontrada = self._busca.search(cadeia, entrada, limite)
+            inicio = encontrada.start() if encontrada else -1
+        elif self.palavras_saida:
+            inicio = cadeia.find(self.palavras_saida[0], entrada, limite)
+        else:
+            inicio = -1     # A região não tem saída: só o fim da entrada a encerra.
+        fim = limite if inicio < 0 else inicio + self.profundidade
+        if fim <= indice:
+            return indice, estado
+        return fim, self._estado_apos[cadeia[fim - self.profundidade:fim]] if self.profundidade else estado
+
+
+def analisar_regioes(
+    transicoes: Mapping[tuple, tuple[str, tuple[str, ...]]],
+    alfabeto_entrada: frozenset,
+    configuracoes: set[tuple[str, str | None]],
+) -> dict[tuple[str, str | None], RegiaoBusca]:
+    """
+    Procura regiões de busca a partir das configurações (estado, topo) dadas.
+
+    Args:
+        transicoes (Mapping): A função de transição do autômato.
+        alfabeto_entrada (frozenset): O alfabeto de entrada (None, se presente, é ε).
+        configuracoes (set): As configurações em que a execução pode entrar em uma região.
+
+    Returns:
+        dict: (estado, topo) -> RegiaoBusca, só para as configurações em que saltar vale a pena.
+    """
+    simbolos = sorted(simbolo for simbolo in alfabeto_entrada if simbolo is not None)
+    if not simbolos or any(not isinstance(simbolo, str) or len(simbolo) != 1 for simbolo in simbolos):
+        return {}
+
+    def neutro(estado: str, simbolo: str, topo: str | None) -> str | None:
+        """O estado após ler `simbolo` sem sair da região, ou None se a transição não for neutra."""
+        regra = transicoes.get((estado, simbolo, topo))
+        if regra is None:
+            # Sem regra: o símbolo é ignorado, a menos que haja uma transição ε.
+            return None if (estado, None, topo) in transicoes else estado
+        destino, empilhados = regra
+        return destino if empilhados == ((topo,) if topo is not None else ()) else None
+
+    regioes = {}
+    for estado_entrada, topo in configuracoes:
+        if not topo:
+            continue    # Um topo vazio ou falso não é devolvido ao ignorar um símbolo: a pilha mudaria.
+        # 1. Os estados alcançáveis por transições neutras e as transições entre eles.
+        estados, pendentes, passos = {estado_entrada}, [estado_entrada], {}
+        while pendentes:
+            estado = pendentes.pop()
+            for simbolo in simbolos:
+                destino = neutro(estado, simbolo, topo)
+                if destino is not None:
+                    passos[(estado, simbolo)] = destino
+                    if destino not in estados:
+                        estados.add(destino)
+                        pendentes.append(destino)
+
+        # 2. O menor m em que os últimos m símbolos lidos determinam o estado, qualquer
+        #    que seja o estado de partida na região (com m = 0, só se ela tiver um estado).
+        for profundidade in range(0 if len(estados) == 1 else 1, PROFUNDIDADE_MAXIMA + 1):
+            if len(simbolos) ** profundidade > PALAVRAS_MAXIMAS:
+                break
+            estado_apos = _estados_apos(estados, passos, simbolos, profundidade)
+            if estado_apos is None:
+                continue
+            # 3. As palavras de m + 1 símbolos cujo último símbolo sai da região.
+            palavras_saida = [
+                palavra + simbolo
+                for palavra, estado in estado_apos.items()
+                for simbolo in simbolos if (estado, simbolo) not in passos
+            ]
+            if len(palavras_saida) <= FRACAO_MAXIMA_SAIDAS * len(simbolos) ** (profundidade + 1):
+                regioes[(estado_entrada, topo)] = RegiaoBusca(
+                    frozenset(estados), topo, profundidade, passos, estado_apos, palavras_saida
+                )
+            break
+    return regioes
+
+
+def _estados_apos(estados: set[str], passos: dict[tuple[str, str], str], simbolos: list[str], profundidade: int) -> dict[str, str] | None:
+    """
+    Para cada palavra de `profundidade` símbolos, o estado alcançado ao lê-la a partir de
+    qualquer estado da região sem sair dela; None se esse estado depender da partida.
+    """
+    estado_apos = {}
+    for palavra in product(simbolos, repeat=profundidade):
+        finais = set()
+        for estado in estados:
+            for simbolo in palavra:
+                estado = passos.get((estado, simbolo))
+                if estado is None:
+                    break
+            else:
+                finais.add(estado)
+        if len(finais) > 1:
+            return None
+        if finais:
+            estado_apos["".join(palavra)] = finais.pop()
+    return estado_apos
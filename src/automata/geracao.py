@@ -0,0 +1,363 @@
+"""
+Módulo que implementa a geração de código Python a partir da definição de um
+autômato (`TransdutorFinito` ou `Automato_Pilha`).
+
+Em vez de interpretar a tabela de transições a cada símbolo (montar a trinca,
+consultar o dicionário, desempacotar o destino), o módulo gerado tem o estado
+em uma variável local inteira e, para cada estado, uma cadeia de `if` com as
+transições embutidas: os símbolos comparados são constantes e cada
+empilhamento é um `append` (ou `extend`) de valores fixos. O comportamento é o
+do interpretador, inclusive as mensagens de erro e, no autômato de pilha, os
+saltos sobre regiões de busca (ver `src.automata.busca`).
+
+O módulo gerado expõe as mesmas assinaturas das classes:
+
+    transdutor:  transcrever(cadeia), transcrever_bloco(cadeia, estado)
+    pilha:       transcrever_pilha(cadeia), validar(cadeia),
+                 consumir(cadeia, estado, pilha, inicio, fim), finalizar(estado, pilha)
+
+`compilar_automato` carrega o módulo uma única vez por definição em cada
+processo. Com `diretorio`, o código também é gravado em um arquivo com o nome
+derivado da impressão digital do autômato (e da versão do gerador), para
+inspeção e para que os tracebacks mostrem as linhas geradas. O que é executado
+é sempre o código recém-gerado, nunca o conteúdo do arquivo: um arquivo
+adulterado (ou de outra versão) é apenas reescrito.
+"""
+
+import hashlib
+import os
+from collections import Counter
+from pathlib import Path
+from types import ModuleType
+
+from .automato_pilha import Automato_Pilha
+from .transdutor_finito import TransdutorFinito
+
+# --- CONSTANTES DO MÓDULO ---
+VERSAO_GERADOR = 1                  # Muda quando o código gerado muda: invalida os arquivos antigos
+_ERRO_SIMBOLO = "f\"Símbolo '{simbolo}' na cadeia de entrada não pertence ao alfabeto de entrada Σ.\""
+
+# Módulos já carregados neste processo, por chave.
+_modulos: dict[str, ModuleType] = {}
+
+
+def _cabecalho(tipo: str, impressao_digital: str) -> list[str]:
+    return [
+        f"# Código gerado a partir de um {tipo} (impressão digital {impressao_digital}).",
+        "# Não edite: o arquivo é refeito sempre que a definição ou o gerador mudam.",
+        "",
+    ]
+
+
+def _ordem_estados(estados, destinos: Counter, inicial: str) -> list[str]:
+    """Os estados mais visitados (mais transições de chegada) vêm primeiro na cadeia de `if`."""
+    return sorted(estados, key=lambda estado: (-destinos[estado] - (estado == inicial), estado))
+
+
+def gerar_fonte_transdutor(transdutor: TransdutorFinito) -> str:
+    """
+    Gera o código-fonte do módulo especializado de um transdutor finito.
+
+    Args:
+        transdutor (TransdutorFinito): O transdutor (já validado pelo construtor).
+
+    Returns:
+        str: O código-fonte do módulo.
+    """
+    estados = _ordem_estados(transdutor.estados, Counter(transdutor.funcao_transicao.values()), transdutor.estado_inicial)
+    indices = {estado: indice for indice, estado in enumerate(estados)}
+    por_estado: dict[str, list[str]] = {estado: [] for estado in estados}
+    for estado, simbolo in sorted(transdutor.funcao_transicao):
+        por_estado[estado].append(simbolo)
+
+    linhas = _cabecalho("TransdutorFinito", transdutor.impressao_digital()) + [
+        f"ESTADOS = {tuple(estados)!r}",
+        f"INDICES = {indices!r}",
+        f"ALFABETO = frozenset({sorted(transdutor.alfabeto_entrada, key=repr)!r})",
+        "",
+        "",
+        "def _erro(estado, simbolo, estado_atual):",
+        "    if simbolo not in ALFABETO:",
+        f"        raise ValueError({_ERRO_SIMBOLO})",
+        "    nome = ESTADOS[estado] if estado >= 0 else estado_atual",
+        "    raise ValueError(f\"Regra de transição/saída não definida para o estado '{nome}' com o símbolo '{simbolo}'.\")",
+        "",
+        "",
+        "def transcrever_bloco(cadeia, estado_atual):",
+        "    estado = INDICES.get(estado_atual, -1)",
+        "    saida = []",
+        "    anexar = saida.append",
+    ]
+    unico = len(estados) == 1
+    if unico:
+        # Sem despacho por estado, o estado de partida é conferido uma única vez.
+        linhas += ["    if estado < 0 and cadeia:", "        _erro(estado, cadeia[0], estado_atual)"]
+    linhas.append("    for simbolo in cadeia:")
+    for posicao, estado in enumerate(estados):
+        recuo = "        "
+        if not unico:
+            linhas.append(f"        {'if' if posicao == 0 else 'elif'} estado == {indices[estado]}:    # {estado!r}")
+            recuo += "    "
+        if not por_estado[estado]:
+            linhas.append(f"{recuo}_erro(estado, simbolo, estado_atual)")
+            continue
+        for ordem, simbolo in enumerate(por_estado[estado]):
+            destino = transdutor.funcao_transicao[(estado, simbolo)]
+            linhas.append(f"{recuo}{'if' if ordem == 0 else 'elif'} simbolo == {simbolo!r}:")
+            saida = transdutor.funcao_saida[(estado, simbolo)]
+            if saida:
+                linhas.append(f"{recuo}    anexar({saida!r})")
+            if destino != estado:
+                linhas.append(f"{recuo}    estado = {indices[destino]}")
+            elif not saida:
+                linhas.append(f"{recuo}    pass")
+        linhas.append(f"{recuo}else:")
+        linhas.append(f"{recuo}    _erro(estado, simbolo, estado_atual)")
+    if not unico:
+        linhas += ["        else:", "            _erro(estado, simbolo, estado_atual)"]
+    linhas += [
+        "    return ''.join(saida), (ESTADOS[estado] if estado >= 0 else estado_atual)",
+        "",
+        "",
+        "def transcrever(cadeia):",
+        "    return transcrever_bloco(cadeia, ESTADOS[" + str(indices[transdutor.estado_inicial]) + "])[0]",
+        "",
+    ]
+    return "\n".join(linhas)
+
+
+def _acao_pilha(linhas: list[str], recuo: str, estado: str, destino: str, empilhados: tuple,
+                indices: dict[str, int], consome: bool, salto: int | None) -> None:
+    """Emite o corpo de uma transição: empilhamento, novo estado, avanço e salto."""
+    if len(empilhados) == 1:
+        linhas.append(f"{recuo}anexar({empilhados[0]!r})")
+    elif empilhados:
+        linhas.append(f"{recuo}empilhar({empilhados!r})")
+    if destino != estado:
+        linhas.append(f"{recuo}estado = {indices[destino]}")
+    if consome:
+        linhas.append(f"{recuo}i += 1")
+    if salto is not None:
+        linhas.append(f"{recuo}i, estado = _saltar({salto}, cadeia, i, limite, {indices[destino]})")
+    linhas.append(f"{recuo}continue")
+
+
+def _laco_pilha(automato: Automato_Pilha, estados: list[str], indices: dict[str, int],
+                saltos: dict[tuple, int], validar: bool) -> list[str]:
+    """Emite o despacho por estado, topo e símbolo do laço de `consumir` ou de `validar`."""
+    com_entrada: dict[str, dict] = {estado: {} for estado in estados}
+    vazias: dict[tuple, tuple] = {}
+    for (estado, simbolo, topo), (destino, empilhados) in automato.transicoes.items():
+        if simbolo is None:
+            vazias[(estado, topo)] = (destino, empilhados)
+        else:
+            com_entrada[estado].setdefault(topo, []).append((simbolo, destino, empilhados))
+    for estado, topo in vazias:
+        com_entrada[estado].setdefault(topo, [])
+
+    linhas = []
+    primeiro_estado = True
+    for estado in estados:
+        if not com_entrada[estado]:
+            continue
+        linhas.append(f"        {'if' if primeiro_estado else 'elif'} estado == {indices[estado]}:    # {estado!r}")
+        primeiro_estado = False
+        topos = sorted(com_entrada[estado].items(), key=lambda item: (-len(item[1]), repr(item[0])))
+        for ordem_topo, (topo, regras) in enumerate(topos):
+            condicao = "topo is None" if topo is None else f"topo == {topo!r}"
+            linhas.append(f"            {'if' if ordem_topo == 0 else 'elif'} {condicao}:")
+            for ordem, (simbolo, destino, empilhados) in enumerate(sorted(regras, key=lambda regra: repr(regra[0]))):
+                linhas.append(f"                {'if' if ordem == 0 else 'elif'} simbolo == {simbolo!r}:")
+                salto = None if validar else saltos.get((estado, simbolo, topo))
+                _acao_pilha(linhas, "                    ", estado, destino, empilhados, indices, True, salto)
+            if (estado, topo) in vazias:
+                # Nenhuma transição com entrada: tenta a transição ε.
+                destino, empilhados = vazias[(estado, topo)]
+                salto = None if validar else saltos.get((estado, None, topo))
+                _acao_pilha(linhas, "                ", estado, destino, empilhados, indices, False, salto)
+            elif not regras:
+                linhas.append("                pass")
+    return linhas
+
+
+def gerar_fonte_pilha(automato: Automato_Pilha) -> str:
+    """
+    Gera o código-fonte do módulo especializado de um autômato de pilha.
+
+    Args:
+        automato (Automato_Pilha): O autômato (já validado pelo construtor).
+
+    Returns:
+        str: O código-fonte do módulo. As funções de salto das regiões de busca são
+        ligadas por `compilar_automato` (em `SALTOS`, `SALTOS_INICIO` e `INVALIDO`).
+    """
+    destinos = Counter(destino for destino, _ in automato.transicoes.values())
+    estados = _ordem_estados(automato.estados, destinos, automato.estado_inicial)
+    indices = {estado: indice for indice, estado in enumerate(estados)}
+    transicoes_salto = automato._preparar_saltos()[0]
+    trincas_salto = sorted(
+        (trinca for trinca, (_, _, saltar) in transicoes_salto.items() if saltar is not None), key=repr
+    )
+    saltos = {trinca: numero for numero, trinca in enumerate(trincas_salto)}
+    vazias = {
+        (estado, topo): (destino, empilhados)
+        for (estado, simbolo, topo), (destino, empilhados) in automato.transicoes.items() if simbolo is None
+    }
+
+    linhas = _cabecalho("Automato_Pilha", automato.impressao_digital()) + [
+        f"ESTADOS = {tuple(estados)!r}",
+        f"INDICES = {indices!r}",
+        f"ALFABETO = frozenset({sorted(automato.alfabeto_entrada, key=repr)!r})",
+        f"FINAIS = frozenset({sorted(automato.estados_finais)!r})",
+        f"VAZIAS = {dict(sorted(vazias.items(), key=repr))!r}",
+        f"ESTADO_INICIAL = {automato.estado_inicial!r}",
+        f"TOPO_INICIAL = {automato.estado_inicial_pilha!r}",
+        f"TRINCAS_SALTO = {tuple(trincas_salto)!r}",
+        "",
+        "# Ligados por `compilar_automato` (ver `src.automata.busca`).",
+        "SALTOS = []",
+        "SALTOS_INICIO = {}",
+        "INVALIDO = None",
+        "",
+        "",
+        "def _saltar(numero, cadeia, i, limite, estado):",
+        "    i, nome = SALTOS[numero](cadeia, i, limite, ESTADOS[estado])",
+        "    return i, INDICES[nome]",
+        "",
+        "",
+        "def consumir(cadeia, estado_atual, pilha, inicio=0, fim=None):",
+        "    estado = INDICES.get(estado_atual, -1)",
+        "    anexar = pilha.append",
+        "    empilhar = pilha.extend",
+        "    desempilhar = pilha.pop",
+        "    alfabeto = ALFABETO",
+        "    i = inicio",
+        "    fim = len(cadeia) if fim is None else fim",
+        "    limite = fim",
+        "    if INVALIDO is not None:",
+        "        encontrado = INVALIDO.search(cadeia, i, fim)",
+        "        if encontrado:",
+        "            limite = encontrado.start()",
+        "        saltar = SALTOS_INICIO.get((estado_atual, pilha[-1])) if pilha else None",
+        "        if saltar is not None:",
+        "            i, estado_atual = saltar(cadeia, i, limite, estado_atual)",
+        "            estado = INDICES[estado_atual]",
+        "    while i < fim:",
+        "        simbolo = cadeia[i]",
+        "        if simbolo not in alfabeto:",
+        f"            raise ValueError({_ERRO_SIMBOLO})",
+        "        topo = desempilhar() if pilha else None",
+    ]
+    linhas += _laco_pilha(automato, estados, indices, saltos, validar=False)
+    linhas += [
+        "        # Sem transição: restaura o topo e ignora o símbolo.",
+        "        if topo:",
+        "            anexar(topo)",
+        "        i += 1",
+        "    return ESTADOS[estado] if estado >= 0 else estado_atual",
+        "",
+        "",
+        "def finalizar(estado, pilha):",
+        "    while estado not in FINAIS:",
+        "        topo = pilha.pop() if pilha else None",
+        "        regra = VAZIAS.get((estado, topo))",
+        "        if regra is None:",
+        "            if topo:",
+        "                pilha.append(topo)",
+        "            raise RuntimeError(f\"Autômato travado no estado '{estado}' sem mais transições ε para chegar a um estado final.\")",
+        "        estado, empilhados = regra",
+        "        pilha.extend(empilhados)",
+        "    return estado",
+        "",
+        "",
+        "def transcrever_pilha(cadeia):",
+        "    pilha = [TOPO_INICIAL]",
+        "    finalizar(consumir(cadeia, ESTADO_INICIAL, pilha), pilha)",
+        "    return pilha",
+        "",
+        "",
+        "def validar(cadeia):",
+        f"    estado = {indices[automato.estado_inicial]}",
+        "    pilha = [TOPO_INICIAL]",
+        "    anexar = pilha.append",
+        "    empilhar = pilha.extend",
+        "    desempilhar = pilha.pop",
+        "    alfabeto = ALFABETO",
+        "    i = 0",
+        "    while i < len(cadeia):",
+        "        simbolo = cadeia[i]",
+        "        if simbolo not in alfabeto:",
+        "            return False",
+        "        topo = desempilhar() if pilha else None",
+    ]
+    linhas += _laco_pilha(automato, estados, indices, saltos, validar=True)
+    linhas += [
+        "        # Sem transição: a cadeia é rejeitada.",
+        "        return False",
+        "    estado = ESTADOS[estado]",
+        "    while True:",
+        "        topo = pilha.pop() if pilha else None",
+        "        regra = VAZIAS.get((estado, topo))",
+        "        if regra is None:",
+        "            if topo:",
+        "                pilha.append(topo)",
+        "            break",
+        "        estado, empilhados = regra",
+        "        pilha.extend(empilhados)",
+        "    return estado in FINAIS",
+        "",
+    ]
+    return "\n".join(linhas)
+
+
+def compilar_automato(automato: TransdutorFinito | Automato_Pilha, diretorio: str | Path | None = None) -> ModuleType:
+    """
+    Retorna o módulo especializado de um autômato, gerando-o se preciso.
+
+    Args:
+        automato (TransdutorFinito | Automato_Pilha): O autômato.
+        diretorio (str | Path | None): Onde o código gerado é gravado para inspeção
+            (criado se não existir); None mantém o módulo só em memória.
+
+    Returns:
+        ModuleType: O módulo, com as funções descritas no cabeçalho deste arquivo.
+
+    Raises:
+        TypeError: Se `automato` não for um dos tipos suportados.
+    """
+    if isinstance(automato, TransdutorFinito):
+        tipo, gerar = "transdutor", gerar_fonte_transdutor
+    elif isinstance(automato, Automato_Pilha):
+        tipo, gerar = "pilha", gerar_fonte_pilha
+    else:
+        raise TypeError(f"Não há gerador de código para {type(automato).__name__}.")
+
+    chave = hashlib.sha256(f"{VERSAO_GERADOR}:{tipo}:{automato.impressao_digital()}".encode('ascii')).hexdigest()
+    nome = f"{tipo}_{chave[:32]}"
+    modulo = _modulos.get(nome)
+    if modulo is not None:
+        return modulo
+
+    fonte = gerar(automato)
+    origem = f"<{nome}>"
+    if diretorio is not None:
+        caminho = Path(diretorio) / f"{nome}.py"
+        origem = str(caminho)
+        if not caminho.exists() or caminho.read_text(encoding='utf-8') != fonte:
+            caminho.parent.mkdir(parents=True, exist_ok=True)
+            # Escrita atômica: outro processo nunca lê um arquivo pela metade.
+            temporario = caminho.with_name(f"{caminho.name}.{os.getpid()}.tmp")
+            temporario.write_text(fonte, encoding='utf-8')
+            os.replace(temporario, caminho)
+    # O código executado é o gerado agora, e não o lido do arquivo (que qualquer um poderia ter trocado).
+    modulo = ModuleType(nome)
+    modulo.__file__ = origem
+    exec(compile(fonte, origem, "exec"), modulo.__dict__)
+
+    if tipo == "pilha":
+        transicoes, regioes, invalido = automato._preparar_saltos()
+        modulo.SALTOS[:] = [transicoes[trinca][2] for trinca in modulo.TRINCAS_SALTO]
+        modulo.SALTOS_INICIO.update({configuracao: regiao.saltar for configuracao, regiao in regioes.items()})
+        modulo.INVALIDO = invalido
+    _modulos[nome] = modulo
+    return modulo
@@ -0,0 +1,78 @@
+"""
+Módulo com o formato de lote usado pelos métodos `transcrever_lote` e
+`transcrever_pilha_lote`.
+
+Um lote de N sequências é guardado como um único buffer concatenado e um vetor
+de N + 1 deslocamentos (no estilo CSR): a sequência i ocupa
+`buffer[deslocamentos[i]:deslocamentos[i + 1]]`. Os resultados voltam no mesmo
+formato, evitando uma chamada e uma lista de resultado por sequência.
+"""
+
+from array import array
+from typing import Sequence
+
+
+def concatenar_lote(sequencias: Sequence[str]) -> tuple[str, array]:
+    """
+    Monta o buffer concatenado e os deslocamentos de uma lista de sequências.
+
+    Args:
+        sequencias (Sequence[str]): As sequências do lote, em ordem.
+
+    Returns:
+        tuple[str, array]: O buffer e os N + 1 deslocamentos (array 'q').
+    """
+    deslocamentos = array('q', [0])
+    total = 0
+    for sequencia in sequencias:
+        total += len(sequencia)
+        deslocamentos.append(total)
+    return ''.join(sequencias), deslocamentos
+
+
+def separar_lote(buffer: Sequence, deslocamentos: Sequence[int]) -> list:
+    """
+    Desfaz `concatenar_lote`, devolvendo um item por sequência.
+
+    Args:
+        buffer (Sequence): O buffer concatenado (uma string ou uma lista de símbolos).
+        deslocamentos (Sequence[int]): Os N + 1 deslocamentos.
+
+    Returns:
+        list: As N fatias do buffer.
+    """
+    return [buffer[deslocamentos[i]:deslocamentos[i + 1]] for i in range(len(deslocamentos) - 1)]
+
+
+def preparar_lote(entrada: str | Sequence[str], deslocamentos: Sequence[int] | None = None) -> tuple[str, array]:
+    """
+    Normaliza a entrada de um método de lote para o formato buffer + deslocamentos.
+
+    Args:
+        entrada (str | Sequence[str]): Uma lista de sequências, ou o buffer concatenado.
+        deslocamentos (Sequence[int] | None): Os deslocamentos do buffer; obrigatórios
+            se `entrada` for um buffer e proibidos se for uma lista. Qualquer
+            sequência de inteiros serve (lista, `array`, vetor NumPy).
+
+    Returns:
+        tuple[str, array]: O buffer e os deslocamentos validados.
+
+    Raises:
+        ValueError: Se os deslocamentos faltarem, sobrarem, não começarem em 0,
+                    decrescerem ou passarem do fim do buffer.
+    """
+    if isinstance(entrada, str):
+        if deslocamentos is None:
+            raise ValueError("Um buffer concatenado exige o vetor de deslocamentos.")
+        deslocamentos = array('q', deslocamentos)
+        if not deslocamentos or deslocamentos[0] != 0:
+            raise ValueError("Os deslocamentos devem começar em 0.")
+        if deslocamentos[-1] > len(entrada):
+            raise ValueError("O último deslocamento passa do fim do buffer.")
+        if any(deslocamentos[i] > deslocamentos[i + 1] for i in range(len(deslocamentos) - 1)):
+            raise ValueError("Os deslocamentos devem ser não decrescentes.")
+        return entrada, deslocamentos
+
+    if deslocamentos is not None:
+        raise ValueError("Deslocamentos só podem ser informados junto com um buffer concatenado.")
+    return concatenar_lote(entrada)
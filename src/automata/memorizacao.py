@@ -0,0 +1,190 @@
+"""
+Módulo que implementa a memorização por blocos da execução de um Autômato de
+Pilha (ver `MemoriaBlocos`).
+
+Sequências biológicas são muito repetitivas (repetições em tandem,
+transposons, duplicações segmentares), e um mesmo trecho da entrada lido a
+partir da mesma configuração produz sempre o mesmo efeito. A entrada é lida em
+blocos de tamanho fixo, e para cada bloco guarda-se em um cache LRU:
+
+    (estado de entrada, controle, conteúdo do bloco)
+        -> (estado de saída, símbolos que substituem o controle)
+
+O controle é o trecho do topo da pilha que as transições de fato leem (ver
+`Automato_Pilha.transdutor_equivalente`): embaixo dele fica o registro, que a
+leitura nunca alcança. Por isso o efeito de um bloco na pilha se resume a
+trocar o controle por uma sequência de símbolos, e um bloco repetido é
+reaplicado sem ser executado de novo. Só autômatos de controle limitado (como
+o ribossomo) podem ser memorizados.
+
+Os blocos têm posições fixas na entrada (múltiplos do tamanho do bloco,
+contados desde o início da execução, mesmo quando ela é alimentada aos
+pedaços): uma repetição em tandem de período P produz no máximo P blocos
+distintos, e os demais acertam o cache. Cópias espalhadas de um trecho só
+acertam quando começam em posições congruentes módulo o tamanho do bloco.
+"""
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .automato_pilha import Automato_Pilha
+
+# --- CONSTANTES DO MÓDULO ---
+TAMANHO_BLOCO_MEMORIA = 1024        # Símbolos de entrada por bloco memorizado
+BLOCOS_MEMORIZADOS = 1024           # Blocos mantidos no cache (LRU)
+
+
+class MemoriaBlocos:
+    """
+    Execução de um `Automato_Pilha` que reaproveita o efeito de blocos repetidos.
+
+    O resultado é sempre idêntico ao do próprio autômato; os contadores medem
+    quanto a memorização ajudou.
+
+    Attributes:
+        automato (Automato_Pilha): O autômato executado.
+        tamanho_bloco (int): Os símbolos de entrada de cada bloco memorizado.
+        capacidade (int): Quantos blocos o cache mantém.
+        acertos (int): Blocos reaplicados a partir do cache.
+        falhas (int): Blocos executados (e guardados) por não estarem no cache.
+        descartes (int): Blocos retirados do cache para dar lugar a outros.
+        tempo_economizado (float): Segundos estimados poupados pelos acertos (o tempo
+            da execução original de cada bloco reaplicado, menos o da reaplicação).
+    """
+
+    def __init__(self, automato: "Automato_Pilha", tamanho_bloco: int = TAMANHO_BLOCO_MEMORIA,
+                 capacidade: int = BLOCOS_MEMORIZADOS):
+        """
+        Args:
+            automato (Automato_Pilha): O autômato a ser executado.
+            tamanho_bloco (int): Os símbolos de entrada de cada bloco memorizado.
+            capacidade (int): Quantos blocos o cache mantém.
+
+        Raises:
+            ValueError: Se `tamanho_bloco` ou `capacidade` não forem positivos, ou se o
+                        trecho da pilha lido pelo autômato não for limitado.
+        """
+        if tamanho_bloco <= 0 or capacidade <= 0:
+            raise ValueError("O tamanho do bloco e a capacidade do cache devem ser positivos.")
+        equivalente = automato.transdutor_equivalente()
+        if equivalente is None:
+            raise ValueError("O trecho da pilha lido pelo autômato não é limitado: seus blocos não podem ser memorizados.")
+        self.automato = automato
+        self.tamanho_bloco = tamanho_bloco
+        self.capacidade = capacidade
+        self._simbolos_saida = equivalente.simbolos_saida
+        self._cache: OrderedDict[tuple[str, tuple[str, ...], str], tuple[str, tuple[str, ...], float]] = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+        self.tempo_economizado = 0.0
+
+    def __repr__(self) -> str:
+        return f"MemoriaBlocos({len(self._cache)} bloco(s) em cache, taxa de acertos {self.taxa_acertos:.1%})"
+
+    @property
+    def taxa_acertos(self) -> float:
+        """A fração dos blocos lidos que foi reaplicada a partir do cache."""
+        total = self.acertos + self.falhas
+        return self.acertos / total if total else 0.0
+
+    def resumo(self) -> str:
+        """Retorna uma linha descrevendo o uso do cache."""
+        return (f"memorização: {self.acertos} acerto(s), {self.falhas} falha(s) "
+                f"(taxa {self.taxa_acertos:.1%}), {self.descartes} descarte(s); "
+                f"~{self.tempo_economizado:.3f}s economizados")
+
+    def transcrever_pilha(self, cadeia: str) -> list[str]:
+        """
+        Equivale a `Automato_Pilha.transcrever_pilha(cadeia)`.
+
+        Args:
+            cadeia (str): A entrada.
+
+        Returns:
+            list[str]: A pilha ao final da execução.
+
+        Raises:
+            ValueError: Se algum símbolo não pertencer ao alfabeto de entrada.
+            RuntimeError: Se o autômato travar fora de um estado final.
+        """
+        pilha = [self.automato.estado_inicial_pilha]
+        estado = self.consumir(cadeia, self.automato.estado_inicial, pilha)
+        self.automato._finalizar(estado, pilha)
+        return pilha
+
+    def consumir(self, cadeia: str, estado_atual: str, pilha: list[str], inicio: int = 0, fim: int | None = None,
+                 posicao_absoluta: int = 0) -> str:
+        """
+        Equivale a `Automato_Pilha._consumir`, reaplicando os blocos já vistos.
+
+        A configuração (`estado_atual`, `pilha`) deve ser alcançável pelo autômato,
+        para que nada abaixo do controle seja lido.
+
+        Args:
+            cadeia (str): A string de entrada.
+            estado_atual (str): O estado em que a execução se encontra.
+            pilha (list[str]): A pilha atual do autômato, que será modificada.
+            inicio (int): Índice do primeiro símbolo a consumir.
+            fim (int | None): Índice final (exclusivo); por padrão, o fim da cadeia.
+            posicao_absoluta (int): Quantos símbolos a execução já consumiu antes de
+                `inicio` (alinha os blocos entre chamadas).
+
+        Returns:
+            str: O estado do autômato após consumir o trecho.
+
+        Raises:
+            ValueError: Se algum símbolo não pertencer ao alfabeto de entrada.
+        """
+        fim = len(cadeia) if fim is None else fim
+        consumir = self.automato._consumir
+        simbolos_saida = self._simbolos_saida
+        cache = self._cache
+        tamanho = self.tamanho_bloco
+        relogio = time.perf_counter
+
+        # O começo do trecho, até a próxima fronteira de bloco, é lido diretamente.
+        posicao = min(fim, inicio + (-posicao_absoluta) % tamanho)
+        if posicao > inicio:
+            estado_atual = consumir(cadeia, estado_atual, pilha, inicio, posicao)
+        while fim - posicao >= tamanho:
+            bloco = cadeia[posicao:posicao + tamanho]
+            posicao += tamanho
+            base = len(pilha)
+            while base and pilha[base - 1] not in simbolos_saida:
+                base -= 1
+            controle = tuple(pilha[base:])
+            if not controle:
+                # Sem controle, o topo seria lido do registro: o bloco não é memorizável.
+                estado_atual = consumir(bloco, estado_atual, pilha)
+                continue
+
+            chave = (estado_atual, controle, bloco)
+            entrada = cache.get(chave)
+            if entrada is not None:
+                inicio_reaplicacao = relogio()
+                cache.move_to_end(chave)
+                estado_atual, substitutos, custo = entrada
+                del pilha[base:]
+                pilha.extend(substitutos)
+                self.acertos += 1
+                self.tempo_economizado += custo - (relogio() - inicio_reaplicacao)
+                continue
+
+            inicio_execucao = relogio()
+            local = list(controle)
+            estado_saida = consumir(bloco, estado_atual, local)
+            custo = relogio() - inicio_execucao
+            cache[chave] = (estado_saida, tuple(local), custo)
+            if len(cache) > self.capacidade:
+                cache.popitem(last=False)
+                self.descartes += 1
+            self.falhas += 1
+            del pilha[base:]
+            pilha.extend(local)
+            estado_atual = estado_saida
+
+        # A sobra, menor que um bloco, é lida diretamente.
+        return consumir(cadeia, estado_atual, pilha, posicao, fim)
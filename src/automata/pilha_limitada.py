@@ -0,0 +1,173 @@
+"""
+Módulo que compila um Autômato de Pilha de pilha limitada em um transdutor
+finito (ver `Automato_Pilha.transdutor_equivalente`).
+
+Durante a leitura da entrada, a pilha de muitos autômatos tem duas partes: um
+trecho de controle no topo, de altura limitada, que as transições de fato
+leem, e embaixo dele um registro de símbolos que só é lido depois do fim da
+entrada. No ribossomo, o controle é 'Z0' (ou a 1ª base do códon) e o registro
+são os aminoácidos, lidos apenas pelo rollback.
+
+`compilar_pilha_limitada` separa as duas partes:
+
+    - símbolos de saída: os empilhados que nenhuma transição com entrada lê no
+      topo; quando o controle fica vazio, os primeiros símbolos empilhados que
+      são de saída descem para o registro;
+    - configurações: os pares (estado, controle) alcançáveis a partir de
+      (q0, (Z0,)), desde que o controle nunca fique vazio nem passe de
+      `ALTURA_MAXIMA` símbolos.
+
+Se as configurações forem finitas, elas são os estados de um `TransdutorFinito`
+que emite, a cada símbolo lido, os símbolos que desceram para o registro. Ao
+fim da entrada, a pilha é o registro seguido do controle, e as transições ε
+restantes (o rollback, que descarta o gene incompleto do registro) rodam no
+próprio autômato de pilha: o resultado é idêntico ao de `transcrever_pilha`.
+"""
+
+from typing import TYPE_CHECKING
+
+from .geracao import compilar_automato
+from .transdutor_finito import TransdutorFinito
+
+if TYPE_CHECKING:
+    from .automato_pilha import Automato_Pilha
+
+# --- CONSTANTES DO MÓDULO ---
+ALTURA_MAXIMA = 8                   # Maior altura do trecho de controle da pilha
+CONFIGURACOES_MAXIMAS = 4096        # Maior número de configurações (estados do transdutor)
+SEPARADOR = "\x1f"                  # Encerra cada símbolo emitido na saída do transdutor
+
+
+class PilhaLimitada:
+    """
+    Um autômato de pilha executado como um transdutor finito.
+
+    Attributes:
+        automato (Automato_Pilha): O autômato original (usado para as transições ε finais).
+        transdutor (TransdutorFinito): O transdutor cujos estados são as configurações
+            (estado, controle) e cuja saída é o registro da pilha.
+        altura_controle (int): A maior altura do trecho de controle: durante a leitura,
+            nada abaixo dos `altura_controle` símbolos do topo é lido.
+        simbolos_saida (frozenset[str]): Os símbolos que descem para o registro; o controle
+            é o maior sufixo da pilha sem nenhum deles.
+    """
+
+    def __init__(self, automato: "Automato_Pilha", transdutor: TransdutorFinito,
+                 configuracoes: dict[str, tuple[str, tuple[str, ...]]], simbolos_saida: frozenset[str]):
+        """
+        Args:
+            automato (Automato_Pilha): O autômato original.
+            transdutor (TransdutorFinito): O transdutor equivalente.
+            configuracoes (dict): Estado do transdutor -> (estado do autômato, controle).
+            simbolos_saida (frozenset[str]): Os símbolos do registro.
+        """
+        self.automato = automato
+        self.transdutor = transdutor
+        self.simbolos_saida = simbolos_saida
+        self._configuracoes = configuracoes
+        self.altura_controle = max(len(controle) for _, controle in configuracoes.values())
+        self._transcrever_bloco = compilar_automato(transdutor).transcrever_bloco
+
+    def __repr__(self) -> str:
+        return f"PilhaLimitada({len(self._configuracoes)} configurações)"
+
+    def transcrever_pilha(self, cadeia: str) -> list[str]:
+        """
+        Equivale a `Automato_Pilha.transcrever_pilha(cadeia)`.
+
+        Args:
+            cadeia (str): A entrada.
+
+        Returns:
+            list[str]: A pilha ao final da execução.
+
+        Raises:
+            ValueError: Se algum símbolo não pertencer ao alfabeto de entrada.
+            RuntimeError: Se o autômato travar fora de um estado final.
+        """
+        saida, estado = self._transcrever_bloco(cadeia, self.transdutor.estado_inicial)
+        estado, controle = self._configuracoes[estado]
+        pilha = saida.split(SEPARADOR)
+        pilha.pop()     # O texto após o último separador é vazio.
+        pilha.extend(controle)
+        self.automato._finalizar(estado, pilha)
+        return pilha
+
+
+def compilar_pilha_limitada(
+    automato: "Automato_Pilha",
+    altura_maxima: int = ALTURA_MAXIMA,
+    configuracoes_maximas: int = CONFIGURACOES_MAXIMAS,
+) -> PilhaLimitada | None:
+    """
+    Compila o autômato em um transdutor finito, se o controle da pilha for limitado.
+
+    Args:
+        automato (Automato_Pilha): O autômato.
+        altura_maxima (int): A maior altura aceita para o trecho de controle.
+        configuracoes_maximas (int): O maior número aceito de configurações.
+
+    Returns:
+        PilhaLimitada | None: A execução equivalente, ou None se o controle não for
+        limitado (ou não couber nos limites) ou se o registro não puder ser separado.
+    """
+    transicoes = automato.transicoes
+    simbolos = sorted((simbolo for simbolo in automato.alfabeto_entrada if simbolo is not None), key=repr)
+    lidos = {topo for (_, simbolo, topo) in transicoes if simbolo is not None}
+    de_saida = {simbolo for _, empilhados in transicoes.values() for simbolo in empilhados} - lidos
+    if any(not isinstance(simbolo, str) or SEPARADOR in simbolo for simbolo in de_saida):
+        return None
+
+    def ler(estado: str, controle: tuple, simbolo: str) -> tuple[str, tuple, tuple] | None:
+        """A configuração e os símbolos emitidos após ler `simbolo` (com as transições ε antes dele)."""
+        emitidos = ()
+        for _ in range(configuracoes_maximas):
+            if not controle:
+                return None     # O topo verdadeiro dependeria do registro.
+            topo, resto = controle[-1], controle[:-1]
+            regra = transicoes.get((estado, simbolo, topo))
+            consome = regra is not None
+            if regra is None:
+                regra = transicoes.get((estado, None, topo))
+            if regra is None:
+                # Sem transição: o símbolo é ignorado e o topo, restaurado.
+                return estado, (controle if topo else resto), emitidos
+            estado, empilhados = regra
+            if not resto:
+                descem = 0
+                while descem < len(empilhados) and empilhados[descem] in de_saida:
+                    descem += 1
+                emitidos += empilhados[:descem]
+                empilhados = empilhados[descem:]
+            if any(simbolo_pilha in de_saida for simbolo_pilha in empilhados):
+                return None     # Um símbolo de saída ficaria preso no controle.
+            controle = resto + empilhados
+            if len(controle) > altura_maxima:
+                return None
+            if consome:
+                return estado, controle, emitidos
+        return None     # Ciclo de transições ε.
+
+    inicial = (automato.estado_inicial, (automato.estado_inicial_pilha,))
+    nomes = {inicial: repr(inicial)}
+    pendentes = [inicial]
+    δ, λ = {}, {}
+    while pendentes:
+        configuracao = pendentes.pop()
+        origem = nomes[configuracao]
+        for simbolo in simbolos:
+            resultado = ler(*configuracao, simbolo)
+            if resultado is None:
+                return None
+            *seguinte, emitidos = resultado
+            seguinte = tuple(seguinte)
+            if seguinte not in nomes:
+                if len(nomes) >= configuracoes_maximas:
+                    return None
+                nomes[seguinte] = repr(seguinte)
+                pendentes.append(seguinte)
+            δ[(origem, simbolo)] = nomes[seguinte]
+            λ[(origem, simbolo)] = "".join(emitido + SEPARADOR for emitido in emitidos)
+
+    transdutor = TransdutorFinito(set(nomes.values()), set(simbolos), set(λ.values()), δ, λ, nomes[inicial])
+    return PilhaLimitada(automato, transdutor, {nome: configuracao for configuracao, nome in nomes.items()}, frozenset(de_saida))
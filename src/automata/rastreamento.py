@@ -0,0 +1,103 @@
+"""
+Módulo que implementa o rastreamento passo a passo do Autômato de Pilha.
+
+Um `Rastreador` reúne os ganchos chamados durante a execução e, opcionalmente,
+um histórico circular das últimas configurações. Ele só é consultado quando é
+passado explicitamente a `Automato_Pilha.transcrever_pilha`; sem ele, a
+execução usa o laço principal de sempre, sem nenhum teste extra por símbolo.
+"""
+
+from collections import deque
+from typing import Callable
+
+# --- CONSTANTES DO MÓDULO ---
+PROFUNDIDADE_PADRAO = 8     # Símbolos do topo da pilha guardados em cada configuração do histórico
+
+
+class Rastreador:
+    """
+    Ganchos e histórico de uma execução rastreada.
+
+    Os ganchos de transição recebem `(passo, indice, estado, simbolo, topo, destino, empilhados)`,
+    em que `simbolo` é None nas transições ε e `indice` é None nas transições ε
+    feitas após o fim da entrada (ex: rollback). `ao_rejeitar` recebe
+    `(passo, indice, estado, simbolo, topo)` quando não há transição e o símbolo
+    é ignorado. `ao_completar_gene` recebe `(passo, indice, gene)` quando uma
+    transição que consome um símbolo empilha o `marcador`, com os símbolos
+    empilhados desde o marcador anterior; transições ε que apenas restauram o
+    marcador (como o rollback do ribossomo) não contam.
+
+    A amostragem vale para `ao_transitar`, `ao_transitar_vazio` e o histórico;
+    rejeições e genes completos são sempre notificados.
+
+    Attributes:
+        passos (int): Quantos passos a execução deu (transições e rejeições).
+        historico (deque | None): As últimas configurações `(passo, indice, estado, topo_da_pilha)`,
+            em que `topo_da_pilha` é uma tupla com até `profundidade` símbolos.
+    """
+
+    def __init__(
+        self,
+        ao_transitar: Callable | None = None,
+        ao_transitar_vazio: Callable | None = None,
+        ao_rejeitar: Callable | None = None,
+        ao_completar_gene: Callable | None = None,
+        amostragem: int = 1,
+        historico: int = 0,
+        marcador: str = 'Stop',
+        profundidade: int = PROFUNDIDADE_PADRAO,
+    ):
+        """
+        Args:
+            ao_transitar (Callable | None): Chamado a cada transição que consome um símbolo.
+            ao_transitar_vazio (Callable | None): Chamado a cada transição ε.
+            ao_rejeitar (Callable | None): Chamado quando um símbolo é ignorado por falta de transição.
+            ao_completar_gene (Callable | None): Chamado quando o marcador de fim de gene é empilhado.
+            amostragem (int): Notifica as transições e grava o histórico só a cada N passos.
+            historico (int): Quantas configurações guardar (0 desliga o histórico).
+            marcador (str): O símbolo de pilha que encerra um gene.
+            profundidade (int): Quantos símbolos do topo da pilha guardar por configuração.
+
+        Raises:
+            ValueError: Se a amostragem não for positiva ou o histórico/profundidade forem negativos.
+        """
+        if amostragem < 1:
+            raise ValueError("A amostragem deve ser de pelo menos 1 passo.")
+        if historico < 0 or profundidade < 0:
+            raise ValueError("O tamanho do histórico e a profundidade não podem ser negativos.")
+        self.ao_transitar = ao_transitar
+        self.ao_transitar_vazio = ao_transitar_vazio
+        self.ao_rejeitar = ao_rejeitar
+        self.ao_completar_gene = ao_completar_gene
+        self.amostragem = amostragem
+        self.marcador = marcador
+        self.profundidade = profundidade
+        self.passos = 0
+        self.historico = deque(maxlen=historico) if historico else None
+
+    def transicao(self, indice: int | None, estado: str, simbolo: str | None, topo: str | None,
+                  destino: str, empilhados: list[str], pilha: list[str]) -> None:
+        """Registra uma transição (com ou sem consumo), já aplicada à pilha."""
+        self.passos += 1
+        if self.passos % self.amostragem == 0:
+            gancho = self.ao_transitar if simbolo is not None else self.ao_transitar_vazio
+            if gancho:
+                gancho(self.passos, indice, estado, simbolo, topo, destino, empilhados)
+            if self.historico is not None:
+                self.historico.append((self.passos, indice, destino, tuple(pilha[-self.profundidade:]) if self.profundidade else ()))
+        if self.ao_completar_gene and simbolo is not None and self.marcador in empilhados:
+            self.ao_completar_gene(self.passos, indice, self._gene(pilha, empilhados))
+
+    def rejeicao(self, indice: int, estado: str, simbolo: str, topo: str | None) -> None:
+        """Registra um símbolo ignorado por falta de transição."""
+        self.passos += 1
+        if self.ao_rejeitar:
+            self.ao_rejeitar(self.passos, indice, estado, simbolo, topo)
+
+    def _gene(self, pilha: list[str], empilhados: list[str]) -> list[str]:
+        """Os símbolos entre o marcador recém-empilhado e o marcador anterior."""
+        fim = len(pilha) - len(empilhados) + empilhados.index(self.marcador)
+        inicio = fim
+        while inicio and pilha[inicio - 1] != self.marcador:
+            inicio -= 1
+        return pilha[inicio:fim]
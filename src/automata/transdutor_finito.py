@@ -5,6 +5,15 @@ Um transdutor finito do tipo Mealy é um autômato finito que, para cada transi
 também produz um símbolo de saída, permitindo transformar cadeias de entrada em cadeias de saída.
 """
 
+import hashlib
+from array import array
+from types import MappingProxyType
+from typing import Sequence
+
+from .lote import preparar_lote
+from .visao import VisaoTranscricao, TAMANHO_BLOCO_VISAO, BLOCOS_EM_CACHE
+
+
 class TransdutorFinito:
     """
     Classe que representa um Transdutor Finito baseado na Máquina de Mealy.
@@ -16,6 +25,10 @@ class TransdutorFinito:
         - δ: é a função de transição de estados (Q × Σ → Q).
         - λ: é a função de saída (Q × Σ → Γ).
         - q0: é o estado inicial, um elemento de Q.
+
+    A definição é congelada na construção (conjuntos viram `frozenset` e as funções,
+    `MappingProxyType` sobre cópias), e o estado de cada execução vive em variáveis
+    locais. Por isso uma mesma instância pode ser usada por várias threads ao mesmo tempo.
     """
 
     def __init__(
@@ -66,13 +79,234 @@ class TransdutorFinito:
             if simbolo_saida not in Γ:
                 raise ValueError(f"O símbolo de saída '{simbolo_saida}' não pertence ao alfabeto de saída Γ.")
 
-        # --- Atribuição dos Componentes ---
-        self.estados = Q
-        self.alfabeto_entrada = Σ
-        self.alfabeto_saida = Γ
-        self.funcao_transicao = δ
-        self.funcao_saida = λ
+        # --- Atribuição dos Componentes (cópias imutáveis) ---
+        self.estados = frozenset(Q)
+        self.alfabeto_entrada = frozenset(Σ)
+        self.alfabeto_saida = frozenset(Γ)
+        self.funcao_transicao = MappingProxyType(dict(δ))
+        self.funcao_saida = MappingProxyType(dict(λ))
         self.estado_inicial = q0
+        self._independente_de_posicao: bool | None = None  # Calculados sob demanda.
+        self._tabela_bytes: bytes | None = None
+
+    def impressao_digital(self) -> str:
+        """
+        Calcula um hash SHA-256 da definição completa da máquina.
+
+        Duas instâncias com a mesma definição (Q, Σ, Γ, δ, λ, q0) têm a mesma
+        impressão digital, independentemente da ordem de inserção nos dicionários.
+
+        Returns:
+            str: O hash em hexadecimal.
+        """
+        definicao = (
+            sorted(self.estados), sorted(self.alfabeto_entrada), sorted(self.alfabeto_saida),
+            sorted(self.funcao_transicao.items()), sorted(self.funcao_saida.items()),
+            self.estado_inicial,
+        )
+        return hashlib.sha256(repr(definicao).encode('utf-8')).hexdigest()
+
+    def independente_de_posicao(self) -> bool:
+        """
+        Indica se a saída de cada símbolo depende só do símbolo, e não do estado.
+
+        É o caso quando, em todo estado alcançável a partir de q0, há regra para
+        todos os símbolos de Σ e cada símbolo produz a mesma saída que em q0.
+        Assim, qualquer trecho da entrada pode ser transcrito a partir de q0,
+        sem processar o que vem antes dele.
+
+        Returns:
+            bool: Verdadeiro se a saída independe da posição na cadeia.
+        """
+        if self._independente_de_posicao is None:
+            saidas = {simbolo: self.funcao_saida.get((self.estado_inicial, simbolo)) for simbolo in self.alfabeto_entrada}
+            independente = None not in saidas.values()
+            alcancaveis = {self.estado_inicial}
+            pendentes = [self.estado_inicial]
+            while independente and pendentes:
+                estado = pendentes.pop()
+                for simbolo, saida in saidas.items():
+                    if self.funcao_saida.get((estado, simbolo)) != saida:
+                        independente = False
+                        break
+                    destino = self.funcao_transicao[(estado, simbolo)]
+                    if destino not in alcancaveis:
+                        alcancaveis.add(destino)
+                        pendentes.append(destino)
+            self._independente_de_posicao = independente
+        return self._independente_de_posicao
+
+    def tabela_bytes(self) -> bytes | None:
+        """
+        Retorna a tabela de `bytes.translate` equivalente à máquina, se houver.
+
+        Existe quando a máquina é independente de posição e todos os símbolos de
+        entrada e de saída são caracteres ASCII (exceto o nulo); a transcrição
+        vira então uma única operação em C sobre os bytes da cadeia.
+
+        Returns:
+            bytes | None: 256 bytes, com zero nos bytes fora do alfabeto de entrada;
+            ou None, se a máquina não puder ser aplicada byte a byte.
+        """
+        if self._tabela_bytes is None and self.independente_de_posicao():
+            tabela = bytearray(256)
+            for simbolo in self.alfabeto_entrada:
+                saida = self.funcao_saida[(self.estado_inicial, simbolo)]
+                if len(simbolo) != 1 or len(saida) != 1 or not 0 < ord(simbolo) < 128 or not 0 < ord(saida) < 128:
+                    return None
+                tabela[ord(simbolo)] = ord(saida)
+            self._tabela_bytes = bytes(tabela)
+        return self._tabela_bytes
+
+    def visao_transcricao(
+        self,
+        cadeia: str,
+        tamanho_bloco: int = TAMANHO_BLOCO_VISAO,
+        blocos_em_cache: int = BLOCOS_EM_CACHE,
+    ) -> VisaoTranscricao:
+        """
+        Retorna a saída de `transcrever(cadeia)` como uma visão preguiçosa.
+
+        A visão suporta `len`, índices, fatias, iteração e `str`, e só transcreve os
+        blocos consultados. Com um transdutor independente de posição, uma prévia
+        ou uma consulta pontual custa O(fatia) em vez de O(cadeia).
+
+        Args:
+            cadeia (str): A cadeia de entrada.
+            tamanho_bloco (int): Os símbolos de entrada transcritos de uma vez.
+            blocos_em_cache (int): Quantos blocos de saída a visão mantém.
+
+        Returns:
+            VisaoTranscricao: A visão sobre a saída; símbolos inválidos levantam
+            ValueError quando o trecho que os contém é consultado.
+        """
+        return VisaoTranscricao(self, cadeia, tamanho_bloco, blocos_em_cache)
+
+    def minimizar(self) -> tuple["TransdutorFinito", dict[str, int]]:
+        """
+        Constrói a máquina de Mealy mínima equivalente por refinamento de partições.
+
+        Remove os estados inalcançáveis a partir de q0 e funde os estados
+        equivalentes, isto é, os que produzem a mesma saída para toda cadeia de
+        entrada. Cada bloco de estados equivalentes é representado pelo seu menor
+        nome (ou por q0, no bloco que o contém).
+
+        Returns:
+            tuple[TransdutorFinito, dict[str, int]]: A máquina mínima e um relatório com
+            'estados_inalcancaveis', 'estados_equivalentes', 'estados_removidos'
+            e 'transicoes_removidas'.
+        """
+        simbolos = sorted(self.alfabeto_entrada)
+
+        # 1. Estados alcançáveis a partir do estado inicial.
+        alcancaveis = {self.estado_inicial}
+        pendentes = [self.estado_inicial]
+        while pendentes:
+            estado = pendentes.pop()
+            for simbolo in simbolos:
+                destino = self.funcao_transicao.get((estado, simbolo))
+                if destino is not None and destino not in alcancaveis:
+                    alcancaveis.add(destino)
+                    pendentes.append(destino)
+
+        # 2. Refinamento: começa agrupando pelas saídas e separa pelos blocos dos destinos.
+        #    Pares (estado, símbolo) sem regra entram na assinatura como None.
+        def numerar(assinaturas: dict) -> dict[str, int]:
+            """Substitui cada assinatura distinta por um número de bloco."""
+            numeros = {}
+            return {estado: numeros.setdefault(assinatura, len(numeros)) for estado, assinatura in assinaturas.items()}
+
+        bloco = numerar({
+            estado: tuple(self.funcao_saida.get((estado, simbolo)) for simbolo in simbolos)
+            for estado in alcancaveis
+        })
+        while True:
+            refinado = numerar({
+                estado: (bloco[estado], tuple(
+                    bloco.get(self.funcao_transicao.get((estado, simbolo))) for simbolo in simbolos
+                ))
+                for estado in alcancaveis
+            })
+            # O refinamento só separa blocos; se a quantidade não mudou, a partição é estável.
+            estavel = len(set(refinado.values())) == len(set(bloco.values()))
+            bloco = refinado
+            if estavel:
+                break
+
+        # 3. Um representante por bloco; o bloco de q0 é representado por q0.
+        representante = {}
+        for estado in sorted(alcancaveis, key=lambda e: (e != self.estado_inicial, e)):
+            representante.setdefault(bloco[estado], estado)
+        mapa = {estado: representante[bloco[estado]] for estado in alcancaveis}
+
+        δ, λ = {}, {}
+        for estado in set(mapa.values()):
+            for simbolo in simbolos:
+                if (estado, simbolo) in self.funcao_transicao:
+                    δ[(estado, simbolo)] = mapa[self.funcao_transicao[(estado, simbolo)]]
+                    λ[(estado, simbolo)] = self.funcao_saida[(estado, simbolo)]
+
+        minima = TransdutorFinito(set(mapa.values()), self.alfabeto_entrada, self.alfabeto_saida, δ, λ, self.estado_inicial)
+        relatorio = {
+            "estados_inalcancaveis": len(self.estados) - len(alcancaveis),
+            "estados_equivalentes": len(alcancaveis) - len(minima.estados),
+            "estados_removidos": len(self.estados) - len(minima.estados),
+            "transicoes_removidas": len(self.funcao_transicao) - len(δ),
+        }
+        return minima, relatorio
+
+    def compor(self, *seguintes: "TransdutorFinito") -> "TransdutorFinito":
+        """
+        Constrói a máquina produto que equivale a aplicar esta máquina e, em
+        seguida, cada uma das `seguintes`, em uma única passada.
+
+        `a.compor(b, c).transcrever(x) == c.transcrever(b.transcrever(a.transcrever(x)))`
+        para toda cadeia que as etapas encadeadas aceitam. Os estados da máquina
+        composta são os pares (q1, q2) alcançáveis a partir de (q0₁, q0₂), nomeados
+        por `repr` do par. Se a saída de uma etapa não tiver regra na etapa
+        seguinte, a transição correspondente fica indefinida e a transcrição
+        levanta ValueError nesse ponto, como o encadeamento faria.
+
+        Args:
+            *seguintes (TransdutorFinito): As etapas aplicadas depois desta, em ordem.
+
+        Returns:
+            TransdutorFinito: A máquina composta, validada pelo construtor.
+        """
+        composta = self
+        for seguinte in seguintes:
+            composta = composta._compor_par(seguinte)
+        return composta
+
+    def __rshift__(self, seguinte: "TransdutorFinito") -> "TransdutorFinito":
+        """Atalho para `compor`: `a >> b >> c` equivale a `a.compor(b, c)`."""
+        return self.compor(seguinte)
+
+    def _compor_par(self, seguinte: "TransdutorFinito") -> "TransdutorFinito":
+        """Produto de duas máquinas, restrito aos pares de estados alcançáveis."""
+        simbolos = sorted(self.alfabeto_entrada)
+        inicial = (self.estado_inicial, seguinte.estado_inicial)
+        δ, λ = {}, {}
+        alcancaveis = {inicial}
+        pendentes = [inicial]
+        while pendentes:
+            par = pendentes.pop()
+            estado, estado_seguinte = par
+            for simbolo in simbolos:
+                if (estado, simbolo) not in self.funcao_transicao:
+                    continue
+                intermediario = self.funcao_saida[(estado, simbolo)]
+                if (estado_seguinte, intermediario) not in seguinte.funcao_transicao:
+                    continue
+                destino = (self.funcao_transicao[(estado, simbolo)], seguinte.funcao_transicao[(estado_seguinte, intermediario)])
+                δ[(repr(par), simbolo)] = repr(destino)
+                λ[(repr(par), simbolo)] = seguinte.funcao_saida[(estado_seguinte, intermediario)]
+                if destino not in alcancaveis:
+                    alcancaveis.add(destino)
+                    pendentes.append(destino)
+
+        Q = {repr(par) for par in alcancaveis}
+        return TransdutorFinito(Q, self.alfabeto_entrada, seguinte.alfabeto_saida, δ, λ, repr(inicial))
 
     def transcrever(self, cadeia: str) -> str:
         """
@@ -90,27 +324,161 @@ class TransdutorFinito:
                         ou se uma regra de transição/saída não for definida para um par
                         (estado, símbolo) encontrado.
         """
+        saida, _ = self.transcrever_bloco(cadeia, self.estado_inicial)
+        return saida
+
+    def transcrever_bloco(self, cadeia: str, estado_atual: str) -> tuple[str, str]:
+        """
+        Processa um bloco da entrada a partir de um estado qualquer.
+
+        Permite transcrever uma cadeia grande aos pedaços: o estado retornado
+        por uma chamada é passado à chamada seguinte.
+
+        Args:
+            cadeia (str): O bloco de entrada a ser processado.
+            estado_atual (str): O estado em que a transcrição se encontra.
+
+        Returns:
+            tuple[str, str]: A saída gerada para o bloco e o estado ao final dele.
+
+        Raises:
+            ValueError: Nas mesmas condições de `transcrever`.
+        """
         resultado = []
-        estado_atual = self.estado_inicial
+        # Referências locais evitam buscas de atributo a cada símbolo.
+        alfabeto_entrada = self.alfabeto_entrada
+        funcao_transicao = self.funcao_transicao
+        funcao_saida = self.funcao_saida
         
         # Itera sobre cada símbolo da cadeia de entrada
         for simbolo in cadeia:
             # Valida se o símbolo pertence ao alfabeto de entrada
-            if simbolo not in self.alfabeto_entrada:
+            if simbolo not in alfabeto_entrada:
                 raise ValueError(f"Símbolo '{simbolo}' na cadeia de entrada não pertence ao alfabeto de entrada Σ.")
 
             tupla_transicao = (estado_atual, simbolo)
 
             # Verifica se existe uma regra definida para o estado e símbolo atuais
-            if tupla_transicao not in self.funcao_transicao:
+            if tupla_transicao not in funcao_transicao:
                 raise ValueError(f"Regra de transição/saída não definida para o estado '{estado_atual}' com o símbolo '{simbolo}'.")
 
-            # Como a regra existe, acessa diretamente os dicionários para obter a saída e o próximo estado
-            saida = self.funcao_saida[tupla_transicao]
-            estado_proximo = self.funcao_transicao[tupla_transicao]
-
             # Adiciona o símbolo de saída ao resultado e atualiza o estado
-            resultado.append(saida)
-            estado_atual = estado_proximo
+            resultado.append(funcao_saida[tupla_transicao])
+            estado_atual = funcao_transicao[tupla_transicao]
+
+        return ''.join(resultado), estado_atual
+
+    def transcrever_em(self, cadeia: str, destino, deslocamento: int = 0) -> int:
+        """
+        Transcreve uma cadeia direto em um buffer gravável fornecido pelo chamador.
+
+        Evita a lista de símbolos e a cadeia de saída de `transcrever`: com uma
+        `tabela_bytes`, a transcrição custa duas cópias temporárias de um byte por
+        base, e o mesmo buffer pode ser reaproveitado entre chamadas.
+
+        Args:
+            cadeia (str): A cadeia de entrada a ser processada.
+            destino: Qualquer buffer gravável e contíguo (bytearray, memoryview, mmap,
+                array de bytes do NumPy...).
+            deslocamento (int): A posição do destino em que a saída começa.
+
+        Returns:
+            int: O número de bytes escritos (a saída é codificada em UTF-8).
+
+        Raises:
+            ValueError: Nas mesmas condições de `transcrever`, ou se a saída não couber
+                no destino a partir do deslocamento.
+            TypeError: Se o destino não for um buffer gravável.
+        """
+        escritos, _ = self.transcrever_bloco_em(cadeia, destino, deslocamento, self.estado_inicial)
+        return escritos
+
+    def transcrever_bloco_em(self, cadeia: str, destino, deslocamento: int, estado_atual: str) -> tuple[int, str]:
+        """
+        Versão de `transcrever_bloco` que escreve a saída em um buffer (ver `transcrever_em`).
+
+        Com uma `tabela_bytes`, o estado não influi na saída e é retornado sem
+        alteração; qualquer estado alcançável produz a mesma transcrição.
+
+        Args:
+            cadeia (str): O bloco de entrada a ser processado.
+            destino: O buffer gravável que recebe a saída.
+            deslocamento (int): A posição do destino em que a saída começa.
+            estado_atual (str): O estado em que a transcrição se encontra.
+
+        Returns:
+            tuple[int, str]: O número de bytes escritos e o estado ao final do bloco.
+
+        Raises:
+            ValueError: Nas mesmas condições de `transcrever_em`.
+            TypeError: Se o destino não for um buffer gravável.
+        """
+        tabela = self.tabela_bytes()
+        if tabela is not None:
+            try:
+                dados = cadeia.encode('ascii').translate(tabela)
+                posicao = dados.find(0)
+            except UnicodeEncodeError as e:
+                posicao = e.start
+            if posicao >= 0:
+                raise ValueError(f"Símbolo '{cadeia[posicao]}' na cadeia de entrada não pertence ao alfabeto de entrada Σ.")
+        else:
+            saida, estado_atual = self.transcrever_bloco(cadeia, estado_atual)
+            dados = saida.encode('utf-8')
+
+        with memoryview(destino) as visao:
+            if visao.readonly:
+                raise TypeError("O destino da transcrição deve ser um buffer gravável.")
+            with visao.cast('B') as bytes_destino:
+                if not 0 <= deslocamento <= len(bytes_destino) - len(dados):
+                    raise ValueError(
+                        f"O destino ({len(bytes_destino)} bytes) não comporta {len(dados)} bytes a partir da posição {deslocamento}."
+                    )
+                bytes_destino[deslocamento:deslocamento + len(dados)] = dados
+        return len(dados), estado_atual
+
+    def transcrever_lote(self, entrada: str | Sequence[str], deslocamentos: Sequence[int] | None = None) -> tuple[str, array]:
+        """
+        Transcreve várias sequências independentes em uma única chamada.
+
+        Cada sequência começa no estado inicial. A entrada é uma lista de
+        sequências ou um buffer concatenado com os seus deslocamentos (ver
+        `src.automata.lote`); a saída vem sempre no formato concatenado.
+
+        Args:
+            entrada (str | Sequence[str]): As sequências, ou o buffer concatenado.
+            deslocamentos (Sequence[int] | None): Os N + 1 deslocamentos do buffer.
+
+        Returns:
+            tuple[str, array]: O buffer de saída e os seus N + 1 deslocamentos.
+
+        Raises:
+            ValueError: Nas mesmas condições de `transcrever`, ou se os deslocamentos forem inválidos.
+        """
+        buffer, deslocamentos = preparar_lote(entrada, deslocamentos)
+        alfabeto_entrada = self.alfabeto_entrada
+        funcao_transicao = self.funcao_transicao
+        funcao_saida = self.funcao_saida
+        estado_inicial = self.estado_inicial
+
+        partes = []
+        deslocamentos_saida = array('q', [0])
+        total = 0
+        for i in range(len(deslocamentos) - 1):
+            estado_atual = estado_inicial
+            resultado = []
+            for simbolo in buffer[deslocamentos[i]:deslocamentos[i + 1]]:
+                tupla_transicao = (estado_atual, simbolo)
+                if tupla_transicao not in funcao_transicao:
+                    # Mesmo diagnóstico de `transcrever_bloco`.
+                    if simbolo not in alfabeto_entrada:
+                        raise ValueError(f"Símbolo '{simbolo}' na cadeia de entrada não pertence ao alfabeto de entrada Σ.")
+                    raise ValueError(f"Regra de transição/saída não definida para o estado '{estado_atual}' com o símbolo '{simbolo}'.")
+                resultado.append(funcao_saida[tupla_transicao])
+                estado_atual = funcao_transicao[tupla_transicao]
+            saida = ''.join(resultado)
+            partes.append(saida)
+            total += len(saida)
+            deslocamentos_saida.append(total)
 
-        return ''.join(resultado)
+        return ''.join(partes), deslocamentos_saida
@@ -0,0 +1,159 @@
+"""
+Módulo que implementa a visão preguiçosa da saída de um `TransdutorFinito`
+(ver `TransdutorFinito.visao_transcricao`).
+
+A visão se comporta como a cadeia de saída (`len`, índices, fatias, iteração e
+`str`), mas só transcreve os blocos da entrada que são de fato consultados,
+guardando os últimos em um cache LRU. Quando a saída de cada símbolo não
+depende do estado (caso do transcritor DNA -> RNA), cada bloco é transcrito
+isoladamente e uma fatia custa O(fatia); nos demais transdutores os blocos
+dependem do estado deixado pelos anteriores, então o primeiro acesso a uma
+posição custa O(posição), e os estados no início de cada bloco já percorrido
+ficam guardados para que blocos descartados do cache sejam refeitos sem
+voltar ao começo.
+"""
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from .transdutor_finito import TransdutorFinito
+
+# --- CONSTANTES DO MÓDULO ---
+TAMANHO_BLOCO_VISAO = 4096          # Símbolos de entrada transcritos de uma vez
+BLOCOS_EM_CACHE = 256               # Blocos de saída mantidos pela visão (LRU)
+
+
+class VisaoTranscricao:
+    """
+    A saída de um transdutor sobre uma cadeia, calculada sob demanda.
+
+    A posição i da visão é o símbolo de saída produzido pelo i-ésimo símbolo de
+    entrada; com símbolos de saída de um caractere (como no RNA), a visão
+    equivale à cadeia `transcritor.transcrever(cadeia)`. Símbolos inválidos só
+    levantam ValueError quando o bloco que os contém é transcrito.
+
+    Attributes:
+        independente_de_posicao (bool): Se os blocos são transcritos isoladamente.
+    """
+
+    def __init__(
+        self,
+        transdutor: "TransdutorFinito",
+        cadeia: str,
+        tamanho_bloco: int = TAMANHO_BLOCO_VISAO,
+        blocos_em_cache: int = BLOCOS_EM_CACHE,
+    ):
+        """
+        Args:
+            transdutor (TransdutorFinito): O transdutor aplicado.
+            cadeia (str): A cadeia de entrada inteira.
+            tamanho_bloco (int): Os símbolos de entrada transcritos de uma vez.
+            blocos_em_cache (int): Quantos blocos de saída a visão mantém.
+
+        Raises:
+            ValueError: Se `tamanho_bloco` ou `blocos_em_cache` não forem positivos.
+        """
+        if tamanho_bloco <= 0 or blocos_em_cache <= 0:
+            raise ValueError("O tamanho do bloco e o número de blocos em cache devem ser positivos.")
+        self.independente_de_posicao = transdutor.independente_de_posicao()
+        self._transdutor = transdutor
+        self._cadeia = cadeia
+        self._tamanho_bloco = tamanho_bloco
+        self._blocos_em_cache = blocos_em_cache
+        self._cache: OrderedDict[int, str | tuple[str, ...]] = OrderedDict()
+        # Com saídas de um caractere, cada bloco é guardado como str; senão, como tupla de símbolos.
+        self._unitario = all(len(simbolo) == 1 for simbolo in transdutor.alfabeto_saida)
+        # Estado no início de cada bloco já alcançado (só usado quando a saída depende do estado).
+        self._estados_iniciais = [transdutor.estado_inicial]
+
+    def __len__(self) -> int:
+        return len(self._cadeia)
+
+    def __repr__(self) -> str:
+        return f"VisaoTranscricao({len(self)} símbolos, {len(self._cache)} bloco(s) em cache)"
+
+    def __str__(self) -> str:
+        return self._juntar(self._trecho(0, len(self)))
+
+    def __iter__(self) -> Iterator[str]:
+        for indice in range(self._numero_blocos()):
+            yield from self._bloco(indice)
+
+    def __getitem__(self, chave: int | slice) -> str:
+        """
+        Um símbolo de saída, ou uma fatia da saída como str.
+
+        Raises:
+            IndexError: Se o índice estiver fora da visão.
+            ValueError: Se o trecho consultado contiver um símbolo inválido.
+        """
+        if isinstance(chave, slice):
+            inicio, fim, passo = chave.indices(len(self))
+            if passo == 1:
+                return self._juntar(self._trecho(inicio, fim))
+            if passo > 0:
+                return self._juntar(self._trecho(inicio, max(inicio, fim))[::passo])
+            # Passo negativo: busca o trecho coberto (fim exclusivo à esquerda) e inverte.
+            return self._juntar(self._trecho(fim + 1, inicio + 1)[::-1][::-passo]) if inicio > fim else ""
+        tamanho = len(self)
+        if chave < 0:
+            chave += tamanho
+        if not 0 <= chave < tamanho:
+            raise IndexError("Índice fora da visão da transcrição.")
+        bloco, deslocamento = divmod(chave, self._tamanho_bloco)
+        return self._bloco(bloco)[deslocamento]
+
+    def _numero_blocos(self) -> int:
+        return -(-len(self) // self._tamanho_bloco)
+
+    def _juntar(self, trecho: str | tuple[str, ...]) -> str:
+        return trecho if self._unitario else ''.join(trecho)
+
+    def _trecho(self, inicio: int, fim: int) -> str | tuple[str, ...]:
+        """Os símbolos de saída das posições [inicio, fim), com 0 <= inicio <= fim <= len."""
+        if inicio >= fim:
+            return "" if self._unitario else ()
+        primeiro, ultimo = inicio // self._tamanho_bloco, (fim - 1) // self._tamanho_bloco
+        partes = [self._bloco(indice) for indice in range(primeiro, ultimo + 1)]
+        trecho = "".join(partes) if self._unitario else sum(partes, ())
+        deslocamento = primeiro * self._tamanho_bloco
+        return trecho[inicio - deslocamento:fim - deslocamento]
+
+    def _bloco(self, indice: int) -> str | tuple[str, ...]:
+        """Devolve o bloco de saída `indice`, do cache ou transcrevendo-o."""
+        bloco = self._cache.get(indice)
+        if bloco is not None:
+            self._cache.move_to_end(indice)
+            return bloco
+
+        if self.independente_de_posicao:
+            bloco = self._transcrever(indice, self._transdutor.estado_inicial)[0]
+        else:
+            # Percorre os blocos ainda não alcançados para descobrir o estado inicial deste.
+            while len(self._estados_iniciais) <= indice:
+                anterior = len(self._estados_iniciais) - 1
+                saida, estado = self._transcrever(anterior, self._estados_iniciais[anterior])
+                self._estados_iniciais.append(estado)
+                self._guardar(anterior, saida)
+            bloco = self._transcrever(indice, self._estados_iniciais[indice])[0]
+        self._guardar(indice, bloco)
+        return bloco
+
+    def _transcrever(self, indice: int, estado: str) -> tuple[str | tuple[str, ...], str]:
+        inicio = indice * self._tamanho_bloco
+        entrada = self._cadeia[inicio:inicio + self._tamanho_bloco]
+        if self._unitario:
+            return self._transdutor.transcrever_bloco(entrada, estado)
+        # Símbolos de saída com mais de um caractere: mantém as fronteiras entre eles.
+        simbolos = []
+        for simbolo in entrada:
+            saida, estado = self._transdutor.transcrever_bloco(simbolo, estado)
+            simbolos.append(saida)
+        return tuple(simbolos), estado
+
+    def _guardar(self, indice: int, bloco: str | tuple[str, ...]) -> None:
+        self._cache[indice] = bloco
+        self._cache.move_to_end(indice)
+        if len(self._cache) > self._blocos_em_cache:
+            self._cache.popitem(last=False)
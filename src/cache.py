@@ -0,0 +1,284 @@
+"""
+Módulo que implementa um cache em disco, endereçado por conteúdo, dos resultados
+do processamento (RNA e proteínas).
+
+A chave de cada entrada é o hash do DNA normalizado combinado com a impressão
+digital das definições dos autômatos (δ, λ e a tabela de códons). Assim, reprocessar
+a mesma sequência com as mesmas máquinas devolve os arquivos já calculados, e
+qualquer mudança na tradução invalida o cache automaticamente.
+
+Estrutura em disco:
+
+    <diretorio>/<chave[:2]>/<chave>/rna.txt
+                                    proteina.txt
+                                    meta.json      # tamanhos e SHA-256 de cada arquivo
+
+O horário de modificação de `meta.json` marca o último uso da entrada e orienta
+a remoção LRU quando o tamanho total passa do limite.
+
+Os arquivos de uma entrada nunca são compartilhados com as saídas: `materializar`
+os copia (por reflink, quando o sistema de arquivos permite), de modo que uma
+execução posterior que reescreva as saídas não altera o cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterable
+
+try:
+    import fcntl
+except ImportError:     # Windows: sem reflink, só cópias comuns.
+    fcntl = None
+
+from .automata import TransdutorFinito, Automato_Pilha
+from .utils import normalizar_dna
+
+# --- CONSTANTES DO MÓDULO ---
+LIMITE_BYTES_PADRAO = 1 << 30                       # Tamanho máximo do cache (1 GiB)
+ARQUIVOS_ENTRADA = ("rna.txt", "proteina.txt")      # Arquivos guardados em cada entrada
+TAMANHO_LEITURA = 1 << 20                           # Bytes lidos por vez ao calcular hashes
+FICLONE = 0x40049409                                # ioctl do Linux que clona um arquivo (reflink)
+
+
+def _copiar(origem: Path, destino: Path) -> None:
+    """Copia `origem` sobre `destino` de forma atômica, por reflink quando possível."""
+    temporario = destino.with_name(f".{destino.name}.{os.getpid()}.tmp")
+    try:
+        with origem.open('rb') as entrada, temporario.open('wb') as saida:
+            try:
+                if fcntl is None:
+                    raise OSError("reflink indisponível")
+                fcntl.ioctl(saida.fileno(), FICLONE, entrada.fileno())
+            except OSError:
+                shutil.copyfileobj(entrada, saida, TAMANHO_LEITURA)
+        os.replace(temporario, destino)
+    finally:
+        temporario.unlink(missing_ok=True)
+
+
+def impressao_digital_definicoes(transcritor: TransdutorFinito, ribossomo: Automato_Pilha, tabela_codons: dict[str, str]) -> str:
+    """
+    Combina as impressões digitais das máquinas e da tabela de códons em um único hash.
+
+    Args:
+        transcritor (TransdutorFinito): O transdutor DNA -> RNA.
+        ribossomo (Automato_Pilha): O autômato RNA -> proteína.
+        tabela_codons (dict[str, str]): A tabela de códons usada na tradução.
+
+    Returns:
+        str: O hash SHA-256 em hexadecimal.
+    """
+    hash_definicoes = hashlib.sha256()
+    hash_definicoes.update(transcritor.impressao_digital().encode('ascii'))
+    hash_definicoes.update(ribossomo.impressao_digital().encode('ascii'))
+    hash_definicoes.update(repr(sorted(tabela_codons.items())).encode('utf-8'))
+    return hash_definicoes.hexdigest()
+
+
+def calcular_chave(blocos: Iterable[str], impressao_digital: str) -> str:
+    """
+    Calcula a chave de cache de uma entrada, lida bloco a bloco (memória constante).
+
+    Args:
+        blocos (Iterable[str]): Os blocos de DNA bruto, em ordem.
+        impressao_digital (str): A impressão digital das definições (ver `impressao_digital_definicoes`).
+
+    Returns:
+        str: A chave em hexadecimal.
+
+    Raises:
+        ValueError: Se o DNA contiver bases inválidas.
+    """
+    hash_chave = hashlib.sha256(impressao_digital.encode('ascii'))
+    hash_chave.update(b'\0')
+    for bloco in blocos:
+        hash_chave.update(normalizar_dna(bloco).encode('ascii'))
+    return hash_chave.hexdigest()
+
+
+def _hash_arquivo(caminho: Path) -> str:
+    """Calcula o SHA-256 de um arquivo, lendo-o em partes."""
+    hash_arquivo = hashlib.sha256()
+    with caminho.open('rb') as arquivo:
+        while parte := arquivo.read(TAMANHO_LEITURA):
+            hash_arquivo.update(parte)
+    return hash_arquivo.hexdigest()
+
+
+class CacheResultados:
+    """
+    Cache em disco de resultados de processamento, com remoção LRU e verificação de integridade.
+
+    Attributes:
+        diretorio (Path): A raiz do cache.
+        limite_bytes (int): O tamanho total máximo das entradas guardadas.
+    """
+
+    def __init__(self, diretorio: str | Path, limite_bytes: int = LIMITE_BYTES_PADRAO):
+        """
+        Args:
+            diretorio (str | Path): A raiz do cache; é criada se não existir.
+            limite_bytes (int): O tamanho total máximo das entradas guardadas.
+
+        Raises:
+            ValueError: Se o limite não for positivo.
+        """
+        if limite_bytes <= 0:
+            raise ValueError("O limite do cache deve ser positivo.")
+        self.diretorio = Path(diretorio)
+        self.limite_bytes = limite_bytes
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+
+    def _caminho_entrada(self, chave: str) -> Path:
+        return self.diretorio / chave[:2] / chave
+
+    def obter(self, chave: str) -> tuple[Path, Path] | None:
+        """
+        Procura uma entrada e confere a sua integridade.
+
+        Uma entrada corrompida (arquivo ausente, tamanho ou hash divergente) é
+        removida e tratada como ausente.
+
+        Args:
+            chave (str): A chave calculada por `calcular_chave`.
+
+        Returns:
+            tuple[Path, Path] | None: Os caminhos dos arquivos de RNA e proteína, ou None.
+        """
+        entrada = self._caminho_entrada(chave)
+        meta = entrada / "meta.json"
+        if not meta.is_file():
+            return None
+
+        try:
+            descricao = json.loads(meta.read_text(encoding='utf-8'))
+            for nome in ARQUIVOS_ENTRADA:
+                caminho = entrada / nome
+                if caminho.stat().st_size != descricao[nome]["tamanho"] or _hash_arquivo(caminho) != descricao[nome]["sha256"]:
+                    raise ValueError(f"conteúdo de '{nome}' não confere")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.warning(f"Entrada de cache '{chave}' corrompida ({e}); removendo.")
+            shutil.rmtree(entrada, ignore_errors=True)
+            return None
+
+        # Marca o uso recente da entrada para a política LRU.
+        os.utime(meta)
+        return entrada / ARQUIVOS_ENTRADA[0], entrada / ARQUIVOS_ENTRADA[1]
+
+    def ler(self, chave: str) -> tuple[str, str] | None:
+        """
+        Em caso de acerto, retorna o conteúdo guardado.
+
+        Args:
+            chave (str): A chave calculada por `calcular_chave`.
+
+        Returns:
+            tuple[str, str] | None: O RNA e as proteínas formatadas, ou None.
+        """
+        arquivos = self.obter(chave)
+        if arquivos is None:
+            return None
+        return tuple(caminho.read_text(encoding='utf-8') for caminho in arquivos)
+
+    def materializar(self, chave: str, destino_rna: Path, destino_proteina: Path) -> bool:
+        """
+        Em caso de acerto, coloca os resultados guardados nos caminhos de destino.
+
+        Cada destino é uma cópia (um reflink, se o sistema de arquivos permitir),
+        montada ao lado dele e movida de uma vez sobre o arquivo anterior.
+
+        Args:
+            chave (str): A chave calculada por `calcular_chave`.
+            destino_rna (Path): Onde o arquivo de RNA deve aparecer.
+            destino_proteina (Path): Onde o arquivo de proteínas deve aparecer.
+
+        Returns:
+            bool: True se houve acerto, False caso contrário.
+        """
+        arquivos = self.obter(chave)
+        if arquivos is None:
+            return False
+        for origem, destino in zip(arquivos, (destino_rna, destino_proteina)):
+            _copiar(origem, Path(destino))
+        return True
+
+    def guardar(self, chave: str, caminho_rna: Path, caminho_proteina: Path) -> None:
+        """
+        Copia os arquivos de resultado para uma nova entrada e aplica o limite de tamanho.
+
+        A entrada é montada em um diretório temporário e movida de uma vez,
+        de modo que leitores nunca vejam uma entrada incompleta. Como a chave
+        determina o conteúdo, uma entrada íntegra já existente é mantida.
+
+        Args:
+            chave (str): A chave calculada por `calcular_chave`.
+            caminho_rna (Path): O arquivo de RNA produzido.
+            caminho_proteina (Path): O arquivo de proteínas produzido.
+        """
+        if self.obter(chave) is not None:
+            return
+        entrada = self._caminho_entrada(chave)
+        entrada.parent.mkdir(parents=True, exist_ok=True)
+        temporario = Path(tempfile.mkdtemp(prefix=".tmp-", dir=entrada.parent))
+        try:
+            descricao = {}
+            for origem, nome in zip((caminho_rna, caminho_proteina), ARQUIVOS_ENTRADA):
+                shutil.copyfile(origem, temporario / nome)
+                descricao[nome] = {
+                    "tamanho": (temporario / nome).stat().st_size,
+                    "sha256": _hash_arquivo(temporario / nome),
+                }
+            (temporario / "meta.json").write_text(json.dumps(descricao), encoding='utf-8')
+            if entrada.exists() and not (entrada / "meta.json").is_file():
+                # Restos de uma entrada incompleta: saem do caminho com um único rename.
+                entrada.rename(temporario.with_name(temporario.name + "-antiga"))
+                shutil.rmtree(temporario.with_name(temporario.name + "-antiga"), ignore_errors=True)
+            try:
+                temporario.rename(entrada)
+            except OSError:
+                # Outro processo guardou a mesma entrada (de mesmo conteúdo) primeiro.
+                if not (entrada / "meta.json").is_file():
+                    raise
+        finally:
+            shutil.rmtree(temporario, ignore_errors=True)
+        self.remover_excedente()
+
+    def _entradas(self) -> list[tuple[float, int, Path]]:
+        """Lista as entradas como (último uso, tamanho em bytes, caminho)."""
+        entradas = []
+        for meta in self.diretorio.glob("*/*/meta.json"):
+            try:
+                tamanho = sum(arquivo.stat().st_size for arquivo in meta.parent.iterdir())
+                entradas.append((meta.stat().st_mtime, tamanho, meta.parent))
+            except OSError:
+                continue
+        return entradas
+
+    def tamanho_total(self) -> int:
+        """Retorna o tamanho total, em bytes, das entradas guardadas."""
+        return sum(tamanho for _, tamanho, _ in self._entradas())
+
+    def remover_excedente(self) -> int:
+        """
+        Remove as entradas usadas há mais tempo até o cache caber no limite.
+
+        Returns:
+            int: O número de entradas removidas.
+        """
+        entradas = sorted(self._entradas())
+        total = sum(tamanho for _, tamanho, _ in entradas)
+        removidas = 0
+        for _, tamanho, caminho in entradas:
+            if total <= self.limite_bytes:
+                break
+            shutil.rmtree(caminho, ignore_errors=True)
+            total -= tamanho
+            removidas += 1
+        if removidas:
+            logging.info(f"Cache: {removidas} entrada(s) antiga(s) removida(s) para respeitar o limite.")
+        return removidas
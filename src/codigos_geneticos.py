@@ -0,0 +1,273 @@
+"""
+Módulo que implementa o registro de códigos genéticos e a tradução sob vários
+códigos em uma única varredura.
+
+Cada código de `CODIGOS_GENETICOS` tem o seu ribossomo (`Automato_Pilha`) e a sua
+tabela compilada montados uma única vez e reaproveitados em chamadas seguintes.
+
+A tradução direta (`traduzir_codigos`) produz exatamente as mesmas proteínas que
+o ribossomo de cada código, mas compartilha o trabalho entre os códigos: as
+posições de início (AUG) são localizadas uma só vez, e os códigos que começam um
+gene na mesma posição leem os códons juntos até que cada um encontre a sua parada.
+
+A tradução em códigos de uma letra (`traduzir_uma_letra`) trabalha sobre os
+índices dos códons (0 a 63), calculados para os três quadros de leitura com
+operações em C; nenhuma lista de nomes 'Met'/'Phe' é montada.
+"""
+
+import re
+import heapq
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+from .automata import Automato_Pilha
+from .tabela_codons import CODIGOS_GENETICOS, CODIGO_UMA_LETRA
+
+# --- CONSTANTES DO MÓDULO ---
+CODIGO_PADRAO = 1               # Número NCBI do código genético padrão
+CODON_INICIO = 'AUG'            # Único códon de início modelado pelo ribossomo
+BASES_RNA = 'ACGU'              # Ordem das bases no índice de um códon (16*b1 + 4*b2 + b3)
+LETRA_PARADA = ord('*')         # Byte que marca um códon de parada na tabela de índices
+_SIMBOLO_INVALIDO = re.compile(r'[^ACGU]')
+_BASE_PARA_INDICE = str.maketrans(BASES_RNA, '\x00\x01\x02\x03')
+
+
+def _validar_codigo(codigo: int) -> None:
+    """Garante que o código genético está registrado."""
+    if codigo not in CODIGOS_GENETICOS:
+        disponiveis = ", ".join(map(str, sorted(CODIGOS_GENETICOS)))
+        raise ValueError(f"Código genético {codigo} desconhecido. Disponíveis: {disponiveis}.")
+
+
+@lru_cache(maxsize=None)
+def obter_ribossomo(codigo: int = CODIGO_PADRAO) -> Automato_Pilha:
+    """
+    Retorna o ribossomo do código genético informado, montando-o apenas na primeira chamada.
+
+    Args:
+        codigo (int): O número NCBI do código genético.
+
+    Returns:
+        Automato_Pilha: O autômato de tradução do código.
+
+    Raises:
+        ValueError: Se o código não estiver registrado.
+    """
+    # Importação local: as funções fábrica vivem no __init__ do pacote, que importa este módulo.
+    from . import criar_ribossomo
+    _validar_codigo(codigo)
+    return criar_ribossomo(CODIGOS_GENETICOS[codigo][1])
+
+
+@lru_cache(maxsize=None)
+def compilar_tabela(codigo: int = CODIGO_PADRAO) -> Mapping[str, str | None]:
+    """
+    Retorna a tabela do código com os códons de parada mapeados para None.
+
+    Args:
+        codigo (int): O número NCBI do código genético.
+
+    Returns:
+        Mapping[str, str | None]: Códon -> aminoácido, ou None se for de parada
+        (somente leitura, pois a mesma tabela é compartilhada por todas as chamadas).
+
+    Raises:
+        ValueError: Se o código não estiver registrado.
+    """
+    _validar_codigo(codigo)
+    return MappingProxyType({
+        codon: (None if aminoacido == 'Stop' else aminoacido) for codon, aminoacido in CODIGOS_GENETICOS[codigo][1].items()
+    })
+
+
+def localizar_inicios(rna: str) -> array:
+    """
+    Localiza todas as ocorrências do códon de início (em C, via expressão regular).
+
+    Como 'AUG' não se sobrepõe a si mesmo, as ocorrências não se sobrepõem.
+
+    Returns:
+        array: As posições, em ordem crescente.
+    """
+    return array('q', (ocorrencia.start() for ocorrencia in re.finditer(CODON_INICIO, rna)))
+
+
+def traduzir_codigos(rna: str, codigos: list[int]) -> dict[int, list[str]]:
+    """
+    Traduz uma fita de RNA sob vários códigos genéticos em uma única varredura.
+
+    O resultado de cada código é idêntico ao do seu ribossomo:
+    `" ".join(resultado[c]) == formatar_proteina(obter_ribossomo(c).transcrever_pilha(rna))`.
+
+    Args:
+        rna (str): A fita de RNA.
+        codigos (list[int]): Os números NCBI dos códigos desejados.
+
+    Returns:
+        dict[int, list[str]]: Para cada código, as proteínas formatadas de cada gene.
+
+    Raises:
+        ValueError: Se um código não estiver registrado ou a fita tiver símbolos inválidos.
+    """
+    tabelas = {codigo: compilar_tabela(codigo) for codigo in codigos}
+    invalido = _SIMBOLO_INVALIDO.search(rna)
+    if invalido:
+        raise ValueError(f"Símbolo '{invalido.group()}' na cadeia de entrada não pertence ao alfabeto de entrada Σ.")
+
+    inicios = localizar_inicios(rna)
+    proteinas: dict[int, list[str]] = {codigo: [] for codigo in tabelas}
+    tamanho = len(rna)
+
+    # Fila de eventos: (índice em `inicios` do próximo gene, código). Códigos que
+    # começam um gene na mesma posição são atendidos juntos.
+    eventos = [(0, codigo) for codigo in tabelas] if inicios else []
+    heapq.heapify(eventos)
+    while eventos:
+        indice_inicio = eventos[0][0]
+        grupo = {}
+        while eventos and eventos[0][0] == indice_inicio:
+            grupo[heapq.heappop(eventos)[1]] = ['Met']
+
+        # Lê os códons uma vez para todo o grupo; cada código sai ao ler a sua parada.
+        posicao = inicios[indice_inicio] + 3
+        while grupo and posicao + 3 <= tamanho:
+            codon = rna[posicao:posicao + 3]
+            posicao += 3
+            for codigo in list(grupo):
+                aminoacido = tabelas[codigo][codon]
+                if aminoacido is None:
+                    proteinas[codigo].append('-'.join(grupo.pop(codigo)))
+                    # A busca recomeça logo após a parada: próximo AUG em posição >= `posicao`.
+                    proximo = bisect_left(inicios, posicao, lo=indice_inicio)
+                    if proximo < len(inicios):
+                        heapq.heappush(eventos, (proximo, codigo))
+                else:
+                    grupo[codigo].append(aminoacido)
+        # Quem restou no grupo chegou ao fim da fita sem parada: o gene é descartado (rollback).
+
+    return proteinas
+
+
+def traduzir_direto(rna: str, codigo: int = CODIGO_PADRAO) -> list[str]:
+    """
+    Traduz uma fita de RNA sob um único código, sem simular o autômato passo a passo.
+
+    Args:
+        rna (str): A fita de RNA.
+        codigo (int): O número NCBI do código genético.
+
+    Returns:
+        list[str]: As proteínas formatadas de cada gene.
+    """
+    return traduzir_codigos(rna, [codigo])[codigo]
+
+
+@lru_cache(maxsize=None)
+def compilar_tabela_indices(codigo: int = CODIGO_PADRAO) -> bytes:
+    """
+    Retorna a tabela do código indexada pelo índice do códon, em códigos de uma letra.
+
+    O códon b1 b2 b3 tem índice `16*i(b1) + 4*i(b2) + i(b3)`, com i seguindo a ordem
+    de `BASES_RNA`; códons de parada valem `LETRA_PARADA` ('*').
+
+    Args:
+        codigo (int): O número NCBI do código genético.
+
+    Returns:
+        bytes: Os 64 códigos de uma letra (ASCII), um por índice de códon,
+        completados com zeros até 256 bytes para uso direto em `bytes.translate`.
+
+    Raises:
+        ValueError: Se o código não estiver registrado.
+    """
+    _validar_codigo(codigo)
+    tabela = CODIGOS_GENETICOS[codigo][1]
+    return bytes(
+        ord(CODIGO_UMA_LETRA[tabela[b1 + b2 + b3]])
+        for b1 in BASES_RNA for b2 in BASES_RNA for b3 in BASES_RNA
+    ).ljust(256, b'\0')
+
+
+def indices_bases(rna: str) -> bytes:
+    """
+    Converte uma fita de RNA já validada em bytes de 0 a 3, na ordem de `BASES_RNA`.
+    """
+    return rna.translate(_BASE_PARA_INDICE).encode('latin-1')
+
+
+def codons_do_quadro(indices: bytes, quadro: int) -> bytes:
+    """
+    Calcula os índices (0 a 63) de todos os códons completos de um quadro de leitura.
+
+    O cálculo é feito em C, sem laço por códon: cada byte de `indices` vale de
+    0 a 3, por isso `(b1 << 4) | (b2 << 2) | b3`, feito sobre os três fluxos de
+    bases como inteiros grandes, nunca transborda de um byte para o vizinho.
+
+    Args:
+        indices (bytes): A fita convertida por `indices_bases`.
+        quadro (int): O deslocamento do primeiro códon (0, 1 ou 2).
+
+    Returns:
+        bytes: Um byte por códon; o códon j começa na base `3*j + quadro`.
+    """
+    terceiras = indices[quadro + 2::3]
+    quantidade = len(terceiras)
+    if not quantidade:
+        return b''
+    return (
+        (int.from_bytes(indices[quadro::3][:quantidade], 'big') << 4)
+        | (int.from_bytes(indices[quadro + 1::3][:quantidade], 'big') << 2)
+        | int.from_bytes(terceiras, 'big')
+    ).to_bytes(quantidade, 'big')
+
+
+def traduzir_uma_letra(rna: str, codigo: int = CODIGO_PADRAO) -> tuple[bytes, array]:
+    """
+    Traduz uma fita de RNA para proteínas em códigos de uma letra.
+
+    Segue exatamente a gramática do ribossomo (busca por AUG, leitura até a
+    parada no mesmo quadro, descarte do gene sem parada no fim da fita), mas
+    trabalha com os índices dos códons: cada quadro de leitura é traduzido uma
+    vez para bytes, e a parada de cada gene é encontrada com `bytes.find`.
+
+    Args:
+        rna (str): A fita de RNA.
+        codigo (int): O número NCBI do código genético.
+
+    Returns:
+        tuple[bytes, array]: Os resíduos de todos os genes, um byte ASCII por
+        aminoácido, e os N + 1 deslocamentos de cada gene (ver `src.automata.lote`).
+
+    Raises:
+        ValueError: Se o código não estiver registrado ou a fita tiver símbolos inválidos.
+    """
+    tabela = compilar_tabela_indices(codigo)
+    invalido = _SIMBOLO_INVALIDO.search(rna)
+    if invalido:
+        raise ValueError(f"Símbolo '{invalido.group()}' na cadeia de entrada não pertence ao alfabeto de entrada Σ.")
+
+    indices = indices_bases(rna)
+    quadros = [codons_do_quadro(indices, quadro).translate(tabela) for quadro in range(3)]
+    inicios = localizar_inicios(rna)
+
+    residuos = bytearray()
+    deslocamentos = array('q', [0])
+    proximo = 0
+    while proximo < len(inicios):
+        inicio = inicios[proximo]
+        letras = quadros[inicio % 3]
+        codon_inicio = inicio // 3
+        parada = letras.find(LETRA_PARADA, codon_inicio + 1)
+        if parada < 0:
+            # Sem parada até o fim da fita: o gene é descartado (rollback) e a fita acabou.
+            break
+        residuos += b'M'
+        residuos += letras[codon_inicio + 1:parada]
+        deslocamentos.append(len(residuos))
+        # A busca recomeça logo após o códon de parada.
+        proximo = bisect_left(inicios, 3 * parada + inicio % 3 + 3, lo=proximo)
+
+    return bytes(residuos), deslocamentos
@@ -0,0 +1,370 @@
+"""
+Módulo que implementa a tradução distribuída: um coordenador divide a fita de
+RNA em fragmentos, envia cada um a um trabalhador (possivelmente em outra
+máquina) por TCP e junta as proteínas na ordem da fita.
+
+Protocolo: cada mensagem é um objeto JSON precedido do seu tamanho em bytes
+(uint32 big-endian), como no enquadramento 'prefixo' do modo residente.
+
+    pedido      {"id": 3, "rna": "...", "codigo": 1}
+    resposta    {"id": 3, "ok": true, "genes": [[inicio, fim, "Met-Phe"], ...]}
+                {"id": 3, "ok": false, "erro": "..."}
+
+O trabalhador traduz o fragmento como se a fita começasse nele (busca por AUG)
+e devolve os genes completos com as suas posições. Os genes que atravessam a
+fronteira de um fragmento, e os que a cadeia de genes de um fragmento pula por
+ter começado fora de sincronia com a fita inteira, são resolvidos na junção:
+a partir do fim de cada gene, o coordenador procura o próximo AUG; se algum
+trabalhador já traduziu um gene começando ali, ele é reaproveitado (um gene só
+depende da fita a partir do seu início); senão, o gene é traduzido localmente.
+
+Se um trabalhador cai ou não responde, os seus fragmentos são redistribuídos
+entre os restantes, até `TENTATIVAS_PADRAO` rodadas.
+"""
+
+import json
+import logging
+import re
+import socket
+import socketserver
+import struct
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Mapping
+
+from .codigos_geneticos import (
+    CODIGO_PADRAO, CODON_INICIO, LETRA_PARADA,
+    compilar_tabela, compilar_tabela_indices, indices_bases, codons_do_quadro, localizar_inicios
+)
+from .tabela_codons import CODIGO_UMA_LETRA
+
+# --- CONSTANTES DO MÓDULO ---
+TAMANHO_FRAGMENTO_PADRAO = 1 << 20  # Bases por fragmento enviado a um trabalhador
+TENTATIVAS_PADRAO = 3               # Rodadas de redistribuição após falhas
+TEMPO_LIMITE_PADRAO = 60.0          # Segundos de espera por uma resposta
+TAMANHO_MAXIMO_MENSAGEM = 64 << 20  # Bytes aceitos em uma mensagem (o prefixo permitiria até 4 GiB)
+TAMANHO_MAXIMO_FRAGMENTO = TAMANHO_MAXIMO_MENSAGEM // 2  # A resposta usa até ~1,4 byte por base
+_TAMANHO = struct.Struct('>I')
+_SIMBOLO_INVALIDO = re.compile(r'[^ACGU]')
+_TRES_LETRAS = {ord(letra): f"{nome}-" for nome, letra in CODIGO_UMA_LETRA.items()}
+
+
+class FalhaTrabalhador(RuntimeError):
+    """O trabalhador caiu, recusou a conexão ou não respondeu a tempo."""
+
+
+def interpretar_endereco(texto: str, host_padrao: str = "127.0.0.1") -> tuple[str, int]:
+    """
+    Converte 'host:porta' (ou só 'porta') em um par (host, porta).
+
+    Raises:
+        ValueError: Se a porta não for um inteiro entre 0 e 65535.
+    """
+    host, _, porta = texto.rpartition(":")
+    if not porta.isdigit() or int(porta) > 65535:
+        raise ValueError(f"Endereço '{texto}' inválido: use HOST:PORTA.")
+    return host or host_padrao, int(porta)
+
+
+# --- Enquadramento ---
+
+def _receber_exato(conexao: socket.socket, tamanho: int) -> bytes | None:
+    """Lê exatamente `tamanho` bytes; None se a conexão fechar antes do primeiro."""
+    partes, faltam = [], tamanho
+    while faltam:
+        parte = conexao.recv(min(faltam, 1 << 20))
+        if not parte:
+            if faltam == tamanho:
+                return None
+            raise ConnectionError("Conexão encerrada no meio de uma mensagem.")
+        partes.append(parte)
+        faltam -= len(parte)
+    return b"".join(partes)
+
+
+def enviar_mensagem(conexao: socket.socket, mensagem: dict[str, Any]) -> None:
+    """
+    Envia um objeto JSON precedido do seu tamanho.
+
+    Raises:
+        ValueError: Se a mensagem passar de `TAMANHO_MAXIMO_MENSAGEM` bytes.
+    """
+    corpo = json.dumps(mensagem, ensure_ascii=False).encode('utf-8')
+    if len(corpo) > TAMANHO_MAXIMO_MENSAGEM:
+        raise ValueError(f"Mensagem de {len(corpo)} bytes excede o máximo de {TAMANHO_MAXIMO_MENSAGEM} bytes.")
+    conexao.sendall(_TAMANHO.pack(len(corpo)) + corpo)
+
+
+def receber_mensagem(conexao: socket.socket) -> Any:
+    """
+    Recebe um valor JSON precedido do seu tamanho.
+
+    O tamanho é conferido antes de qualquer leitura do corpo: um par não consegue
+    fazer o outro lado reservar mais que `TAMANHO_MAXIMO_MENSAGEM` bytes.
+
+    Returns:
+        Any: A mensagem (um objeto, se o par seguir o protocolo), ou None se a conexão
+        foi encerrada entre mensagens.
+
+    Raises:
+        ConnectionError: Se a conexão for encerrada no meio de uma mensagem.
+        ValueError: Se o tamanho anunciado passar de `TAMANHO_MAXIMO_MENSAGEM` ou o
+            corpo não for JSON válido (`json.JSONDecodeError`, `UnicodeDecodeError`).
+    """
+    cabecalho = _receber_exato(conexao, _TAMANHO.size)
+    if cabecalho is None:
+        return None
+    tamanho = _TAMANHO.unpack(cabecalho)[0]
+    if tamanho > TAMANHO_MAXIMO_MENSAGEM:
+        raise ValueError(f"Mensagem de {tamanho} bytes excede o máximo de {TAMANHO_MAXIMO_MENSAGEM} bytes.")
+    corpo = _receber_exato(conexao, tamanho) or b""
+    return json.loads(corpo.decode('utf-8'))
+
+
+# --- Trabalhador ---
+
+def traduzir_fragmento(rna: str, codigo: int = CODIGO_PADRAO) -> list[tuple[int, int, str]]:
+    """
+    Traduz um fragmento como se a fita começasse nele, guardando a posição de cada gene.
+
+    Faz a mesma varredura de `traduzir_uma_letra` (quadros de leitura em códigos
+    de uma letra e `bytes.find` para a parada) e converte cada gene para o
+    formato de três letras. O gene sem parada no fim do fragmento não é devolvido.
+
+    Args:
+        rna (str): O fragmento de RNA.
+        codigo (int): O número NCBI do código genético.
+
+    Returns:
+        list[tuple[int, int, str]]: Para cada gene, o início (AUG), o fim (após a
+        parada, exclusivo), relativos ao fragmento, e a proteína formatada.
+
+    Raises:
+        ValueError: Se o código não estiver registrado ou o fragmento tiver símbolos inválidos.
+    """
+    tabela = compilar_tabela_indices(codigo)
+    invalido = _SIMBOLO_INVALIDO.search(rna)
+    if invalido:
+        raise ValueError(f"Símbolo '{invalido.group()}' na cadeia de entrada não pertence ao alfabeto de entrada Σ.")
+
+    indices = indices_bases(rna)
+    quadros = [codons_do_quadro(indices, quadro).translate(tabela) for quadro in range(3)]
+    inicios = localizar_inicios(rna)
+
+    genes = []
+    proximo = 0
+    while proximo < len(inicios):
+        inicio = inicios[proximo]
+        letras = quadros[inicio % 3]
+        codon_inicio = inicio // 3
+        parada = letras.find(LETRA_PARADA, codon_inicio + 1)
+        if parada < 0:
+            break
+        fim = 3 * parada + inicio % 3 + 3
+        residuos = "M" + letras[codon_inicio + 1:parada].decode('ascii')
+        genes.append((inicio, fim, residuos.translate(_TRES_LETRAS)[:-1]))
+        proximo = bisect_left(inicios, fim, lo=proximo)
+    return genes
+
+
+class _AtendimentoTrabalhador(socketserver.BaseRequestHandler):
+    """Atende os pedidos de uma conexão do coordenador, um após o outro."""
+
+    def handle(self) -> None:
+        while True:
+            try:
+                pedido = receber_mensagem(self.request)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                # O enquadramento segue íntegro: só este pedido é recusado.
+                enviar_mensagem(self.request, {"id": None, "ok": False, "erro": f"Pedido não é JSON válido: {e}"})
+                continue
+            except (ValueError, ConnectionError) as e:
+                logging.warning(f"Conexão de {self.client_address[0]} encerrada: {e}")
+                return
+            if pedido is None:
+                return
+            if not isinstance(pedido, dict):
+                enviar_mensagem(self.request, {"id": None, "ok": False, "erro": "O pedido deve ser um objeto JSON."})
+                continue
+            try:
+                genes = traduzir_fragmento(pedido["rna"], pedido.get("codigo", CODIGO_PADRAO))
+                resposta = {"id": pedido.get("id"), "ok": True, "genes": genes}
+            except (ValueError, KeyError, TypeError) as e:
+                resposta = {"id": pedido.get("id"), "ok": False, "erro": str(e)}
+            enviar_mensagem(self.request, resposta)
+
+
+class TrabalhadorTraducao(socketserver.ThreadingTCPServer):
+    """
+    Servidor TCP que traduz fragmentos para um coordenador.
+
+    Uso: `TrabalhadorTraducao(("127.0.0.1", 7070)).serve_forever()`; com a porta 0,
+    o sistema escolhe uma porta livre, informada em `endereco`.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, endereco: tuple[str, int]):
+        """
+        Args:
+            endereco (tuple[str, int]): O par (host, porta) em que o trabalhador escuta.
+        """
+        super().__init__(endereco, _AtendimentoTrabalhador)
+
+    @property
+    def endereco(self) -> tuple[str, int]:
+        """O par (host, porta) em que o trabalhador está escutando."""
+        return self.server_address[:2]
+
+
+# --- Coordenador ---
+
+def _traduzir_gene(rna: str, inicio: int, tabela: Mapping[str, str | None]) -> tuple[int, str] | None:
+    """Traduz localmente o gene que começa em `inicio`: (fim, proteína), ou None se não houver parada."""
+    nomes = ['Met']
+    for posicao in range(inicio + 3, len(rna) - 2, 3):
+        aminoacido = tabela[rna[posicao:posicao + 3]]
+        if aminoacido is None:
+            return posicao + 3, '-'.join(nomes)
+        nomes.append(aminoacido)
+    return None
+
+
+class CoordenadorTraducao:
+    """
+    Distribui a tradução de uma fita de RNA entre trabalhadores remotos.
+
+    Attributes:
+        enderecos (list[tuple[str, int]]): Os trabalhadores, como pares (host, porta).
+        fragmentos_reenviados (int): Quantos fragmentos precisaram ser reenviados na última tradução.
+        genes_locais (int): Quantos genes a junção traduziu localmente na última tradução.
+    """
+
+    def __init__(
+        self,
+        enderecos: list[tuple[str, int]],
+        tamanho_fragmento: int = TAMANHO_FRAGMENTO_PADRAO,
+        tentativas: int = TENTATIVAS_PADRAO,
+        tempo_limite: float = TEMPO_LIMITE_PADRAO,
+    ):
+        """
+        Args:
+            enderecos (list[tuple[str, int]]): Os trabalhadores, como pares (host, porta).
+            tamanho_fragmento (int): Bases por fragmento.
+            tentativas (int): Rodadas de redistribuição dos fragmentos que falharem.
+            tempo_limite (float): Segundos de espera pela conexão e por cada resposta.
+
+        Raises:
+            ValueError: Se não houver trabalhadores ou o tamanho do fragmento não for positivo
+                ou não couber (com a resposta) em uma mensagem.
+        """
+        if not enderecos:
+            raise ValueError("É preciso informar ao menos um trabalhador.")
+        if not 0 < tamanho_fragmento <= TAMANHO_MAXIMO_FRAGMENTO:
+            raise ValueError(f"O tamanho do fragmento deve estar entre 1 e {TAMANHO_MAXIMO_FRAGMENTO} bases.")
+        self.enderecos = list(enderecos)
+        self.tamanho_fragmento = tamanho_fragmento
+        self.tentativas = tentativas
+        self.tempo_limite = tempo_limite
+        self.fragmentos_reenviados = 0
+        self.genes_locais = 0
+
+    def _enviar_lote(self, endereco: tuple[str, int], pedidos: list[dict[str, Any]]) -> tuple[dict[int, list], list[dict[str, Any]]]:
+        """
+        Envia os pedidos a um trabalhador por uma única conexão.
+
+        Returns:
+            tuple: As respostas obtidas (id -> genes) e os pedidos que ficaram sem resposta.
+
+        Raises:
+            ValueError: Se o trabalhador rejeitar um fragmento (ex: símbolo inválido).
+        """
+        respostas: dict[int, list] = {}
+        try:
+            with socket.create_connection(endereco, timeout=self.tempo_limite) as conexao:
+                for pedido in pedidos:
+                    enviar_mensagem(conexao, pedido)
+                    resposta = receber_mensagem(conexao)
+                    if resposta is None:
+                        raise ConnectionError("O trabalhador encerrou a conexão.")
+                    if not resposta.get("ok"):
+                        raise ValueError(resposta.get("erro", "Fragmento rejeitado pelo trabalhador."))
+                    respostas[pedido["id"]] = resposta["genes"]
+        except (OSError, json.JSONDecodeError) as e:
+            # socket.timeout e ConnectionError são subclasses de OSError.
+            logging.warning(f"Trabalhador {endereco[0]}:{endereco[1]} falhou ({e}); seus fragmentos serão redistribuídos.")
+        return respostas, [pedido for pedido in pedidos if pedido["id"] not in respostas]
+
+    def _espalhar(self, rna: str, codigo: int) -> list[list]:
+        """Envia todos os fragmentos e devolve os genes de cada um, com posições relativas."""
+        pendentes = [
+            {"id": indice, "rna": rna[inicio:inicio + self.tamanho_fragmento], "codigo": codigo}
+            for indice, inicio in enumerate(range(0, len(rna), self.tamanho_fragmento))
+        ]
+        resultados: list[list] = [[] for _ in pendentes]
+        vivos = list(self.enderecos)
+
+        for rodada in range(self.tentativas + 1):
+            if not pendentes or not vivos:
+                break
+            if rodada:
+                self.fragmentos_reenviados += len(pendentes)
+            lotes = {endereco: pendentes[posicao::len(vivos)] for posicao, endereco in enumerate(vivos)}
+            with ThreadPoolExecutor(len(vivos)) as pool:
+                retornos = dict(zip(lotes, pool.map(lambda endereco: self._enviar_lote(endereco, lotes[endereco]), lotes)))
+            pendentes = []
+            for endereco, (respostas, falhas) in retornos.items():
+                for indice, genes in respostas.items():
+                    resultados[indice] = genes
+                if falhas:
+                    vivos.remove(endereco)
+                    pendentes.extend(falhas)
+            pendentes.sort(key=lambda pedido: pedido["id"])
+
+        if pendentes:
+            raise FalhaTrabalhador(f"{len(pendentes)} fragmento(s) sem resposta após {self.tentativas} nova(s) tentativa(s).")
+        return resultados
+
+    def traduzir(self, rna: str, codigo: int = CODIGO_PADRAO) -> list[str]:
+        """
+        Traduz a fita com os trabalhadores e junta as proteínas na ordem da fita.
+
+        O resultado é idêntico ao do ribossomo: `" ".join(resultado) ==
+        formatar_proteina(obter_ribossomo(codigo).transcrever_pilha(rna))`.
+
+        Args:
+            rna (str): A fita de RNA.
+            codigo (int): O número NCBI do código genético.
+
+        Returns:
+            list[str]: As proteínas formatadas de cada gene.
+
+        Raises:
+            ValueError: Se a fita tiver símbolos inválidos ou o código for desconhecido.
+            FalhaTrabalhador: Se algum fragmento ficar sem resposta após as novas tentativas.
+        """
+        tabela = compilar_tabela(codigo)
+        self.fragmentos_reenviados = 0
+        self.genes_locais = 0
+
+        # Genes já traduzidos pelos trabalhadores, indexados pela posição global do AUG.
+        remotos: dict[int, tuple[int, str]] = {}
+        for indice, genes in enumerate(self._espalhar(rna, codigo)):
+            deslocamento = indice * self.tamanho_fragmento
+            for inicio, fim, proteina in genes:
+                remotos[inicio + deslocamento] = (fim + deslocamento, proteina)
+
+        proteinas = []
+        posicao = 0
+        while (inicio := rna.find(CODON_INICIO, posicao)) >= 0:
+            gene = remotos.get(inicio)
+            if gene is None:
+                # Gene que atravessa uma fronteira, ou AUG pulado por um fragmento fora de sincronia.
+                gene = _traduzir_gene(rna, inicio, tabela)
+                if gene is None:
+                    break       # Sem parada até o fim da fita: o gene é descartado (rollback).
+                self.genes_locais += 1
+            posicao, proteina = gene
+            proteinas.append(proteina)
+        return proteinas
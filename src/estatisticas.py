@@ -0,0 +1,187 @@
+"""
+Módulo que implementa o modo só-estatísticas: a entrada passa pela transcrição
+e pela lógica de tradução do ribossomo, mas apenas contadores são atualizados.
+
+Nenhum RNA ou proteína é materializado. A memória usada depende só do tamanho
+do bloco: entre blocos, guarda-se no máximo duas bases pendentes, se um gene
+está aberto e as contagens parciais desse gene (descartadas se a fita acabar
+antes da parada, como no rollback do ribossomo).
+
+As estatísticas cobrem:
+    - uso de códons: os códons dos genes completos, do AUG à parada, inclusive;
+    - composição de aminoácidos: derivada do uso de códons (sem as paradas);
+    - número de genes e histograma dos comprimentos (em resíduos, Met incluído);
+    - conteúdo GC da entrada.
+"""
+
+import re
+from collections import Counter
+from typing import Any, Iterable
+
+from .automata import TransdutorFinito
+from .codigos_geneticos import (
+    BASES_RNA, CODIGO_PADRAO, LETRA_PARADA, CODON_INICIO,
+    compilar_tabela, compilar_tabela_indices, indices_bases, codons_do_quadro
+)
+from .utils import normalizar_dna
+
+# --- CONSTANTES DO MÓDULO ---
+CODONS = tuple(b1 + b2 + b3 for b1 in BASES_RNA for b2 in BASES_RNA for b3 in BASES_RNA)   # Em ordem de índice
+_SIMBOLO_INVALIDO = re.compile(r'[^ACGU]')
+
+
+def _contar_codons(contagem: list[int], codons: bytes) -> None:
+    """Soma a `contagem` as ocorrências de cada índice de códon (64 buscas em C)."""
+    if codons:
+        for indice in range(len(contagem)):
+            contagem[indice] += codons.count(indice)
+
+
+class EstatisticasTraducao:
+    """
+    Acumula as estatísticas da tradução de uma fita de RNA lida em blocos.
+
+    Os genes reconhecidos são exatamente os do ribossomo (`Automato_Pilha`) para o
+    mesmo código genético: busca por AUG, leitura no mesmo quadro até a parada e
+    descarte do gene sem parada no fim da fita.
+
+    Attributes:
+        codigo (int): O número NCBI do código genético.
+        bases (int): Quantas bases foram lidas.
+        bases_gc (int): Quantas dessas bases são G ou C.
+        genes (int): Quantos genes completos foram encontrados.
+        uso_codons (list[int]): As contagens de cada códon, em ordem de índice (ver `CODONS`).
+        comprimentos (Counter): Comprimento do gene (em resíduos) -> número de genes.
+    """
+
+    def __init__(self, codigo: int = CODIGO_PADRAO):
+        """
+        Args:
+            codigo (int): O número NCBI do código genético.
+
+        Raises:
+            ValueError: Se o código não estiver registrado.
+        """
+        self.codigo = codigo
+        self._tabela = compilar_tabela_indices(codigo)
+        self.bases = 0
+        self.bases_gc = 0
+        self.genes = 0
+        self.uso_codons = [0] * len(CODONS)
+        self.comprimentos: Counter = Counter()
+        # Estado entre blocos.
+        self._resto = ""                        # Bases ainda não examinadas (no máximo 2)
+        self._em_gene = False
+        self._codons_gene = 0                   # Códons já lidos do gene aberto
+        self._pendente = [0] * len(CODONS)      # Contagens do gene aberto
+
+    def consumir(self, rna: str) -> None:
+        """
+        Atualiza as estatísticas com o próximo bloco da fita.
+
+        Args:
+            rna (str): O bloco de RNA.
+
+        Raises:
+            ValueError: Se o bloco tiver símbolos fora de {A, C, G, U}.
+        """
+        invalido = _SIMBOLO_INVALIDO.search(rna)
+        if invalido:
+            raise ValueError(f"Símbolo '{invalido.group()}' na cadeia de entrada não pertence ao alfabeto de entrada Σ.")
+        self.bases += len(rna)
+        self.bases_gc += rna.count('G') + rna.count('C')
+
+        texto = self._resto + rna
+        indices = indices_bases(texto)
+        codons = [codons_do_quadro(indices, quadro) for quadro in range(3)]
+        letras = [codons_quadro.translate(self._tabela) for codons_quadro in codons]
+        confirmados = []        # Códons dos genes concluídos neste bloco
+        posicao = 0
+
+        while True:
+            if not self._em_gene:
+                inicio = texto.find(CODON_INICIO, posicao)
+                if inicio < 0:
+                    # Guarda as duas últimas bases: um AUG pode atravessar a fronteira.
+                    posicao = max(posicao, len(texto) - 2)
+                    break
+                self._em_gene = True
+                posicao = inicio
+                continue
+
+            quadro, primeiro = posicao % 3, posicao // 3
+            parada = letras[quadro].find(LETRA_PARADA, primeiro)
+            if parada < 0:
+                # O gene continua no próximo bloco: conta o que foi lido como pendente.
+                trecho = codons[quadro][primeiro:]
+                _contar_codons(self._pendente, trecho)
+                self._codons_gene += len(trecho)
+                posicao = 3 * len(codons[quadro]) + quadro
+                break
+
+            confirmados.append(codons[quadro][primeiro:parada + 1])
+            self.comprimentos[self._codons_gene + parada - primeiro] += 1
+            self.genes += 1
+            if self._codons_gene:
+                self.uso_codons = [total + parcial for total, parcial in zip(self.uso_codons, self._pendente)]
+                self._pendente = [0] * len(CODONS)
+                self._codons_gene = 0
+            self._em_gene = False
+            posicao = 3 * (parada + 1) + quadro
+
+        _contar_codons(self.uso_codons, b''.join(confirmados))
+        self._resto = texto[posicao:]
+
+    def resumo(self) -> dict[str, Any]:
+        """
+        Monta o resumo das estatísticas, pronto para `json.dumps`.
+
+        Um gene ainda aberto (sem parada) não entra no resumo, como no rollback do ribossomo.
+
+        Returns:
+            dict[str, Any]: As estatísticas agregadas.
+        """
+        tabela = compilar_tabela(self.codigo)
+        composicao: Counter = Counter()
+        for codon, quantidade in zip(CODONS, self.uso_codons):
+            if quantidade and tabela[codon] is not None:
+                composicao[tabela[codon]] += quantidade
+
+        residuos = sum(comprimento * quantidade for comprimento, quantidade in self.comprimentos.items())
+        return {
+            "codigo": self.codigo,
+            "bases": self.bases,
+            "conteudo_gc": self.bases_gc / self.bases if self.bases else 0.0,
+            "genes": self.genes,
+            "comprimento_genes": {
+                "minimo": min(self.comprimentos, default=0),
+                "maximo": max(self.comprimentos, default=0),
+                "medio": residuos / self.genes if self.genes else 0.0,
+                "histograma": {str(comprimento): self.comprimentos[comprimento] for comprimento in sorted(self.comprimentos)},
+            },
+            "uso_codons": dict(zip(CODONS, self.uso_codons)),
+            "composicao_aminoacidos": dict(sorted(composicao.items())),
+        }
+
+
+def calcular_estatisticas(fonte: Iterable[str], transcritor: TransdutorFinito, codigo: int = CODIGO_PADRAO) -> dict[str, Any]:
+    """
+    Calcula as estatísticas de uma entrada de DNA lida em blocos, em memória constante.
+
+    Args:
+        fonte (Iterable[str]): Os blocos de DNA bruto, em ordem (ex: `ler_blocos`).
+        transcritor (TransdutorFinito): O transdutor DNA -> RNA.
+        codigo (int): O número NCBI do código genético.
+
+    Returns:
+        dict[str, Any]: O resumo de `EstatisticasTraducao.resumo`.
+
+    Raises:
+        ValueError: Se o DNA contiver bases inválidas ou o código for desconhecido.
+    """
+    estatisticas = EstatisticasTraducao(codigo)
+    estado = transcritor.estado_inicial
+    for bloco in fonte:
+        rna, estado = transcritor.transcrever_bloco(normalizar_dna(bloco), estado)
+        estatisticas.consumir(rna)
+    return estatisticas.resumo()
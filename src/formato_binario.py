@@ -0,0 +1,90 @@
+"""
+Módulo que implementa o formato binário compacto de proteínas.
+
+Cada resíduo ocupa um byte (o seu código de uma letra em ASCII), e uma tabela
+de deslocamentos indica onde começa cada gene:
+
+    cabeçalho   'PROT' | versão (uint16) | reservado (uint16) | número de genes N (uint64)
+    tabela      N + 1 deslocamentos (uint64), do início dos resíduos
+    resíduos    os bytes de todos os genes, concatenados
+
+Todos os inteiros são little-endian. A proteína i ocupa
+`residuos[deslocamentos[i]:deslocamentos[i + 1]]`, no mesmo formato de lote
+usado por `src.automata.lote`.
+"""
+
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Sequence
+
+# --- CONSTANTES DO MÓDULO ---
+ASSINATURA = b'PROT'                # Identifica o formato no início do arquivo
+VERSAO = 1                          # Versão atual do formato
+_CABECALHO = struct.Struct('<4sHHQ')
+
+
+def _deslocamentos_little_endian(deslocamentos: array) -> array:
+    """Converte (ou desfaz a conversão de) um array 'Q' entre a ordem nativa e little-endian."""
+    if sys.byteorder == 'big':
+        deslocamentos = array('Q', deslocamentos)
+        deslocamentos.byteswap()
+    return deslocamentos
+
+
+def escrever_proteinas_binario(caminho: str | Path, residuos: bytes, deslocamentos: Sequence[int]) -> None:
+    """
+    Grava as proteínas no formato binário.
+
+    Args:
+        caminho (str | Path): O arquivo de destino.
+        residuos (bytes): Os resíduos de todos os genes, um byte por aminoácido.
+        deslocamentos (Sequence[int]): Os N + 1 deslocamentos de cada gene.
+
+    Raises:
+        ValueError: Se os deslocamentos não descreverem exatamente os resíduos.
+    """
+    if not deslocamentos or deslocamentos[0] != 0 or deslocamentos[-1] != len(residuos):
+        raise ValueError("Os deslocamentos devem ir de 0 até o número de resíduos.")
+    tabela = _deslocamentos_little_endian(array('Q', deslocamentos))
+    with Path(caminho).open('wb') as arquivo:
+        arquivo.write(_CABECALHO.pack(ASSINATURA, VERSAO, 0, len(deslocamentos) - 1))
+        tabela.tofile(arquivo)
+        arquivo.write(residuos)
+
+
+def ler_proteinas_binario(caminho: str | Path) -> tuple[bytes, array]:
+    """
+    Lê um arquivo gravado por `escrever_proteinas_binario`.
+
+    Args:
+        caminho (str | Path): O arquivo a ser lido.
+
+    Returns:
+        tuple[bytes, array]: Os resíduos e os N + 1 deslocamentos (array 'Q').
+
+    Raises:
+        ValueError: Se o arquivo não estiver no formato ou estiver truncado.
+    """
+    with Path(caminho).open('rb') as arquivo:
+        cabecalho = arquivo.read(_CABECALHO.size)
+        if len(cabecalho) != _CABECALHO.size:
+            raise ValueError("Arquivo binário de proteínas truncado.")
+        assinatura, versao, _, genes = _CABECALHO.unpack(cabecalho)
+        if assinatura != ASSINATURA or versao != VERSAO:
+            raise ValueError("O arquivo não está no formato binário de proteínas (versão 1).")
+        # O número de genes vem do arquivo: confere com o tamanho dele antes de alocar a tabela.
+        if (genes + 1) * 8 > os.fstat(arquivo.fileno()).st_size - _CABECALHO.size:
+            raise ValueError("Arquivo binário de proteínas truncado.")
+        tabela = array('Q')
+        try:
+            tabela.fromfile(arquivo, genes + 1)
+        except EOFError:
+            raise ValueError("Arquivo binário de proteínas truncado.") from None
+        tabela = _deslocamentos_little_endian(tabela)
+        residuos = arquivo.read()
+    if len(residuos) != tabela[-1]:
+        raise ValueError("O número de resíduos não confere com a tabela de deslocamentos.")
+    return residuos, tabela
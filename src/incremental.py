@@ -0,0 +1,397 @@
+"""
+Módulo que implementa a retradução incremental de uma fita de RNA após edições.
+
+Durante a tradução completa, a configuração do `Automato_Pilha` (estado e parte
+em aberto da pilha) é registrada em pontos de controle a cada `intervalo`
+símbolos, junto com o número de genes já concluídos antes de cada ponto.
+
+Quando um trecho da fita é substituído, a tradução é retomada do último ponto
+de controle anterior à edição e segue até o primeiro ponto posterior a ela em
+que a configuração volta a coincidir com a da execução antiga. Daí em diante o
+comportamento do autômato é idêntico, então os genes antigos são reaproveitados.
+O trabalho do autômato é proporcional ao tamanho da edição (mais a distância
+até a convergência), e não ao tamanho do genoma. O mesmo vale para a
+atualização do registro: a fita, as configurações e os genes ficam em
+segmentos, e a edição troca só os que foram refeitos.
+"""
+
+import json
+from pathlib import Path
+from typing import NamedTuple
+
+from .automata import Automato_Pilha, ExecucaoPilha
+from .utils import separar_proteinas, formatar_proteina
+
+# --- CONSTANTES DO MÓDULO ---
+INTERVALO_PADRAO = 4096             # Símbolos entre dois pontos de controle
+BLOCO_COMPARACAO = 1 << 16          # Tamanho dos blocos comparados ao calcular diferenças
+
+
+class PontoControle(NamedTuple):
+    """
+    Configuração do autômato registrada antes de consumir o símbolo `posicao`.
+
+    Attributes:
+        posicao (int): Índice na fita de RNA.
+        estado (str): O estado do autômato.
+        pilha (tuple[str, ...]): A parte em aberto da pilha (após drenar os genes concluídos).
+        genes_antes (int): Quantos genes foram concluídos antes desta posição.
+    """
+    posicao: int
+    estado: str
+    pilha: tuple[str, ...]
+    genes_antes: int
+
+
+def calcular_diferenca(antiga: str, nova: str) -> tuple[int, int, int]:
+    """
+    Localiza o trecho que difere entre duas cadeias pelo maior prefixo e sufixo comuns.
+
+    As comparações são feitas em blocos (em C), e não símbolo a símbolo.
+
+    Args:
+        antiga (str): A cadeia original.
+        nova (str): A cadeia editada.
+
+    Returns:
+        tuple[int, int, int]: (inicio, fim_antiga, fim_nova), tais que
+        `nova == antiga[:inicio] + nova[inicio:fim_nova] + antiga[fim_antiga:]`.
+    """
+    limite = min(len(antiga), len(nova))
+    tamanho_antiga, tamanho_nova = len(antiga), len(nova)
+
+    # Maior prefixo comum: avança blocos inteiros e refina dentro do primeiro diferente.
+    inicio = 0
+    while inicio + BLOCO_COMPARACAO <= limite and antiga[inicio:inicio + BLOCO_COMPARACAO] == nova[inicio:inicio + BLOCO_COMPARACAO]:
+        inicio += BLOCO_COMPARACAO
+    while inicio < limite and antiga[inicio] == nova[inicio]:
+        inicio += 1
+
+    # Maior sufixo comum que não invada o prefixo.
+    limite_sufixo = limite - inicio
+    sufixo = 0
+    while sufixo + BLOCO_COMPARACAO <= limite_sufixo and \
+            antiga[tamanho_antiga - sufixo - BLOCO_COMPARACAO:tamanho_antiga - sufixo] == nova[tamanho_nova - sufixo - BLOCO_COMPARACAO:tamanho_nova - sufixo]:
+        sufixo += BLOCO_COMPARACAO
+    while sufixo < limite_sufixo and antiga[tamanho_antiga - sufixo - 1] == nova[tamanho_nova - sufixo - 1]:
+        sufixo += 1
+
+    return inicio, tamanho_antiga - sufixo, tamanho_nova - sufixo
+
+
+class _SomasPrefixo:
+    """
+    Árvore de Fenwick sobre os tamanhos dos segmentos da fita.
+
+    Dá a posição inicial de um segmento e o segmento que contém uma posição em
+    O(log n), e absorve a mudança de tamanho de um segmento sem deslocar os
+    seguintes: é assim que as posições após uma edição são corrigidas sob demanda.
+    """
+
+    def __init__(self, valores: list[int]):
+        self._arvore = [0] + valores
+        for indice in range(1, len(self._arvore)):
+            pai = indice + (indice & -indice)
+            if pai < len(self._arvore):
+                self._arvore[pai] += self._arvore[indice]
+
+    def somar(self, indice: int, delta: int) -> None:
+        """Soma `delta` ao valor `indice`."""
+        indice += 1
+        while indice < len(self._arvore):
+            self._arvore[indice] += delta
+            indice += indice & -indice
+
+    def prefixo(self, indice: int) -> int:
+        """Retorna a soma dos valores anteriores a `indice`."""
+        soma = 0
+        while indice > 0:
+            soma += self._arvore[indice]
+            indice -= indice & -indice
+        return soma
+
+    def localizar(self, posicao: int) -> int:
+        """Retorna o maior índice cuja soma anterior não passa de `posicao` (valores positivos)."""
+        indice = 0
+        passo = 1 << (len(self._arvore) - 1).bit_length()
+        while passo:
+            proximo = indice + passo
+            if proximo < len(self._arvore) and self._arvore[proximo] <= posicao:
+                indice = proximo
+                posicao -= self._arvore[proximo]
+            passo >>= 1
+        return min(indice, len(self._arvore) - 2)
+
+
+class TraducaoIncremental:
+    """
+    Tradução de RNA em proteínas que pode ser atualizada após edições na fita.
+
+    A fita é guardada em segmentos, um por ponto de controle, cada um com a
+    configuração do autômato no seu início e os genes concluídos ao lê-lo. Uma
+    edição troca apenas os segmentos reprocessados; as posições dos seguintes são
+    obtidas por somas de prefixo, sem reescrevê-las. A fita e as proteínas
+    completas só são montadas quando consultadas.
+
+    Attributes:
+        ribossomo (Automato_Pilha): O autômato de tradução.
+        intervalo (int): Símbolos entre dois pontos de controle.
+        simbolos_reprocessados (int): Quantos símbolos a última atualização consumiu.
+    """
+
+    def __init__(self, ribossomo: Automato_Pilha, intervalo: int = INTERVALO_PADRAO):
+        """
+        Args:
+            ribossomo (Automato_Pilha): O autômato de tradução (marcador de gene: 'Stop').
+            intervalo (int): Símbolos entre dois pontos de controle.
+
+        Raises:
+            ValueError: Se o intervalo não for positivo.
+        """
+        if intervalo <= 0:
+            raise ValueError("O intervalo entre pontos de controle deve ser positivo.")
+        self.ribossomo = ribossomo
+        self.intervalo = intervalo
+        self.simbolos_reprocessados = 0
+        self._segmentos: list[str] = []
+        self._configuracoes: list[tuple[str, tuple[str, ...]]] = []
+        self._genes: list[list[str]] = []
+        self._posicoes = _SomasPrefixo([])
+        self._tamanho = 0
+        self._rna: str | None = ""
+        self._proteina: str | None = ""
+        self._final = (ribossomo.estado_inicial, (ribossomo.estado_inicial_pilha,))
+        self._resto = ""
+
+    @property
+    def rna(self) -> str:
+        """A fita de RNA atual (montada a partir dos segmentos na primeira consulta)."""
+        if self._rna is None:
+            self._rna = "".join(self._segmentos)
+        return self._rna
+
+    @property
+    def genes(self) -> list[str]:
+        """As proteínas de cada gene concluído, em ordem."""
+        return [gene for genes in self._genes for gene in genes]
+
+    @property
+    def pontos(self) -> list[PontoControle]:
+        """Os pontos de controle, em ordem de posição."""
+        pontos = []
+        posicao = genes_antes = 0
+        for segmento, configuracao, genes in zip(self._segmentos, self._configuracoes, self._genes):
+            pontos.append(PontoControle(posicao, *configuracao, genes_antes))
+            posicao += len(segmento)
+            genes_antes += len(genes)
+        return pontos
+
+    @property
+    def proteina(self) -> str:
+        """As proteínas formatadas, idênticas a `formatar_proteina(ribossomo.transcrever_pilha(rna))`."""
+        if self._proteina is None:
+            genes = self.genes
+            self._proteina = " ".join(genes + [self._resto] if self._resto else genes)
+        return self._proteina
+
+    def _concluir(self, execucao: ExecucaoPilha) -> None:
+        """Guarda a configuração final e traduz o que restou após as transições ε finais."""
+        self._final = execucao.configuracao
+        copia = ExecucaoPilha(self.ribossomo, marcador='Stop')
+        copia.restaurar(*self._final)
+        self._resto = formatar_proteina(copia.finalizar())
+
+    def traduzir(self, rna: str) -> str:
+        """
+        Traduz a fita inteira, registrando os pontos de controle.
+
+        Args:
+            rna (str): A fita de RNA.
+
+        Returns:
+            str: As proteínas formatadas.
+        """
+        self._segmentos, self._configuracoes, self._genes = [], [], []
+        execucao = ExecucaoPilha(self.ribossomo, marcador='Stop')
+        for posicao in range(0, len(rna), self.intervalo):
+            self._segmentos.append(rna[posicao:posicao + self.intervalo])
+            self._configuracoes.append(execucao.configuracao)
+            execucao.consumir(rna, posicao, min(posicao + self.intervalo, len(rna)))
+            self._genes.append(separar_proteinas(execucao.drenar()))
+        self._posicoes = _SomasPrefixo([len(segmento) for segmento in self._segmentos])
+        self._tamanho = len(rna)
+        self._rna, self._proteina = rna, None
+        self.simbolos_reprocessados = len(rna)
+        self._concluir(execucao)
+        return self.proteina
+
+    def editar(self, inicio: int, fim: int, trecho: str) -> None:
+        """
+        Substitui `rna[inicio:fim]` por `trecho` e atualiza a tradução.
+
+        Só os segmentos entre o último ponto de controle anterior à edição e o ponto
+        de convergência são refeitos; a fita e as proteínas completas não são
+        remontadas aqui (consulte `rna` e `proteina`).
+
+        Args:
+            inicio (int): Início do trecho substituído.
+            fim (int): Fim (exclusivo) do trecho substituído.
+            trecho (str): O novo conteúdo do trecho.
+
+        Raises:
+            ValueError: Se os índices estiverem fora da fita ou o trecho tiver símbolos inválidos.
+        """
+        if not 0 <= inicio <= fim <= self._tamanho:
+            raise ValueError(f"Trecho [{inicio}:{fim}] fora da fita de {self._tamanho} bases.")
+        if not self._segmentos:
+            self.traduzir(trecho)
+            return
+
+        # Retoma do último ponto de controle anterior à edição.
+        k0 = self._posicoes.localizar(inicio)
+        base = self._posicoes.prefixo(k0)
+        # Pontos antigos candidatos à convergência: os que ficam após o trecho editado.
+        j = self._posicoes.localizar(fim)
+        if self._posicoes.prefixo(j) < fim:
+            j += 1
+        j = max(j, k0 + 1)
+
+        antigo = "".join(self._segmentos[k0:j])
+        cadeia = antigo[:inicio - base] + trecho + antigo[fim - base:]
+        cobertos = j - k0
+        execucao = ExecucaoPilha(self.ribossomo, marcador='Stop')
+        execucao.restaurar(*self._configuracoes[k0])
+        segmentos: list[str] = []
+        configuracoes: list[tuple[str, tuple[str, ...]]] = []
+        genes: list[list[str]] = []
+        reprocessados = 0
+        while True:
+            # O trecho refeito mantém o número de segmentos que substitui, a menos que
+            # a edição os deixe desproporcionais ao intervalo.
+            pedacos = cobertos
+            if not cobertos * self.intervalo // 2 <= len(cadeia) < 2 * cobertos * self.intervalo:
+                pedacos = max(1, len(cadeia) // self.intervalo)
+            cortes = [len(cadeia) * parte // pedacos for parte in range(pedacos + 1)]
+            for posicao, proxima in zip(cortes, cortes[1:]):
+                if posicao < proxima:
+                    segmentos.append(cadeia[posicao:proxima])
+                    configuracoes.append(execucao.configuracao)
+                    execucao.consumir(cadeia, posicao, proxima)
+                    genes.append(separar_proteinas(execucao.drenar()))
+            reprocessados += len(cadeia)
+
+            if j == len(self._segmentos):
+                # Chegou ao fim da fita sem convergir: a configuração final mudou.
+                self._concluir(execucao)
+                break
+            if execucao.configuracao == self._configuracoes[j]:
+                # Convergiu: o restante da execução antiga continua válido, apenas deslocado.
+                break
+            cadeia, cobertos = self._segmentos[j], 1
+            j += 1
+
+        if len(segmentos) == j - k0:
+            for indice, segmento in enumerate(segmentos, k0):
+                self._posicoes.somar(indice, len(segmento) - len(self._segmentos[indice]))
+        self._segmentos[k0:j] = segmentos
+        self._configuracoes[k0:j] = configuracoes
+        self._genes[k0:j] = genes
+        if len(segmentos) != j - k0:
+            # O número de segmentos mudou (edição da ordem do intervalo): refaz as somas.
+            self._posicoes = _SomasPrefixo([len(segmento) for segmento in self._segmentos])
+        self._tamanho += len(trecho) - (fim - inicio)
+        self._rna = self._proteina = None
+        self.simbolos_reprocessados = reprocessados
+
+    def aplicar_edicoes(self, edicoes: list[tuple[int, int, str]]) -> None:
+        """
+        Aplica várias edições (inicio, fim, trecho) dadas em coordenadas da fita original.
+
+        As edições não podem se sobrepor; são aplicadas de trás para frente para
+        que as coordenadas continuem válidas.
+        """
+        reprocessados = 0
+        for inicio, fim, trecho in sorted(edicoes, reverse=True):
+            self.editar(inicio, fim, trecho)
+            reprocessados += self.simbolos_reprocessados
+        self.simbolos_reprocessados = reprocessados
+
+    def atualizar(self, rna: str) -> str:
+        """
+        Atualiza a tradução para uma nova versão da fita, localizando a diferença automaticamente.
+
+        Args:
+            rna (str): A nova fita de RNA.
+
+        Returns:
+            str: As proteínas formatadas da nova fita.
+        """
+        inicio, fim_antiga, fim_nova = calcular_diferenca(self.rna, rna)
+        self.editar(inicio, fim_antiga, rna[inicio:fim_nova])
+        self._rna = rna
+        return self.proteina
+
+    def salvar(self, caminho: str | Path) -> None:
+        """
+        Salva os pontos de controle e as fronteiras dos genes em um arquivo JSON.
+
+        A fita e as proteínas não são incluídas: elas já estão nos arquivos de saída
+        e devem ser informadas a `carregar`.
+        """
+        estado = {
+            "impressao_digital": self.ribossomo.impressao_digital(),
+            "intervalo": self.intervalo,
+            "tamanho": self._tamanho,
+            "genes": sum(len(genes) for genes in self._genes),
+            "pontos": [list(ponto) for ponto in self.pontos],
+            "final": list(self._final),
+            "resto": self._resto,
+        }
+        Path(caminho).write_text(json.dumps(estado), encoding='utf-8')
+
+    @classmethod
+    def carregar(cls, caminho: str | Path, ribossomo: Automato_Pilha, rna: str, proteina: str) -> "TraducaoIncremental":
+        """
+        Restaura uma tradução salva por `salvar`.
+
+        Args:
+            caminho (str | Path): O arquivo JSON salvo.
+            ribossomo (Automato_Pilha): O mesmo autômato usado na tradução salva.
+            rna (str): A fita de RNA traduzida.
+            proteina (str): As proteínas formatadas da tradução salva.
+
+        Returns:
+            TraducaoIncremental: A tradução pronta para receber edições.
+
+        Raises:
+            ValueError: Se o estado salvo não corresponder ao autômato, à fita ou às proteínas.
+        """
+        estado = json.loads(Path(caminho).read_text(encoding='utf-8'))
+        if estado["impressao_digital"] != ribossomo.impressao_digital():
+            raise ValueError("O estado incremental foi gerado com outro autômato.")
+        if estado["tamanho"] != len(rna):
+            raise ValueError("O estado incremental não corresponde à fita de RNA informada.")
+
+        traducao = cls(ribossomo, estado["intervalo"])
+        traducao._resto = estado["resto"]
+        texto = proteina
+        if traducao._resto:
+            texto = texto[:len(texto) - len(traducao._resto)].rstrip(" ")
+        genes = texto.split(" ") if texto else []
+        if len(genes) != estado["genes"]:
+            raise ValueError("O estado incremental não corresponde às proteínas informadas.")
+
+        pontos = [
+            PontoControle(posicao, estado_ponto, tuple(pilha), genes_antes)
+            for posicao, estado_ponto, pilha, genes_antes in estado["pontos"]
+        ]
+        limites = pontos[1:] + [PontoControle(len(rna), "", (), len(genes))]
+        for ponto, seguinte in zip(pontos, limites):
+            traducao._segmentos.append(rna[ponto.posicao:seguinte.posicao])
+            traducao._configuracoes.append((ponto.estado, ponto.pilha))
+            traducao._genes.append(genes[ponto.genes_antes:seguinte.genes_antes])
+        traducao._posicoes = _SomasPrefixo([len(segmento) for segmento in traducao._segmentos])
+        traducao._tamanho = len(rna)
+        traducao._rna, traducao._proteina = rna, proteina
+        traducao._final = (estado["final"][0], tuple(estado["final"][1]))
+        return traducao
@@ -0,0 +1,268 @@
+"""
+Módulo que implementa o registro de motores de tradução e a escolha automática
+entre eles.
+
+Um motor é uma forma de executar o processamento completo (DNA -> RNA ->
+proteínas no formato de três letras), com a mesma saída dos demais:
+
+    - 'pilha':    o ribossomo (`Automato_Pilha.transcrever_pilha`) sobre a fita inteira;
+    - 'direto':   a tradução por tabela de códons (`traduzir_direto`), sobre a fita inteira;
+    - 'gerado':   o ribossomo especializado em código Python (`compilar_automato`), sobre a fita inteira;
+    - 'limitada': o ribossomo executado como transdutor finito (`Automato_Pilha.transdutor_equivalente`),
+                  sobre a fita inteira;
+    - 'pipeline': leitura, transcrição, tradução e escrita concorrentes, em blocos,
+                  com memória limitada (`processar_em_pipeline`);
+    - 'processos': a tradução por tabela de códons em um pool de processos, com a
+                  fita em memória compartilhada (`traduzir_em_processos`).
+
+`escolher_motor` decide a partir do tamanho da entrada, de ela estar em
+arquivo ou em memória, do número de CPUs e da memória disponível. O limiar de
+'processos' vem de `calibrar` (tarefa `python run.py calibrar`), que mede cada
+motor nesta máquina e grava o resultado em `ARQUIVO_CALIBRACAO`; sem esse
+arquivo, vale `LIMIAR_PROCESSOS`. Os demais limiares, os picos de memória por
+base e a ordem de preferência são fixos.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+from .automata import compilar_automato
+from .codigos_geneticos import CODIGO_PADRAO, obter_ribossomo, traduzir_direto
+from .processos import traduzir_em_processos
+from .utils import formatar_proteina, gerar_dna_aleatorio
+
+# --- CONSTANTES DO MÓDULO ---
+LIMIAR_PIPELINE = 8 << 20           # Bases a partir das quais um arquivo vai para o pipeline (com 2+ CPUs)
+LIMIAR_PROCESSOS = 1_000_000        # Bases a partir das quais a entrada vai para 'processos' (com 2+ CPUs)
+FRACAO_MEMORIA = 0.5                # Fração da memória disponível que um motor em memória pode usar
+TAMANHOS_CALIBRACAO = (10_000, 100_000, 1_000_000)
+# Código gerado pelo motor 'gerado', gravado para inspeção (relativo à raiz do projeto, não ao diretório corrente)
+DIRETORIO_CODIGO = Path(__file__).resolve().parent.parent / "data" / "cache" / "codigo"
+# Resultado de `calibrar` lido por `escolher_motor` (também relativo à raiz do projeto)
+ARQUIVO_CALIBRACAO = Path(__file__).resolve().parent.parent / "data" / "cache" / "calibracao.json"
+
+
+class Motor(NamedTuple):
+    """
+    Um motor de tradução registrado.
+
+    Attributes:
+        nome (str): O nome usado em `--motor`.
+        descricao (str): Uma linha para a ajuda da linha de comando.
+        bytes_por_base (float): Pico de memória estimado por base de entrada.
+        traduzir (Callable | None): RNA -> proteínas formatadas, para os motores que
+            trabalham sobre a fita inteira; None para os que leem em blocos.
+    """
+    nome: str
+    descricao: str
+    bytes_por_base: float
+    traduzir: Callable[[str, int], str] | None
+
+
+class Recursos(NamedTuple):
+    """
+    Os recursos da máquina considerados na escolha.
+
+    Attributes:
+        cpus (int): O número de CPUs utilizáveis.
+        memoria_disponivel (int | None): Bytes de memória livres (None se desconhecido).
+    """
+    cpus: int
+    memoria_disponivel: int | None
+
+
+def _traduzir_pilha(rna: str, codigo: int) -> str:
+    return formatar_proteina(obter_ribossomo(codigo).transcrever_pilha(rna))
+
+
+def _traduzir_gerado(rna: str, codigo: int) -> str:
+    return formatar_proteina(compilar_automato(obter_ribossomo(codigo), DIRETORIO_CODIGO).transcrever_pilha(rna))
+
+
+def _traduzir_limitada(rna: str, codigo: int) -> str:
+    return formatar_proteina(obter_ribossomo(codigo).transdutor_equivalente().transcrever_pilha(rna))
+
+
+def _traduzir_direto(rna: str, codigo: int) -> str:
+    return " ".join(traduzir_direto(rna, codigo))
+
+
+def _traduzir_processos(rna: str, codigo: int) -> str:
+    return " ".join(traduzir_em_processos(rna, codigo))
+
+
+# Em ordem de preferência: entre os motores em memória que cabem, vence o primeiro. O autômato de
+# pilha vem antes de tudo: é a tradução de referência do projeto e o padrão de sempre da linha de
+# comando, trocado só quando o tamanho da entrada ou os recursos da máquina pedem outro motor.
+# Os picos por base foram medidos com tracemalloc (DNA + RNA + proteínas, 1M de bases).
+MOTORES: dict[str, Motor] = {
+    "pilha": Motor("pilha", "autômato de pilha (referência), sobre a fita inteira", 11.0, _traduzir_pilha),
+    "direto": Motor("direto", "tradução por tabela de códons, sobre a fita inteira", 11.0, _traduzir_direto),
+    "gerado": Motor("gerado", "autômato de pilha compilado para código Python", 11.0, _traduzir_gerado),
+    # O registro sai do transdutor como texto e é separado em lista: ~9 B/base a mais que 'pilha'.
+    "limitada": Motor("limitada", "autômato de pilha como transdutor finito (pilha limitada)", 20.0, _traduzir_limitada),
+    "pipeline": Motor("pipeline", "etapas concorrentes em blocos, memória limitada", 0.0, None),
+    # Fica por último: o ganho depende de várias CPUs. O pico soma aos 11 B/base os segmentos
+    # compartilhados (fita, resíduos e posições dos genes: ~2,7 B/base) e a cópia codificada da fita.
+    "processos": Motor("processos", "pool de processos sobre memória compartilhada", 15.0, _traduzir_processos),
+}
+
+
+def registrar_motor(motor: Motor) -> None:
+    """
+    Registra (ou substitui) um motor.
+
+    Motores novos entram no fim da ordem de preferência.
+
+    Args:
+        motor (Motor): O motor a registrar.
+    """
+    MOTORES[motor.nome] = motor
+
+
+def detectar_recursos() -> Recursos:
+    """
+    Detecta as CPUs utilizáveis e a memória livre da máquina.
+
+    Returns:
+        Recursos: Os recursos detectados; a memória é None onde `os.sysconf` não a informa.
+    """
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    try:
+        memoria = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        memoria = None
+    return Recursos(cpus, memoria)
+
+
+def carregar_calibracao(arquivo: str | Path = ARQUIVO_CALIBRACAO) -> dict[str, Any]:
+    """
+    Lê o resultado gravado por `calibrar`.
+
+    Args:
+        arquivo (str | Path): O arquivo JSON da calibração.
+
+    Returns:
+        dict[str, Any]: A calibração, ou um dicionário vazio se o arquivo não existir
+        ou não for válido (a escolha usa então os limiares fixos).
+    """
+    try:
+        calibracao = json.loads(Path(arquivo).read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logging.warning(f"Calibração em '{arquivo}' ignorada ({e}).")
+        return {}
+    limiar = calibracao.get("limiar_processos", 0) if isinstance(calibracao, dict) else 0
+    if limiar is not None and not (isinstance(limiar, int) and limiar > 0):
+        logging.warning(f"Calibração em '{arquivo}' ignorada (sem um limiar válido para 'processos').")
+        return {}
+    return calibracao
+
+
+def escolher_motor(tamanho: int, em_arquivo: bool, recursos: Recursos | None = None,
+                   calibracao: dict[str, Any] | None = None) -> tuple[str, str]:
+    """
+    Escolhe o motor para uma entrada.
+
+    Regras, em ordem:
+        1. um arquivo com pelo menos `LIMIAR_PIPELINE` bases, com 2 ou mais CPUs, vai para
+           o 'pipeline': a leitura e a escrita do disco (fora do GIL) ocupam outra CPU enquanto
+           a transcrição e a tradução se revezam em uma só; não há paralelismo de CPU entre elas;
+        2. uma entrada com pelo menos o limiar calibrado de bases (`LIMIAR_PROCESSOS`, sem
+           calibração), com 2 ou mais CPUs, vai para 'processos', se o pico estimado dele
+           couber em `FRACAO_MEMORIA` da memória disponível;
+        3. senão, o primeiro motor em memória cujo pico estimado cabe em `FRACAO_MEMORIA`
+           da memória disponível;
+        4. se nenhum couber, o 'pipeline', cuja memória não depende do tamanho da entrada.
+
+    Args:
+        tamanho (int): O tamanho da entrada, em bases (ou bytes, para arquivos).
+        em_arquivo (bool): Se a entrada é lida de um arquivo (e não está em memória).
+        recursos (Recursos | None): Os recursos da máquina (padrão: `detectar_recursos()`).
+        calibracao (dict[str, Any] | None): O resultado de `calibrar` (padrão:
+            `carregar_calibracao()`); um "limiar_processos" None desliga a regra 2.
+
+    Returns:
+        tuple[str, str]: O nome do motor e o motivo da escolha, para o log.
+    """
+    recursos = recursos or detectar_recursos()
+    calibracao = carregar_calibracao() if calibracao is None else calibracao
+    limiar_processos = calibracao.get("limiar_processos", LIMIAR_PROCESSOS)
+    if em_arquivo and tamanho >= LIMIAR_PIPELINE and recursos.cpus >= 2 and "pipeline" in MOTORES:
+        return "pipeline", f"arquivo de {tamanho} bases e {recursos.cpus} CPUs"
+
+    def cabe(motor: Motor) -> bool:
+        necessario = motor.bytes_por_base * tamanho
+        return recursos.memoria_disponivel is None or necessario <= FRACAO_MEMORIA * recursos.memoria_disponivel
+
+    processos = MOTORES.get("processos")
+    if processos is not None and limiar_processos is not None and tamanho >= limiar_processos \
+            and recursos.cpus >= 2 and cabe(processos):
+        return "processos", f"{tamanho} bases em memória e {recursos.cpus} CPUs"
+
+    for motor in MOTORES.values():
+        if motor.traduzir is not None and cabe(motor):
+            necessario = motor.bytes_por_base * tamanho
+            return motor.nome, f"{tamanho} bases em memória, pico estimado de {necessario / 2**20:.1f} MB"
+
+    return "pipeline", f"{tamanho} bases não cabem em {recursos.memoria_disponivel} bytes livres"
+
+
+def calibrar(tamanhos: tuple[int, ...] = TAMANHOS_CALIBRACAO, codigo: int = CODIGO_PADRAO,
+             arquivo: str | Path | None = None) -> dict[str, Any]:
+    """
+    Mede o tempo de tradução de cada motor em memória, em entradas aleatórias.
+
+    Deriva das medições o limiar de 'processos': o menor tamanho medido a partir do
+    qual ele vence, em todos os tamanhos maiores, o motor em memória preferido.
+
+    Args:
+        tamanhos (tuple[int, ...]): Os tamanhos de entrada medidos, em bases.
+        codigo (int): O número NCBI do código genético.
+        arquivo (str | Path | None): Onde gravar o resultado para `escolher_motor`
+            (normalmente `ARQUIVO_CALIBRACAO`); None não grava.
+
+    Returns:
+        dict[str, Any]: Para cada tamanho, os segundos de cada motor; em
+        "mais_rapido", o motor em memória mais rápido em cada tamanho; em
+        "limiar_processos", o limiar derivado (None se 'processos' nunca venceu).
+    """
+    # Importação local: as funções fábrica vivem no __init__ do pacote, que importa este módulo.
+    from . import criar_transcritor_dna_rna
+    transcritor = criar_transcritor_dna_rna()
+    medicoes: dict[str, Any] = {"tamanhos": {}, "mais_rapido": {}}
+    for tamanho in tamanhos:
+        rna = transcritor.transcrever(gerar_dna_aleatorio(tamanho))
+        tempos = {}
+        for motor in MOTORES.values():
+            if motor.traduzir is not None:
+                inicio = time.perf_counter()
+                motor.traduzir(rna, codigo)
+                tempos[motor.nome] = time.perf_counter() - inicio
+        medicoes["tamanhos"][tamanho] = tempos
+        medicoes["mais_rapido"][tamanho] = min(tempos, key=tempos.get)
+        logging.info(f"{tamanho} bases: " + ", ".join(f"{nome} {segundos:.4f} s" for nome, segundos in tempos.items()))
+
+    if "processos" in MOTORES:
+        preferido = next(nome for nome, motor in MOTORES.items() if motor.traduzir is not None and nome != "processos")
+        limiar = None
+        for tamanho in sorted(medicoes["tamanhos"], reverse=True):
+            tempos = medicoes["tamanhos"][tamanho]
+            if tempos["processos"] >= tempos[preferido]:
+                break
+            limiar = tamanho
+        medicoes["limiar_processos"] = limiar
+        if arquivo is not None:
+            caminho = Path(arquivo)
+            caminho.parent.mkdir(parents=True, exist_ok=True)
+            caminho.write_text(json.dumps({
+                "limiar_processos": limiar,
+                "cpus": detectar_recursos().cpus,
+                "tamanhos": {str(tamanho): tempos for tamanho, tempos in medicoes["tamanhos"].items()},
+            }, indent=2), encoding='utf-8')
+    return medicoes
@@ -0,0 +1,91 @@
+"""
+Módulo que implementa o processamento de várias cadeias independentes em um
+pool de threads, com um único transdutor e um único ribossomo compartilhados.
+
+Os autômatos têm a definição congelada e guardam o estado de cada execução em
+variáveis locais, então as threads não precisam de travas nem de cópias. No
+CPython com GIL as threads se revezam e o ganho é pequeno; nos builds sem GIL
+(3.13t em diante, `sys._is_gil_enabled()` falso) elas rodam em paralelo e a
+vazão cresce com o número de CPUs. `medir_escalabilidade` (tarefa
+`python run.py escalabilidade`) mede isso na máquina atual.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Sequence
+
+from .automata import TransdutorFinito, Automato_Pilha
+from .utils import normalizar_dna, formatar_proteina
+
+# --- CONSTANTES DO MÓDULO ---
+CONTAGENS_THREADS = (1, 2, 4, 8)    # Tamanhos de pool medidos por padrão
+
+
+def gil_ativo() -> bool:
+    """Indica se o interpretador roda com o GIL (sempre verdadeiro antes do 3.13)."""
+    verificar = getattr(sys, "_is_gil_enabled", None)
+    return True if verificar is None else verificar()
+
+
+def processar_em_threads(
+    cadeias: Iterable[str],
+    transcritor: TransdutorFinito,
+    ribossomo: Automato_Pilha,
+    trabalhadores: int | None = None,
+) -> list[str]:
+    """
+    Transcreve e traduz cadeias de DNA independentes em um pool de threads.
+
+    Args:
+        cadeias (Iterable[str]): As cadeias de DNA bruto.
+        transcritor (TransdutorFinito): O transdutor DNA -> RNA, compartilhado.
+        ribossomo (Automato_Pilha): O autômato RNA -> proteína, compartilhado.
+        trabalhadores (int | None): O número de threads (padrão: o de `ThreadPoolExecutor`).
+
+    Returns:
+        list[str]: As proteínas formatadas de cada cadeia, na ordem da entrada.
+
+    Raises:
+        ValueError: Se alguma cadeia contiver bases inválidas.
+    """
+    def processar(dna: str) -> str:
+        return formatar_proteina(ribossomo.transcrever_pilha(transcritor.transcrever(normalizar_dna(dna))))
+
+    with ThreadPoolExecutor(trabalhadores, thread_name_prefix="traducao") as pool:
+        return list(pool.map(processar, cadeias))
+
+
+def medir_escalabilidade(
+    cadeias: Sequence[str],
+    transcritor: TransdutorFinito,
+    ribossomo: Automato_Pilha,
+    contagens: Sequence[int] = CONTAGENS_THREADS,
+) -> dict[str, Any]:
+    """
+    Mede a vazão de `processar_em_threads` para cada tamanho de pool.
+
+    Args:
+        cadeias (Sequence[str]): As cadeias processadas em cada medição.
+        transcritor (TransdutorFinito): O transdutor DNA -> RNA.
+        ribossomo (Automato_Pilha): O autômato RNA -> proteína.
+        contagens (Sequence[int]): Os números de threads medidos.
+
+    Returns:
+        dict[str, Any]: 'gil' e 'cpus' da máquina e, em 'medicoes', para cada número
+        de threads os segundos gastos, a vazão e a aceleração em relação ao primeiro
+        número medido (uma thread, no padrão).
+    """
+    bases = sum(len(cadeia) for cadeia in cadeias)
+    processar_em_threads(cadeias[:1], transcritor, ribossomo, 1)     # Aquecimento, fora da medição.
+    medicoes = {}
+    for trabalhadores in contagens:
+        inicio = time.perf_counter()
+        processar_em_threads(cadeias, transcritor, ribossomo, trabalhadores)
+        segundos = time.perf_counter() - inicio
+        medicoes[trabalhadores] = {"segundos": segundos, "bases_por_segundo": bases / segundos}
+    referencia = medicoes[contagens[0]]["segundos"]
+    for medicao in medicoes.values():
+        medicao["aceleracao"] = referencia / medicao["segundos"]
+    return {"gil": gil_ativo(), "cpus": os.cpu_count(), "medicoes": medicoes}
@@ -0,0 +1,171 @@
+"""
+Módulo que implementa o perfilamento do processamento completo de uma cadeia
+de DNA (a tarefa `python run.py profile`).
+
+As etapas de `processar_cadeia` (normalização, transcrição, tradução,
+formatação e escrita) rodam sob três instrumentos ao mesmo tempo:
+
+    - cProfile, para o relatório de pontos quentes ordenado por tempo;
+    - uma thread de amostragem da pilha de chamadas, para o arquivo de pilhas
+      colapsadas ("a;b;c N") lido por ferramentas de flame graph;
+    - tracemalloc, para o pico de memória de cada etapa e as linhas que mais
+      alocaram ao fim dela.
+
+Arquivos gerados em `diretorio`:
+
+    <prefixo>_hotspots.txt      funções ordenadas por tempo próprio e acumulado
+    <prefixo>_pilhas.txt        pilhas colapsadas com o número de amostras
+    <prefixo>_memoria.json      pico e maiores alocações de cada etapa
+"""
+
+import cProfile
+import io
+import json
+import logging
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable
+
+from .utils import normalizar_dna, formatar_proteina, escrever_arquivo
+
+# --- CONSTANTES DO MÓDULO ---
+INTERVALO_AMOSTRAGEM = 0.001        # Segundos entre duas amostras da pilha de chamadas
+LINHAS_HOTSPOTS = 40                # Funções listadas em cada ordenação do relatório
+MAIORES_ALOCACOES = 10              # Linhas de código listadas por etapa
+QUADROS_TRACEMALLOC = 8             # Profundidade das pilhas guardadas pelo tracemalloc
+
+
+class AmostradorPilhas:
+    """
+    Amostra periodicamente a pilha de chamadas de uma thread, em segundo plano.
+
+    Attributes:
+        amostras (Counter): Pilha colapsada ("modulo:funcao;...") -> número de amostras.
+    """
+
+    def __init__(self, thread_alvo: int, intervalo: float = INTERVALO_AMOSTRAGEM):
+        """
+        Args:
+            thread_alvo (int): O identificador (`threading.get_ident`) da thread amostrada.
+            intervalo (float): Segundos entre duas amostras.
+        """
+        self.amostras: Counter = Counter()
+        self._alvo = thread_alvo
+        self._intervalo = intervalo
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._amostrar, name="perfil-amostrador", daemon=True)
+
+    def _amostrar(self) -> None:
+        while not self._parar.wait(self._intervalo):
+            quadro = sys._current_frames().get(self._alvo)
+            nomes = []
+            while quadro is not None:
+                modulo = quadro.f_globals.get("__name__", "?")
+                # Espaços e ';' separam campos no formato colapsado.
+                nomes.append(f"{modulo}:{quadro.f_code.co_name}".replace(" ", "_").replace(";", "_"))
+                quadro = quadro.f_back
+            if nomes:
+                self.amostras[";".join(reversed(nomes))] += 1
+
+    def __enter__(self) -> "AmostradorPilhas":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *excecao) -> None:
+        self._parar.set()
+        self._thread.join()
+
+    def colapsado(self) -> str:
+        """As amostras no formato de pilhas colapsadas, uma pilha por linha."""
+        return "".join(f"{pilha} {quantidade}\n" for pilha, quantidade in sorted(self.amostras.items()))
+
+
+def _relatorio_hotspots(perfilador: cProfile.Profile) -> str:
+    """Formata as estatísticas do cProfile ordenadas por tempo próprio e acumulado."""
+    saida = io.StringIO()
+    for criterio, titulo in (("tottime", "TEMPO PRÓPRIO"), ("cumulative", "TEMPO ACUMULADO")):
+        saida.write(f"=== ORDENADO POR {titulo} ===\n")
+        pstats.Stats(perfilador, stream=saida).strip_dirs().sort_stats(criterio).print_stats(LINHAS_HOTSPOTS)
+    return saida.getvalue()
+
+
+def perfilar(dna: str, diretorio: str | Path, transcritor, ribossomo, prefixo: str = "perfil") -> dict[str, Any]:
+    """
+    Processa uma cadeia de DNA como `processar_cadeia`, sob perfilamento, e grava os relatórios.
+
+    Args:
+        dna (str): O DNA bruto a processar.
+        diretorio (str | Path): Onde os relatórios (e os arquivos de RNA e proteína) são gravados.
+        transcritor (TransdutorFinito): O transdutor DNA -> RNA.
+        ribossomo (Automato_Pilha): O autômato RNA -> proteína.
+        prefixo (str): O prefixo dos nomes dos arquivos gerados.
+
+    Returns:
+        dict[str, Any]: O conteúdo de `<prefixo>_memoria.json`: para cada etapa, o tempo,
+        o pico de memória e as maiores alocações vivas ao fim dela.
+
+    Raises:
+        ValueError: Se o DNA contiver bases inválidas.
+        FileNotFoundError: Se o diretório não existir.
+    """
+    diretorio = Path(diretorio)
+    if not diretorio.is_dir():
+        raise FileNotFoundError(f"O diretório de destino '{diretorio}' não existe.")
+
+    resultados: dict[str, Any] = {}
+    etapas: list[tuple[str, Callable[[], Any]]] = [
+        ("normalizacao", lambda: normalizar_dna(dna)),
+        ("transcricao", lambda: transcritor.transcrever(resultados["normalizacao"])),
+        ("traducao", lambda: ribossomo.transcrever_pilha(resultados["transcricao"])),
+        ("formatacao", lambda: formatar_proteina(resultados["traducao"])),
+        ("escrita", lambda: (
+            escrever_arquivo(diretorio / f"{prefixo}_rna.txt", resultados["transcricao"]),
+            escrever_arquivo(diretorio / f"{prefixo}_proteina.txt", resultados["formatacao"]),
+        )),
+    ]
+
+    memoria: dict[str, Any] = {"bases": len(dna), "etapas": {}}
+    perfilador = cProfile.Profile()
+    ja_rastreava = tracemalloc.is_tracing()
+    if not ja_rastreava:
+        tracemalloc.start(QUADROS_TRACEMALLOC)
+    try:
+        with AmostradorPilhas(threading.get_ident()) as amostrador:
+            for nome, etapa in etapas:
+                logging.info(f"Perfilando a etapa '{nome}'...")
+                tracemalloc.reset_peak()
+                antes, _ = tracemalloc.get_traced_memory()
+                inicio = time.perf_counter()
+                perfilador.enable()
+                try:
+                    resultados[nome] = etapa()
+                finally:
+                    perfilador.disable()
+                duracao = time.perf_counter() - inicio
+                atual, pico = tracemalloc.get_traced_memory()
+                maiores = tracemalloc.take_snapshot().filter_traces(
+                    [tracemalloc.Filter(False, tracemalloc.__file__)]
+                ).statistics('lineno')[:MAIORES_ALOCACOES]
+                memoria["etapas"][nome] = {
+                    "segundos": duracao,
+                    "pico_bytes": pico - antes,
+                    "variacao_bytes": atual - antes,
+                    "maiores_alocacoes": [
+                        {"linha": str(estatistica.traceback[0]), "bytes": estatistica.size, "blocos": estatistica.count}
+                        for estatistica in maiores
+                    ],
+                }
+    finally:
+        if not ja_rastreava:
+            tracemalloc.stop()
+
+    escrever_arquivo(diretorio / f"{prefixo}_hotspots.txt", _relatorio_hotspots(perfilador))
+    escrever_arquivo(diretorio / f"{prefixo}_pilhas.txt", amostrador.colapsado())
+    escrever_arquivo(diretorio / f"{prefixo}_memoria.json", json.dumps(memoria, ensure_ascii=False, indent=2))
+    logging.info(f"Relatórios de perfil salvos em '{diretorio}' (prefixo '{prefixo}').")
+    return memoria
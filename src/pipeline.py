@@ -0,0 +1,544 @@
+"""
+Módulo que implementa a execução em pipeline do processamento de DNA.
+
+Em vez de ler todo o arquivo, transcrever tudo, traduzir tudo e só então
+escrever os resultados, as quatro etapas rodam concorrentemente em threads
+ligadas por filas limitadas de blocos:
+
+    leitura -> transcrição -> tradução -> escrita
+
+O ganho de tempo vem só da E/S: no CPython com GIL, a transcrição e a
+tradução, que usam a CPU, não rodam ao mesmo tempo (as threads se revezam no
+interpretador). O que se sobrepõe a elas são a leitura e a escrita do disco,
+que liberam o GIL durante as chamadas ao sistema. O tempo total tende então à
+soma da transcrição e da tradução (mais a parte da E/S que não se sobrepôs), e
+não à etapa mais lenta. Paralelismo de CPU real só em builds sem GIL (3.13t em
+diante); para dividir a tradução entre CPUs, use `src.processos`. As filas
+limitadas impedem que uma etapa rápida acumule a entrada inteira na memória,
+e é disso que vem a outra vantagem do pipeline: a memória não depende do
+tamanho da entrada.
+
+Com um arquivo de ponto de controle, a etapa de escrita grava periodicamente
+(a cada `intervalo_ponto_controle` segundos) quanto da entrada já foi
+consumido e o SHA-256 desse trecho, o estado do transdutor, o estado e a pilha
+do ribossomo e o tamanho dos arquivos de saída (que são sincronizados com o
+disco antes). Uma execução interrompida pode então ser retomada
+(`retomar=True`): a entrada já consumida é conferida e pulada, as saídas são
+truncadas nesses tamanhos e os autômatos continuam da configuração salva,
+produzindo arquivos idênticos aos de uma execução sem interrupção.
+
+Com `memoria_maxima`, o pipeline se ajusta a um orçamento de memória: os
+blocos de entrada são fatiados no tamanho que cabe nele (com as filas cheias)
+e a pilha do ribossomo guarda em memória no máximo a parte do orçamento que
+lhe cabe. O resto do gene ainda aberto é derramado em um arquivo temporário
+(ver `ExecucaoPilha`), que vai aos pedaços para a saída quando o gene se fecha
+ou é descartado sem ser lido se o gene ficar incompleto. Assim o pico de
+memória independe do formato da entrada, inclusive de um 'AUG' sem 'Stop'
+por centenas de megabases.
+
+Com `memorizar`, o ribossomo lê cada bloco de RNA por uma `MemoriaBlocos`,
+que reaplica o efeito de trechos repetidos da entrada em vez de executá-los
+de novo; a taxa de acertos e o tempo economizado entram no relatório.
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .automata import TransdutorFinito, Automato_Pilha, ExecucaoPilha, MemoriaBlocos
+from .utils import normalizar_dna, nome_arquivo_valido, formatar_proteina
+
+# --- CONSTANTES DO MÓDULO ---
+TAMANHO_BLOCO_PADRAO = 1 << 20      # Caracteres lidos por bloco (1 MiB)
+CAPACIDADE_FILA_PADRAO = 4          # Blocos que cada fila comporta
+INTERVALO_PONTO_CONTROLE_PADRAO = 30.0  # Segundos entre dois pontos de controle
+VERSAO_PONTO_CONTROLE = 2
+# Modelo de memória de `memoria_maxima`, medido com tracemalloc (capacidade de fila 4):
+BYTES_POR_BASE_BLOCO = 24.0         # Pico por base do tamanho de bloco, com todas as filas cheias
+BYTES_POR_SIMBOLO_PILHA = 20.0      # Símbolo na pilha do ribossomo, com a cópia feita ao derramá-lo
+FRACAO_MEMORIA_BLOCOS = 0.75        # Parte do orçamento para os blocos; o resto é da pilha
+TAMANHO_BLOCO_MINIMO = 4096
+_FIM = object()                     # Sentinela que sinaliza o fim do fluxo
+
+
+class EstatisticasEtapa:
+    """
+    Contadores de uma etapa do pipeline.
+
+    Attributes:
+        nome (str): O nome da etapa.
+        blocos (int): Quantos blocos a etapa processou.
+        bases (int): Quantas bases passaram pela etapa.
+        tempo_ativo (float): Segundos gastos processando (sem contar esperas nas filas).
+    """
+    def __init__(self, nome: str):
+        self.nome = nome
+        self.blocos = 0
+        self.bases = 0
+        self.tempo_ativo = 0.0
+
+    @property
+    def vazao(self) -> float:
+        """Bases por segundo de tempo ativo."""
+        return self.bases / self.tempo_ativo if self.tempo_ativo else 0.0
+
+
+class OcupacaoFila:
+    """
+    Amostras da ocupação de uma fila, coletadas a cada bloco inserido.
+
+    Attributes:
+        nome (str): O nome da fila.
+        capacidade (int): O número máximo de blocos na fila.
+        maxima (int): A maior ocupação observada.
+        amostras (int): Quantas amostras foram coletadas.
+    """
+    def __init__(self, nome: str, capacidade: int):
+        self.nome = nome
+        self.capacidade = capacidade
+        self.maxima = 0
+        self.amostras = 0
+        self._soma = 0
+
+    def registrar(self, ocupacao: int) -> None:
+        """Registra uma amostra de ocupação."""
+        self.maxima = max(self.maxima, ocupacao)
+        self.amostras += 1
+        self._soma += ocupacao
+
+    @property
+    def media(self) -> float:
+        """A ocupação média observada."""
+        return self._soma / self.amostras if self.amostras else 0.0
+
+
+class RelatorioPipeline:
+    """
+    Resultado observável de uma execução do pipeline.
+
+    Attributes:
+        etapas (list[EstatisticasEtapa]): Os contadores de cada etapa, em ordem.
+        filas (list[OcupacaoFila]): A ocupação de cada fila, em ordem.
+        tempo_total (float): Segundos de relógio da execução completa.
+        genes (int): Quantos genes completos foram traduzidos.
+        pontos_controle (int): Quantos pontos de controle foram gravados.
+        retomado_de (int): Caracteres da entrada pulados por uma retomada (0 se não houve).
+        tamanho_bloco (int | None): O tamanho dos blocos imposto por `memoria_maxima` (None sem orçamento).
+        maximo_derramado (int): O maior número de símbolos da pilha mantidos em disco ao mesmo tempo.
+        memoria (MemoriaBlocos | None): A memorização usada pelo ribossomo (None sem `memorizar`).
+    """
+    def __init__(self, etapas: list[EstatisticasEtapa], filas: list[OcupacaoFila]):
+        self.etapas = etapas
+        self.filas = filas
+        self.tempo_total = 0.0
+        self.genes = 0
+        self.pontos_controle = 0
+        self.retomado_de = 0
+        self.tamanho_bloco = None
+        self.maximo_derramado = 0
+        self.memoria = None
+
+    @property
+    def etapa_mais_lenta(self) -> EstatisticasEtapa:
+        """A etapa com maior tempo ativo, que limita o tempo total."""
+        return max(self.etapas, key=lambda etapa: etapa.tempo_ativo)
+
+    def resumo(self) -> str:
+        """Retorna um texto de várias linhas descrevendo a execução."""
+        linhas = [f"Tempo total: {self.tempo_total:.3f}s ({self.genes} gene(s))"]
+        if self.retomado_de or self.pontos_controle:
+            linhas.append(f"  retomado após {self.retomado_de} caracteres; {self.pontos_controle} ponto(s) de controle gravado(s)")
+        if self.tamanho_bloco is not None:
+            linhas.append(f"  orçamento de memória: blocos de {self.tamanho_bloco} bases; até {self.maximo_derramado} símbolo(s) da pilha em disco")
+        if self.memoria is not None:
+            linhas.append(f"  {self.memoria.resumo()}")
+        for etapa in self.etapas:
+            linhas.append(
+                f"  etapa {etapa.nome:<12} {etapa.blocos:>6} blocos  "
+                f"{etapa.tempo_ativo:8.3f}s ativos  {etapa.vazao / 1e6:8.2f} Mbases/s"
+            )
+        for fila in self.filas:
+            linhas.append(
+                f"  fila  {fila.nome:<12} ocupação média {fila.media:.2f}"
+                f" / máxima {fila.maxima} (capacidade {fila.capacidade})"
+            )
+        return "\n".join(linhas)
+
+
+class _Abortado(Exception):
+    """Sinaliza, dentro de uma etapa, que outra etapa falhou."""
+
+
+def _colocar(fila: queue.Queue, item: Any, ocupacao: OcupacaoFila, abortar: threading.Event) -> None:
+    """Insere um item na fila, desistindo se o pipeline for abortado."""
+    while True:
+        if abortar.is_set():
+            raise _Abortado()
+        try:
+            fila.put(item, timeout=0.1)
+        except queue.Full:
+            continue
+        ocupacao.registrar(fila.qsize())
+        return
+
+
+def _retirar(fila: queue.Queue, abortar: threading.Event) -> Any:
+    """Retira um item da fila, desistindo se o pipeline for abortado."""
+    while True:
+        if abortar.is_set():
+            raise _Abortado()
+        try:
+            return fila.get(timeout=0.1)
+        except queue.Empty:
+            continue
+
+
+def _gravar_ponto_controle(caminho: Path, dados: dict[str, Any]) -> None:
+    """Grava o ponto de controle de forma atômica (arquivo temporário + `os.replace`)."""
+    temporario = caminho.with_name(caminho.name + ".tmp")
+    with temporario.open('w', encoding='utf-8') as arquivo:
+        json.dump(dados, arquivo)
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+    os.replace(temporario, caminho)
+
+
+def carregar_ponto_controle(caminho: str | Path, transcritor: TransdutorFinito, ribossomo: Automato_Pilha) -> dict[str, Any]:
+    """
+    Lê um ponto de controle gravado por `processar_em_pipeline`.
+
+    Args:
+        caminho (str | Path): O arquivo do ponto de controle.
+        transcritor (TransdutorFinito): O transdutor da execução que será retomada.
+        ribossomo (Automato_Pilha): O ribossomo da execução que será retomada.
+
+    Returns:
+        dict[str, Any]: O conteúdo do ponto de controle.
+
+    Raises:
+        ValueError: Se o arquivo for de outra versão ou de autômatos diferentes.
+        FileNotFoundError: Se o arquivo não existir.
+    """
+    dados = json.loads(Path(caminho).read_text(encoding='utf-8'))
+    if dados.get("versao") != VERSAO_PONTO_CONTROLE:
+        raise ValueError("Ponto de controle de uma versão desconhecida.")
+    if dados["automatos"] != [transcritor.impressao_digital(), ribossomo.impressao_digital()]:
+        raise ValueError("O ponto de controle foi gravado com autômatos diferentes.")
+    return dados
+
+
+def _pular(fonte: Iterable[str], quantidade: int, resumo_esperado: str) -> tuple[Iterator[str], Any]:
+    """
+    Descarta os primeiros `quantidade` caracteres de um fluxo de blocos, conferindo-os.
+
+    Args:
+        fonte (Iterable[str]): O fluxo de blocos.
+        quantidade (int): Quantos caracteres pular.
+        resumo_esperado (str): O SHA-256 (hexadecimal) dos caracteres pulados.
+
+    Returns:
+        tuple: O restante do fluxo e o SHA-256 em andamento (já com o trecho pulado).
+
+    Raises:
+        ValueError: Se a entrada acabar antes ou o trecho pulado for outro.
+    """
+    resumo = hashlib.sha256()
+    iterador = iter(fonte)
+    resto = []
+    for bloco in iterador:
+        if quantidade >= len(bloco):
+            resumo.update(bloco.encode('utf-8'))
+            quantidade -= len(bloco)
+            if quantidade == 0:
+                break
+            continue
+        resumo.update(bloco[:quantidade].encode('utf-8'))
+        resto.append(bloco[quantidade:])
+        quantidade = 0
+        break
+    if quantidade or resumo.hexdigest() != resumo_esperado:
+        raise ValueError("A entrada não é a mesma da execução interrompida: o ponto de controle não pode ser usado.")
+    return itertools.chain(resto, iterador), resumo
+
+
+def _fatiar(fonte: Iterable[str], tamanho: int) -> Iterable[str]:
+    """Divide os blocos de um fluxo maiores que `tamanho`."""
+    for bloco in fonte:
+        for inicio in range(0, len(bloco), tamanho):
+            yield bloco[inicio:inicio + tamanho]
+
+
+def _formatar_partes(partes: Iterator[list[str]]) -> Iterator[tuple[str, bool]]:
+    """
+    Formata aos pedaços um trecho drenado com `ExecucaoPilha.drenar_partes`.
+
+    Todas as partes, menos a última, são de um gene que estava aberto quando
+    foram derramadas (não contêm 'Stop'). Concatenados, os textos são
+    `formatar_proteina` do trecho inteiro.
+
+    Returns:
+        Pares (texto, continua): `continua` indica que o texto prossegue o anterior
+        (já começa com o separador) em vez de abrir um novo trecho.
+    """
+    anterior = next(partes, None)
+    if anterior is None:
+        return
+    continua = False
+    for parte in partes:
+        yield ('-' if continua else '') + '-'.join(anterior), continua
+        anterior, continua = parte, True
+    texto = formatar_proteina(anterior)
+    if texto or not continua:
+        # Um 'Stop' logo no início da última parte fecha o gene derramado.
+        separador = (' ' if anterior[0] == 'Stop' else '-') if continua else ''
+        yield separador + texto, continua
+
+
+def processar_em_pipeline(
+    fonte: Iterable[str],
+    caminho_rna: str | Path,
+    caminho_proteina: str | Path,
+    transcritor: TransdutorFinito,
+    ribossomo: Automato_Pilha,
+    capacidade_fila: int = CAPACIDADE_FILA_PADRAO,
+    ponto_controle: str | Path | None = None,
+    intervalo_ponto_controle: float = INTERVALO_PONTO_CONTROLE_PADRAO,
+    retomar: bool = False,
+    memoria_maxima: int | None = None,
+    memorizar: bool = False,
+) -> RelatorioPipeline:
+    """
+    Processa um fluxo de blocos de DNA com as etapas rodando concorrentemente.
+
+    Os arquivos gerados são idênticos aos do processamento sequencial
+    (`transcrever` seguido de `transcrever_pilha` e `formatar_proteina`).
+
+    Args:
+        fonte (Iterable[str]): Os blocos de DNA bruto, em ordem (ex: `ler_blocos`).
+        caminho_rna (str | Path): Arquivo onde o RNA transcrito será escrito.
+        caminho_proteina (str | Path): Arquivo onde as proteínas serão escritas.
+        transcritor (TransdutorFinito): O transdutor DNA -> RNA.
+        ribossomo (Automato_Pilha): O autômato RNA -> proteína.
+        capacidade_fila (int): Quantos blocos cada fila comporta.
+        ponto_controle (str | Path | None): Arquivo onde os pontos de controle são
+            gravados (nenhum, se None). É removido quando a execução termina.
+        intervalo_ponto_controle (float): Segundos mínimos entre dois pontos de controle.
+        retomar (bool): Continua do `ponto_controle`, se ele existir; `fonte` deve
+            fornecer a mesma entrada desde o início.
+        memoria_maxima (int | None): Orçamento de memória em bytes para os blocos e a
+            pilha (sem contar o próprio interpretador); None para não limitar. Enquanto
+            parte da pilha estiver em disco, nenhum ponto de controle é gravado.
+        memorizar (bool): Reaplica o efeito de blocos de RNA repetidos (ver `MemoriaBlocos`).
+
+    Returns:
+        RelatorioPipeline: Vazão de cada etapa e ocupação de cada fila.
+
+    Raises:
+        ValueError: Se um nome de arquivo for inválido, o DNA contiver bases inválidas
+            ou o ponto de controle não corresponder aos autômatos, à entrada ou aos
+            arquivos de saída.
+        FileNotFoundError: Se o diretório de destino não existir.
+    """
+    caminho_rna, caminho_proteina = Path(caminho_rna), Path(caminho_proteina)
+    for caminho in (caminho_rna, caminho_proteina):
+        if not nome_arquivo_valido(caminho.name):
+            raise ValueError(f"Nome de arquivo inválido: {caminho.name}")
+        if not caminho.parent.exists():
+            raise FileNotFoundError(f"O diretório de destino '{caminho.parent}' não existe.")
+
+    nomes_etapas = ("leitura", "transcricao", "traducao", "escrita")
+    etapas = [EstatisticasEtapa(nome) for nome in nomes_etapas]
+    ocupacoes = [OcupacaoFila(nome, capacidade_fila) for nome in ("dna", "rna", "saida")]
+    filas = [queue.Queue(maxsize=capacidade_fila) for _ in ocupacoes]
+    relatorio = RelatorioPipeline(etapas, ocupacoes)
+    abortar = threading.Event()
+    erros: list[BaseException] = []
+
+    # Configuração inicial: do começo, ou do ponto de controle salvo.
+    ponto_controle = Path(ponto_controle) if ponto_controle else None
+    inicial = {
+        "consumido": 0, "estado_transdutor": transcritor.estado_inicial,
+        "estado_pilha": ribossomo.estado_inicial, "pilha": [ribossomo.estado_inicial_pilha],
+        "bytes_rna": 0, "bytes_proteina": 0, "genes": 0,
+    }
+    resumo_entrada = hashlib.sha256() if ponto_controle else None
+    if retomar and ponto_controle and ponto_controle.exists():
+        inicial = carregar_ponto_controle(ponto_controle, transcritor, ribossomo)
+        for caminho, tamanho in ((caminho_rna, inicial["bytes_rna"]), (caminho_proteina, inicial["bytes_proteina"])):
+            if (caminho.stat().st_size if caminho.exists() else 0) < tamanho:
+                raise ValueError(f"'{caminho.name}' é menor que o registrado no ponto de controle: a execução não pode ser retomada.")
+        fonte, resumo_entrada = _pular(fonte, inicial["consumido"], inicial["resumo_entrada"])
+        relatorio.retomado_de = inicial["consumido"]
+        relatorio.genes = inicial["genes"]
+        logging.info(f"Retomando do ponto de controle: {inicial['consumido']} caracteres já processados.")
+    automatos = [transcritor.impressao_digital(), ribossomo.impressao_digital()] if ponto_controle else None
+
+    limite_pilha = None
+    if memoria_maxima is not None:
+        relatorio.tamanho_bloco = max(TAMANHO_BLOCO_MINIMO, int(memoria_maxima * FRACAO_MEMORIA_BLOCOS / BYTES_POR_BASE_BLOCO))
+        limite_pilha = max(1, int(memoria_maxima * (1 - FRACAO_MEMORIA_BLOCOS) / BYTES_POR_SIMBOLO_PILHA))
+        fonte = _fatiar(fonte, relatorio.tamanho_bloco)
+    if memorizar:
+        relatorio.memoria = MemoriaBlocos(ribossomo)
+
+    # --- Etapas ---
+    # Cada etapa retira um bloco da fila anterior, processa-o e o entrega à seguinte.
+
+    # Junto de cada bloco viaja a marca do que já foi feito ao fim dele (caracteres
+    # consumidos e seu SHA-256, configurações dos autômatos), usada nos pontos de controle.
+    # A pilha só entra na marca quando um ponto de controle está para vencer: a tradução
+    # consulta `proximo_ponto`, que a escrita adia a cada ponto gravado.
+    proximo_ponto = time.perf_counter() + intervalo_ponto_controle
+
+    def leitura() -> None:
+        estatisticas = etapas[0]
+        iterador = iter(fonte)
+        consumido = inicial["consumido"]
+        while True:
+            inicio = time.perf_counter()
+            bloco = next(iterador, _FIM)
+            if bloco is _FIM:
+                break
+            dna = normalizar_dna(bloco)
+            consumido += len(bloco)
+            if resumo_entrada is not None:
+                resumo_entrada.update(bloco.encode('utf-8'))
+            marca = (consumido, resumo_entrada.hexdigest() if resumo_entrada is not None else None)
+            estatisticas.tempo_ativo += time.perf_counter() - inicio
+            estatisticas.blocos += 1
+            estatisticas.bases += len(dna)
+            _colocar(filas[0], (dna, marca), ocupacoes[0], abortar)
+        _colocar(filas[0], _FIM, ocupacoes[0], abortar)
+
+    def transcricao() -> None:
+        estatisticas = etapas[1]
+        estado = inicial["estado_transdutor"]
+        # Um único buffer de saída, reaproveitado em todos os blocos (só cresce se um bloco não couber).
+        bytes_por_simbolo = max((len(simbolo.encode('utf-8')) for simbolo in transcritor.alfabeto_saida), default=1)
+        buffer = bytearray()
+        while (item := _retirar(filas[0], abortar)) is not _FIM:
+            dna, marca = item
+            inicio = time.perf_counter()
+            if len(buffer) < len(dna) * bytes_por_simbolo:
+                buffer = bytearray(len(dna) * bytes_por_simbolo)
+            escritos, estado = transcritor.transcrever_bloco_em(dna, buffer, 0, estado)
+            with memoryview(buffer)[:escritos] as saida:
+                rna = str(saida, 'utf-8')
+            estatisticas.tempo_ativo += time.perf_counter() - inicio
+            estatisticas.blocos += 1
+            estatisticas.bases += len(rna)
+            _colocar(filas[1], (rna, (*marca, estado)), ocupacoes[1], abortar)
+        _colocar(filas[1], _FIM, ocupacoes[1], abortar)
+
+    def contar_genes(partes: Iterator[list[str]]) -> Iterator[list[str]]:
+        for parte in partes:
+            relatorio.genes += parte.count('Stop')
+            yield parte
+
+    def traducao() -> None:
+        nonlocal proximo_ponto
+        estatisticas = etapas[2]
+        execucao = ExecucaoPilha(ribossomo, marcador='Stop', limite_pilha=limite_pilha, memoria=relatorio.memoria)
+        execucao.restaurar(inicial["estado_pilha"], inicial["pilha"])
+        while (item := _retirar(filas[1], abortar)) is not _FIM:
+            rna, marca = item
+            inicio = time.perf_counter()
+            execucao.consumir(rna)
+            partes = execucao.drenar_partes()
+            relatorio.maximo_derramado = max(relatorio.maximo_derramado, execucao.derramados)
+            # Um gene que estava em disco segue para a escrita aos pedaços, à frente do texto do bloco.
+            texto, continua = "", False
+            for seguinte in _formatar_partes(contar_genes(partes)):
+                if texto:
+                    _colocar(filas[2], ("", texto, None, continua), ocupacoes[2], abortar)
+                texto, continua = seguinte
+            estatisticas.tempo_ativo += time.perf_counter() - inicio
+            estatisticas.blocos += 1
+            estatisticas.bases += len(rna)
+            # A pilha só é copiada se um ponto de controle vencer e puder ser gravado (com ela toda em memória).
+            if ponto_controle and not execucao.derramados and time.perf_counter() >= proximo_ponto:
+                marca = (*marca, execucao.estado, list(execucao.pilha), relatorio.genes)
+                proximo_ponto = float('inf')    # Até a escrita gravar este ponto.
+            else:
+                marca = None
+            _colocar(filas[2], (rna, texto, marca, continua), ocupacoes[2], abortar)
+        # O que sobrou na pilha passa pelas transições ε finais (ex: rollback).
+        _colocar(filas[2], ("", formatar_proteina(execucao.finalizar()), None, False), ocupacoes[2], abortar)
+        _colocar(filas[2], _FIM, ocupacoes[2], abortar)
+
+    def escrita() -> None:
+        nonlocal proximo_ponto
+        estatisticas = etapas[3]
+        # As saídas são ASCII: caracteres escritos == bytes escritos.
+        bytes_rna, bytes_proteina = inicial["bytes_rna"], inicial["bytes_proteina"]
+        if relatorio.retomado_de:
+            # Descarta o que foi escrito depois do ponto de controle.
+            os.truncate(caminho_rna, bytes_rna)
+            os.truncate(caminho_proteina, bytes_proteina)
+        modo = 'a' if relatorio.retomado_de else 'w'
+        with caminho_rna.open(modo, encoding='utf-8') as arquivo_rna, \
+             caminho_proteina.open(modo, encoding='utf-8') as arquivo_proteina:
+            while (item := _retirar(filas[2], abortar)) is not _FIM:
+                rna, proteinas, marca, continua = item
+                inicio = time.perf_counter()
+                arquivo_rna.write(rna)
+                bytes_rna += len(rna)
+                if proteinas:
+                    # Genes de blocos diferentes são separados por espaço, como em `formatar_proteina`.
+                    if bytes_proteina and not continua:
+                        proteinas = f" {proteinas}"
+                    arquivo_proteina.write(proteinas)
+                    bytes_proteina += len(proteinas)
+                if marca:
+                    # As saídas chegam ao disco antes do ponto de controle que registra seus tamanhos.
+                    for arquivo in (arquivo_rna, arquivo_proteina):
+                        arquivo.flush()
+                        os.fsync(arquivo.fileno())
+                    consumido, resumo, estado_transdutor, estado_pilha, pilha, genes = marca
+                    _gravar_ponto_controle(ponto_controle, {
+                        "versao": VERSAO_PONTO_CONTROLE, "automatos": automatos,
+                        "consumido": consumido, "resumo_entrada": resumo, "estado_transdutor": estado_transdutor,
+                        "estado_pilha": estado_pilha, "pilha": pilha,
+                        "bytes_rna": bytes_rna, "bytes_proteina": bytes_proteina, "genes": genes,
+                    })
+                    relatorio.pontos_controle += 1
+                    proximo_ponto = time.perf_counter() + intervalo_ponto_controle
+                estatisticas.tempo_ativo += time.perf_counter() - inicio
+                estatisticas.blocos += 1
+                estatisticas.bases += len(rna)
+
+    def executar(etapa) -> None:
+        try:
+            etapa()
+        except _Abortado:
+            pass
+        except BaseException as e:
+            erros.append(e)
+            abortar.set()
+
+    inicio = time.perf_counter()
+    threads = [
+        threading.Thread(target=executar, args=(etapa,), name=f"pipeline-{nome}", daemon=True)
+        for nome, etapa in zip(nomes_etapas, (leitura, transcricao, traducao, escrita))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    relatorio.tempo_total = time.perf_counter() - inicio
+
+    if erros:
+        raise erros[0]
+    if ponto_controle:
+        # Execução concluída: não há o que retomar.
+        ponto_controle.unlink(missing_ok=True)
+
+    logging.debug("Pipeline concluído.\n%s", relatorio.resumo())
+    return relatorio
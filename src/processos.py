@@ -0,0 +1,277 @@
+"""
+Módulo que implementa a transcrição e a tradução em um pool de processos, com
+a troca de dados feita por memória compartilhada (`multiprocessing.shared_memory`).
+
+Nada de tamanho proporcional à entrada é serializado entre os processos:
+
+    - a entrada é copiada uma única vez para um segmento compartilhado;
+    - cada trabalhador lê o seu fragmento por `memoryview`, escreve o RNA
+      transcrito no segmento de RNA e os genes que encontrou em dois segmentos
+      pré-alocados: os resíduos (um byte por aminoácido) e os pares
+      (início, fim) de cada gene, relativos ao fragmento;
+    - pelos pipes do pool passam só os nomes dos segmentos, as posições do
+      fragmento e, na volta, o número de genes encontrados.
+
+Os fragmentos têm tamanho múltiplo de 6, então a região de cada um nos
+segmentos de saída é fixa: um gene ocupa ao menos 6 bases e produz no máximo
+um resíduo a cada 3 bases, logo o fragmento k nunca passa de
+`tamanho_fragmento // 3` resíduos nem de `tamanho_fragmento // 6` genes.
+
+Cada trabalhador traduz o seu fragmento como se a fita começasse nele; a
+junção na ordem da fita segue a regra de `src.distribuido`: um gene só depende
+da fita a partir do seu AUG, então o gene de um trabalhador que começa onde a
+varredura global está é reaproveitado, e os demais (os que atravessam uma
+fronteira) são traduzidos no processo principal.
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .automata import TransdutorFinito, separar_lote
+from .codigos_geneticos import (
+    CODIGO_PADRAO, CODON_INICIO, LETRA_PARADA,
+    compilar_tabela_indices, indices_bases, codons_do_quadro, localizar_inicios
+)
+from .tabela_codons import CODIGO_UMA_LETRA
+
+# --- CONSTANTES DO MÓDULO ---
+TAMANHO_FRAGMENTO_PADRAO = (1 << 20) // 6 * 6   # Bases por tarefa (múltiplo de 6)
+JANELA_GENE_LOCAL = 3 << 12                     # Bases lidas de cada vez ao procurar a parada de um gene na junção
+_SIMBOLO_INVALIDO = re.compile(r'[^ACGU]')
+_INVALIDO = 0                                   # Byte de saída dos símbolos fora do alfabeto na tabela de transcrição
+_TRES_LETRAS = {ord(letra): f"{nome}-" for nome, letra in CODIGO_UMA_LETRA.items()}
+
+# Segmentos abertos em cada processo trabalhador, pelo inicializador do pool.
+_segmentos: dict[str, shared_memory.SharedMemory] = {}
+
+
+def tabela_transcricao(transcritor: TransdutorFinito) -> bytes:
+    """
+    Retorna a tabela de `bytes.translate` do transdutor, enviada aos trabalhadores.
+
+    Os autômatos não são serializáveis (as definições são `MappingProxyType`),
+    então o transdutor viaja como a sua `tabela_bytes`.
+
+    Args:
+        transcritor (TransdutorFinito): O transdutor; a saída de cada símbolo não pode
+            depender do estado, e os símbolos devem ser caracteres ASCII.
+
+    Returns:
+        bytes: 256 bytes; os símbolos fora do alfabeto de entrada valem zero.
+
+    Raises:
+        ValueError: Se o transdutor não puder ser aplicado byte a byte.
+    """
+    tabela = transcritor.tabela_bytes()
+    if tabela is None:
+        raise ValueError("A transcrição em processos exige um transdutor independente de posição, com símbolos ASCII.")
+    return tabela
+
+
+def _abrir_segmentos(nomes: dict[str, str]) -> None:
+    """Inicializador do pool: abre, uma vez por processo, os segmentos da chamada."""
+    for papel, nome in nomes.items():
+        _segmentos[papel] = shared_memory.SharedMemory(name=nome)
+
+
+def _processar_fragmento(
+    indice: int, inicio: int, fim: int, tamanho_fragmento: int, tabela: bytes | None, codigo: int
+) -> int:
+    """
+    Tarefa de um trabalhador: transcreve (se `tabela` for dada) e traduz um fragmento.
+
+    Returns:
+        int: O número de genes gravados na região do fragmento.
+
+    Raises:
+        ValueError: Se o fragmento tiver símbolos inválidos.
+    """
+    # As visões dos segmentos são liberadas também no erro: um segmento com visões abertas não fecha.
+    with _segmentos["entrada"].buf[inicio:fim] as entrada:
+        rna = entrada.tobytes()
+        if tabela is not None:
+            rna = rna.translate(tabela)
+            posicao = rna.find(_INVALIDO)
+            if posicao >= 0:
+                raise ValueError(f"Símbolo '{chr(entrada[posicao])}' na cadeia de entrada não pertence ao alfabeto de entrada Σ.")
+            _segmentos["rna"].buf[inicio:fim] = rna
+    texto = rna.decode('latin-1')
+    invalido = _SIMBOLO_INVALIDO.search(texto)
+    if invalido:
+        raise ValueError(f"Símbolo '{invalido.group()}' na cadeia de entrada não pertence ao alfabeto de entrada Σ.")
+
+    # Mesma varredura de `traduzir_uma_letra`, gravando direto nas regiões do fragmento.
+    tabela_codons = compilar_tabela_indices(codigo)
+    indices = indices_bases(texto)
+    quadros = [codons_do_quadro(indices, quadro).translate(tabela_codons) for quadro in range(3)]
+    inicios = localizar_inicios(texto)
+
+    residuos = _segmentos["residuos"].buf
+    proximo_residuo = indice * (tamanho_fragmento // 3)
+    proximo_gene = 2 * indice * (tamanho_fragmento // 6)
+    quantidade = 0
+    proximo = 0
+    with _segmentos["genes"].buf.cast('I') as genes:
+        while proximo < len(inicios):
+            inicio_gene = inicios[proximo]
+            letras = quadros[inicio_gene % 3]
+            codon_inicio = inicio_gene // 3
+            parada = letras.find(LETRA_PARADA, codon_inicio + 1)
+            if parada < 0:
+                break
+            fim_gene = 3 * parada + inicio_gene % 3 + 3
+            residuos[proximo_residuo] = ord('M')
+            residuos[proximo_residuo + 1:proximo_residuo + parada - codon_inicio] = letras[codon_inicio + 1:parada]
+            proximo_residuo += parada - codon_inicio
+            genes[proximo_gene] = inicio_gene
+            genes[proximo_gene + 1] = fim_gene
+            proximo_gene += 2
+            quantidade += 1
+            proximo = bisect_left(inicios, fim_gene, lo=proximo)
+    return quantidade
+
+
+def _gene_local(rna: str, inicio: int, tabela: bytes) -> tuple[int, bytes] | None:
+    """Traduz no processo principal o gene que começa em `inicio`: (fim, resíduos), ou None sem parada."""
+    janela = JANELA_GENE_LOCAL
+    while True:
+        limite = min(len(rna), inicio + janela)
+        letras = codons_do_quadro(indices_bases(rna[inicio:limite]), 0).translate(tabela)
+        parada = letras.find(LETRA_PARADA, 1)
+        if parada >= 0:
+            return inicio + 3 * parada + 3, b'M' + letras[1:parada]
+        if limite == len(rna):
+            return None
+        janela *= 2
+
+
+def processar_em_processos(
+    entrada: str,
+    codigo: int = CODIGO_PADRAO,
+    transcritor: TransdutorFinito | None = None,
+    trabalhadores: int | None = None,
+    tamanho_fragmento: int = TAMANHO_FRAGMENTO_PADRAO,
+) -> tuple[str, bytes, array]:
+    """
+    Transcreve (opcionalmente) e traduz uma fita em um pool de processos.
+
+    O resultado é o de `traduzir_uma_letra` sobre o RNA: os genes seguem a
+    gramática do ribossomo, e o gene sem parada no fim da fita é descartado.
+
+    Args:
+        entrada (str): O DNA já normalizado, se `transcritor` for dado; senão, o RNA.
+        codigo (int): O número NCBI do código genético.
+        transcritor (TransdutorFinito | None): O transdutor DNA -> RNA, independente
+            de posição; None se a entrada já for RNA.
+        trabalhadores (int | None): O número de processos (padrão: o de `ProcessPoolExecutor`).
+        tamanho_fragmento (int): Bases por tarefa, arredondado para cima até um múltiplo de 6.
+
+    Returns:
+        tuple[str, bytes, array]: O RNA, os resíduos de todos os genes em códigos de
+        uma letra e os N + 1 deslocamentos de cada gene (ver `src.automata.lote`).
+
+    Raises:
+        ValueError: Se a entrada tiver símbolos inválidos, o código for desconhecido,
+            o transdutor não puder ser aplicado byte a byte ou o fragmento não for positivo.
+    """
+    if tamanho_fragmento <= 0:
+        raise ValueError("O tamanho do fragmento deve ser positivo.")
+    tabela_codons = compilar_tabela_indices(codigo)
+    tabela = tabela_transcricao(transcritor) if transcritor is not None else None
+    tamanho_fragmento = -(-tamanho_fragmento // 6) * 6
+    tamanho = len(entrada)
+    if not tamanho:
+        return "", b"", array('q', [0])
+
+    try:
+        dados = entrada.encode('latin-1')
+    except UnicodeEncodeError as e:
+        raise ValueError(f"Símbolo '{entrada[e.start]}' na cadeia de entrada não pertence ao alfabeto de entrada Σ.") from None
+
+    fragmentos = -(-tamanho // tamanho_fragmento)
+    segmentos = {}
+    try:
+        tamanhos = {
+            "entrada": tamanho,
+            "residuos": fragmentos * (tamanho_fragmento // 3),
+            "genes": fragmentos * (tamanho_fragmento // 6) * 2 * array('I').itemsize,
+        }
+        if tabela is not None:
+            tamanhos["rna"] = tamanho
+        for papel, bytes_segmento in tamanhos.items():
+            segmentos[papel] = shared_memory.SharedMemory(create=True, size=bytes_segmento)
+        segmentos["entrada"].buf[:tamanho] = dados
+        del dados
+
+        nomes = {papel: segmento.name for papel, segmento in segmentos.items()}
+        with ProcessPoolExecutor(trabalhadores, initializer=_abrir_segmentos, initargs=(nomes,)) as pool:
+            tarefas = [
+                pool.submit(_processar_fragmento, indice, inicio, min(inicio + tamanho_fragmento, tamanho),
+                            tamanho_fragmento, tabela, codigo)
+                for indice, inicio in enumerate(range(0, tamanho, tamanho_fragmento))
+            ]
+            quantidades = [tarefa.result() for tarefa in tarefas]
+
+        rna = entrada if tabela is None else bytes(segmentos["rna"].buf[:tamanho]).decode('latin-1')
+        residuos_remotos = segmentos["residuos"].buf
+
+        # Genes dos trabalhadores, indexados pela posição global do AUG: (fim, início e fim dos resíduos).
+        # A visão é liberada também no erro, para que o `finally` consiga fechar o segmento.
+        remotos: dict[int, tuple[int, int, int]] = {}
+        with segmentos["genes"].buf.cast('I') as pares:
+            for indice, quantidade in enumerate(quantidades):
+                deslocamento = indice * tamanho_fragmento
+                posicao_residuo = indice * (tamanho_fragmento // 3)
+                base = 2 * indice * (tamanho_fragmento // 6)
+                for gene in range(quantidade):
+                    inicio, fim = pares[base + 2 * gene], pares[base + 2 * gene + 1]
+                    ultimo_residuo = posicao_residuo + (fim - inicio) // 3 - 1
+                    remotos[inicio + deslocamento] = (fim + deslocamento, posicao_residuo, ultimo_residuo)
+                    posicao_residuo = ultimo_residuo
+
+        residuos = bytearray()
+        deslocamentos = array('q', [0])
+        posicao = 0
+        while (inicio := rna.find(CODON_INICIO, posicao)) >= 0:
+            gene = remotos.get(inicio)
+            if gene is not None:
+                posicao, primeiro, ultimo = gene
+                residuos += residuos_remotos[primeiro:ultimo]
+            else:
+                # Gene que atravessa uma fronteira, ou AUG pulado por um fragmento fora de sincronia.
+                local = _gene_local(rna, inicio, tabela_codons)
+                if local is None:
+                    break       # Sem parada até o fim da fita: o gene é descartado (rollback).
+                posicao, letras = local
+                residuos += letras
+            deslocamentos.append(len(residuos))
+        return rna, bytes(residuos), deslocamentos
+    finally:
+        for segmento in segmentos.values():
+            segmento.close()
+            segmento.unlink()
+
+
+def traduzir_em_processos(rna: str, codigo: int = CODIGO_PADRAO, trabalhadores: int | None = None) -> list[str]:
+    """
+    Traduz uma fita de RNA em um pool de processos, no formato de três letras.
+
+    O resultado é idêntico ao do ribossomo: `" ".join(resultado) ==
+    formatar_proteina(obter_ribossomo(codigo).transcrever_pilha(rna))`.
+
+    Args:
+        rna (str): A fita de RNA.
+        codigo (int): O número NCBI do código genético.
+        trabalhadores (int | None): O número de processos.
+
+    Returns:
+        list[str]: As proteínas formatadas de cada gene.
+
+    Raises:
+        ValueError: Se a fita tiver símbolos inválidos ou o código for desconhecido.
+    """
+    _, residuos, deslocamentos = processar_em_processos(rna, codigo, trabalhadores=trabalhadores)
+    return [proteina.decode('ascii').translate(_TRES_LETRAS)[:-1] for proteina in separar_lote(residuos, deslocamentos)]
@@ -0,0 +1,179 @@
+"""
+Módulo que implementa o modo residente (`--serve-stdio`): um processo que fica
+ativo, recebe trabalhos pela entrada padrão e devolve os resultados pela saída
+padrão, sem pagar a inicialização do interpretador e a montagem dos autômatos
+a cada chamada.
+
+Cada trabalho é um objeto JSON:
+
+    {"id": 7, "dna": "TACAAAATT", "tarefa": "proteinas", "codigo": 1, "incluir_rna": false}
+
+    - "dna" (ou "arquivo", com o caminho de um arquivo de DNA) é obrigatório;
+    - "tarefa" é "proteinas" (padrão), "uma-letra" ou "estatisticas";
+    - "codigo" é o código genético do NCBI (padrão: 1);
+    - "incluir_rna" devolve também o RNA transcrito.
+
+No enquadramento 'linhas', cada linha da entrada é um trabalho; uma linha que
+não começa com '{' é tratada como DNA puro. No enquadramento 'prefixo', cada
+trabalho é precedido pelo seu tamanho em bytes (uint32 big-endian). As respostas
+seguem o mesmo enquadramento e trazem o tempo gasto em cada etapa:
+
+    {"id": 7, "ok": true, "proteinas": ["Met-Phe"], "tempos": {"transcricao": ..., "traducao": ..., "total": ...}}
+    {"id": 8, "ok": false, "erro": "..."}
+"""
+
+import json
+import logging
+import struct
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
+
+from .codigos_geneticos import CODIGO_PADRAO, obter_ribossomo, traduzir_uma_letra
+from .automata import separar_lote
+from .estatisticas import EstatisticasTraducao
+from .utils import normalizar_dna, separar_proteinas, ler_arquivo
+
+# --- CONSTANTES DO MÓDULO ---
+ENQUADRAMENTOS = ("linhas", "prefixo")      # Formas de delimitar os trabalhos
+TAREFAS = ("proteinas", "uma-letra", "estatisticas")
+_TAMANHO = struct.Struct('>I')
+
+
+def _ler_trabalhos(entrada: BinaryIO, enquadramento: str) -> Iterator[bytes]:
+    """Separa os trabalhos brutos da entrada conforme o enquadramento."""
+    if enquadramento == "linhas":
+        for linha in entrada:
+            if linha.strip():
+                yield linha
+        return
+    while cabecalho := entrada.read(_TAMANHO.size):
+        if len(cabecalho) < _TAMANHO.size:
+            raise EOFError("Prefixo de tamanho incompleto no fim da entrada.")
+        (tamanho,) = _TAMANHO.unpack(cabecalho)
+        corpo = entrada.read(tamanho)
+        if len(corpo) < tamanho:
+            raise EOFError("Trabalho truncado no fim da entrada.")
+        yield corpo
+
+
+def _escrever_resposta(saida: BinaryIO, resposta: dict[str, Any], enquadramento: str) -> None:
+    """Escreve uma resposta e a envia imediatamente."""
+    corpo = json.dumps(resposta, ensure_ascii=False).encode('utf-8')
+    if enquadramento == "linhas":
+        saida.write(corpo + b"\n")
+    else:
+        saida.write(_TAMANHO.pack(len(corpo)) + corpo)
+    saida.flush()
+
+
+def _interpretar(bruto: bytes) -> dict[str, Any]:
+    """Converte um trabalho bruto em pedido; texto que não é JSON vira DNA puro."""
+    texto = bruto.decode('utf-8').strip()
+    if not texto.startswith('{'):
+        return {"dna": texto}
+    pedido = json.loads(texto)
+    if not isinstance(pedido, dict):
+        raise ValueError("O trabalho deve ser um objeto JSON.")
+    return pedido
+
+
+class ServidorTraducao:
+    """
+    Executa trabalhos de tradução com os autômatos já montados.
+
+    Attributes:
+        trabalhos (int): Quantos trabalhos foram atendidos.
+        falhas (int): Quantos deles terminaram em erro.
+    """
+
+    def __init__(self):
+        # Importação local: as funções fábrica vivem no __init__ do pacote, que importa este módulo.
+        from . import criar_transcritor_dna_rna
+        self._transcritor = criar_transcritor_dna_rna()
+        obter_ribossomo(CODIGO_PADRAO)      # Aquece o ribossomo mais usado.
+        self.trabalhos = 0
+        self.falhas = 0
+
+    def executar(self, pedido: dict[str, Any]) -> dict[str, Any]:
+        """
+        Executa um trabalho.
+
+        Args:
+            pedido (dict[str, Any]): O trabalho, no formato descrito no módulo.
+
+        Returns:
+            dict[str, Any]: O resultado, com os tempos de cada etapa em segundos.
+
+        Raises:
+            ValueError: Se o pedido for inválido ou o DNA contiver bases inválidas.
+            FileNotFoundError: Se o arquivo indicado não existir.
+        """
+        inicio = time.perf_counter()
+        tarefa = pedido.get("tarefa", TAREFAS[0])
+        if tarefa not in TAREFAS:
+            raise ValueError(f"Tarefa '{tarefa}' desconhecida. Disponíveis: {', '.join(TAREFAS)}.")
+        codigo = pedido.get("codigo", CODIGO_PADRAO)
+        if "dna" in pedido:
+            dna = pedido["dna"]
+        elif "arquivo" in pedido:
+            dna = ler_arquivo(Path(pedido["arquivo"]))
+        else:
+            raise ValueError("O trabalho deve informar 'dna' ou 'arquivo'.")
+
+        rna = self._transcritor.transcrever(normalizar_dna(dna))
+        meio = time.perf_counter()
+
+        resposta: dict[str, Any] = {"ok": True}
+        if tarefa == "proteinas":
+            resposta["proteinas"] = separar_proteinas(obter_ribossomo(codigo).transcrever_pilha(rna))
+        elif tarefa == "uma-letra":
+            residuos, deslocamentos = traduzir_uma_letra(rna, codigo)
+            resposta["proteinas"] = [proteina.decode('ascii') for proteina in separar_lote(residuos, deslocamentos)]
+        else:
+            estatisticas = EstatisticasTraducao(codigo)
+            estatisticas.consumir(rna)
+            resposta["estatisticas"] = estatisticas.resumo()
+        if pedido.get("incluir_rna"):
+            resposta["rna"] = rna
+        fim = time.perf_counter()
+
+        resposta["tempos"] = {"transcricao": meio - inicio, "traducao": fim - meio, "total": fim - inicio}
+        return resposta
+
+    def servir(self, entrada: BinaryIO, saida: BinaryIO, enquadramento: str = ENQUADRAMENTOS[0]) -> int:
+        """
+        Atende trabalhos até o fim da entrada.
+
+        Um trabalho com erro gera uma resposta com "ok": false e não interrompe o servidor.
+
+        Args:
+            entrada (BinaryIO): De onde os trabalhos são lidos (ex: `sys.stdin.buffer`).
+            saida (BinaryIO): Para onde as respostas são escritas (ex: `sys.stdout.buffer`).
+            enquadramento (str): 'linhas' ou 'prefixo'.
+
+        Returns:
+            int: O número de trabalhos atendidos.
+
+        Raises:
+            ValueError: Se o enquadramento for desconhecido.
+            EOFError: Se, no enquadramento 'prefixo', a entrada terminar no meio de um trabalho.
+        """
+        if enquadramento not in ENQUADRAMENTOS:
+            raise ValueError(f"Enquadramento '{enquadramento}' desconhecido. Disponíveis: {', '.join(ENQUADRAMENTOS)}.")
+
+        for bruto in _ler_trabalhos(entrada, enquadramento):
+            identificador = None
+            try:
+                pedido = _interpretar(bruto)
+                identificador = pedido.get("id")
+                resposta = self.executar(pedido)
+            except (ValueError, KeyError, TypeError, OSError, RuntimeError) as e:
+                # json.JSONDecodeError e UnicodeDecodeError são subclasses de ValueError.
+                self.falhas += 1
+                resposta = {"ok": False, "erro": str(e)}
+            self.trabalhos += 1
+            _escrever_resposta(saida, {"id": identificador, **resposta}, enquadramento)
+
+        logging.info(f"Servidor encerrado: {self.trabalhos} trabalho(s), {self.falhas} com erro.")
+        return self.trabalhos
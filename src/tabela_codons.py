@@ -68,3 +68,43 @@ TABELA_CODONS = {
     # Glicina (Gly)
     'GGU': 'Gly', 'GGC': 'Gly', 'GGA': 'Gly', 'GGG': 'Gly'
 }
+
+
+def _derivar_tabela(alteracoes: dict[str, str]) -> dict[str, str]:
+    """Cria uma tabela a partir da padrão, substituindo apenas os códons informados."""
+    tabela = dict(TABELA_CODONS)
+    tabela.update(alteracoes)
+    return tabela
+
+# Tabelas de tradução do NCBI (https://www.ncbi.nlm.nih.gov/Taxonomy/Utils/wprintgc.cgi),
+# indexadas pelo número oficial de cada código. Cada entrada é (nome, tabela).
+# Apenas os aminoácidos atribuídos são modelados; o códon de início é sempre AUG.
+CODIGOS_GENETICOS = {
+    1: ("Padrão", TABELA_CODONS),
+    2: ("Mitocondrial de vertebrados", _derivar_tabela({'AGA': 'Stop', 'AGG': 'Stop', 'AUA': 'Met', 'UGA': 'Trp'})),
+    3: ("Mitocondrial de leveduras", _derivar_tabela({'AUA': 'Met', 'CUU': 'Thr', 'CUC': 'Thr', 'CUA': 'Thr', 'CUG': 'Thr', 'UGA': 'Trp'})),
+    4: ("Mitocondrial de fungos, protozoários e celenterados; Mycoplasma", _derivar_tabela({'UGA': 'Trp'})),
+    5: ("Mitocondrial de invertebrados", _derivar_tabela({'AGA': 'Ser', 'AGG': 'Ser', 'AUA': 'Met', 'UGA': 'Trp'})),
+    6: ("Nuclear de ciliados, dasicladáceas e Hexamita", _derivar_tabela({'UAA': 'Gln', 'UAG': 'Gln'})),
+    9: ("Mitocondrial de equinodermos e platelmintos", _derivar_tabela({'AAA': 'Asn', 'AGA': 'Ser', 'AGG': 'Ser', 'UGA': 'Trp'})),
+    10: ("Nuclear de Euplotidae", _derivar_tabela({'UGA': 'Cys'})),
+    11: ("Bactérias, arqueias e plastídios vegetais", TABELA_CODONS),
+    12: ("Nuclear alternativo de leveduras", _derivar_tabela({'CUG': 'Ser'})),
+    13: ("Mitocondrial de ascídias", _derivar_tabela({'AGA': 'Gly', 'AGG': 'Gly', 'AUA': 'Met', 'UGA': 'Trp'})),
+    14: ("Mitocondrial alternativo de platelmintos", _derivar_tabela({'AAA': 'Asn', 'AGA': 'Ser', 'AGG': 'Ser', 'UAA': 'Tyr', 'UGA': 'Trp'})),
+    16: ("Mitocondrial de clorofíceas", _derivar_tabela({'UAG': 'Leu'})),
+    21: ("Mitocondrial de trematódeos", _derivar_tabela({'UGA': 'Trp', 'AUA': 'Met', 'AGA': 'Ser', 'AGG': 'Ser', 'AAA': 'Asn'})),
+    22: ("Mitocondrial de Scenedesmus obliquus", _derivar_tabela({'UCA': 'Stop', 'UAG': 'Leu'})),
+    24: ("Mitocondrial de pterobrânquios", _derivar_tabela({'AGA': 'Ser', 'AGG': 'Lys', 'UGA': 'Trp'})),
+    25: ("Candidate Division SR1 e Gracilibacteria", _derivar_tabela({'UGA': 'Gly'})),
+    26: ("Nuclear de Pachysolen tannophilus", _derivar_tabela({'CUG': 'Ala'})),
+}
+
+# Códigos de uma letra da IUPAC para cada aminoácido; '*' representa a parada.
+CODIGO_UMA_LETRA = {
+    'Ala': 'A', 'Arg': 'R', 'Asn': 'N', 'Asp': 'D', 'Cys': 'C',
+    'Gln': 'Q', 'Glu': 'E', 'Gly': 'G', 'His': 'H', 'Ile': 'I',
+    'Leu': 'L', 'Lys': 'K', 'Met': 'M', 'Phe': 'F', 'Pro': 'P',
+    'Ser': 'S', 'Thr': 'T', 'Trp': 'W', 'Tyr': 'Y', 'Val': 'V',
+    'Stop': '*',
+}
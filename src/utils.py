@@ -1,6 +1,9 @@
 import random
 import re
 from pathlib import Path
+from typing import Iterator
+
+from .tabela_codons import CODIGO_UMA_LETRA
 
 # --- CONSTANTES DO MÓDULO ---
 BASES_DNA = ('A', 'C', 'G', 'T')            # Tupla de bases nitrogenadas do DNA
@@ -64,6 +67,72 @@ def formatar_proteina(proteina: list[str]) -> str:
     # Junta todos os itens com '-', substitui 'Stop' por um espaço e remove espaços extras.
     return re.sub(r'(-)?Stop(-)?', ' ', '-'.join(proteina)).strip()
 
+def separar_proteinas(simbolos: list[str]) -> list[str]:
+    """
+    Divide a saída bruta do autômato em proteínas formatadas, uma por gene.
+
+    Exemplo: ['Met', 'Phe', 'Stop', 'Met', 'Stop'] -> ["Met-Phe", "Met"]
+
+    Unidas por espaço, as proteínas reproduzem `formatar_proteina(simbolos)`.
+
+    Args:
+        simbolos: Uma lista de símbolos retornada pelo autômato (ou um trecho dela).
+
+    Returns:
+        A lista de proteínas formatadas.
+    """
+    proteinas = []
+    atual = []
+    for simbolo in simbolos:
+        if simbolo == 'Stop':
+            if atual:
+                proteinas.append('-'.join(atual))
+            atual = []
+        else:
+            atual.append(simbolo)
+    if atual:
+        proteinas.append('-'.join(atual))
+    return proteinas
+
+def formatar_proteina_uma_letra(simbolos: list[str]) -> str:
+    """
+    Converte a saída bruta do autômato em códigos de uma letra, uma proteína por linha.
+
+    Exemplo: ['Met', 'Phe', 'Stop', 'Met', 'Stop'] -> "MF\nM\n"
+
+    Args:
+        simbolos: Uma lista de símbolos retornada pelo autômato.
+
+    Returns:
+        As proteínas, cada uma terminada por uma quebra de linha.
+    """
+    return ''.join(
+        ''.join(CODIGO_UMA_LETRA[aminoacido] for aminoacido in proteina.split('-')) + '\n'
+        for proteina in separar_proteinas(simbolos)
+    )
+
+def normalizar_dna(dna: str) -> str:
+    """
+    Remove caracteres que não são letras (quebras de linha, espaços, dígitos)
+    e converte a cadeia para maiúsculas.
+
+    A operação é local a cada caractere, portanto pode ser aplicada bloco a bloco.
+
+    Args:
+        dna (str): A cadeia (ou bloco) de DNA bruta.
+
+    Returns:
+        str: A cadeia limpa.
+
+    Raises:
+        ValueError: Se a cadeia contiver bases diferentes de A, T, C e G.
+    """
+    cadeia_dna = "".join(filter(str.isalpha, dna)).upper()
+    # Se sobrar algo após remover as bases das pontas, há um caractere inválido.
+    if cadeia_dna.strip('ATCG'):
+        raise ValueError("DNA contém bases inválidas. Use apenas A, T, C, G.")
+    return cadeia_dna
+
 def nome_arquivo_valido(nome_arquivo: str) -> bool:
     """
     Verifica se um nome de arquivo é válido para o sistema de arquivos do Windows.
@@ -118,3 +187,28 @@ def ler_arquivo(caminho_arquivo: str | Path) -> str:
         raise FileNotFoundError(f"Arquivo não encontrado: {caminho}")
     
     return caminho.read_text(encoding='utf-8')
+
+def ler_blocos(caminho_arquivo: str | Path, tamanho_bloco: int) -> Iterator[str]:
+    """
+    Lê o conteúdo de texto de um arquivo em blocos de tamanho fixo.
+
+    Args:
+        caminho_arquivo (str | Path): O caminho completo do arquivo a ser lido.
+        tamanho_bloco (int): O número de caracteres de cada bloco.
+
+    Yields:
+        str: Os blocos do arquivo, em ordem.
+
+    Raises:
+        ValueError: Se o nome do arquivo contiver caracteres inválidos.
+        FileNotFoundError: Se o arquivo não for encontrado no caminho especificado.
+    """
+    caminho = Path(caminho_arquivo)
+    if not nome_arquivo_valido(caminho.name):
+        raise ValueError(f"Nome de arquivo inválido: {caminho.name}")
+    if not caminho.is_file():
+        raise FileNotFoundError(f"Arquivo não encontrado: {caminho}")
+
+    with caminho.open(encoding='utf-8') as arquivo:
+        while bloco := arquivo.read(tamanho_bloco):
+            yield bloco
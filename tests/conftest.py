@@ -0,0 +1,16 @@
+"""
+Fixtures compartilhadas pelos testes.
+"""
+import pytest
+from src import Automato_Pilha
+
+@pytest.fixture
+def parenteses() -> Automato_Pilha:
+    """Parênteses balanceados: usa ε para terminar, empilha vários símbolos de uma vez e a pilha cresce com a entrada."""
+    δ = {
+        ('q', '(', 'Z0'): ('q', ['Z0', 'X']),
+        ('q', '(', 'X'): ('q', ['X', 'X']),
+        ('q', ')', 'X'): ('q', []),
+        ('q', None, 'Z0'): ('f', []),
+    }
+    return Automato_Pilha({'q', 'f'}, {'(', ')', None}, {'Z0', 'X'}, δ, 'q', 'Z0', {'f'})
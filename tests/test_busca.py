@@ -0,0 +1,92 @@
+"""
+Testes do salto sobre regiões de busca do Autômato de Pilha (`src/automata/busca.py`).
+
+Cada resultado com saltos é comparado ao do laço passo a passo de referência
+(o laço rastreado, usado quando um `Rastreador` é passado).
+"""
+import random
+import pytest
+from src import Automato_Pilha, ExecucaoPilha, Rastreador, criar_ribossomo, criar_transcritor_dna_rna, gerar_dna_aleatorio
+
+ribossomo = criar_ribossomo()
+
+def referencia(automato: Automato_Pilha, cadeia: str) -> list[str]:
+    return automato.transcrever_pilha(cadeia, Rastreador())
+
+def criar_contador(padrao: str) -> Automato_Pilha:
+    """Empilha 'x' a cada ocorrência de `padrao` (busca do tipo KMP, com Z0 no topo)."""
+    Σ = set("ACGU")
+    δ = {}
+    for i in range(len(padrao)):
+        for base in Σ:
+            lido = padrao[:i] + base
+            # Maior sufixo do que foi lido que é prefixo do padrão.
+            k = next(k for k in range(len(lido), -1, -1) if padrao.startswith(lido[len(lido) - k:]))
+            if k == len(padrao):
+                δ[(f'p{i}', base, 'Z0')] = ('p0', ['x', 'Z0'])
+            else:
+                δ[(f'p{i}', base, 'Z0')] = (f'p{k}', ['Z0'])
+    Q = {f'p{i}' for i in range(len(padrao))}
+    return Automato_Pilha(Q, Σ, {'Z0', 'x'}, δ, 'p0', 'Z0', Q)
+
+def criar_alternador() -> Automato_Pilha:
+    """Alterna de estado a cada símbolo: o estado nunca é determinado pelos últimos símbolos."""
+    δ = {(estado, base, 'Z0'): ('b' if estado == 'a' else 'a', ['Z0']) for estado in 'ab' for base in "ACGU"}
+    δ[('a', 'G', 'Z0')] = ('a', ['x', 'Z0'])
+    return Automato_Pilha({'a', 'b'}, set("ACGU"), {'Z0', 'x'}, δ, 'a', 'Z0', {'a', 'b'})
+
+def test_regiao_do_ribossomo():
+    """Os três estados de busca formam uma região cuja única saída é 'AUG'."""
+    regioes = ribossomo.regioes_busca()
+    regiao = regioes[('q_inicial', 'Z0')]
+    assert regiao.estados == {'q_inicial', 'q_achouA', 'q_achouAU'}
+    assert (regiao.profundidade, regiao.palavras_saida) == (2, ('AUG',))
+
+@pytest.mark.parametrize("padrao, profundidade", [("G", 0), ("GA", 1), ("AUG", 2), ("ACAC", 3)])
+def test_regioes_de_automatos_genericos(padrao, profundidade):
+    regiao = criar_contador(padrao).regioes_busca()[('p0', 'Z0')]
+    assert regiao.profundidade == profundidade
+    assert padrao in regiao.palavras_saida
+
+def test_sem_regiao_quando_nao_compensa():
+    """Sem estado determinado pelos últimos símbolos, ou com saídas frequentes, não há salto."""
+    assert criar_alternador().regioes_busca() == {}
+    assert criar_contador("C").regioes_busca()[('p0', 'Z0')].palavras_saida == ('C',)
+    # Duas das quatro bases saem da região: metade das palavras, acima do limite.
+    dois = criar_contador("C")
+    δ = dict(dois.transicoes)
+    δ[('p0', 'U', 'Z0')] = ('p0', ('x', 'Z0'))
+    assert Automato_Pilha(set(dois.estados), set(dois.alfabeto_entrada), set(dois.alfabeto_pilha),
+                          δ, 'p0', 'Z0', set(dois.estados)).regioes_busca() == {}
+
+@pytest.mark.parametrize("semente", range(6))
+def test_saltos_equivalem_ao_laco_passo_a_passo(semente):
+    aleatorio = random.Random(semente)
+    automatos = [ribossomo, criar_contador("AUG"), criar_contador("ACAC"), criar_contador("G"), criar_alternador()]
+    for _ in range(20):
+        # Fitas ricas e pobres em 'A', para exercitar saídas frequentes e saltos longos.
+        bases = aleatorio.choice(["ACGU", "CGU", "AAUG", "ACGUUUUU"])
+        cadeia = "".join(aleatorio.choice(bases) for _ in range(aleatorio.randrange(400)))
+        for automato in automatos:
+            assert automato.transcrever_pilha(cadeia) == referencia(automato, cadeia)
+
+def test_saltos_em_blocos():
+    """Blocos cortados no meio de um 'AUG' ou de uma região dão o mesmo resultado."""
+    rna = criar_transcritor_dna_rna().transcrever(gerar_dna_aleatorio(20_000))
+    aleatorio = random.Random(7)
+    execucao = ExecucaoPilha(ribossomo)
+    posicao = 0
+    while posicao < len(rna):
+        passo = aleatorio.choice([1, 2, 3, 50, 997])
+        execucao.consumir(rna, posicao, min(posicao + passo, len(rna)))
+        posicao += passo
+    assert execucao.finalizar() == referencia(ribossomo, rna)
+
+@pytest.mark.parametrize("cadeia", ["CCCCX", "CCCCAUGX", "CCCAUGGCCUAACCCTCCC", "UUUAUGUAACC.AUG"])
+def test_simbolo_invalido_apos_regiao(cadeia):
+    """O erro é o do laço passo a passo, no mesmo símbolo."""
+    with pytest.raises(ValueError) as com_saltos:
+        ribossomo.transcrever_pilha(cadeia)
+    with pytest.raises(ValueError) as sem_saltos:
+        referencia(ribossomo, cadeia)
+    assert str(com_saltos.value) == str(sem_saltos.value)
@@ -0,0 +1,102 @@
+"""
+Testes para o cache de resultados endereçado por conteúdo.
+
+Verifica o cálculo das chaves, os acertos e falhas, a detecção de entradas
+corrompidas e a remoção LRU ao ultrapassar o limite de tamanho.
+"""
+import os
+import pytest
+from src import (
+    CacheResultados, calcular_chave, impressao_digital_definicoes,
+    criar_transcritor_dna_rna, criar_ribossomo, TABELA_CODONS
+)
+
+IMPRESSAO = impressao_digital_definicoes(criar_transcritor_dna_rna(), criar_ribossomo(), TABELA_CODONS)
+
+def guardar_resultado(cache: CacheResultados, tmp_path, chave: str, rna: str, proteina: str) -> None:
+    """Escreve os arquivos de saída e os guarda no cache."""
+    (tmp_path / "rna.txt").write_text(rna, encoding='utf-8')
+    (tmp_path / "proteina.txt").write_text(proteina, encoding='utf-8')
+    cache.guardar(chave, tmp_path / "rna.txt", tmp_path / "proteina.txt")
+
+def test_chave_usa_dna_normalizado():
+    """Quebras de linha, minúsculas e divisão em blocos não alteram a chave."""
+    assert calcular_chave(["ATCG", "TTAC"], IMPRESSAO) == calcular_chave(["atc\ngtt", "ac"], IMPRESSAO)
+    assert calcular_chave(["ATCG"], IMPRESSAO) != calcular_chave(["ATCC"], IMPRESSAO)
+
+def test_chave_depende_das_definicoes():
+    """Alterar a tabela de códons muda a impressão digital e, portanto, a chave."""
+    tabela = dict(TABELA_CODONS, UGA='Trp')
+    outra = impressao_digital_definicoes(criar_transcritor_dna_rna(), criar_ribossomo(), tabela)
+    assert calcular_chave(["ATCG"], IMPRESSAO) != calcular_chave(["ATCG"], outra)
+
+def test_acerto_e_materializacao(tmp_path):
+    """Uma entrada guardada é encontrada e copiada para os destinos."""
+    cache = CacheResultados(tmp_path / "cache")
+    chave = calcular_chave(["TACAAAATT"], IMPRESSAO)
+    assert cache.ler(chave) is None
+    guardar_resultado(cache, tmp_path, chave, "AUGUUUUAA", "Met-Phe")
+
+    assert cache.ler(chave) == ("AUGUUUUAA", "Met-Phe")
+    destino_rna, destino_proteina = tmp_path / "saida_rna.txt", tmp_path / "saida_proteina.txt"
+    destino_rna.write_text("antigo", encoding='utf-8')
+    assert cache.materializar(chave, destino_rna, destino_proteina)
+    assert destino_rna.read_text(encoding='utf-8') == "AUGUUUUAA"
+    assert destino_proteina.read_text(encoding='utf-8') == "Met-Phe"
+
+def test_saida_reescrita_nao_altera_o_cache(tmp_path):
+    """Os destinos são cópias: reescrevê-los no lugar (como faz uma execução sem cache) não toca a entrada."""
+    cache = CacheResultados(tmp_path / "cache")
+    chave = calcular_chave(["TACAAAATT"], IMPRESSAO)
+    guardar_resultado(cache, tmp_path, chave, "AUGUUUUAA", "Met-Phe")
+    destino_rna, destino_proteina = tmp_path / "saida_rna.txt", tmp_path / "saida_proteina.txt"
+    assert cache.materializar(chave, destino_rna, destino_proteina)
+    with destino_rna.open('r+', encoding='utf-8') as arquivo:
+        arquivo.write("CCC")
+    assert cache.ler(chave) == ("AUGUUUUAA", "Met-Phe")
+
+def test_guardar_de_novo_e_sobre_restos(tmp_path):
+    """Uma entrada íntegra é mantida; restos sem `meta.json` são trocados pela entrada nova."""
+    cache = CacheResultados(tmp_path / "cache")
+    chave = calcular_chave(["TAC"], IMPRESSAO)
+    entrada = tmp_path / "cache" / chave[:2] / chave
+    entrada.mkdir(parents=True)
+    (entrada / "rna.txt").write_text("resto", encoding='utf-8')
+    guardar_resultado(cache, tmp_path, chave, "AUG", "")
+    assert cache.ler(chave) == ("AUG", "")
+    guardar_resultado(cache, tmp_path, chave, "AUG", "")
+    assert cache.ler(chave) == ("AUG", "")
+    assert sorted(caminho.name for caminho in entrada.parent.iterdir()) == [chave]
+
+def test_entrada_corrompida_e_descartada(tmp_path):
+    """Um arquivo alterado no cache faz a entrada ser removida e tratada como falha."""
+    cache = CacheResultados(tmp_path / "cache")
+    chave = calcular_chave(["TAC"], IMPRESSAO)
+    guardar_resultado(cache, tmp_path, chave, "AUG", "")
+    caminho_rna, _ = cache.obter(chave)
+    caminho_rna.write_text("AUC", encoding='utf-8')
+
+    assert cache.obter(chave) is None
+    assert not caminho_rna.parent.exists()
+
+def test_remocao_lru(tmp_path):
+    """Ao passar do limite, a entrada usada há mais tempo é removida primeiro."""
+    cache = CacheResultados(tmp_path / "cache", limite_bytes=2500)
+    chaves = [calcular_chave([base * 10], IMPRESSAO) for base in "ACG"]
+    for i, chave in enumerate(chaves[:2]):
+        guardar_resultado(cache, tmp_path, chave, "A" * 1000, "")
+        # Força horários de uso distintos e crescentes.
+        os.utime(cache.diretorio / chave[:2] / chave / "meta.json", (i, i))
+    # Usar a primeira entrada a torna a mais recente.
+    assert cache.obter(chaves[0]) is not None
+
+    guardar_resultado(cache, tmp_path, chaves[2], "A" * 1000, "")
+    assert cache.obter(chaves[1]) is None
+    assert cache.obter(chaves[0]) is not None
+    assert cache.obter(chaves[2]) is not None
+    assert cache.tamanho_total() <= cache.limite_bytes
+
+def test_limite_invalido(tmp_path):
+    """O limite do cache deve ser positivo."""
+    with pytest.raises(ValueError):
+        CacheResultados(tmp_path, limite_bytes=0)
@@ -0,0 +1,83 @@
+"""
+Testes para o registro de códigos genéticos e a tradução sob vários códigos.
+
+Verifica que a tradução em uma única varredura produz, para cada código,
+exatamente as proteínas do ribossomo montado com a tabela correspondente.
+"""
+import pytest
+from src import (
+    CODIGOS_GENETICOS, obter_ribossomo, traduzir_codigos, traduzir_direto,
+    formatar_proteina, criar_transcritor_dna_rna, gerar_dna_aleatorio, gerar_dna_pseudoaleatorio
+)
+
+transcritor = criar_transcritor_dna_rna()
+
+# Casos no formato: (descricao, codigo, rna_de_entrada, proteina_esperada)
+test_cases = [
+    ("UGA é parada no código padrão", 1, "AUGUUUUGAAAA", "Met-Phe"),
+    ("UGA é Trp no mitocondrial de vertebrados", 2, "AUGUUUUGAUAA", "Met-Phe-Trp"),
+    ("AGA é parada no mitocondrial de vertebrados", 2, "AUGAGAAUGCCCUAG", "Met Met-Pro"),
+    ("AUA é Met no mitocondrial de invertebrados", 5, "AUGAUAUAA", "Met-Met"),
+    ("CUG é Ser no nuclear alternativo de leveduras", 12, "AUGCUGUAA", "Met-Ser"),
+    ("UAA não é parada em ciliados", 6, "AUGUAAUGA", "Met-Gln"),
+]
+
+@pytest.mark.parametrize("descricao, codigo, rna, saida_esperada", test_cases)
+def test_codigos_especificos(descricao, codigo, rna, saida_esperada):
+    """Cada código traduz os seus códons alterados como esperado, nos dois motores."""
+    assert formatar_proteina(obter_ribossomo(codigo).transcrever_pilha(rna)) == saida_esperada
+    assert " ".join(traduzir_direto(rna, codigo)) == saida_esperada
+
+@pytest.mark.parametrize("semente", range(5))
+def test_varios_codigos_equivalem_aos_ribossomos(semente):
+    """A varredura única reproduz o ribossomo de cada código registrado."""
+    dna = gerar_dna_aleatorio(1500) + gerar_dna_pseudoaleatorio(40) + gerar_dna_aleatorio(20 * semente)
+    rna = transcritor.transcrever(dna)
+    resultado = traduzir_codigos(rna, list(CODIGOS_GENETICOS))
+    for codigo in CODIGOS_GENETICOS:
+        assert " ".join(resultado[codigo]) == formatar_proteina(obter_ribossomo(codigo).transcrever_pilha(rna))
+
+def test_ribossomo_reaproveitado():
+    """O ribossomo de cada código é montado uma única vez."""
+    assert obter_ribossomo(2) is obter_ribossomo(2)
+
+def test_codigo_desconhecido():
+    """Um código que não está no registro é rejeitado."""
+    with pytest.raises(ValueError):
+        traduzir_codigos("AUGUAA", [1, 7])
+
+def test_simbolo_invalido():
+    """Assim como o ribossomo, a tradução direta rejeita símbolos fora de Σ."""
+    with pytest.raises(ValueError):
+        traduzir_direto("AUGUXA")
+
+# --- Códigos de uma letra ---
+
+from src import CODIGO_UMA_LETRA, traduzir_uma_letra, separar_lote, formatar_proteina_uma_letra
+
+def para_uma_letra(proteina: str) -> str:
+    """'Met-Phe' -> 'MF'."""
+    return ''.join(CODIGO_UMA_LETRA[aminoacido] for aminoacido in proteina.split('-'))
+
+@pytest.mark.parametrize("descricao, codigo, rna, saida_esperada", test_cases)
+def test_uma_letra_codigos_especificos(descricao, codigo, rna, saida_esperada):
+    """A tradução por índices de códon respeita os códons alterados de cada código."""
+    residuos, deslocamentos = traduzir_uma_letra(rna, codigo)
+    assert [p.decode() for p in separar_lote(residuos, deslocamentos)] == [para_uma_letra(p) for p in saida_esperada.split()]
+
+@pytest.mark.parametrize("semente", range(5))
+def test_uma_letra_equivale_ao_ribossomo(semente):
+    """Cada gene tem exatamente os aminoácidos produzidos pelo ribossomo, em todos os quadros."""
+    dna = gerar_dna_aleatorio(1500 + semente) + gerar_dna_pseudoaleatorio(40) + gerar_dna_aleatorio(20 * semente)
+    rna = transcritor.transcrever(dna)
+    for codigo in CODIGOS_GENETICOS:
+        pilha = obter_ribossomo(codigo).transcrever_pilha(rna)
+        residuos, deslocamentos = traduzir_uma_letra(rna, codigo)
+        texto = ''.join(p.decode() + '\n' for p in separar_lote(residuos, deslocamentos))
+        assert texto == formatar_proteina_uma_letra(pilha)
+
+def test_uma_letra_sem_genes():
+    """Fitas curtas, sem início ou com gene incompleto não produzem resíduos."""
+    for rna in ("", "AU", "UUUCCC", "AUGUUU"):
+        residuos, deslocamentos = traduzir_uma_letra(rna)
+        assert residuos == b'' and list(deslocamentos) == [0]
@@ -0,0 +1,211 @@
+"""
+Testes diferenciais entre todos os motores de execução.
+
+Gera entradas aleatórias e adversariais (lixo, genes truncados, paradas em
+sequência, AUGs sobrepostos, genes muito longos) e exige que todos os motores de
+transcrição e de tradução produzam exatamente a saída do motor de referência
+(`transcrever` e `transcrever_pilha`). Os motores que leem em blocos recebem
+fronteiras de bloco aleatórias. No fim, testes de fumaça com entradas grandes
+conferem que cada motor termina dentro de um orçamento de tempo.
+
+Para incluir um motor novo na comparação, basta registrá-lo em
+`MOTORES_TRANSCRICAO` ou `MOTORES_TRADUCAO`.
+"""
+import random
+import time
+from typing import Callable, Iterator
+import pytest
+from src import (
+    ExecucaoPilha, Rastreador, TraducaoIncremental, EstatisticasTraducao, CODIGO_UMA_LETRA,
+    criar_transcritor_dna_rna, criar_ribossomo, formatar_proteina, separar_proteinas,
+    separar_lote, traduzir_direto, traduzir_codigos, traduzir_uma_letra, processar_em_pipeline,
+    gerar_dna_aleatorio
+)
+
+transcritor = criar_transcritor_dna_rna()
+ribossomo = criar_ribossomo()
+transcritor_minimo, _ = transcritor.minimizar()
+ribossomo_minimo, _ = ribossomo.minimizar()
+
+SEMENTES = range(40)
+PARA_DNA = str.maketrans("ACGU", "TGCA")            # Desfaz a transcrição (RNA -> fita molde)
+CODONS_SENTIDO = [a + b + c for a in "ACGU" for b in "ACGU" for c in "ACGU" if a + b + c not in ("UAA", "UAG", "UGA")]
+ORCAMENTO_SEGUNDOS = 20.0                           # Tempo máximo de cada motor nos testes de fumaça
+TAMANHO_FUMACA = 1_000_000                          # Bases dos testes de fumaça
+
+# --- Geração de entradas ---
+
+def fragmento(gerador: random.Random) -> str:
+    """Um pedaço de RNA escolhido entre casos comuns e adversariais."""
+    tipo = gerador.randrange(8)
+    if tipo == 0:       # lixo
+        return "".join(gerador.choices("ACGU", k=gerador.randint(0, 40)))
+    if tipo == 1:       # gene completo
+        return "AUG" + "".join(gerador.choices(CODONS_SENTIDO, k=gerador.randint(0, 15))) + gerador.choice(["UAA", "UAG", "UGA"])
+    if tipo == 2:       # gene truncado (sem parada, às vezes no meio de um códon)
+        return "AUG" + "".join(gerador.choices(CODONS_SENTIDO, k=gerador.randint(0, 10))) + "AU"[:gerador.randint(0, 2)]
+    if tipo == 3:       # paradas em sequência
+        return "AUG" + "".join(gerador.choices(["UAA", "UAG", "UGA"], k=gerador.randint(1, 5)))
+    if tipo == 4:       # AUGs sobrepostos e em quadros diferentes
+        return gerador.choice(["AUGAUG", "AAUGG", "AUGUGAUG", "AUAUGAUGA", "AUGG" * gerador.randint(1, 4)])
+    if tipo == 5:       # parada fora do quadro do gene
+        return "AUGA" + "UAA" + "CUAGG" + "UAG"
+    if tipo == 6:       # gene muito longo
+        return "AUG" + "".join(gerador.choices(CODONS_SENTIDO, k=gerador.randint(500, 3000))) + "UAA"
+    return ""           # vazio
+
+def gerar_rna(semente: int) -> str:
+    """Uma fita de RNA com alguns fragmentos aleatórios (às vezes vazia)."""
+    gerador = random.Random(semente)
+    return "".join(fragmento(gerador) for _ in range(gerador.randint(0, 25)))
+
+def cortes(tamanho: int, gerador: random.Random) -> Iterator[tuple[int, int]]:
+    """Fronteiras de bloco aleatórias, incluindo blocos de 1 base e blocos vazios."""
+    inicio = 0
+    while inicio < tamanho:
+        fim = min(tamanho, inicio + gerador.choice([0, 1, 2, 3, 4, 7, 64, 4096]))
+        yield inicio, fim
+        inicio = fim
+
+def para_uma_letra(proteinas: str) -> str:
+    """'Met-Phe Met' -> 'MF\\nM\\n'."""
+    return "".join("".join(CODIGO_UMA_LETRA[a] for a in proteina.split("-")) + "\n" for proteina in proteinas.split())
+
+# --- Motores de transcrição: DNA -> RNA ---
+
+def transcrever_em_blocos(dna: str, gerador: random.Random) -> str:
+    partes, estado = [], transcritor.estado_inicial
+    for inicio, fim in cortes(len(dna), gerador):
+        parte, estado = transcritor.transcrever_bloco(dna[inicio:fim], estado)
+        partes.append(parte)
+    return "".join(partes)
+
+def transcrever_em_lote(dna: str, gerador: random.Random) -> str:
+    saida, _ = transcritor.transcrever_lote([dna])
+    return saida
+
+MOTORES_TRANSCRICAO: dict[str, Callable[[str, random.Random], str]] = {
+    "blocos": transcrever_em_blocos,
+    "lote": transcrever_em_lote,
+    "minimizado": lambda dna, gerador: transcritor_minimo.transcrever(dna),
+}
+
+# --- Motores de tradução: RNA -> proteínas formatadas ---
+
+def traduzir_em_blocos(rna: str, gerador: random.Random) -> str:
+    execucao = ExecucaoPilha(ribossomo, marcador="Stop")
+    genes = []
+    for inicio, fim in cortes(len(rna), gerador):
+        execucao.consumir(rna, inicio, fim)
+        genes.extend(separar_proteinas(execucao.drenar()))
+    genes.extend(separar_proteinas(execucao.finalizar()))
+    return " ".join(genes)
+
+def traduzir_em_lote(rna: str, gerador: random.Random) -> str:
+    simbolos, deslocamentos = ribossomo.transcrever_pilha_lote(["AUG", rna, "UUU"])
+    return formatar_proteina(separar_lote(simbolos, deslocamentos)[1])
+
+def traduzir_incremental(rna: str, gerador: random.Random) -> str:
+    return TraducaoIncremental(ribossomo, intervalo=gerador.randint(1, 50)).traduzir(rna)
+
+MOTORES_TRADUCAO: dict[str, Callable[[str, random.Random], str]] = {
+    "blocos": traduzir_em_blocos,
+    "lote": traduzir_em_lote,
+    "rastreado": lambda rna, gerador: formatar_proteina(ribossomo.transcrever_pilha(rna, Rastreador(historico=3))),
+    "incremental": traduzir_incremental,
+    "minimizado": lambda rna, gerador: formatar_proteina(ribossomo_minimo.transcrever_pilha(rna)),
+    "limitada": lambda rna, gerador: formatar_proteina(ribossomo.transdutor_equivalente().transcrever_pilha(rna)),
+    "direto": lambda rna, gerador: " ".join(traduzir_direto(rna)),
+    "varios_codigos": lambda rna, gerador: " ".join(traduzir_codigos(rna, [2, 1, 11])[1]),
+}
+
+def referencia(rna: str) -> str:
+    return formatar_proteina(ribossomo.transcrever_pilha(rna))
+
+# --- Testes diferenciais ---
+
+@pytest.mark.parametrize("motor", MOTORES_TRANSCRICAO)
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_transcricao_diferencial(motor, semente):
+    dna = gerar_rna(semente).translate(PARA_DNA)
+    assert MOTORES_TRANSCRICAO[motor](dna, random.Random(semente)) == transcritor.transcrever(dna)
+
+@pytest.mark.parametrize("motor", MOTORES_TRADUCAO)
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_traducao_diferencial(motor, semente):
+    rna = gerar_rna(semente)
+    assert MOTORES_TRADUCAO[motor](rna, random.Random(semente)) == referencia(rna)
+
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_uma_letra_diferencial(semente):
+    rna = gerar_rna(semente)
+    residuos, deslocamentos = traduzir_uma_letra(rna)
+    assert "".join(p.decode() + "\n" for p in separar_lote(residuos, deslocamentos)) == para_uma_letra(referencia(rna))
+
+@pytest.mark.parametrize("semente", SEMENTES)
+def test_estatisticas_diferencial(semente):
+    rna, gerador = gerar_rna(semente), random.Random(semente)
+    estatisticas = EstatisticasTraducao()
+    for inicio, fim in cortes(len(rna), gerador):
+        estatisticas.consumir(rna[inicio:fim])
+    proteinas = referencia(rna).split()
+    resumo = estatisticas.resumo()
+    assert resumo["genes"] == len(proteinas)
+    assert sum(int(c) * n for c, n in resumo["comprimento_genes"]["histograma"].items()) == sum(len(p.split("-")) for p in proteinas)
+
+@pytest.mark.parametrize("semente", range(0, 40, 4))
+def test_pipeline_diferencial(semente, tmp_path):
+    rna, gerador = gerar_rna(semente), random.Random(semente)
+    dna = rna.translate(PARA_DNA)
+    blocos = [dna[inicio:fim] for inicio, fim in cortes(len(dna), gerador)]
+    processar_em_pipeline(blocos, tmp_path / "rna.txt", tmp_path / "proteina.txt", transcritor, ribossomo, capacidade_fila=2)
+    assert (tmp_path / "rna.txt").read_text() == rna
+    assert (tmp_path / "proteina.txt").read_text() == referencia(rna)
+
+@pytest.mark.parametrize("semente", range(10))
+def test_edicoes_incrementais_diferencial(semente):
+    """Edições aleatórias sobre a tradução incremental equivalem a retraduzir do zero."""
+    gerador = random.Random(semente)
+    rna = gerar_rna(semente)
+    traducao = TraducaoIncremental(ribossomo, intervalo=gerador.randint(1, 64))
+    traducao.traduzir(rna)
+    for _ in range(5):
+        inicio = gerador.randint(0, len(rna))
+        fim = gerador.randint(inicio, min(len(rna), inicio + 30))
+        trecho = fragmento(gerador)
+        rna = rna[:inicio] + trecho + rna[fim:]
+        traducao.editar(inicio, fim, trecho)
+        assert traducao.proteina == referencia(rna)
+
+# --- Testes de fumaça com entradas grandes ---
+
+@pytest.fixture(scope="module")
+def entrada_grande() -> tuple[str, str, str]:
+    """DNA e RNA grandes e a tradução de referência, calculados uma vez."""
+    dna = gerar_dna_aleatorio(TAMANHO_FUMACA)
+    rna = transcritor.transcrever(dna)
+    return dna, rna, referencia(rna)
+
+@pytest.mark.parametrize("motor", ["blocos", "incremental", "direto"])
+def test_fumaca_traducao(motor, entrada_grande):
+    _, rna, esperado = entrada_grande
+    inicio = time.perf_counter()
+    assert MOTORES_TRADUCAO[motor](rna, random.Random(0)) == esperado
+    assert time.perf_counter() - inicio < ORCAMENTO_SEGUNDOS
+
+def test_fumaca_pipeline(entrada_grande, tmp_path):
+    dna, rna, esperado = entrada_grande
+    inicio = time.perf_counter()
+    blocos = [dna[i:i + 65536] for i in range(0, len(dna), 65536)]
+    processar_em_pipeline(blocos, tmp_path / "rna.txt", tmp_path / "proteina.txt", transcritor, ribossomo)
+    assert time.perf_counter() - inicio < ORCAMENTO_SEGUNDOS
+    assert (tmp_path / "proteina.txt").read_text() == esperado
+
+def test_fumaca_gene_gigante():
+    """Um único gene de 300 mil códons não estoura a pilha nem o orçamento."""
+    rna = "AUG" + "GCU" * 300_000 + "UAA"
+    inicio = time.perf_counter()
+    assert traduzir_em_blocos(rna, random.Random(0)) == "Met" + "-Ala" * 300_000
+    residuos, _ = traduzir_uma_letra(rna)
+    assert len(residuos) == 300_001
+    assert time.perf_counter() - inicio < ORCAMENTO_SEGUNDOS
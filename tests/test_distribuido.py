@@ -0,0 +1,173 @@
+"""
+Testes da tradução distribuída (`src/distribuido.py`) com trabalhadores em localhost.
+
+Cobre genes que atravessam fronteiras de fragmento, trabalhadores que caem no
+meio da tradução, endereços sem trabalhador e a execução real pela linha de comando.
+"""
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+import pytest
+from src import (
+    TrabalhadorTraducao, CoordenadorTraducao, FalhaTrabalhador, traduzir_fragmento, interpretar_endereco,
+    criar_transcritor_dna_rna, criar_ribossomo, formatar_proteina, gerar_dna_aleatorio
+)
+from src.distribuido import TAMANHO_MAXIMO_MENSAGEM, enviar_mensagem, receber_mensagem
+
+RAIZ = Path(__file__).resolve().parent.parent
+ribossomo = criar_ribossomo()
+CODONS_SENTIDO = [a + b + c for a in "ACGU" for b in "ACGU" for c in "ACGU" if a + b + c not in ("UAA", "UAG", "UGA")]
+
+def referencia(rna: str) -> str:
+    return formatar_proteina(ribossomo.transcrever_pilha(rna))
+
+def gerar_rna(semente: int) -> str:
+    """Lixo, genes curtos e longos, AUGs sobrepostos e genes sem parada."""
+    gerador = random.Random(semente)
+    partes = []
+    for _ in range(gerador.randint(0, 30)):
+        tipo = gerador.randrange(4)
+        if tipo == 0:
+            partes.append("".join(gerador.choices("ACGU", k=gerador.randint(0, 30))))
+        elif tipo == 1:
+            partes.append("AUG" + "".join(gerador.choices(CODONS_SENTIDO, k=gerador.randint(0, 40))) + "UGA")
+        elif tipo == 2:
+            partes.append(gerador.choice(["AUGAUG", "AAUGG", "AUGUGAUG", "AUAUGAUGA"]))
+        else:
+            partes.append("AUG" + "".join(gerador.choices(CODONS_SENTIDO, k=gerador.randint(0, 10))))
+    return "".join(partes)
+
+class TrabalhadorInstavel(TrabalhadorTraducao):
+    """Trabalhador que derruba a conexão depois de atender `limite` pedidos."""
+
+    def __init__(self, endereco, limite):
+        super().__init__(endereco)
+        self.limite = limite
+
+    def finish_request(self, request, client_address):
+        if self.limite <= 0:
+            request.close()
+            return
+        self.limite -= 1
+        pedido = receber_mensagem(request)
+        enviar_mensagem(request, {"id": pedido["id"], "ok": True, "genes": traduzir_fragmento(pedido["rna"], pedido["codigo"])})
+        # Encerra sem atender o resto do lote: o coordenador deve redistribuí-lo.
+
+def iniciar(trabalhador):
+    threading.Thread(target=trabalhador.serve_forever, daemon=True).start()
+    return trabalhador
+
+@pytest.fixture(scope="module")
+def trabalhadores():
+    servidores = [iniciar(TrabalhadorTraducao(("127.0.0.1", 0))) for _ in range(3)]
+    yield [servidor.endereco for servidor in servidores]
+    for servidor in servidores:
+        servidor.shutdown()
+        servidor.server_close()
+
+def porta_livre() -> int:
+    with socket.socket() as provisorio:
+        provisorio.bind(("127.0.0.1", 0))
+        return provisorio.getsockname()[1]
+
+def test_traduzir_fragmento():
+    assert traduzir_fragmento("CCAUGUUUUAAAUGCC") == [(2, 11, "Met-Phe")]
+
+@pytest.mark.parametrize("semente", range(30))
+def test_diferencial_com_fronteiras(trabalhadores, semente):
+    """Fragmentos minúsculos forçam genes atravessando fronteiras e cadeias fora de sincronia."""
+    rna = gerar_rna(semente)
+    coordenador = CoordenadorTraducao(trabalhadores, tamanho_fragmento=random.Random(semente).choice([1, 2, 5, 17, 64]))
+    assert " ".join(coordenador.traduzir(rna)) == referencia(rna)
+
+def test_entrada_grande(trabalhadores):
+    rna = criar_transcritor_dna_rna().transcrever(gerar_dna_aleatorio(300_000))
+    coordenador = CoordenadorTraducao(trabalhadores, tamanho_fragmento=10_000)
+    assert " ".join(coordenador.traduzir(rna)) == referencia(rna)
+    assert coordenador.fragmentos_reenviados == 0
+
+def test_trabalhador_que_cai_tem_fragmentos_reenviados(trabalhadores):
+    instavel = iniciar(TrabalhadorInstavel(("127.0.0.1", 0), limite=1))
+    try:
+        rna = gerar_rna(7) * 20
+        coordenador = CoordenadorTraducao([instavel.endereco, *trabalhadores], tamanho_fragmento=50)
+        assert " ".join(coordenador.traduzir(rna)) == referencia(rna)
+        assert coordenador.fragmentos_reenviados > 0
+    finally:
+        instavel.shutdown()
+        instavel.server_close()
+
+def test_endereco_sem_trabalhador(trabalhadores):
+    rna = gerar_rna(3)
+    coordenador = CoordenadorTraducao([("127.0.0.1", porta_livre()), trabalhadores[0]], tamanho_fragmento=20, tempo_limite=2)
+    assert " ".join(coordenador.traduzir(rna)) == referencia(rna)
+
+def test_todos_os_trabalhadores_falham():
+    coordenador = CoordenadorTraducao([("127.0.0.1", porta_livre())], tamanho_fragmento=20, tempo_limite=2)
+    with pytest.raises(FalhaTrabalhador):
+        coordenador.traduzir("AUGUUUUAA")
+
+def test_fragmento_invalido_nao_e_reenviado(trabalhadores):
+    with pytest.raises(ValueError):
+        CoordenadorTraducao(trabalhadores, tamanho_fragmento=4).traduzir("AUGUUUXUAA")
+
+@pytest.mark.parametrize("corpo", [b"[1, 2]", b"\"AUG\"", b"{nao e json", b"\xff"])
+def test_pedido_que_nao_e_objeto_recebe_erro(trabalhadores, corpo):
+    """O trabalhador responde com `ok: False` e continua atendendo a mesma conexão."""
+    with socket.create_connection(trabalhadores[0], timeout=5) as conexao:
+        conexao.sendall(len(corpo).to_bytes(4, 'big') + corpo)
+        assert receber_mensagem(conexao)["ok"] is False
+        enviar_mensagem(conexao, {"id": 1, "rna": "AUGUUUUAA"})
+        assert receber_mensagem(conexao) == {"id": 1, "ok": True, "genes": [[0, 9, "Met-Phe"]]}
+
+def test_mensagem_grande_demais_encerra_a_conexao(trabalhadores):
+    """Um prefixo acima do máximo é recusado antes de qualquer alocação para o corpo."""
+    with socket.create_connection(trabalhadores[0], timeout=5) as conexao:
+        conexao.sendall((TAMANHO_MAXIMO_MENSAGEM + 1).to_bytes(4, 'big'))
+        assert conexao.recv(1) == b""
+    with pytest.raises(ValueError):
+        CoordenadorTraducao(trabalhadores, tamanho_fragmento=TAMANHO_MAXIMO_MENSAGEM)
+
+@pytest.mark.parametrize("texto, esperado", [("host:7070", ("host", 7070)), ("7070", ("127.0.0.1", 7070)), ("::1:80", ("::1", 80))])
+def test_interpretar_endereco(texto, esperado):
+    assert interpretar_endereco(texto) == esperado
+
+@pytest.mark.parametrize("texto", ["host:", "host:porta", "host:70000"])
+def test_interpretar_endereco_invalido(texto):
+    with pytest.raises(ValueError):
+        interpretar_endereco(texto)
+
+def test_linha_de_comando(tmp_path):
+    """Dois processos `--trabalhador` e um `--distribuir` produzem a saída do ribossomo."""
+    portas = [porta_livre() for _ in range(2)]
+    processos = [
+        subprocess.Popen([sys.executable, str(RAIZ / "main.py"), "--trabalhador", f"127.0.0.1:{porta}"], cwd=tmp_path,
+                         stderr=subprocess.DEVNULL)
+        for porta in portas
+    ]
+    try:
+        for porta in portas:
+            for _ in range(100):
+                try:
+                    socket.create_connection(("127.0.0.1", porta), timeout=1).close()
+                    break
+                except OSError:
+                    time.sleep(0.05)
+        (tmp_path / "data" / "input").mkdir(parents=True, exist_ok=True)
+        dna = gerar_dna_aleatorio(20_000)
+        (tmp_path / "data" / "input" / "genoma.txt").write_text(dna)
+        subprocess.run(
+            [sys.executable, str(RAIZ / "main.py"), "-l", "genoma.txt", "--tamanho-bloco", "1000",
+             "--distribuir", *(f"127.0.0.1:{porta}" for porta in portas)],
+            cwd=tmp_path, check=True, capture_output=True
+        )
+        rna = criar_transcritor_dna_rna().transcrever(dna)
+        assert (tmp_path / "data" / "output" / "genoma_proteina.txt").read_text() == referencia(rna)
+    finally:
+        for processo in processos:
+            processo.terminate()
+            processo.wait()
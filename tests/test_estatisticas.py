@@ -0,0 +1,78 @@
+"""
+Testes para o modo só-estatísticas.
+
+Compara as contagens acumuladas em blocos com as obtidas a partir da saída
+do ribossomo, para vários tamanhos de bloco e códigos genéticos.
+"""
+import random
+from collections import Counter
+import pytest
+from src import (
+    EstatisticasTraducao, calcular_estatisticas, obter_ribossomo, separar_proteinas, compilar_tabela,
+    criar_transcritor_dna_rna, gerar_dna_aleatorio, gerar_dna_pseudoaleatorio
+)
+
+transcritor = criar_transcritor_dna_rna()
+
+def codons_dos_genes(rna: str, codigo: int) -> list[list[str]]:
+    """Referência simples: os códons de cada gene completo, do AUG à parada."""
+    tabela = compilar_tabela(codigo)
+    genes, posicao = [], 0
+    while (inicio := rna.find('AUG', posicao)) >= 0:
+        gene, posicao = [], inicio
+        while posicao + 3 <= len(rna):
+            codon = rna[posicao:posicao + 3]
+            gene.append(codon)
+            posicao += 3
+            if tabela[codon] is None:
+                genes.append(gene)
+                break
+        else:
+            break
+    return genes
+
+def em_blocos(cadeia: str, gerador: random.Random):
+    """Divide a cadeia em blocos de tamanhos aleatórios (inclusive 1 e 2 bases)."""
+    posicao = 0
+    while posicao < len(cadeia):
+        tamanho = gerador.choice([1, 2, 3, 5, 64, 1000])
+        yield cadeia[posicao:posicao + tamanho]
+        posicao += tamanho
+
+@pytest.mark.parametrize("semente", range(6))
+def test_estatisticas_equivalem_a_referencia(semente):
+    """Genes, comprimentos, uso de códons e composição batem com a tradução completa."""
+    gerador = random.Random(semente)
+    codigo = gerador.choice([1, 2, 6, 22])
+    dna = gerar_dna_aleatorio(gerador.randint(0, 4000)) + gerar_dna_pseudoaleatorio(50) + gerar_dna_aleatorio(gerador.randint(0, 50))
+    rna = transcritor.transcrever(dna)
+    resumo = calcular_estatisticas(em_blocos(dna, gerador), transcritor, codigo)
+
+    genes = codons_dos_genes(rna, codigo)
+    proteinas = separar_proteinas(obter_ribossomo(codigo).transcrever_pilha(rna))
+    assert resumo["genes"] == len(genes) == len(proteinas)
+    assert resumo["comprimento_genes"]["histograma"] == {
+        str(comprimento): quantidade for comprimento, quantidade in sorted(Counter(len(p.split('-')) for p in proteinas).items())
+    }
+    uso = Counter(codon for gene in genes for codon in gene)
+    assert {codon: n for codon, n in resumo["uso_codons"].items() if n} == dict(uso)
+    assert resumo["composicao_aminoacidos"] == dict(sorted(Counter(a for p in proteinas for a in p.split('-')).items()))
+    assert resumo["bases"] == len(dna)
+    assert resumo["conteudo_gc"] == pytest.approx((dna.count('G') + dna.count('C')) / len(dna))
+
+def test_gene_aberto_e_descartado():
+    """Um gene sem parada no fim da fita não entra nas estatísticas."""
+    estatisticas = EstatisticasTraducao()
+    for bloco in ("AUGUU", "UUAAAU", "GCCC"):
+        estatisticas.consumir(bloco)
+    resumo = estatisticas.resumo()
+    assert resumo["genes"] == 1
+    assert resumo["comprimento_genes"]["histograma"] == {"2": 1}
+    assert resumo["uso_codons"]["UAA"] == 1 and resumo["uso_codons"]["GCC"] == 0
+
+def test_entrada_vazia_e_invalida():
+    """Sem bases o resumo é zerado; símbolos fora de Σ são rejeitados."""
+    resumo = calcular_estatisticas([], transcritor)
+    assert resumo["genes"] == 0 and resumo["conteudo_gc"] == 0.0
+    with pytest.raises(ValueError):
+        EstatisticasTraducao().consumir("AUGT")
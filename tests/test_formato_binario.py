@@ -0,0 +1,59 @@
+"""
+Testes para o formato binário compacto de proteínas.
+
+Verifica a ida e volta pelo arquivo, o tamanho (um byte por resíduo mais a
+tabela de genes) e a rejeição de arquivos corrompidos.
+"""
+import struct
+import pytest
+from src import (
+    escrever_proteinas_binario, ler_proteinas_binario, traduzir_uma_letra, separar_lote,
+    criar_transcritor_dna_rna, gerar_dna_pseudoaleatorio
+)
+
+def test_ida_e_volta(tmp_path):
+    """O arquivo devolve os mesmos resíduos e deslocamentos."""
+    rna = criar_transcritor_dna_rna().transcrever(gerar_dna_pseudoaleatorio(500))
+    residuos, deslocamentos = traduzir_uma_letra(rna)
+    caminho = tmp_path / "proteina.bin"
+    escrever_proteinas_binario(caminho, residuos, deslocamentos)
+
+    lidos, tabela = ler_proteinas_binario(caminho)
+    assert lidos == residuos
+    assert list(tabela) == list(deslocamentos)
+    assert caminho.stat().st_size == 16 + 8 * len(deslocamentos) + len(residuos)
+
+def test_sem_genes(tmp_path):
+    """Um arquivo sem genes tem só o cabeçalho e o deslocamento inicial."""
+    caminho = tmp_path / "vazio.bin"
+    escrever_proteinas_binario(caminho, b'', [0])
+    residuos, tabela = ler_proteinas_binario(caminho)
+    assert residuos == b'' and list(tabela) == [0]
+
+def test_deslocamentos_inconsistentes(tmp_path):
+    """Os deslocamentos precisam cobrir exatamente os resíduos."""
+    with pytest.raises(ValueError):
+        escrever_proteinas_binario(tmp_path / "x.bin", b'MF', [0, 1])
+
+@pytest.mark.parametrize("corte", [3, 17, -1])
+def test_arquivo_corrompido(tmp_path, corte):
+    """Assinatura errada ou arquivo truncado são rejeitados."""
+    caminho = tmp_path / "proteina.bin"
+    escrever_proteinas_binario(caminho, b'MFMK', [0, 2, 4])
+    conteudo = caminho.read_bytes()
+    caminho.write_bytes(conteudo[:corte])
+    with pytest.raises(ValueError):
+        ler_proteinas_binario(caminho)
+    caminho.write_bytes(b'XXXX' + conteudo[4:])
+    with pytest.raises(ValueError):
+        ler_proteinas_binario(caminho)
+
+@pytest.mark.parametrize("genes", [3, 2**62, 2**64 - 1])
+def test_numero_de_genes_maior_que_o_arquivo(tmp_path, genes):
+    """Um cabeçalho que promete mais genes do que cabem no arquivo é rejeitado antes de alocar a tabela."""
+    caminho = tmp_path / "proteina.bin"
+    escrever_proteinas_binario(caminho, b'MFMK', [0, 2, 4])
+    conteudo = caminho.read_bytes()
+    caminho.write_bytes(conteudo[:8] + struct.pack('<Q', genes) + conteudo[16:])
+    with pytest.raises(ValueError):
+        ler_proteinas_binario(caminho)
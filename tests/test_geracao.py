@@ -0,0 +1,116 @@
+"""
+Testes da geração de código a partir dos autômatos (`src/automata/geracao.py`).
+
+Cada módulo gerado é comparado ao interpretador do autômato correspondente:
+mesmas saídas, mesmos estados e as mesmas mensagens de erro.
+"""
+import random
+import pytest
+from src import Automato_Pilha, TransdutorFinito, compilar_automato, criar_ribossomo, criar_transcritor_dna_rna, gerar_dna_aleatorio
+from src.automata import geracao
+
+transcritor = criar_transcritor_dna_rna()
+ribossomo = criar_ribossomo()
+
+def criar_alternador() -> TransdutorFinito:
+    """Escreve as posições pares em maiúsculas e as ímpares em minúsculas."""
+    bases = "ACGU"
+    δ = {(estado, base): ('impar' if estado == 'par' else 'par') for estado in ('par', 'impar') for base in bases}
+    λ = {(estado, base): (base if estado == 'par' else base.lower()) for estado in ('par', 'impar') for base in bases}
+    return TransdutorFinito({'par', 'impar'}, set(bases), set(bases + bases.lower()), δ, λ, 'par')
+
+def capturar(funcao, *args):
+    """O resultado da chamada, ou o tipo e a mensagem da exceção levantada."""
+    try:
+        return funcao(*args)
+    except (ValueError, RuntimeError) as erro:
+        return type(erro), str(erro)
+
+@pytest.mark.parametrize("fabrica", [criar_transcritor_dna_rna, criar_alternador])
+def test_transdutor_gerado_equivale_ao_interpretador(fabrica):
+    transdutor = fabrica()
+    modulo = compilar_automato(transdutor)
+    entrada = gerar_dna_aleatorio(5_000).replace('T', 'U') if fabrica is criar_alternador else gerar_dna_aleatorio(5_000)
+    assert modulo.transcrever(entrada) == transdutor.transcrever(entrada)
+    for estado in transdutor.estados:
+        assert modulo.transcrever_bloco(entrada[:7], estado) == transdutor.transcrever_bloco(entrada[:7], estado)
+
+@pytest.mark.parametrize("entrada", ["ACGX", "AC GT", "ACGU"])
+def test_transdutor_gerado_erros(entrada):
+    modulo = compilar_automato(transcritor)
+    assert capturar(modulo.transcrever, entrada) == capturar(transcritor.transcrever, entrada)
+
+def test_transdutor_gerado_estado_desconhecido():
+    modulo = compilar_automato(criar_alternador())
+    assert capturar(modulo.transcrever_bloco, "A", 'x') == capturar(criar_alternador().transcrever_bloco, "A", 'x')
+    assert modulo.transcrever_bloco("", 'x') == ("", 'x')
+
+@pytest.mark.parametrize("semente", range(4))
+def test_ribossomo_gerado_equivale_ao_interpretador(semente):
+    aleatorio = random.Random(semente)
+    modulo = compilar_automato(ribossomo)
+    for _ in range(200):
+        # Fitas ricas em 'AUG' exercitam a tradução; as pobres, os saltos sobre a busca.
+        bases = aleatorio.choice(["ACGU", "CGU", "AAUG", "AUGGCU"])
+        cadeia = "".join(aleatorio.choice(bases) for _ in range(aleatorio.randrange(120)))
+        assert modulo.transcrever_pilha(cadeia) == ribossomo.transcrever_pilha(cadeia)
+        assert modulo.validar(cadeia) == ribossomo.validar(cadeia)
+
+def test_ribossomo_gerado_em_blocos():
+    rna = transcritor.transcrever(gerar_dna_aleatorio(20_000))
+    modulo = compilar_automato(ribossomo)
+    pilha, estado = ['Z0'], 'q_inicial'
+    for inicio in range(0, len(rna), 997):
+        estado = modulo.consumir(rna, estado, pilha, inicio, min(inicio + 997, len(rna)))
+    modulo.finalizar(estado, pilha)
+    assert pilha == ribossomo.transcrever_pilha(rna)
+
+@pytest.mark.parametrize("cadeia", ["", "()", "(()())", "(()", "())", "(a)", ")("])
+def test_pilha_gerada_validar_e_erros(cadeia, parenteses):
+    modulo = compilar_automato(parenteses)
+    assert modulo.validar(cadeia) == parenteses.validar(cadeia)
+    assert capturar(modulo.transcrever_pilha, cadeia) == capturar(parenteses.transcrever_pilha, cadeia)
+
+def test_cache_em_disco(tmp_path, monkeypatch):
+    monkeypatch.setattr(geracao, "_modulos", {})
+    modulo = compilar_automato(ribossomo, tmp_path)
+    arquivos = list(tmp_path.glob("pilha_*.py"))
+    assert len(arquivos) == 1
+    assert compilar_automato(criar_ribossomo(), tmp_path) is modulo
+
+    # Em outro processo (sem o cache em memória), um arquivo adulterado não é executado, e sim refeito.
+    original = arquivos[0].read_text(encoding='utf-8')
+    arquivos[0].write_text("raise SystemExit('injetado')\n", encoding='utf-8')
+    monkeypatch.setattr(geracao, "_modulos", {})
+    reaberto = compilar_automato(ribossomo, tmp_path)
+    assert reaberto is not modulo
+    assert arquivos[0].read_text(encoding='utf-8') == original
+    rna = transcritor.transcrever(gerar_dna_aleatorio(2_000))
+    assert reaberto.transcrever_pilha(rna) == ribossomo.transcrever_pilha(rna)
+
+@pytest.mark.parametrize("nome", ['b\nraise SystemExit("injetado")', "b'\"#", "b\n    raise SystemExit(1)"])
+def test_nomes_de_estado_nao_viram_codigo(nome):
+    """Os nomes dos estados só aparecem no código gerado como literais (repr)."""
+    bases = "ACGU"
+    δ = {(estado, base): (nome if estado == 'a' else 'a') for estado in ('a', nome) for base in bases}
+    λ = {(estado, base): base for estado in ('a', nome) for base in bases}
+    transdutor = TransdutorFinito({'a', nome}, set(bases), set(bases), δ, λ, 'a')
+    modulo = compilar_automato(transdutor)
+    assert modulo.transcrever_bloco("ACG", 'a') == transdutor.transcrever_bloco("ACG", 'a')
+
+    δ = {('q', base, 'Z0'): (nome, ['Z0']) for base in bases}
+    δ.update({(nome, base, 'Z0'): ('q', ['Z0']) for base in bases})
+    automato = Automato_Pilha({'q', nome}, set(bases) | {None}, {'Z0'}, δ, 'q', 'Z0', {'q'})
+    modulo = compilar_automato(automato)
+    for cadeia in ("ACGU", "ACGUA"):
+        assert capturar(modulo.transcrever_pilha, cadeia) == capturar(automato.transcrever_pilha, cadeia)
+
+def test_definicoes_diferentes_geram_modulos_diferentes(tmp_path, monkeypatch):
+    monkeypatch.setattr(geracao, "_modulos", {})
+    compilar_automato(transcritor, tmp_path)
+    compilar_automato(criar_alternador(), tmp_path)
+    assert len(list(tmp_path.glob("transdutor_*.py"))) == 2
+
+def test_tipo_sem_gerador():
+    with pytest.raises(TypeError):
+        compilar_automato("ACGU")
@@ -0,0 +1,106 @@
+"""
+Testes para a retradução incremental após edições na fita de RNA.
+
+Compara o resultado incremental com a tradução completa da fita editada
+e verifica que o trabalho refeito é limitado à vizinhança da edição.
+"""
+import random
+import pytest
+from src import (
+    criar_ribossomo, criar_transcritor_dna_rna, formatar_proteina,
+    gerar_dna_aleatorio, gerar_dna_pseudoaleatorio, TraducaoIncremental, calcular_diferenca
+)
+
+ribossomo = criar_ribossomo()
+transcritor = criar_transcritor_dna_rna()
+
+def traducao_completa(rna: str) -> str:
+    """Tradução de referência, sem reaproveitamento."""
+    return formatar_proteina(ribossomo.transcrever_pilha(rna))
+
+@pytest.mark.parametrize("intervalo", [1, 7, 64, 4096])
+def test_edicoes_aleatorias_equivalem_a_traducao_completa(intervalo):
+    """Substituições, inserções e remoções aleatórias produzem a mesma proteína que a tradução completa."""
+    gerador = random.Random(intervalo)
+    rna = transcritor.transcrever(gerar_dna_aleatorio(2000) + gerar_dna_pseudoaleatorio(100))
+    traducao = TraducaoIncremental(ribossomo, intervalo)
+    assert traducao.traduzir(rna) == traducao_completa(rna)
+
+    for _ in range(30):
+        inicio = gerador.randint(0, len(traducao.rna))
+        fim = min(len(traducao.rna), inicio + gerador.randint(0, 12))
+        trecho = "".join(gerador.choices("ACGU", k=gerador.randint(0, 12)))
+        traducao.editar(inicio, fim, trecho)
+        assert traducao.proteina == traducao_completa(traducao.rna)
+
+def test_atualizar_localiza_a_diferenca():
+    """`atualizar` recebe a fita nova inteira e retraduz só a vizinhança da edição."""
+    rna = transcritor.transcrever(gerar_dna_aleatorio(100000))
+    traducao = TraducaoIncremental(ribossomo, intervalo=256)
+    traducao.traduzir(rna)
+
+    nova = rna[:50000] + "AUGUUUUAA" + rna[50003:]
+    assert calcular_diferenca(rna, nova)[0] >= 50000
+    assert traducao.atualizar(nova) == traducao_completa(nova)
+    assert traducao.simbolos_reprocessados < 10000
+
+def test_aplicar_varias_edicoes():
+    """Edições dadas em coordenadas da fita original são aplicadas corretamente."""
+    rna = transcritor.transcrever(gerar_dna_aleatorio(5000))
+    traducao = TraducaoIncremental(ribossomo, intervalo=100)
+    traducao.traduzir(rna)
+    edicoes = [(10, 12, "AUG"), (2000, 2000, "UAA"), (4000, 4100, "")]
+    esperado = rna[:10] + "AUG" + rna[12:2000] + "UAA" + rna[2000:4000] + rna[4100:]
+    traducao.aplicar_edicoes(edicoes)
+    assert traducao.proteina == traducao_completa(esperado)
+    assert traducao.rna == esperado
+
+def test_salvar_e_carregar(tmp_path):
+    """O estado salvo em disco permite continuar editando em outra execução."""
+    rna = transcritor.transcrever(gerar_dna_aleatorio(3000) + gerar_dna_pseudoaleatorio(30))
+    traducao = TraducaoIncremental(ribossomo, intervalo=50)
+    proteina = traducao.traduzir(rna)
+    traducao.salvar(tmp_path / "estado.json")
+
+    restaurada = TraducaoIncremental.carregar(tmp_path / "estado.json", ribossomo, rna, proteina)
+    restaurada.editar(1500, 1501, "G")
+    assert restaurada.proteina == traducao_completa(rna[:1500] + "G" + rna[1501:])
+
+    with pytest.raises(ValueError):
+        TraducaoIncremental.carregar(tmp_path / "estado.json", ribossomo, rna + "A", proteina)
+
+def test_edicao_fora_da_fita():
+    """Índices fora da fita são rejeitados."""
+    traducao = TraducaoIncremental(ribossomo)
+    traducao.traduzir("AUGUAA")
+    with pytest.raises(ValueError):
+        traducao.editar(3, 10, "")
+
+def test_edicao_troca_apenas_os_segmentos_refeitos():
+    """Uma edição não remonta a fita nem reescreve os segmentos após a convergência."""
+    rna = transcritor.transcrever(gerar_dna_aleatorio(200000))
+    traducao = TraducaoIncremental(ribossomo, intervalo=256)
+    traducao.traduzir(rna)
+    antes = list(traducao._segmentos)
+
+    traducao.editar(100000, 100001, "GA")
+    assert traducao._rna is None and traducao._proteina is None
+    preservados = sum(novo is velho for novo, velho in zip(traducao._segmentos[-len(antes) // 2:], antes[-len(antes) // 2:]))
+    assert preservados >= len(antes) // 2 - 5
+    assert traducao.proteina == traducao_completa(rna[:100000] + "GA" + rna[100001:])
+
+def test_edicoes_grandes_redividem_os_segmentos():
+    """Inserções e remoções maiores que o intervalo mudam o número de segmentos sem perder a equivalência."""
+    gerador = random.Random(7)
+    rna = transcritor.transcrever(gerar_dna_aleatorio(5000))
+    traducao = TraducaoIncremental(ribossomo, intervalo=50)
+    traducao.traduzir(rna)
+    for _ in range(20):
+        inicio = gerador.randint(0, len(rna))
+        fim = min(len(rna), inicio + gerador.randint(0, 400))
+        trecho = "".join(gerador.choices("ACGU", k=gerador.randint(0, 400)))
+        rna = rna[:inicio] + trecho + rna[fim:]
+        traducao.editar(inicio, fim, trecho)
+        assert traducao.rna == rna
+        assert traducao.proteina == traducao_completa(rna)
+        assert [ponto.posicao for ponto in traducao.pontos] == sorted({ponto.posicao for ponto in traducao.pontos})
@@ -0,0 +1,79 @@
+"""
+Testes da memorização por blocos do Autômato de Pilha (`src/automata/memorizacao.py`).
+
+Cada execução memorizada é comparada a `Automato_Pilha.transcrever_pilha`.
+"""
+import random
+import pytest
+from src import ExecucaoPilha, MemoriaBlocos, criar_ribossomo, criar_transcritor_dna_rna, gerar_dna_aleatorio
+
+transcritor = criar_transcritor_dna_rna()
+ribossomo = criar_ribossomo()
+
+def repeticao_em_tandem(semente: int, copias: int) -> str:
+    """Um gene curto seguido de bases aleatórias, repetido em tandem."""
+    aleatorio = random.Random(semente)
+    unidade = "AUG" + "".join(aleatorio.choice(["GCU", "CCA", "UUC"]) for _ in range(8)) + "UAA"
+    unidade += "".join(aleatorio.choice("ACGU") for _ in range(aleatorio.randrange(1, 20)))
+    return unidade * copias
+
+@pytest.mark.parametrize("tamanho_bloco", [1, 7, 64, 1024])
+def test_memorizada_equivale_ao_original(tamanho_bloco):
+    aleatorio = random.Random(tamanho_bloco)
+    for _ in range(100):
+        bases = aleatorio.choice(["ACGU", "AAUG", "AUGGCU"])
+        cadeia = "".join(aleatorio.choice(bases) for _ in range(aleatorio.randrange(300)))
+        memoria = MemoriaBlocos(ribossomo, tamanho_bloco=tamanho_bloco, capacidade=16)
+        assert memoria.transcrever_pilha(cadeia) == ribossomo.transcrever_pilha(cadeia)
+    rna = transcritor.transcrever(gerar_dna_aleatorio(20_000))
+    assert MemoriaBlocos(ribossomo, tamanho_bloco).transcrever_pilha(rna) == ribossomo.transcrever_pilha(rna)
+
+@pytest.mark.parametrize("semente", range(3))
+def test_repeticao_em_tandem_acerta_o_cache(semente):
+    """Inclui uma cópia final cortada: o gene aberto é descartado pelo rollback."""
+    rna = repeticao_em_tandem(semente, 1000)
+    rna += rna[:50]
+    memoria = MemoriaBlocos(ribossomo, tamanho_bloco=64)
+    assert memoria.transcrever_pilha(rna) == ribossomo.transcrever_pilha(rna)
+    assert memoria.taxa_acertos > 0.5
+    assert memoria.acertos + memoria.falhas == len(rna) // 64
+    assert "acerto(s)" in memoria.resumo()
+
+def test_capacidade_limita_o_cache():
+    rna = transcritor.transcrever(gerar_dna_aleatorio(10_000))
+    memoria = MemoriaBlocos(ribossomo, tamanho_bloco=100, capacidade=5)
+    assert memoria.transcrever_pilha(rna) == ribossomo.transcrever_pilha(rna)
+    assert len(memoria._cache) == 5
+    assert memoria.descartes == memoria.falhas - 5
+
+def test_bloco_repetido_nao_e_executado_de_novo(monkeypatch):
+    memoria = MemoriaBlocos(ribossomo, tamanho_bloco=30)
+    rna = ("AUG" + "GCU" * 9) * 20
+    esperado = ribossomo.transcrever_pilha(rna)
+    chamadas = []
+    original = ribossomo._consumir
+    monkeypatch.setattr(ribossomo, "_consumir", lambda *args: chamadas.append(args[0]) or original(*args))
+    assert memoria.transcrever_pilha(rna) == esperado
+    # Períodos de 30 e 60 bases: só os dois primeiros blocos (e a sobra vazia) são executados.
+    assert len(chamadas) == 3 and memoria.acertos == 18
+
+def test_execucao_em_blocos_com_memoria():
+    rna = repeticao_em_tandem(7, 200)
+    memoria = MemoriaBlocos(ribossomo, tamanho_bloco=128)
+    execucao = ExecucaoPilha(ribossomo, marcador='Stop', memoria=memoria)
+    simbolos = []
+    for inicio in range(0, len(rna), 999):
+        execucao.consumir(rna[inicio:inicio + 999])
+        simbolos.extend(execucao.drenar())
+    simbolos.extend(execucao.finalizar())
+    assert simbolos == ribossomo.transcrever_pilha(rna)
+    # Os blocos seguem alinhados à entrada inteira, apesar dos cortes a cada 999 símbolos.
+    assert memoria.taxa_acertos > 0.5
+
+def test_erros(parenteses):
+    with pytest.raises(ValueError):
+        MemoriaBlocos(ribossomo).transcrever_pilha("AUGX" * 500)
+    with pytest.raises(ValueError):
+        MemoriaBlocos(ribossomo, tamanho_bloco=0)
+    with pytest.raises(ValueError):
+        MemoriaBlocos(parenteses)
@@ -0,0 +1,94 @@
+"""
+Testes para a minimização do Transdutor Finito e a redução do Autômato de Pilha.
+
+Cada máquina é inflada com estados inalcançáveis, estados equivalentes e
+transições mortas; a versão reduzida deve produzir exatamente as mesmas saídas
+e o relatório deve contar o que foi removido.
+"""
+import random
+import pytest
+from src import (
+    TransdutorFinito, Automato_Pilha, criar_transcritor_dna_rna, criar_ribossomo,
+    gerar_dna_aleatorio, gerar_dna_pseudoaleatorio
+)
+
+COMPLEMENTO = {'A': 'U', 'C': 'G', 'G': 'C', 'T': 'A'}
+
+def transcritor_inflado() -> TransdutorFinito:
+    """Transcritor DNA -> RNA com três estados equivalentes em ciclo e um inalcançável."""
+    Q = {'q0', 'q1', 'q2', 'morto'}
+    ciclo = {'q0': 'q1', 'q1': 'q2', 'q2': 'q0', 'morto': 'q0'}
+    δ = {(q, b): ciclo[q] for q in Q for b in COMPLEMENTO}
+    λ = {(q, b): COMPLEMENTO[b] for q in Q for b in COMPLEMENTO}
+    return TransdutorFinito(Q, set(COMPLEMENTO), set(COMPLEMENTO.values()), δ, λ, 'q0')
+
+def transdutor_paridade() -> TransdutorFinito:
+    """Transdutor que já é mínimo: troca a saída conforme a paridade da posição."""
+    δ = {('par', 'a'): 'impar', ('impar', 'a'): 'par'}
+    λ = {('par', 'a'): '0', ('impar', 'a'): '1'}
+    return TransdutorFinito({'par', 'impar'}, {'a'}, {'0', '1'}, δ, λ, 'par')
+
+def ribossomo_inflado() -> Automato_Pilha:
+    """Ribossomo com uma cópia equivalente de 'q_inicial', um estado inalcançável e uma transição morta."""
+    base = criar_ribossomo()
+    δ = dict(base.transicoes)
+    # Cópia de q_inicial, para a qual passam a apontar as transições de parada.
+    for (origem, entrada, topo), (destino, simbolos) in base.transicoes.items():
+        if origem == 'q_inicial':
+            δ[('q_inicial_copia', entrada, topo)] = (destino, simbolos)
+        if destino == 'q_inicial' and 'Stop' in simbolos:
+            δ[(origem, entrada, topo)] = ('q_inicial_copia', simbolos)
+    # Estado sem nenhuma transição de entrada.
+    δ[('q_orfao', 'A', 'Z0')] = ('q_inicial', ['Z0'])
+    # Na busca, o topo é sempre Z0: esta transição nunca dispara.
+    δ[('q_achouA', 'C', 'Met')] = ('q_final', [])
+    Q = base.estados | {'q_inicial_copia', 'q_orfao'}
+    return Automato_Pilha(Q, base.alfabeto_entrada, base.alfabeto_pilha, δ,
+                          base.estado_inicial, base.estado_inicial_pilha, base.estados_finais)
+
+def test_transdutor_inflado_e_minimizado():
+    """Os três estados do ciclo viram um só e o inalcançável é removido."""
+    inflado = transcritor_inflado()
+    minimo, relatorio = inflado.minimizar()
+    assert minimo.estados == {'q0'}
+    assert relatorio == {"estados_inalcancaveis": 1, "estados_equivalentes": 2,
+                         "estados_removidos": 3, "transicoes_removidas": 12}
+    for _ in range(20):
+        dna = gerar_dna_aleatorio(random.randint(0, 200))
+        assert minimo.transcrever(dna) == inflado.transcrever(dna) == criar_transcritor_dna_rna().transcrever(dna)
+
+def test_transdutor_minimo_nao_muda():
+    """Estados que produzem saídas diferentes não são fundidos."""
+    minimo, relatorio = transdutor_paridade().minimizar()
+    assert minimo.estados == {'par', 'impar'}
+    assert relatorio["estados_removidos"] == 0
+    assert minimo.transcrever("aaaaa") == "01010"
+
+def test_ribossomo_inflado_e_reduzido():
+    """A redução desfaz o inchaço e conta estados e transições removidos."""
+    inflado = ribossomo_inflado()
+    reduzido, relatorio = inflado.minimizar()
+    assert reduzido.estados == criar_ribossomo().estados
+    assert relatorio["estados_inalcancaveis"] == 1
+    assert relatorio["estados_equivalentes"] == 1
+    assert relatorio["transicoes_mortas"] == 2
+    assert len(reduzido.transicoes) == len(criar_ribossomo().transicoes)
+
+@pytest.mark.parametrize("semente", range(5))
+def test_ribossomo_reduzido_equivalente(semente):
+    """O autômato reduzido aceita e traduz exatamente como o original."""
+    gerador = random.Random(semente)
+    transcritor = criar_transcritor_dna_rna()
+    inflado = ribossomo_inflado()
+    reduzido, _ = inflado.minimizar()
+    for _ in range(20):
+        dna = gerar_dna_aleatorio(gerador.randint(0, 300)) + gerar_dna_pseudoaleatorio(gerador.randint(2, 30))
+        rna = transcritor.transcrever(dna)[:gerador.randint(0, len(dna))]
+        assert reduzido.transcrever_pilha(rna) == inflado.transcrever_pilha(rna)
+        assert reduzido.validar(rna) == inflado.validar(rna)
+
+def test_ribossomo_padrao_ja_reduzido():
+    """O ribossomo de fábrica não tem estados nem transições supérfluos."""
+    _, relatorio = criar_ribossomo().minimizar()
+    assert relatorio["estados_removidos"] == 0
+    assert relatorio["transicoes_removidas"] == 0
@@ -0,0 +1,95 @@
+"""
+Testes do registro de motores e da escolha automática (`src/motores.py`).
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from src import (
+    MOTORES, Motor, Recursos, escolher_motor, registrar_motor, detectar_recursos, calibrar, carregar_calibracao,
+    criar_transcritor_dna_rna, criar_ribossomo, formatar_proteina, gerar_dna_aleatorio
+)
+from src.motores import LIMIAR_PIPELINE, LIMIAR_PROCESSOS
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+GIGA = 1 << 30
+
+@pytest.mark.parametrize("motor", [nome for nome, motor in MOTORES.items() if motor.traduzir])
+def test_motores_em_memoria_equivalentes(motor):
+    """Todo motor em memória produz a saída do ribossomo."""
+    rna = criar_transcritor_dna_rna().transcrever(gerar_dna_aleatorio(20_000))
+    assert MOTORES[motor].traduzir(rna, 1) == formatar_proteina(criar_ribossomo().transcrever_pilha(rna))
+
+@pytest.mark.parametrize("tamanho, em_arquivo, recursos, esperado", [
+    (1_000, False, Recursos(8, GIGA), "pilha"),
+    (LIMIAR_PIPELINE, False, Recursos(8, GIGA), "processos"),    # Em memória: já está carregada
+    (LIMIAR_PIPELINE, True, Recursos(8, GIGA), "pipeline"),       # Arquivo grande e várias CPUs
+    (LIMIAR_PIPELINE, True, Recursos(1, GIGA), "pilha"),          # Uma CPU: nada a sobrepor
+    (LIMIAR_PIPELINE - 1, True, Recursos(8, GIGA), "processos"),
+    (10**9, True, Recursos(1, GIGA), "pipeline"),                 # Não cabe na memória
+    (10**9, False, Recursos(1, None), "pilha"),                   # Memória desconhecida
+    (LIMIAR_PROCESSOS, False, Recursos(2, GIGA), "processos"),    # Entrada grande e várias CPUs
+    (LIMIAR_PROCESSOS, True, Recursos(4, GIGA), "processos"),     # Arquivo abaixo do limiar do pipeline
+    (LIMIAR_PROCESSOS, False, Recursos(1, GIGA), "pilha"),        # Uma CPU: nada a dividir
+    (LIMIAR_PROCESSOS - 1, False, Recursos(8, GIGA), "pilha"),
+    (30_000_000, False, Recursos(8, 700 << 20), "pilha"),         # 'processos' não cabe, 'pilha' cabe
+])
+def test_escolher_motor(tamanho, em_arquivo, recursos, esperado):
+    motor, motivo = escolher_motor(tamanho, em_arquivo, recursos, calibracao={})
+    assert motor == esperado and motivo
+
+def test_registrar_motor():
+    """Um motor registrado entra no fim da preferência e pode ser escolhido."""
+    novo = Motor("teste", "motor de teste", 0.5, MOTORES["direto"].traduzir)
+    registrar_motor(novo)
+    try:
+        assert list(MOTORES)[-1] == "teste"
+        # Só o motor novo cabe na memória.
+        assert escolher_motor(1000, False, Recursos(1, 2000), calibracao={})[0] == "teste"
+    finally:
+        del MOTORES["teste"]
+
+def test_detectar_recursos():
+    recursos = detectar_recursos()
+    assert recursos.cpus >= 1
+    assert recursos.memoria_disponivel is None or recursos.memoria_disponivel > 0
+
+def test_calibrar(tmp_path):
+    medicoes = calibrar((300, 3000), arquivo=tmp_path / "calibracao.json")
+    assert set(medicoes["tamanhos"]) == {300, 3000}
+    assert set(medicoes["tamanhos"][300]) == {nome for nome, motor in MOTORES.items() if motor.traduzir}
+    assert medicoes["mais_rapido"][3000] in MOTORES
+    assert medicoes["limiar_processos"] in (None, 300, 3000)
+    assert carregar_calibracao(tmp_path / "calibracao.json")["limiar_processos"] == medicoes["limiar_processos"]
+
+@pytest.mark.parametrize("limiar, esperado", [
+    (5_000, "processos"),
+    (50_000, "pilha"),
+    (None, "pilha"),                                                # 'processos' nunca venceu
+])
+def test_escolher_motor_usa_a_calibracao(tmp_path, limiar, esperado):
+    """O limiar gravado pela calibração substitui `LIMIAR_PROCESSOS`."""
+    arquivo = tmp_path / "calibracao.json"
+    arquivo.write_text(json.dumps({"limiar_processos": limiar}))
+    assert escolher_motor(10_000, False, Recursos(4, GIGA), carregar_calibracao(arquivo))[0] == esperado
+
+@pytest.mark.parametrize("conteudo", ["{", "[]", '{"limiar_processos": -1}', '{"limiar_processos": "x"}', "{}"])
+def test_calibracao_invalida_usa_os_limiares_fixos(tmp_path, conteudo):
+    arquivo = tmp_path / "calibracao.json"
+    arquivo.write_text(conteudo)
+    assert carregar_calibracao(arquivo) == {}
+    assert carregar_calibracao(tmp_path / "ausente.json") == {}
+    assert escolher_motor(LIMIAR_PROCESSOS, False, Recursos(4, GIGA), carregar_calibracao(arquivo))[0] == "processos"
+
+@pytest.mark.parametrize("opcoes", [
+    ["--motor", "direto", "--formato", "uma-letra"],
+    ["--motor", "pilha", "-c", "1", "2"],
+    ["--motor", "gerado", "--max-memoria", "64"],
+])
+def test_motor_em_conflito_e_recusado(opcoes):
+    """Um --motor que seria ignorado pelo modo pedido é um erro da linha de comando."""
+    resultado = subprocess.run([sys.executable, "main.py", "-a", "10", *opcoes], cwd=RAIZ, capture_output=True, text=True)
+    assert resultado.returncode == 2
+    assert "--motor" in resultado.stderr
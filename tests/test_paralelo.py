@@ -0,0 +1,65 @@
+"""
+Testes do compartilhamento dos autômatos entre threads (`src/paralelo.py`).
+"""
+import threading
+import pytest
+from src import (
+    criar_transcritor_dna_rna, criar_ribossomo, gerar_dna_aleatorio, formatar_proteina,
+    processar_em_threads, medir_escalabilidade, gil_ativo, compilar_tabela
+)
+
+transcritor = criar_transcritor_dna_rna()
+ribossomo = criar_ribossomo()
+
+def sequencial(dna: str) -> str:
+    return formatar_proteina(ribossomo.transcrever_pilha(transcritor.transcrever(dna)))
+
+def test_definicoes_congeladas():
+    """Nenhuma parte da definição pode ser alterada depois da construção."""
+    with pytest.raises(TypeError):
+        ribossomo.transicoes[('q0', 'A', 'Z0')] = ('q0', ())
+    with pytest.raises(TypeError):
+        transcritor.funcao_saida[('q0', 'A')] = 'A'
+    with pytest.raises(AttributeError):
+        ribossomo.estados.add('novo')
+    with pytest.raises(AttributeError):
+        transcritor.alfabeto_entrada.add('X')
+    with pytest.raises(TypeError):
+        compilar_tabela(1)['AUG'] = None
+
+def test_definicao_copiada():
+    """Alterar os dicionários usados na construção não afeta a máquina."""
+    δ = dict(transcritor.funcao_transicao)
+    λ = dict(transcritor.funcao_saida)
+    maquina = type(transcritor)(set(transcritor.estados), set(transcritor.alfabeto_entrada),
+                                set(transcritor.alfabeto_saida), δ, λ, transcritor.estado_inicial)
+    λ.clear()
+    assert maquina.transcrever("TAC") == "AUG"
+
+def test_processar_em_threads():
+    cadeias = [gerar_dna_aleatorio(tamanho) for tamanho in (0, 5, 3000, 20_000) * 6]
+    assert processar_em_threads(cadeias, transcritor, ribossomo, trabalhadores=8) == [sequencial(c) for c in cadeias]
+
+def test_mesma_instancia_em_varias_threads():
+    """Threads que usam a mesma instância ao mesmo tempo obtêm o resultado sequencial."""
+    cadeias = [gerar_dna_aleatorio(30_000) for _ in range(8)]
+    esperados = [sequencial(c) for c in cadeias]
+    barreira = threading.Barrier(len(cadeias))
+    resultados = [None] * len(cadeias)
+
+    def executar(indice):
+        barreira.wait()
+        resultados[indice] = sequencial(cadeias[indice])
+
+    threads = [threading.Thread(target=executar, args=(i,)) for i in range(len(cadeias))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert resultados == esperados
+
+def test_medir_escalabilidade():
+    resultado = medir_escalabilidade([gerar_dna_aleatorio(2000)] * 4, transcritor, ribossomo, (1, 2))
+    assert resultado["gil"] == gil_ativo()
+    assert set(resultado["medicoes"]) == {1, 2}
+    assert resultado["medicoes"][1]["aceleracao"] == 1.0
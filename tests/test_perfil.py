@@ -0,0 +1,40 @@
+"""
+Testes da tarefa de perfilamento (`src/perfil.py`).
+"""
+import json
+import re
+import pytest
+from src import criar_transcritor_dna_rna, criar_ribossomo, gerar_dna_aleatorio
+from src.perfil import perfilar
+
+ETAPAS = ["normalizacao", "transcricao", "traducao", "formatacao", "escrita"]
+
+@pytest.fixture
+def memoria(tmp_path):
+    return perfilar(gerar_dna_aleatorio(30_000), tmp_path, criar_transcritor_dna_rna(), criar_ribossomo(), prefixo="teste")
+
+def test_relatorios_gravados(memoria, tmp_path):
+    """Os três relatórios e as saídas do processamento são gravados com o prefixo."""
+    for sufixo in ("hotspots.txt", "pilhas.txt", "memoria.json", "rna.txt", "proteina.txt"):
+        assert (tmp_path / f"teste_{sufixo}").is_file()
+    hotspots = (tmp_path / "teste_hotspots.txt").read_text()
+    assert "ORDENADO POR TEMPO PRÓPRIO" in hotspots and "transcrever_pilha" in hotspots
+
+def test_pilhas_colapsadas(memoria, tmp_path):
+    """Cada linha do arquivo de pilhas é 'quadro;quadro;... N'."""
+    linhas = (tmp_path / "teste_pilhas.txt").read_text().splitlines()
+    assert all(re.fullmatch(r"\S+(;\S+)* \d+", linha) for linha in linhas)
+
+def test_memoria_por_etapa(memoria, tmp_path):
+    """Cada etapa tem tempo, pico e maiores alocações; o JSON gravado é o retornado."""
+    assert list(memoria["etapas"]) == ETAPAS
+    assert memoria["bases"] == 30_000
+    for etapa in memoria["etapas"].values():
+        assert etapa["segundos"] >= 0 and etapa["pico_bytes"] >= 0
+        assert isinstance(etapa["maiores_alocacoes"], list)
+    assert memoria["etapas"]["transcricao"]["pico_bytes"] >= 30_000
+    assert json.loads((tmp_path / "teste_memoria.json").read_text()) == memoria
+
+def test_diretorio_inexistente(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        perfilar("TAC", tmp_path / "nao_existe", criar_transcritor_dna_rna(), criar_ribossomo())
@@ -0,0 +1,55 @@
+"""
+Testes da compilação de autômatos de pilha limitada em transdutores finitos
+(`src/automata/pilha_limitada.py`).
+
+Cada execução compilada é comparada a `Automato_Pilha.transcrever_pilha`.
+"""
+import random
+import pytest
+from src import Automato_Pilha, criar_ribossomo, criar_transcritor_dna_rna, gerar_dna_aleatorio, obter_ribossomo
+from src.automata.pilha_limitada import compilar_pilha_limitada
+
+ribossomo = criar_ribossomo()
+
+def criar_marcador() -> Automato_Pilha:
+    """Registra 'x' a cada 'G' lido; termina (por ε) só no estado 'a'."""
+    δ = {(estado, base, 'Z0'): ('b' if estado == 'a' else 'a', ['Z0']) for estado in 'ab' for base in "ACU"}
+    δ.update({(estado, 'G', 'Z0'): (estado, ['x', 'Z0']) for estado in 'ab'})
+    δ[('a', None, 'Z0')] = ('f', ['Z0'])
+    return Automato_Pilha({'a', 'b', 'f'}, set("ACGU") | {None}, {'Z0', 'x'}, δ, 'a', 'Z0', {'f'})
+
+def executar(execucao, cadeia):
+    """A pilha final, ou o tipo e a mensagem da exceção levantada."""
+    try:
+        return execucao.transcrever_pilha(cadeia)
+    except (ValueError, RuntimeError) as erro:
+        return type(erro), str(erro)
+
+def test_ribossomo_tem_controle_limitado():
+    compilado = ribossomo.transdutor_equivalente()
+    assert compilado is not None and compilado is ribossomo.transdutor_equivalente()
+    # Busca (3), espera da 1ª base (1), 1ª base lida (4) e 1ª e 2ª bases lidas (16).
+    assert len(compilado.transdutor.estados) == 24
+
+@pytest.mark.parametrize("codigo", [1, 2, 11])
+def test_ribossomo_compilado_equivale_ao_original(codigo):
+    original = obter_ribossomo(codigo)
+    compilado = compilar_pilha_limitada(original)
+    aleatorio = random.Random(codigo)
+    for _ in range(150):
+        bases = aleatorio.choice(["ACGU", "CGU", "AAUG", "AUGGCU"])
+        cadeia = "".join(aleatorio.choice(bases) for _ in range(aleatorio.randrange(150)))
+        assert compilado.transcrever_pilha(cadeia) == original.transcrever_pilha(cadeia)
+    rna = criar_transcritor_dna_rna().transcrever(gerar_dna_aleatorio(30_000))
+    assert compilado.transcrever_pilha(rna) == original.transcrever_pilha(rna)
+
+@pytest.mark.parametrize("cadeia", ["", "A", "G", "AG", "GAG", "ACGX", "AUGGCC"])
+def test_marcador_compilado_equivale_ao_original(cadeia):
+    """Inclui a execução que trava fora de um estado final e o símbolo inválido."""
+    marcador = criar_marcador()
+    assert executar(compilar_pilha_limitada(marcador), cadeia) == executar(marcador, cadeia)
+
+def test_pilha_ilimitada_nao_compila(parenteses):
+    assert parenteses.transdutor_equivalente() is None
+    assert compilar_pilha_limitada(ribossomo, altura_maxima=0) is None
+    assert compilar_pilha_limitada(ribossomo, configuracoes_maximas=10) is None
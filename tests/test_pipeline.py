@@ -0,0 +1,231 @@
+"""
+Testes para a execução em pipeline e para a execução em blocos do Autômato de Pilha.
+
+Verifica que processar a entrada aos pedaços, com as etapas concorrentes,
+produz exatamente os mesmos arquivos que o processamento sequencial, também
+quando a execução é interrompida e retomada de um ponto de controle.
+"""
+import random
+import tracemalloc
+import pytest
+from src import (
+    criar_transcritor_dna_rna, criar_ribossomo, formatar_proteina, ExecucaoPilha,
+    gerar_dna_aleatorio, gerar_dna_pseudoaleatorio, processar_em_pipeline, CODIGOS_GENETICOS
+)
+
+transcritor = criar_transcritor_dna_rna()
+ribossomo = criar_ribossomo()
+
+# Tamanhos de bloco usados para parametrizar os testes (inclui blocos que cortam códons).
+TAMANHOS_BLOCO = [1, 7, 64, 1000]
+
+def dividir(cadeia: str, tamanho: int) -> list[str]:
+    """Divide a cadeia em blocos de tamanho fixo."""
+    return [cadeia[i:i + tamanho] for i in range(0, len(cadeia), tamanho)]
+
+@pytest.mark.parametrize("tamanho_bloco", TAMANHOS_BLOCO)
+def test_execucao_em_blocos_equivale_a_completa(tamanho_bloco):
+    """A execução bloco a bloco, drenando os genes concluídos, gera a mesma proteína."""
+    rna = transcritor.transcrever(gerar_dna_aleatorio(3000))
+    execucao = ExecucaoPilha(ribossomo, marcador='Stop')
+    simbolos = []
+    for bloco in dividir(rna, tamanho_bloco):
+        execucao.consumir(bloco)
+        simbolos.extend(execucao.drenar())
+    simbolos.extend(execucao.finalizar())
+    assert formatar_proteina(simbolos) == formatar_proteina(ribossomo.transcrever_pilha(rna))
+
+def test_drenar_nao_percorre_de_novo_o_gene_aberto(monkeypatch):
+    """Cada `drenar` só procura o marcador no que foi empilhado desde o anterior."""
+    rna = "AUG" + "GCU" * 20_000 + "UAA" + "CCAUGUUU"
+    execucao = ExecucaoPilha(ribossomo, marcador='Stop')
+    percorridos = []
+    index = list.index
+    class Pilha(list):
+        def index(self, valor, inicio=0, fim=None):
+            fim = len(self) if fim is None else fim
+            percorridos.append(fim - inicio)
+            return index(self, valor, inicio, fim)
+    execucao.pilha = Pilha(execucao.pilha)
+    simbolos = []
+    for bloco in dividir(rna, 30):
+        execucao.consumir(bloco)
+        simbolos.extend(execucao.drenar())
+    simbolos.extend(execucao.finalizar())
+    assert formatar_proteina(simbolos) == formatar_proteina(ribossomo.transcrever_pilha(rna))
+    assert sum(percorridos) < 4 * len(rna)
+
+@pytest.mark.parametrize("tamanho_bloco", TAMANHOS_BLOCO)
+def test_pipeline_equivale_ao_sequencial(tmp_path, tamanho_bloco):
+    """Os arquivos escritos pelo pipeline são idênticos aos do fluxo sequencial."""
+    dna = gerar_dna_aleatorio(2000) + gerar_dna_pseudoaleatorio(200) + "acgt\nTTAC"
+    caminho_rna, caminho_proteina = tmp_path / "x_rna.txt", tmp_path / "x_proteina.txt"
+
+    relatorio = processar_em_pipeline(dividir(dna, tamanho_bloco), caminho_rna, caminho_proteina, transcritor, ribossomo)
+
+    rna = transcritor.transcrever(dna.replace("\n", "").upper())
+    assert caminho_rna.read_text(encoding='utf-8') == rna
+    assert caminho_proteina.read_text(encoding='utf-8') == formatar_proteina(ribossomo.transcrever_pilha(rna))
+    assert relatorio.etapas[0].bases == len(rna)
+    assert all(fila.maxima <= fila.capacidade for fila in relatorio.filas)
+
+def test_pipeline_propaga_erro(tmp_path):
+    """Uma base inválida em qualquer bloco interrompe o pipeline com ValueError."""
+    blocos = ["ATCG"] * 50 + ["ATXG"] + ["ATCG"] * 50
+    with pytest.raises(ValueError):
+        processar_em_pipeline(blocos, tmp_path / "r.txt", tmp_path / "p.txt", transcritor, ribossomo, capacidade_fila=1)
+
+def fonte_com_queda(blocos: list[str], queda: int):
+    """Entrega os blocos e simula a queda do processo antes do bloco `queda`."""
+    for indice, bloco in enumerate(blocos):
+        if indice == queda:
+            raise RuntimeError("queda simulada")
+        yield bloco
+
+@pytest.mark.parametrize("tamanho_bloco, queda", [(1, 500), (7, 100), (64, 40), (100, 40)])
+def test_retomada_equivale_a_execucao_sem_interrupcao(tmp_path, tamanho_bloco, queda):
+    """Após uma queda, a retomada produz os mesmos arquivos de uma execução inteira.
+
+    As filas comportam no máximo 15 blocos em trânsito, então, com `queda` acima
+    disso, ao menos um ponto de controle já foi gravado quando a leitura falha.
+    """
+    dna = gerar_dna_aleatorio(4000) + "acgt\nTTAC" + gerar_dna_pseudoaleatorio(300)
+    blocos = dividir(dna, tamanho_bloco)
+    caminho_rna, caminho_proteina = tmp_path / "x_rna.txt", tmp_path / "x_proteina.txt"
+    ponto_controle = tmp_path / "x_ponto_controle.json"
+
+    with pytest.raises(RuntimeError):
+        processar_em_pipeline(fonte_com_queda(blocos, queda), caminho_rna, caminho_proteina, transcritor, ribossomo,
+                              ponto_controle=ponto_controle, intervalo_ponto_controle=0)
+    assert ponto_controle.exists()
+
+    relatorio = processar_em_pipeline(blocos, caminho_rna, caminho_proteina, transcritor, ribossomo,
+                                      ponto_controle=ponto_controle, intervalo_ponto_controle=0, retomar=True)
+
+    rna = transcritor.transcrever(dna.replace("\n", "").upper())
+    proteinas = formatar_proteina(ribossomo.transcrever_pilha(rna))
+    assert caminho_rna.read_text(encoding='utf-8') == rna
+    assert caminho_proteina.read_text(encoding='utf-8') == proteinas
+    assert 0 < relatorio.retomado_de <= queda * tamanho_bloco
+    assert relatorio.genes == len(proteinas.split())
+    assert not ponto_controle.exists()
+
+def test_retomar_sem_ponto_controle_processa_tudo(tmp_path):
+    dna = gerar_dna_aleatorio(1000)
+    relatorio = processar_em_pipeline(dividir(dna, 64), tmp_path / "r.txt", tmp_path / "p.txt", transcritor, ribossomo,
+                                      ponto_controle=tmp_path / "pc.json", retomar=True)
+    assert relatorio.retomado_de == 0
+    assert (tmp_path / "r.txt").read_text(encoding='utf-8') == transcritor.transcrever(dna)
+
+def test_ponto_controle_de_outros_automatos(tmp_path):
+    """Um ponto de controle gravado com outro ribossomo não é aceito."""
+    ponto_controle = tmp_path / "pc.json"
+    with pytest.raises(RuntimeError):
+        processar_em_pipeline(fonte_com_queda(dividir(gerar_dna_aleatorio(1000), 10), 50), tmp_path / "r.txt",
+                              tmp_path / "p.txt", transcritor, ribossomo, ponto_controle=ponto_controle, intervalo_ponto_controle=0)
+    outro = criar_ribossomo({**CODIGOS_GENETICOS[2][1]})
+    with pytest.raises(ValueError):
+        processar_em_pipeline(["A"], tmp_path / "r.txt", tmp_path / "p.txt", transcritor, outro,
+                              ponto_controle=ponto_controle, retomar=True)
+
+@pytest.mark.parametrize("alterar", ["entrada", "saida"])
+def test_retomada_recusa_entrada_ou_saida_diferentes(tmp_path, alterar):
+    """Outra entrada, ou uma saída menor que a registrada, não é retomada (nem truncada)."""
+    dna = gerar_dna_aleatorio(4000)
+    blocos = dividir(dna, 10)
+    caminho_rna, caminho_proteina = tmp_path / "x_rna.txt", tmp_path / "x_proteina.txt"
+    ponto_controle = tmp_path / "pc.json"
+    with pytest.raises(RuntimeError):
+        processar_em_pipeline(fonte_com_queda(blocos, 200), caminho_rna, caminho_proteina, transcritor, ribossomo,
+                              ponto_controle=ponto_controle, intervalo_ponto_controle=0)
+    if alterar == "entrada":
+        blocos = dividir(("A" if dna[0] != "A" else "C") + dna[1:], 10)
+    else:
+        caminho_rna.write_text("", encoding='utf-8')
+    antes = caminho_proteina.read_bytes()
+    with pytest.raises(ValueError):
+        processar_em_pipeline(blocos, caminho_rna, caminho_proteina, transcritor, ribossomo,
+                              ponto_controle=ponto_controle, retomar=True)
+    assert caminho_proteina.read_bytes() == antes and ponto_controle.exists()
+
+# --- Orçamento de memória e pilha derramada em disco ---
+
+def gene_longo(codons: int, fechado: bool = True, semente: int = 0) -> str:
+    """Um gene de DNA molde ('TAC' -> 'AUG') com `codons` códons sem parada."""
+    aleatorio = random.Random(semente)
+    return "TAC" + "".join(aleatorio.choice(["GGC", "CCG", "AAA", "TGT"]) for _ in range(codons)) + ("ATT" if fechado else "")
+
+@pytest.mark.parametrize("marcador", [None, 'Stop'])
+def test_execucao_derramada_equivale_a_em_memoria(marcador):
+    aleatorio = random.Random(11)
+    for _ in range(60):
+        rna = transcritor.transcrever(gene_longo(aleatorio.randrange(200), aleatorio.random() < 0.5) + gerar_dna_aleatorio(aleatorio.randrange(300)))
+        passos = [aleatorio.choice([1, 7, 50]) for _ in range(len(rna))]
+        resultados = []
+        for limite in (None, aleatorio.choice([1, 2, 5, 20])):
+            execucao = ExecucaoPilha(ribossomo, marcador, limite_pilha=limite)
+            simbolos, posicao = [], 0
+            for passo in passos:
+                if posicao >= len(rna):
+                    break
+                execucao.consumir(rna, posicao, min(posicao + passo, len(rna)))
+                simbolos.extend(execucao.drenar())
+                posicao += passo
+            resultados.append(simbolos + execucao.finalizar())
+        assert resultados[0] == resultados[1]
+
+def test_rollback_descarta_o_derramado_sem_ler(monkeypatch):
+    execucao = ExecucaoPilha(ribossomo, marcador='Stop', limite_pilha=100)
+    for bloco in dividir(transcritor.transcrever(gene_longo(5000, fechado=False)), 999):
+        execucao.consumir(bloco)
+        assert execucao.drenar() == []
+        assert len(execucao.pilha) <= 100 + 999
+    assert execucao.derramados > 4000
+    monkeypatch.setattr("src.automata.automato_pilha.pickle.load", lambda arquivo: pytest.fail("o arquivo foi lido"))
+    assert execucao.finalizar() == []
+    assert execucao.derramados == 0
+
+def test_derramar_exige_pilha_limitada(parenteses):
+    with pytest.raises(ValueError):
+        ExecucaoPilha(parenteses, limite_pilha=10)
+
+@pytest.mark.parametrize("dna", [
+    gerar_dna_aleatorio(20_000),
+    "".join(gene_longo(codons, semente=codons) + gerar_dna_aleatorio(50) for codons in (3, 4000, 10, 9000)),
+    gene_longo(3000) + gene_longo(20_000, fechado=False, semente=1),
+], ids=["aleatorio", "genes_longos", "gene_aberto"])
+def test_pipeline_com_orcamento_de_memoria(tmp_path, dna):
+    caminho_rna, caminho_proteina = tmp_path / "x_rna.txt", tmp_path / "x_proteina.txt"
+    relatorio = processar_em_pipeline(dividir(dna, 50_000), caminho_rna, caminho_proteina, transcritor, ribossomo,
+                                      memoria_maxima=20_000)
+    rna = transcritor.transcrever(dna)
+    assert caminho_rna.read_text(encoding='utf-8') == rna
+    assert caminho_proteina.read_text(encoding='utf-8') == formatar_proteina(ribossomo.transcrever_pilha(rna))
+    assert relatorio.tamanho_bloco < 50_000
+    assert relatorio.etapas[0].blocos >= len(dna) / relatorio.tamanho_bloco
+
+def test_pico_de_memoria_com_gene_aberto(tmp_path):
+    """Um 'AUG' sem 'Stop' não faz a memória crescer com a entrada."""
+    def fonte():
+        yield "TAC"
+        for _ in range(6):
+            yield "GGC" * 50_000
+    orcamento = 1 << 19
+    tracemalloc.start()
+    relatorio = processar_em_pipeline(fonte(), tmp_path / "r.txt", tmp_path / "p.txt", transcritor, ribossomo,
+                                      memoria_maxima=orcamento)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert relatorio.maximo_derramado > 250_000
+    assert pico < 1.5 * orcamento
+    assert (tmp_path / "p.txt").read_text(encoding='utf-8') == ""
+
+def test_pipeline_memorizado(tmp_path):
+    dna = ("TAC" + "CGA" * 10 + "ATT" + "GCGTA") * 5000
+    caminho_rna, caminho_proteina = tmp_path / "x_rna.txt", tmp_path / "x_proteina.txt"
+    relatorio = processar_em_pipeline(dividir(dna, 10_000), caminho_rna, caminho_proteina, transcritor, ribossomo,
+                                      memorizar=True)
+    rna = transcritor.transcrever(dna)
+    assert caminho_proteina.read_text(encoding='utf-8') == formatar_proteina(ribossomo.transcrever_pilha(rna))
+    assert relatorio.memoria.acertos > relatorio.memoria.falhas
+    assert "memorização" in relatorio.resumo()
@@ -0,0 +1,77 @@
+"""
+Testes da transcrição e tradução em processos com memória compartilhada (`src/processos.py`).
+"""
+import os
+import pickle
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from src import (
+    TransdutorFinito, criar_transcritor_dna_rna, criar_ribossomo, gerar_dna_aleatorio, formatar_proteina,
+    traduzir_uma_letra, processar_em_processos, traduzir_em_processos, tabela_transcricao
+)
+
+transcritor = criar_transcritor_dna_rna()
+
+def segmentos_abertos() -> set[str]:
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+@pytest.mark.parametrize("tamanho, fragmento", [(0, 6), (1, 6), (200, 6), (1000, 12), (5000, 60), (60_000, 1000)])
+def test_equivale_a_traducao_sequencial(tamanho, fragmento):
+    """RNA, resíduos e deslocamentos iguais aos da execução em um só processo, com ou sem transcrição."""
+    dna = gerar_dna_aleatorio(tamanho) if tamanho else ""
+    rna = transcritor.transcrever(dna)
+    esperado = traduzir_uma_letra(rna)
+    assert processar_em_processos(dna, 1, transcritor, 2, fragmento) == (rna, *esperado)
+    assert processar_em_processos(rna, 1, None, 2, fragmento) == (rna, *esperado)
+
+def test_genes_que_atravessam_fragmentos():
+    """Um gene mais longo que vários fragmentos é traduzido na junção."""
+    rna = "CC" + "AUG" + "GCU" * 400 + "UAA" + "AUGUUUUGA" + "AUGCCC"
+    esperado = traduzir_uma_letra(rna)
+    assert processar_em_processos(rna, 1, None, 3, 30)[1:] == esperado
+    assert esperado[0] == b"M" + b"A" * 400 + b"MF"
+
+def test_traduzir_em_processos_equivale_ao_ribossomo():
+    rna = transcritor.transcrever(gerar_dna_aleatorio(20_000))
+    assert " ".join(traduzir_em_processos(rna, 1, 2)) == formatar_proteina(criar_ribossomo().transcrever_pilha(rna))
+
+@pytest.mark.parametrize("entrada, com_transcricao", [("ACGT" * 50 + "X", True), ("ACGU" * 50 + "T", False), ("ACGTÇ", True)])
+def test_simbolo_invalido_libera_os_segmentos(entrada, com_transcricao):
+    """O erro de um trabalhador chega ao chamador e nenhum segmento fica para trás."""
+    antes = segmentos_abertos()
+    with pytest.raises(ValueError, match="não pertence ao alfabeto"):
+        processar_em_processos(entrada, 1, transcritor if com_transcricao else None, 2, 12)
+    assert segmentos_abertos() == antes
+
+def test_erro_na_juncao_libera_os_segmentos(monkeypatch):
+    """Um erro ao juntar os genes chega ao chamador (e não um BufferError) e libera os segmentos."""
+    def falhar(*args):
+        raise RuntimeError("falha simulada")
+
+    monkeypatch.setattr("src.processos._gene_local", falhar)
+    antes = segmentos_abertos()
+    with pytest.raises(RuntimeError, match="falha simulada"):
+        processar_em_processos("CC" + "AUG" + "GCU" * 400 + "UAA", 1, None, 2, 30)
+    assert segmentos_abertos() == antes
+
+def test_apenas_posicoes_cruzam_os_processos(monkeypatch):
+    """Os argumentos de cada tarefa não crescem com a entrada."""
+    tamanhos = []
+    submeter = ProcessPoolExecutor.submit
+
+    def registrar(pool, funcao, *args):
+        tamanhos.append(len(pickle.dumps(args)))
+        return submeter(pool, funcao, *args)
+
+    monkeypatch.setattr(ProcessPoolExecutor, "submit", registrar)
+    processar_em_processos(gerar_dna_aleatorio(120_000), 1, transcritor, 2, 30_000)
+    assert len(tamanhos) == 4 and max(tamanhos) < 400
+
+def test_transdutor_dependente_de_posicao_rejeitado():
+    bases = "ACGU"
+    δ = {(estado, base): ('impar' if estado == 'par' else 'par') for estado in ('par', 'impar') for base in bases}
+    λ = {(estado, base): (base if estado == 'par' else base.lower()) for estado in ('par', 'impar') for base in bases}
+    alternador = TransdutorFinito({'par', 'impar'}, set(bases), set(bases + bases.lower()), δ, λ, 'par')
+    with pytest.raises(ValueError):
+        tabela_transcricao(alternador)
+    assert tabela_transcricao(transcritor)[ord('A')] == ord('U')
@@ -0,0 +1,59 @@
+"""
+Testes para o rastreamento passo a passo do Autômato de Pilha.
+
+Verifica que os ganchos não alteram o resultado, que a amostragem e o histórico
+circular funcionam e que, sem rastreador, o laço rastreado nunca é usado.
+"""
+import pytest
+from src import Rastreador, criar_ribossomo, criar_transcritor_dna_rna, formatar_proteina, gerar_dna_pseudoaleatorio
+
+ribossomo = criar_ribossomo()
+
+def test_rastreamento_nao_altera_resultado():
+    """Com ou sem rastreador, a pilha final é a mesma."""
+    rna = criar_transcritor_dna_rna().transcrever(gerar_dna_pseudoaleatorio(300))
+    assert ribossomo.transcrever_pilha(rna, Rastreador(historico=4)) == ribossomo.transcrever_pilha(rna)
+
+def test_genes_completos_e_rejeicoes():
+    """Cada gene concluído é notificado uma vez; o gene incompleto descartado não."""
+    genes, rejeitados = [], []
+    rastreador = Rastreador(
+        ao_completar_gene=lambda passo, indice, gene: genes.append((indice, '-'.join(gene))),
+        ao_rejeitar=lambda passo, indice, estado, simbolo, topo: rejeitados.append(indice),
+    )
+    pilha = ribossomo.transcrever_pilha("AUGUUUUAAAUGCCCUAGAUGUUU", rastreador)
+    assert formatar_proteina(pilha) == "Met-Phe Met-Pro"
+    assert genes == [(8, "Met-Phe"), (17, "Met-Pro")]
+    assert rejeitados == []
+
+def test_amostragem_e_historico():
+    """A amostragem reduz as chamadas e o histórico guarda só as últimas K configurações."""
+    chamadas = []
+    rastreador = Rastreador(ao_transitar=lambda *args: chamadas.append(args[0]), amostragem=3, historico=2)
+    ribossomo.transcrever_pilha("AUGUUUUAA", rastreador)
+    assert chamadas == list(range(3, rastreador.passos + 1, 3))
+    assert len(rastreador.historico) == 2
+    passo, _, estado, topo = rastreador.historico[-1]
+    assert estado in ribossomo.estados and topo[-1] == 'Z0'
+
+def test_transicoes_vazias_apos_a_entrada():
+    """O rollback do gene incompleto aparece como transições ε sem índice de entrada."""
+    vazias = []
+    rastreador = Rastreador(ao_transitar_vazio=lambda passo, indice, *resto: vazias.append(indice))
+    ribossomo.transcrever_pilha("AUGUUU", rastreador)
+    assert vazias and all(indice is None for indice in vazias)
+
+def test_sem_rastreador_usa_o_laco_principal(monkeypatch):
+    """Desligado, o rastreamento não custa nada: o laço rastreado nem é chamado."""
+    def proibido(*args):
+        raise AssertionError("laço rastreado usado sem rastreador")
+    monkeypatch.setattr(type(ribossomo), "_consumir_rastreado", proibido)
+    monkeypatch.setattr(type(ribossomo), "_finalizar_rastreado", proibido)
+    assert formatar_proteina(ribossomo.transcrever_pilha("AUGUUUUAA")) == "Met-Phe"
+
+def test_parametros_invalidos():
+    """Amostragem e histórico precisam ser coerentes."""
+    with pytest.raises(ValueError):
+        Rastreador(amostragem=0)
+    with pytest.raises(ValueError):
+        Rastreador(historico=-1)
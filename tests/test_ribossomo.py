@@ -7,7 +7,10 @@ e casos extremos, validando a gramática implementada.
 """
 
 import pytest
-from src import criar_ribossomo, formatar_proteina
+from src import (
+    criar_ribossomo, formatar_proteina, concatenar_lote, separar_lote, gerar_dna_pseudoaleatorio,
+    criar_transcritor_dna_rna
+)
 
 # Instância única do ribossomo para ser usada em todos os testes.
 ribossomo = criar_ribossomo()
@@ -29,4 +32,29 @@ test_cases = [
 def test_ribossomo(descricao, rna, saida_esperada):
     """Testa a tradução de RNA para proteína em múltiplos cenários."""
     proteina = ribossomo.transcrever_pilha(rna)
-    assert saida_esperada == formatar_proteina(proteina)
\ No newline at end of file
+    assert saida_esperada == formatar_proteina(proteina)
+
+# --- Processamento em lote ---
+
+def test_lote_equivale_a_chamadas_individuais():
+    """Lista e buffer + deslocamentos produzem as mesmas pilhas que uma chamada por sequência."""
+    transcritor = criar_transcritor_dna_rna()
+    leituras = [rna for _, rna, _ in test_cases] + [transcritor.transcrever(gerar_dna_pseudoaleatorio(50)) for _ in range(20)]
+    esperado = [ribossomo.transcrever_pilha(rna) for rna in leituras]
+
+    simbolos, deslocamentos = ribossomo.transcrever_pilha_lote(leituras)
+    assert separar_lote(simbolos, deslocamentos) == esperado
+
+    buffer, deslocamentos_entrada = concatenar_lote(leituras)
+    assert ribossomo.transcrever_pilha_lote(buffer, deslocamentos_entrada) == (simbolos, deslocamentos)
+
+def test_lote_com_deslocamentos_invalidos():
+    """Deslocamentos ausentes, fora de ordem ou além do buffer são rejeitados."""
+    with pytest.raises(ValueError):
+        ribossomo.transcrever_pilha_lote("AUGUAA")
+    with pytest.raises(ValueError):
+        ribossomo.transcrever_pilha_lote("AUGUAA", [0, 4, 2])
+    with pytest.raises(ValueError):
+        ribossomo.transcrever_pilha_lote("AUGUAA", [0, 7])
+    with pytest.raises(ValueError):
+        ribossomo.transcrever_pilha_lote(["AUGUAA"], [0, 6])
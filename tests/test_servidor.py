@@ -0,0 +1,72 @@
+"""
+Testes para o modo residente (`--serve-stdio`).
+
+Verifica os dois enquadramentos, o isolamento de trabalhos com erro e a
+execução real do processo pela linha de comando.
+"""
+import io
+import json
+import struct
+import subprocess
+import sys
+from pathlib import Path
+from src import ServidorTraducao
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+def respostas_em_linhas(*trabalhos: str) -> list[dict]:
+    entrada = io.BytesIO("".join(f"{trabalho}\n" for trabalho in trabalhos).encode())
+    saida = io.BytesIO()
+    ServidorTraducao().servir(entrada, saida, "linhas")
+    return [json.loads(linha) for linha in saida.getvalue().splitlines()]
+
+def test_tarefas_em_linhas():
+    """DNA puro, JSON e as três tarefas produzem os resultados esperados."""
+    respostas = respostas_em_linhas(
+        "TACAAAATT",
+        json.dumps({"id": "a", "dna": "TACAAAATTTACGGGATC", "tarefa": "uma-letra"}),
+        json.dumps({"id": "b", "dna": "TACAAAATT", "tarefa": "estatisticas", "incluir_rna": True}),
+    )
+    assert respostas[0]["proteinas"] == ["Met-Phe"]
+    assert respostas[1]["id"] == "a" and respostas[1]["proteinas"] == ["MF", "MP"]
+    assert respostas[2]["estatisticas"]["genes"] == 1 and respostas[2]["rna"] == "AUGUUUUAA"
+    for resposta in respostas:
+        assert resposta["ok"] and set(resposta["tempos"]) == {"transcricao", "traducao", "total"}
+
+def test_erros_nao_derrubam_o_servidor():
+    """Um trabalho inválido recebe "ok": false e os seguintes continuam sendo atendidos."""
+    respostas = respostas_em_linhas(
+        json.dumps({"id": 1, "dna": "TAX"}),
+        json.dumps({"id": 2, "tarefa": "proteinas"}),
+        json.dumps({"id": 3, "dna": "TAC", "tarefa": "outra"}),
+        "{ json quebrado",
+        json.dumps({"id": 5, "dna": "TACAAAATT", "codigo": 99}),
+        json.dumps({"id": 6, "dna": "TACAAAATT"}),
+    )
+    assert [resposta["ok"] for resposta in respostas] == [False] * 5 + [True]
+    assert respostas[0]["id"] == 1 and respostas[3]["id"] is None
+
+def test_enquadramento_por_prefixo():
+    """Cada trabalho e cada resposta são precedidos pelo tamanho em uint32."""
+    corpos = [json.dumps({"id": i, "dna": "TACAAAATT\n" * i}).encode() for i in range(1, 4)]
+    entrada = io.BytesIO(b"".join(struct.pack('>I', len(corpo)) + corpo for corpo in corpos))
+    saida = io.BytesIO()
+    assert ServidorTraducao().servir(entrada, saida, "prefixo") == 3
+
+    dados, respostas = saida.getvalue(), []
+    while dados:
+        (tamanho,) = struct.unpack('>I', dados[:4])
+        respostas.append(json.loads(dados[4:4 + tamanho]))
+        dados = dados[4 + tamanho:]
+    assert [resposta["proteinas"] for resposta in respostas] == [["Met-Phe"] * i for i in range(1, 4)]
+
+def test_processo_residente():
+    """`main.py --serve-stdio` atende vários trabalhos em um único processo."""
+    trabalhos = "".join(json.dumps({"id": i, "dna": "TACAAAATT"}) + "\n" for i in range(50))
+    processo = subprocess.run(
+        [sys.executable, "main.py", "--serve-stdio"], input=trabalhos.encode(),
+        capture_output=True, cwd=RAIZ, timeout=60, check=True,
+    )
+    respostas = [json.loads(linha) for linha in processo.stdout.splitlines()]
+    assert [resposta["id"] for resposta in respostas] == list(range(50))
+    assert all(resposta["proteinas"] == ["Met-Phe"] for resposta in respostas)
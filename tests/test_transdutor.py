@@ -4,8 +4,10 @@ Testes para o Transdutor Finito (Máquina de Mealy).
 Verifica se a transcrição de DNA para RNA está funcionando corretamente,
 substituindo cada base pela sua correspondente na fita de RNA.
 """
+import mmap
+from array import array
 import pytest
-from src import criar_transcritor_dna_rna
+from src import criar_transcritor_dna_rna, TransdutorFinito, gerar_dna_aleatorio, concatenar_lote, separar_lote
 
 # Instância única do transdutor para ser usada em todos os testes deste arquivo.
 transcritor = criar_transcritor_dna_rna()
@@ -29,4 +31,170 @@ def test_transcritor(descricao, entrada, esperado):
     resultado = transcritor.transcrever(entrada)
     
     # Verifica se o resultado é o esperado.
-    assert resultado == esperado
\ No newline at end of file
+    assert resultado == esperado
+
+# --- Composição de transdutores ---
+
+def criar_retrotranscritor() -> TransdutorFinito:
+    """RNA -> DNA molde: desfaz a transcrição."""
+    δ = {('r', base): 'r' for base in "UAGC"}
+    λ = {('r', base): saida for base, saida in zip("UAGC", "ATCG")}
+    return TransdutorFinito({'r'}, set("UAGC"), set("ATCG"), δ, λ, 'r')
+
+def criar_alternador() -> TransdutorFinito:
+    """Escreve as posições pares em maiúsculas e as ímpares em minúsculas."""
+    bases = "ACGU"
+    δ = {(estado, base): ('impar' if estado == 'par' else 'par') for estado in ('par', 'impar') for base in bases}
+    λ = {(estado, base): (base if estado == 'par' else base.lower()) for estado in ('par', 'impar') for base in bases}
+    return TransdutorFinito({'par', 'impar'}, set(bases), set(bases + bases.lower()), δ, λ, 'par')
+
+def test_composicao_equivale_ao_encadeamento():
+    """A máquina produto de N etapas produz a mesma saída que as etapas em sequência."""
+    etapas = [transcritor, criar_retrotranscritor(), transcritor, criar_alternador()]
+    composta = etapas[0].compor(*etapas[1:])
+    for tamanho in (0, 1, 7, 500):
+        dna = gerar_dna_aleatorio(tamanho)
+        esperado = dna
+        for etapa in etapas:
+            esperado = etapa.transcrever(esperado)
+        assert composta.transcrever(dna) == esperado
+    assert composta.transcrever("ATCG") == "UaGc"
+
+def test_composicao_restrita_a_pares_alcancaveis():
+    """Só os pares de estados alcançáveis entram na máquina produto."""
+    alternador = criar_alternador()
+    # (q0, par) e (q0, impar) são alcançáveis; não há outros pares.
+    assert len((transcritor >> alternador).estados) == 2
+    assert len((alternador.compor(criar_alternador().compor())).estados) == 2
+
+def test_composicao_com_saida_sem_regra():
+    """Uma saída que a etapa seguinte não aceita deixa a transição indefinida."""
+    # O transcritor emite 'U', que não pertence ao alfabeto do próprio transcritor.
+    composta = transcritor >> transcritor
+    assert composta.transcrever("TCG") == "UCG"
+    with pytest.raises(ValueError):
+        composta.transcrever("A")
+
+
+# --- Processamento em lote ---
+
+def test_transcricao_em_lote():
+    """O lote devolve, no formato concatenado, o mesmo que uma chamada por sequência."""
+    leituras = [entrada for _, entrada, _ in test_cases] + [gerar_dna_aleatorio(150) for _ in range(10)]
+    saida, deslocamentos = transcritor.transcrever_lote(leituras)
+    assert separar_lote(saida, deslocamentos) == [transcritor.transcrever(dna) for dna in leituras]
+    assert transcritor.transcrever_lote(*concatenar_lote(leituras)) == (saida, deslocamentos)
+
+def test_lote_reinicia_o_estado():
+    """Cada sequência do lote começa no estado inicial."""
+    saida, deslocamentos = criar_alternador().transcrever_lote(["AC", "G", "UA"])
+    assert separar_lote(saida, deslocamentos) == ["Ac", "G", "Ua"]
+
+
+# --- Visão preguiçosa da transcrição ---
+
+def test_independencia_de_posicao():
+    """Só transdutores cuja saída depende apenas do símbolo são independentes de posição."""
+    assert transcritor.independente_de_posicao()
+    assert criar_retrotranscritor().independente_de_posicao()
+    assert not criar_alternador().independente_de_posicao()
+    # Sem regra para um símbolo, a transcrição de um trecho isolado poderia diferir.
+    parcial = TransdutorFinito({'q'}, set("AC"), set("U"), {('q', 'A'): 'q'}, {('q', 'A'): 'U'}, 'q')
+    assert not parcial.independente_de_posicao()
+
+@pytest.mark.parametrize("fabrica", [criar_transcritor_dna_rna, criar_alternador, lambda: transcritor >> criar_alternador()])
+@pytest.mark.parametrize("tamanho_bloco", [1, 7, 64])
+def test_visao_equivale_a_transcricao(fabrica, tamanho_bloco):
+    """Índices, fatias, iteração e str da visão coincidem com a cadeia transcrita."""
+    maquina = fabrica()
+    entrada = gerar_dna_aleatorio(300)
+    if "U" in maquina.alfabeto_entrada:
+        entrada = transcritor.transcrever(entrada)
+    esperado = maquina.transcrever(entrada)
+    visao = maquina.visao_transcricao(entrada, tamanho_bloco=tamanho_bloco, blocos_em_cache=3)
+
+    assert len(visao) == len(esperado)
+    for fatia in (slice(250, 290), slice(0, 60), slice(-5, None), slice(10, 200, 3),
+                  slice(None, None, -1), slice(280, 20, -7), slice(50, 10), slice(400, 500)):
+        assert visao[fatia] == esperado[fatia]
+    assert [visao[i] for i in (0, 1, 150, -1)] == [esperado[i] for i in (0, 1, 150, -1)]
+    assert "".join(visao) == esperado
+    assert str(visao) == esperado
+    with pytest.raises(IndexError):
+        visao[300]
+
+def test_visao_so_transcreve_o_trecho_consultado():
+    """Com transdutor independente de posição, a prévia não toca no resto da entrada."""
+    # O símbolo inválido fica fora da prévia: só é detectado quando o seu bloco é consultado.
+    entrada = "ATCG" * 1000 + "X"
+    visao = transcritor.visao_transcricao(entrada, tamanho_bloco=100)
+    assert visao[:60] == transcritor.transcrever(entrada[:60])
+    assert visao[3950:3990] == transcritor.transcrever(entrada[3950:3990])
+    with pytest.raises(ValueError):
+        visao[-1]
+    with pytest.raises(ValueError):
+        str(visao)
+
+def test_visao_com_simbolos_de_varios_caracteres():
+    """Cada posição da visão é um símbolo de saída, mesmo com mais de um caractere."""
+    δ = {('q', base): 'q' for base in "ACGT"}
+    λ = {('q', base): nome for base, nome in zip("ACGT", ("Ade", "Cit", "Gua", "Tim"))}
+    nomeador = TransdutorFinito({'q'}, set("ACGT"), set(λ.values()), δ, λ, 'q')
+    visao = nomeador.visao_transcricao("GATTACA", tamanho_bloco=2)
+    assert len(visao) == 7
+    assert visao[1] == "Ade"
+    assert visao[2:4] == "TimTim"
+    assert list(visao)[-1] == "Ade"
+    assert str(visao) == nomeador.transcrever("GATTACA")
+
+
+# --- Transcrição em buffer ---
+
+def test_tabela_bytes():
+    """Só máquinas independentes de posição com símbolos ASCII têm tabela."""
+    tabela = transcritor.tabela_bytes()
+    assert b"ATCG".translate(tabela) == b"UAGC"
+    assert tabela[ord('X')] == 0
+    assert criar_alternador().tabela_bytes() is None
+
+@pytest.mark.parametrize("criar_destino", [
+    lambda n: bytearray(n), lambda n: memoryview(bytearray(n)), lambda n: array('B', bytes(n)),
+])
+def test_transcrever_em_buffer(criar_destino):
+    """A saída é escrita a partir do deslocamento e o número de bytes é retornado."""
+    dna = gerar_dna_aleatorio(500)
+    destino = criar_destino(510)
+    assert transcritor.transcrever_em(dna, destino, 10) == 500
+    assert bytes(destino)[:10] == bytes(10)
+    assert bytes(destino)[10:].decode() == transcritor.transcrever(dna)
+
+def test_transcrever_em_mmap_reaproveitado():
+    """O mesmo buffer recebe blocos seguidos, sem realocação."""
+    blocos = [gerar_dna_aleatorio(100) for _ in range(3)]
+    with mmap.mmap(-1, 300) as destino:
+        posicao = 0
+        for bloco in blocos:
+            posicao += transcritor.transcrever_em(bloco, destino, posicao)
+        assert destino[:].decode() == transcritor.transcrever("".join(blocos))
+
+def test_transcrever_bloco_em_sem_tabela():
+    """Máquinas sem tabela usam o laço de `transcrever_bloco` e devolvem o estado."""
+    alternador = criar_alternador()
+    destino = bytearray(8)
+    escritos, estado = alternador.transcrever_bloco_em("ACG", destino, 0, 'par')
+    assert (escritos, estado) == (3, 'impar')
+    escritos, estado = alternador.transcrever_bloco_em("UA", destino, 3, estado)
+    assert (escritos, estado, bytes(destino[:5])) == (2, 'impar', b"AcGuA")
+
+@pytest.mark.parametrize("entrada", ["ACGX", "ACGÇ", "AC GT"])
+def test_transcrever_em_simbolo_invalido(entrada):
+    with pytest.raises(ValueError, match="não pertence ao alfabeto"):
+        transcritor.transcrever_em(entrada, bytearray(10))
+
+def test_transcrever_em_destino_invalido():
+    with pytest.raises(ValueError):
+        transcritor.transcrever_em("ACGT", bytearray(5), 2)
+    with pytest.raises(TypeError):
+        transcritor.transcrever_em("ACGT", bytes(4))
+    with pytest.raises(TypeError):
+        transcritor.transcrever_em("ACGT", "....")